@@ -0,0 +1,148 @@
+#!/usr/bin/env -S rye run python
+"""Benchmark the first request made by forked worker processes.
+
+A client is created and used in the parent process, which then forks `--workers`
+children that all make requests at the same time, like gunicorn workers do after
+`--preload`. This is run in three modes:
+
+- `inherited pool`: a plain `httpx.Client` is passed as `http_client`, so every child
+  sends its requests over the connection it inherited from the parent.
+- `client per child`: the usual workaround, every child creates its own client.
+- `fork-safe pool`: the client's default HTTP client, which replaces its connection
+  pool in each child while reusing the parent's SSL context.
+
+For every worker we record the latency of its first request and whether the responses
+it received actually belonged to its own requests.
+
+The local stand-in server answers every request with the `x-request-id` it was sent.
+"""
+
+from __future__ import annotations
+
+import time
+import argparse
+import threading
+import statistics
+import multiprocessing
+from typing import Any, Dict, List, Callable
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import httpx
+
+from swarms_client import SwarmsClient
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        request_id = self.headers.get("x-request-id", "")
+        body = ('{"status": "%s"}' % request_id).encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: Any) -> None:
+        pass
+
+
+class Server(ThreadingHTTPServer):
+    daemon_threads = True
+    block_on_close = False
+
+
+def worker(
+    client: SwarmsClient | Callable[[], SwarmsClient], index: int, requests: int, start: Any, results: Any
+) -> None:
+    start.wait()
+    if not isinstance(client, SwarmsClient):
+        started = time.perf_counter()
+        client = client()
+        construct = time.perf_counter() - started
+    else:
+        construct = 0.0
+
+    result: Dict[str, Any] = {"first": None, "errors": 0, "mismatched": 0}
+    for i in range(requests):
+        request_id = f"{index}-{i}"
+        started = time.perf_counter()
+        try:
+            status = client.health.check(extra_headers={"x-request-id": request_id}).status
+        except Exception:
+            result["errors"] += 1
+        else:
+            if status != request_id:
+                result["mismatched"] += 1
+        if i == 0:
+            result["first"] = construct + time.perf_counter() - started
+    results.put(result)
+
+
+def run(name: str, client: SwarmsClient | Callable[[], SwarmsClient], *, workers: int, requests: int) -> None:
+    if isinstance(client, SwarmsClient):
+        # put a keep-alive connection into the pool before forking
+        client.health.check(extra_headers={"x-request-id": "parent"})
+
+    ctx = multiprocessing.get_context("fork")
+    start = ctx.Event()
+    results = ctx.Queue()
+    processes = [ctx.Process(target=worker, args=(client, i, requests, start, results)) for i in range(workers)]
+    for process in processes:
+        process.start()
+    start.set()
+
+    collected: List[Dict[str, Any]] = []
+    for _ in processes:
+        try:
+            collected.append(results.get(timeout=30))
+        except Exception:
+            collected.append({"first": None, "errors": requests, "mismatched": 0})
+    for process in processes:
+        process.join(5)
+        if process.is_alive():
+            process.kill()
+
+    # the first request includes creating the client, if the child has to do that
+    firsts = sorted(result["first"] * 1000 for result in collected if result["first"] is not None)
+    errors = sum(result["errors"] for result in collected)
+    mismatched = sum(result["mismatched"] for result in collected)
+    total = workers * requests
+    p50 = statistics.median(firsts) if firsts else float("nan")
+    worst = firsts[-1] if firsts else float("nan")
+    print(
+        f"{name:<16} first request p50 {p50:7.2f}ms  max {worst:7.2f}ms  "
+        f"errors {errors:>4}/{total}  wrong responses {mismatched:>4}/{total}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=20, help="requests per worker")
+    args = parser.parse_args()
+
+    server = Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    # retries would hide the failures we want to count
+    inherited = SwarmsClient(base_url=base_url, api_key="benchmark", max_retries=0, http_client=httpx.Client(timeout=5))
+    run("inherited pool", inherited, workers=args.workers, requests=args.requests)
+
+    run(
+        "client per child",
+        lambda: SwarmsClient(base_url=base_url, api_key="benchmark", max_retries=0, timeout=5),
+        workers=args.workers,
+        requests=args.requests,
+    )
+
+    fork_safe = SwarmsClient(base_url=base_url, api_key="benchmark", max_retries=0, timeout=5)
+    run("fork-safe pool", fork_safe, workers=args.workers, requests=args.requests)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env -S rye run python
+"""Benchmark a wide fan-out of concurrent requests over HTTP/1.1 and HTTP/2.
+
+`--concurrency` tasks share one `AsyncSwarmsClient` and each send `--requests` requests
+one after the other to a local stand-in server, which answers every request after
+`--delay` seconds, like a slow API call would. This is run in three modes:
+
+- `http/1.1 pool`: the default client, with a pool of at most 100 connections.
+- `http/2 (httpx)`: a plain `httpx.AsyncClient(http2=True)`, which multiplexes every
+  request over a single connection of at most 100 concurrent streams.
+- `http/2 (sdk)`: the client's HTTP/2 mode, which opens up to 10 connections of 100
+  streams each.
+
+For every request, the server reports how long it took to arrive after the SDK method
+was called; this is mostly time spent waiting for a connection or a free stream.
+
+The stand-in server speaks cleartext HTTP/2, which httpx only uses with "prior knowledge",
+i.e. `http1=False`. Against the real API, `http2=True` is negotiated during the TLS handshake.
+"""
+
+from __future__ import annotations
+
+import time
+import asyncio
+import argparse
+import threading
+import statistics
+from typing import Any, List
+
+import httpx
+import h2.config
+import h2.events
+import h2.connection
+
+from swarms_client import AsyncSwarmsClient, DefaultAsyncHttpxClient
+
+PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+
+class Server:
+    """Serves HTTP/1.1 and cleartext HTTP/2 on the same port."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.connections = 0
+
+    def body(self, started: str | None) -> bytes:
+        wait = time.perf_counter() - float(started) if started else 0.0
+        return b'{"status": "%f"}' % wait
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            data = await reader.readexactly(len(PREFACE))
+        except asyncio.IncompleteReadError:
+            writer.close()
+            return
+        if data == PREFACE:
+            await self.handle_h2(data, reader, writer)
+        else:
+            await self.handle_h1(data, reader, writer)
+        writer.close()
+
+    async def handle_h1(self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        buffer = data
+        while True:
+            while b"\r\n\r\n" not in buffer:
+                chunk = await reader.read(65536)
+                if not chunk:
+                    return
+                buffer += chunk
+            head, _, buffer = buffer.partition(b"\r\n\r\n")
+            started = None
+            for line in head.split(b"\r\n")[1:]:
+                name, _, value = line.partition(b":")
+                if name.strip().lower() == b"x-started":
+                    started = value.strip().decode()
+
+            body = self.body(started)
+            await asyncio.sleep(self.delay)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\ncontent-type: application/json\r\ncontent-length: %d\r\n\r\n%s" % (len(body), body)
+            )
+
+    async def handle_h2(self, data: bytes, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        tasks: List["asyncio.Task[None]"] = []
+
+        async def respond(stream_id: int, body: bytes) -> None:
+            await asyncio.sleep(self.delay)
+            conn.send_headers(
+                stream_id,
+                [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(body)))],
+            )
+            conn.send_data(stream_id, body, end_stream=True)
+            writer.write(conn.data_to_send())
+
+        while data:
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.RequestReceived):
+                    headers = {bytes(name).lower(): bytes(value) for name, value in event.headers}
+                    started = headers.get(b"x-started")
+                    body = self.body(started.decode() if started else None)
+                    tasks.append(asyncio.ensure_future(respond(event.stream_id, body)))
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    return
+            writer.write(conn.data_to_send())
+            data = await reader.read(65536)
+
+        for task in tasks:
+            task.cancel()
+
+
+def serve(server: Server, ready: Any) -> None:
+    loop = asyncio.new_event_loop()
+    listener = loop.run_until_complete(asyncio.start_server(server.handle, "127.0.0.1", 0, backlog=1024))
+    ready.append(listener.sockets[0].getsockname()[1])
+    loop.run_forever()
+
+
+async def run(name: str, client: AsyncSwarmsClient, server: Server, *, concurrency: int, requests: int) -> None:
+    waits: List[float] = []
+
+    async def worker() -> None:
+        for _ in range(requests):
+            response = await client.health.check(extra_headers={"x-started": repr(time.perf_counter())})
+            waits.append(float(response.status or 0) * 1000)
+
+    server.connections = 0
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+    await client.close()
+
+    waits.sort()
+    p95 = waits[int(len(waits) * 0.95) - 1]
+    print(
+        f"{name:<15} {len(waits) / elapsed:8.0f} req/s  "
+        f"wait for connection p50 {statistics.median(waits):7.1f}ms  p95 {p95:7.1f}ms  max {waits[-1]:7.1f}ms  "
+        f"connections {server.connections:>4}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=500)
+    parser.add_argument("--requests", type=int, default=2, help="requests per task")
+    parser.add_argument("--delay", type=float, default=0.2, help="seconds the server takes to answer")
+    args = parser.parse_args()
+
+    server = Server(args.delay)
+    ready: List[int] = []
+    threading.Thread(target=serve, args=(server, ready), daemon=True).start()
+    while not ready:
+        time.sleep(0.01)
+    base_url = f"http://127.0.0.1:{ready[0]}"
+
+    modes = {
+        "http/1.1 pool": lambda: AsyncSwarmsClient(base_url=base_url, api_key="benchmark"),
+        "http/2 (httpx)": lambda: AsyncSwarmsClient(
+            base_url=base_url, api_key="benchmark", http_client=httpx.AsyncClient(http1=False, http2=True, timeout=60)
+        ),
+        "http/2 (sdk)": lambda: AsyncSwarmsClient(
+            base_url=base_url, api_key="benchmark", http_client=DefaultAsyncHttpxClient(http1=False, http2=True)
+        ),
+    }
+    for name, make_client in modes.items():
+        await run(name, make_client(), server, concurrency=args.concurrency, requests=args.requests)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
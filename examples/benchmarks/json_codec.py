@@ -0,0 +1,95 @@
+#!/usr/bin/env -S rye run python
+"""Benchmark the throughput of the JSON codecs on request and response sized payloads.
+
+Payloads shaped like a swarm run request, with a `messages` history, and like a swarm
+run response, with a large `output`, are generated at each of `--sizes` and encoded
+and decoded with every installed codec:
+
+- `httpx json=`: what the client does by default, encoding through `httpx.Request(json=...)`
+  and decoding with `httpx.Response.json()`.
+- `stdlib`, `orjson`, `msgspec`: the codecs that can be passed as `json_codec`.
+
+Throughput is reported in MB of JSON per second.
+"""
+
+from __future__ import annotations
+
+import time
+import argparse
+from typing import Any, Dict, List, Callable
+
+import httpx
+
+from swarms_client.lib.json_codec import JSONCodec, OrjsonCodec, MsgspecCodec
+
+
+def request_payload(size: int) -> Dict[str, Any]:
+    message = {"role": "user", "content": "Summarize the quarterly report for the board. " * 4}
+    count = max(1, size // len(JSONCodec().dumps(message)))
+    return {"name": "research-swarm", "swarm_type": "ConcurrentWorkflow", "messages": [message] * count}
+
+
+def response_payload(size: int) -> Dict[str, Any]:
+    step = {"role": "agent-1", "content": "The revenue grew by 12% while costs stayed flat. " * 4, "tokens": 87}
+    count = max(1, size // len(JSONCodec().dumps(step)))
+    return {"job_id": "abc", "status": "success", "output": [step] * count, "usage": {"total_tokens": 87 * count}}
+
+
+def throughput(fn: Callable[[Any], object], arg: Any, size: int, *, seconds: float) -> float:
+    fn(arg)
+    runs = 0
+    started = time.perf_counter()
+    while True:
+        fn(arg)
+        runs += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= seconds:
+            return runs * size / elapsed / 1e6
+
+
+def httpx_encode(payload: Dict[str, Any]) -> bytes:
+    return httpx.Request("POST", "http://localhost", json=payload).read()
+
+
+def httpx_decode(body: bytes) -> Any:
+    return httpx.Response(200, content=body).json()
+
+
+def parse_size(value: str) -> int:
+    units = {"k": 1_000, "m": 1_000_000}
+    if value[-1].lower() in units:
+        return int(float(value[:-1]) * units[value[-1].lower()])
+    return int(value)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=parse_size, nargs="+", default=[parse_size(s) for s in ("1k", "100k", "5m")])
+    parser.add_argument("--seconds", type=float, default=0.5, help="how long to measure each case for")
+    args = parser.parse_args()
+
+    codecs: List[JSONCodec] = [JSONCodec()]
+    for codec_cls in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_cls())
+        except ImportError:
+            print(f"skipping {codec_cls.name}, it is not installed")
+
+    print(f"{'codec':<12} {'size':>10} {'encode MB/s':>12} {'decode MB/s':>12}")
+    for size in args.sizes:
+        request = request_payload(size)
+        body = JSONCodec().dumps(response_payload(size))
+        request_size = len(JSONCodec().dumps(request))
+
+        encode = throughput(httpx_encode, request, request_size, seconds=args.seconds)
+        decode = throughput(httpx_decode, body, len(body), seconds=args.seconds)
+        print(f"{'httpx json=':<12} {size:>10} {encode:>12.0f} {decode:>12.0f}")
+
+        for codec in codecs:
+            encode = throughput(codec.dumps, request, request_size, seconds=args.seconds)
+            decode = throughput(codec.loads, body, len(body), seconds=args.seconds)
+            print(f"{codec.name:<12} {size:>10} {encode:>12.0f} {decode:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
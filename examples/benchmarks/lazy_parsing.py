@@ -0,0 +1,88 @@
+#!/usr/bin/env -S rye run python
+"""Benchmark parsing swarm run responses with a large `output` when only the metadata is read.
+
+A `SwarmRunResponse` body whose `output` holds `--messages` messages is parsed in two modes,
+and only its `job_id`, `usage` and `execution_time` are read:
+
+- `eager`: the default, which decodes the whole body and constructs the model from it.
+- `lazy`: `lazy_parsing=True`, which scans the body and leaves `output` undecoded.
+
+Both are reported with the time taken and the peak memory allocated while parsing.
+The lazy mode scans the body with msgspec, so the benchmark needs it to be installed.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import argparse
+import tracemalloc
+from typing import Any, Callable
+
+from swarms_client.types import SwarmRunResponse
+from swarms_client._models import construct_type
+from swarms_client.lib.lazy_parsing import _raw_decoder, construct_lazy
+
+
+def make_body(messages: int) -> bytes:
+    return json.dumps(
+        {
+            "job_id": "abc",
+            "status": "success",
+            "swarm_name": "research-swarm",
+            "execution_time": 42,
+            "usage": {"input_tokens": 1200, "output_tokens": 800, "total_tokens": 2000},
+            "output": [
+                {"role": f"agent-{i % 4}", "content": "The revenue grew by 12% while costs stayed flat. " * 10}
+                for i in range(messages)
+            ],
+        }
+    ).encode()
+
+
+def eager(body: bytes) -> Any:
+    return construct_type(type_=SwarmRunResponse, value=json.loads(body))
+
+
+def lazy(body: bytes) -> Any:
+    return construct_lazy(SwarmRunResponse, body, json.loads)
+
+
+def measure(name: str, parse: Callable[[bytes], Any], body: bytes, *, iterations: int) -> None:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        run = parse(body)
+        assert (run.job_id, run.usage, run.execution_time) == (
+            "abc",
+            {"input_tokens": 1200, "output_tokens": 800, "total_tokens": 2000},
+            42.0,
+        )
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    run = parse(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<6} min {min(timings) * 1000:8.2f}ms  peak memory {peak / 1e6:8.1f}MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--messages", type=int, default=20_000)
+    parser.add_argument("--iterations", type=int, default=5)
+    args = parser.parse_args()
+
+    if _raw_decoder() is None:
+        parser.error("lazy parsing needs msgspec, install it with `pip install msgspec`")
+
+    body = make_body(args.messages)
+    print(f"body {len(body) / 1e6:.1f}MB")
+
+    measure("eager", eager, body, iterations=args.iterations)
+    measure("lazy", lazy, body, iterations=args.iterations)
+
+
+if __name__ == "__main__":
+    main()
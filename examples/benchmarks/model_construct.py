@@ -0,0 +1,96 @@
+#!/usr/bin/env -S rye run python
+"""Benchmark constructing response models from decoded JSON.
+
+Responses are built the way the client builds them, with `construct_type()`, in three shapes:
+
+- `swarm runs`: a `List[SwarmRunResponse]` of `--items` swarm runs.
+- `batch runs`: a `BatchRunResponse` of `--items` agent results.
+- `stream chunks`: `--items` `AgentRunResponse` chunks constructed one at a time,
+  like the events of a high-rate stream.
+
+For reference, every shape is also validated with pydantic, which is what a fully validated
+(and much stricter) response would cost.
+"""
+
+from __future__ import annotations
+
+import time
+import argparse
+import statistics
+from typing import Any, Dict, List, Callable
+
+import pydantic
+
+from swarms_client.types import AgentRunResponse, SwarmRunResponse
+from swarms_client._models import construct_type
+from swarms_client.types.swarms import BatchRunResponse
+
+
+def swarm_run(i: int) -> Dict[str, Any]:
+    return {
+        "job_id": f"job-{i}",
+        "status": "success",
+        "swarm_name": "research-swarm",
+        "description": "Researches the state of the art",
+        "swarm_type": "ConcurrentWorkflow",
+        "number_of_agents": 4,
+        "service_tier": "standard",
+        "execution_time": 12,
+        "output": [{"role": f"agent-{n}", "content": "The revenue grew by 12%."} for n in range(4)],
+        "usage": {"input_tokens": 1200, "output_tokens": 800, "total_tokens": 2000},
+    }
+
+
+def agent_run(i: int) -> Dict[str, Any]:
+    return {
+        "job_id": f"run-{i}",
+        "success": True,
+        "name": "analyst",
+        "description": "Analyzes a report",
+        "temperature": 1,
+        "outputs": "The revenue grew by 12%.",
+        "usage": {"input_tokens": 300, "output_tokens": 200, "total_tokens": 500},
+        "timestamp": "2025-01-01T00:00:00Z",
+    }
+
+
+def run(name: str, fn: Callable[[], object], *, items: int, iterations: int) -> None:
+    fn()  # warm up caches
+    timings: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+
+    median = statistics.median(timings)
+    print(f"{name:<30} median {median * 1000:8.2f}ms  {items / median:>12,.0f} items/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+
+    swarm_runs = [swarm_run(i) for i in range(args.items)]
+    agent_runs = [agent_run(i) for i in range(args.items)]
+    swarm_runs_adapter: Any = pydantic.TypeAdapter(List[SwarmRunResponse])
+
+    def stream_chunks() -> None:
+        for chunk in agent_runs:
+            construct_type(type_=AgentRunResponse, value=chunk)
+
+    def validate_stream_chunks() -> None:
+        for chunk in agent_runs:
+            AgentRunResponse.model_validate(chunk)
+
+    kwargs = {"items": args.items, "iterations": args.iterations}
+    run("swarm runs", lambda: construct_type(type_=List[SwarmRunResponse], value=swarm_runs), **kwargs)
+    run("swarm runs (validated)", lambda: swarm_runs_adapter.validate_python(swarm_runs), **kwargs)
+    run("batch runs", lambda: construct_type(type_=BatchRunResponse, value=agent_runs), **kwargs)
+    run("stream chunks", stream_chunks, **kwargs)
+    run("stream chunks (validated)", validate_stream_chunks, **kwargs)
+
+
+if __name__ == "__main__":
+    main()
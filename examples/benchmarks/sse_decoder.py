@@ -0,0 +1,101 @@
+#!/usr/bin/env -S rye run python
+"""Benchmark the throughput of the server-sent events decoder on synthetic streams.
+
+Two streams are decoded, split into network chunks of `--chunk-size` bytes:
+
+- `tokens`: `--events` small events, like a high-rate stream of completion tokens.
+- `large`: `--large-events` events with `--large-size` bytes of data each, like
+  streamed steps that carry a whole agent output.
+
+Each is decoded with:
+
+- `previous`: the previous decoder, which concatenated every event with `data += line`
+  and split each chunk into lines twice.
+- `current`: `SSEDecoder`, which scans a `bytearray` buffer for line endings once.
+
+Throughput is reported in events and MB per second.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import argparse
+from typing import List, Iterator
+
+from swarms_client._streaming import SSEDecoder, ServerSentEvent
+
+
+class PreviousSSEDecoder(SSEDecoder):
+    """The decoder before the `bytearray` buffer, for comparison."""
+
+    def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
+        for chunk in self._iter_chunks(iterator):
+            for raw_line in chunk.splitlines():
+                sse = self.decode(raw_line.decode("utf-8"))
+                if sse:
+                    yield sse
+
+    def _iter_chunks(self, iterator: Iterator[bytes]) -> Iterator[bytes]:
+        data = b""
+        for chunk in iterator:
+            for line in chunk.splitlines(keepends=True):
+                data += line
+                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
+                    yield data
+                    data = b""
+        if data:
+            yield data
+
+
+def token_stream(events: int) -> bytes:
+    token = {"choices": [{"delta": {"content": "hello"}, "index": 0}], "id": "chunk"}
+    return b"".join(b"data: " + json.dumps({**token, "n": i}).encode() + b"\n\n" for i in range(events))
+
+
+def large_stream(events: int, size: int) -> bytes:
+    step = {"agent": "researcher", "output": "x" * size}
+    return b"".join(b"event: step\ndata: " + json.dumps(step).encode() + b"\n\n" for _ in range(events))
+
+
+def chunked(body: bytes, size: int) -> List[bytes]:
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+def measure(decoder_cls: type[SSEDecoder], chunks: List[bytes], *, seconds: float) -> tuple[float, int]:
+    size = sum(len(chunk) for chunk in chunks)
+    runs = 0
+    events = 0
+    started = time.perf_counter()
+    while True:
+        events = sum(1 for _ in decoder_cls().iter_bytes(iter(chunks)))
+        runs += 1
+        elapsed = time.perf_counter() - started
+        if elapsed >= seconds:
+            return runs * size / elapsed / 1e6, int(runs * events / elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--large-events", type=int, default=20)
+    parser.add_argument("--large-size", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=4096)
+    parser.add_argument("--seconds", type=float, default=2.0, help="how long to measure each case for")
+    args = parser.parse_args()
+
+    streams = {
+        "tokens": token_stream(args.events),
+        "large": large_stream(args.large_events, args.large_size),
+    }
+
+    print(f"{'stream':<8} {'decoder':<10} {'MB/s':>10} {'events/s':>12}")
+    for name, body in streams.items():
+        chunks = chunked(body, args.chunk_size)
+        for label, decoder_cls in (("previous", PreviousSSEDecoder), ("current", SSEDecoder)):
+            mb_per_second, events_per_second = measure(decoder_cls, chunks, seconds=args.seconds)
+            print(f"{name:<8} {label:<10} {mb_per_second:>10.1f} {events_per_second:>12,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env -S rye run python
+"""Benchmark transforming a large swarm spec into a request body.
+
+The params of `client.swarms.run()` for a swarm of `--agents` agents, each with
+`--tools` tool schemas and the swarm with `--messages` chat messages, are transformed
+`--iterations` times in two modes:
+
+- `recursive walk`: the previous implementation, which resolves type hints, unwraps
+  `Annotated` types and tries every union member for every value.
+- `compiled plan`: `maybe_transform()`, which compiles a plan once per type and only
+  copies the parts of the data that change.
+"""
+
+from __future__ import annotations
+
+import time
+import argparse
+import statistics
+from typing import Any, Dict, List, Callable
+
+from swarms_client.types import swarm_run_params
+from swarms_client._types import NOT_GIVEN
+from swarms_client._utils import maybe_transform
+from swarms_client._utils._transform import _transform_recursive
+
+
+def make_params(*, agents: int, tools: int, messages: int) -> Dict[str, Any]:
+    tool = {
+        "type": "function",
+        "function": {
+            "name": "search",
+            "description": "Search the web for up-to-date information.",
+            "parameters": {
+                "type": "object",
+                "properties": {"query": {"type": "string"}, "limit": {"type": "integer"}},
+                "required": ["query"],
+            },
+        },
+    }
+    return {
+        "name": "research-swarm",
+        "description": "A large swarm",
+        "agents": [
+            {
+                "agent_name": f"agent-{i}",
+                "description": "Researches one part of the task",
+                "system_prompt": "You are a meticulous researcher. " * 20,
+                "model_name": "gpt-4o-mini",
+                "role": "worker",
+                "max_loops": 1,
+                "temperature": 0.5,
+                "llm_args": {"top_p": 0.9, "seed": i},
+                "tools_list_dictionary": [dict(tool) for _ in range(tools)],
+            }
+            for i in range(agents)
+        ],
+        "messages": [{"role": "user", "content": f"message {i} " * 10} for i in range(messages)],
+        "swarm_type": "ConcurrentWorkflow",
+        "task": "Summarize the state of the art",
+        "img": NOT_GIVEN,
+        "rules": NOT_GIVEN,
+        "tasks": NOT_GIVEN,
+    }
+
+
+def run(name: str, fn: Callable[[], object], *, iterations: int) -> float:
+    fn()  # warm up caches
+    timings: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    median = statistics.median(timings)
+    print(f"{name:<15} median {median:8.3f}ms  min {min(timings):8.3f}ms  max {max(timings):8.3f}ms")
+    return median
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--agents", type=int, default=50)
+    parser.add_argument("--tools", type=int, default=20, help="tool schemas per agent")
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    params = make_params(agents=args.agents, tools=args.tools, messages=args.messages)
+    expected_type = swarm_run_params.SwarmRunParams
+
+    before = run(
+        "recursive walk",
+        lambda: _transform_recursive(params, annotation=expected_type),
+        iterations=args.iterations,
+    )
+    after = run("compiled plan", lambda: maybe_transform(params, expected_type), iterations=args.iterations)
+
+    assert _transform_recursive(params, annotation=expected_type) == maybe_transform(params, expected_type)
+    print(f"speedup {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
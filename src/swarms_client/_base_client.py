@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import sys
 import json
 import time
@@ -9,6 +10,7 @@ import asyncio
 import inspect
 import logging
 import platform
+import threading
 import email.utils
 from types import TracebackType
 from random import random
@@ -21,6 +23,7 @@ from typing import (
     Generic,
     Mapping,
     TypeVar,
+    Callable,
     Iterable,
     Iterator,
     Optional,
@@ -29,7 +32,7 @@ from typing import (
     cast,
     overload,
 )
-from typing_extensions import Literal, override, get_origin
+from typing_extensions import Unpack, Literal, override, get_origin
 
 import anyio
 import httpx
@@ -58,7 +61,16 @@ from ._types import (
     HttpxRequestFiles,
     ModelBuilderProtocol,
 )
-from ._utils import is_dict, is_list, asyncify, is_given, lru_cache, is_mapping
+from ._utils import (
+    is_dict,
+    is_list,
+    asyncify,
+    is_given,
+    lru_cache,
+    is_mapping,
+    get_async_library,
+    pop_transform_time,
+)
 from ._compat import PYDANTIC_V2, model_copy, model_dump
 from ._models import GenericModel, FinalRequestOptions, validate_type, construct_type
 from ._response import (
@@ -67,6 +79,7 @@ from ._response import (
     AsyncAPIResponse,
     extract_response_type,
 )
+from .lib.http2 import HTTP2Transport, AsyncHTTP2Transport
 from ._constants import (
     DEFAULT_TIMEOUT,
     MAX_RETRY_DELAY,
@@ -75,14 +88,19 @@ from ._constants import (
     RAW_RESPONSE_HEADER,
     OVERRIDE_CAST_TO_HEADER,
     DEFAULT_CONNECTION_LIMITS,
+    DEFAULT_MAX_STREAM_RESUMES,
+    DEFAULT_HTTP2_CONNECTION_LIMITS,
 )
 from ._streaming import Stream, SSEDecoder, AsyncStream, SSEBytesDecoder
+from .lib.timing import RequestTiming
 from ._exceptions import (
     APIStatusError,
     APITimeoutError,
     APIConnectionError,
     APIResponseValidationError,
 )
+from .lib.json_codec import JSONCodec, JSONCodecName, get_json_codec
+from .lib.response_cache import CACHE_HEADER, CacheMode, _pop_cache_mode
 
 log: logging.Logger = logging.getLogger(__name__)
 
@@ -97,6 +115,17 @@ _T_co = TypeVar("_T_co", covariant=True)
 _StreamT = TypeVar("_StreamT", bound=Stream[Any])
 _AsyncStreamT = TypeVar("_AsyncStreamT", bound=AsyncStream[Any])
 
+if TYPE_CHECKING:
+    from .lib.hedging import Hedging
+    from .lib.preflight import Preflight
+    from .lib.rate_limit import RateLimiter
+    from .lib.concurrency import AdaptiveConcurrencyLimiter
+    from .lib.pool_metrics import PoolMetrics
+    from .lib.singleflight import Singleflight
+    from .lib.catalog_cache import CatalogCache
+    from .lib.stream_resume import StreamMetrics
+    from .lib.response_cache import ResponseCache
+
 if TYPE_CHECKING:
     from httpx._config import (
         DEFAULT_TIMEOUT_CONFIG,  # pyright: ignore[reportPrivateImportUsage]
@@ -369,6 +398,17 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
     _strict_response_validation: bool
     _idempotency_header: str | None
     _default_stream_cls: type[_DefaultStreamT] | None = None
+    _on_timing: Callable[[RequestTiming], object] | None = None
+    _json_codec: JSONCodec | None = None
+    _lazy_parsing: bool = False
+    _max_stream_resumes: int = DEFAULT_MAX_STREAM_RESUMES
+    _stream_metrics: StreamMetrics | None = None
+    _stream_idle_timeout: float | None = None
+    _response_cache: ResponseCache | None = None
+    _catalog_cache: CatalogCache | None = None
+    _preflight: Preflight | None = None
+    _singleflight: Singleflight | None = None
+    _hedging: Hedging | None = None
 
     def __init__(
         self,
@@ -481,6 +521,17 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
 
         return merge_url
 
+    def _endpoint_path(self, request: httpx.Request) -> str:
+        """
+        Returns the path of the request relative to the 'base_url' on the client,
+        e.g. `/v1/swarm/completions`, which is how the endpoints are configured.
+        """
+        path = request.url.path
+        prefix = self.base_url.path.rstrip("/")
+        if prefix and path.startswith(prefix + "/"):
+            return path[len(prefix) :]
+        return path
+
     def _make_sse_decoder(self) -> SSEDecoder | SSEBytesDecoder:
         return SSEDecoder()
 
@@ -550,6 +601,11 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         if is_body_allowed:
             if isinstance(json_data, bytes):
                 kwargs["content"] = json_data
+            elif self._json_codec is not None and not files and is_given(json_data) and json_data is not None:
+                # encode straight to bytes instead of through httpx's `json=`
+                kwargs["content"] = self._json_codec.dumps(json_data)
+                if "Content-Type" not in headers:
+                    headers["Content-Type"] = "application/json"
             else:
                 kwargs["json"] = json_data if is_given(json_data) else None
             kwargs["files"] = files
@@ -628,6 +684,132 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
 
         return cast_to
 
+    def _decode_json(self, response: httpx.Response) -> Any:
+        if self._json_codec is None:
+            return response.json()
+        return self._json_codec.loads(response.content)
+
+    def _loads_json(self, data: bytes) -> Any:
+        if self._json_codec is None:
+            return json.loads(data)
+        return self._json_codec.loads(data)
+
+    def _finish_timing(self, timing: RequestTiming, *, retries_taken: int) -> None:
+        timing._finish(retries_taken=retries_taken)
+        if self._on_timing is None:
+            return
+
+        try:
+            self._on_timing(timing)
+        except Exception:
+            # a broken metrics hook shouldn't fail the request
+            log.warning("The `on_timing` callback raised an exception", exc_info=True)
+
+    def _take_cache_mode(self, options: FinalRequestOptions) -> CacheMode | None:
+        """Removes the `X-Swarms-Cache` header from the options and returns its value."""
+        if self._response_cache is None and self._catalog_cache is None:
+            return None
+        if not is_given(options.headers):
+            return None
+
+        # the header only controls the caches, so it's never sent
+        headers = dict(options.headers)
+        mode = _pop_cache_mode(headers)
+        options.headers = headers
+        return mode
+
+    def _lookup_cached_response(
+        self, options: FinalRequestOptions, *, mode: CacheMode | None, stream: bool
+    ) -> tuple[str | None, httpx.Response | None]:
+        """Returns the response cache key of the request, if its response is cached,
+        and the cached response, if there is one.
+        """
+        cache = self._response_cache
+        if cache is None or stream or mode == "bypass" or options.files:
+            return None, None
+        if options.url not in cache.paths:
+            return None, None
+
+        request = self._build_request(options)
+        if self._should_stream_response_body(request):
+            return None, None
+
+        key = cache._key(request, self._endpoint_path(request))
+        if key is None:
+            return None, None
+        if mode == "refresh":
+            cache._miss()
+            return key, None
+        return key, cache._get(key, request)
+
+    def _store_cached_response(self, key: str | None, response: httpx.Response) -> None:
+        if key is not None and self._response_cache is not None:
+            self._response_cache._put(key, response)
+
+    def _lookup_catalog(
+        self, options: FinalRequestOptions, *, mode: CacheMode | None, stream: bool
+    ) -> tuple[str | None, httpx.Response | None, bool]:
+        """Returns the catalog cache key of the request, if its response is cached,
+        the cached response, if it can be used, and whether it should be refreshed.
+        """
+        cache = self._catalog_cache
+        if cache is None or stream or mode == "bypass":
+            return None, None, False
+        if options.url not in cache.paths:
+            return None, None, False
+
+        request = self._build_request(options)
+        if self._should_stream_response_body(request):
+            return None, None, False
+
+        key = cache._key(request, self._endpoint_path(request))
+        if key is None:
+            return None, None, False
+        if mode == "refresh":
+            cache._miss()
+            return key, None, False
+
+        state, cached = cache._get(key, request)
+        return key, cached, state == "stale"
+
+    def _catalog_refresh_options(self, options: FinalRequestOptions) -> FinalRequestOptions:
+        options = model_copy(options)
+        headers = options.headers if is_given(options.headers) else {}
+        options.headers = {**headers, CACHE_HEADER: "refresh"}
+        return options
+
+    def _add_conditional_headers(self, key: str | None, request: httpx.Request) -> None:
+        if key is not None and self._catalog_cache is not None:
+            request.headers.update(self._catalog_cache._conditional_headers(key))
+
+    def _update_catalog(self, key: str | None, response: httpx.Response) -> httpx.Response:
+        if key is None or self._catalog_cache is None:
+            return response
+        return self._catalog_cache._update(key, response)
+
+    def _preflight_body(self, options: FinalRequestOptions) -> object | None:
+        """Returns the JSON body of the request, if it should be validated by `preflight`."""
+        preflight = self._preflight
+        if preflight is None or options.method.lower() != "post":
+            return None
+        if options.url not in preflight.paths:
+            return None
+
+        if options.extra_json is not None and is_mapping(options.json_data):
+            return _merge_mappings(options.json_data, options.extra_json)
+        return options.json_data
+
+    def _singleflight_key(self, request: httpx.Request, *, stream: bool) -> str | None:
+        """Returns the key of identical requests, if the request can share a response."""
+        if self._singleflight is None or stream:
+            return None
+        return self._singleflight._key(request, self._endpoint_path(request))
+
+    def _should_hedge(self, request: httpx.Request, *, stream: bool) -> bool:
+        return (
+            self._hedging is not None and not stream and self._hedging._applies(request, self._endpoint_path(request))
+        )
+
     def _should_stream_response_body(self, request: httpx.Request) -> bool:
         return request.headers.get(RAW_RESPONSE_HEADER) == "stream"  # type: ignore[no-any-return]
 
@@ -814,9 +996,46 @@ class BaseClient(Generic[_HttpxClientT, _DefaultStreamT]):
         return f"stainless-python-retry-{uuid.uuid4()}"
 
 
+_fork_generation = 0
+
+
+def _after_fork_in_child() -> None:
+    global _fork_generation
+    _fork_generation += 1
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def _reuse_ssl_context(
+    transport: httpx.BaseTransport | httpx.AsyncBaseTransport, kwargs: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Passes the SSL context of the inherited transport on to its replacement.
+
+    Loading the CA bundle for a new SSL context is by far the most expensive part of
+    creating a client, and the inherited context can safely be reused after a fork.
+    """
+    ssl_context = getattr(transport, "_ssl_context", None) or getattr(
+        getattr(transport, "_pool", None), "_ssl_context", None
+    )
+    if ssl_context is None or "verify" in kwargs:
+        return kwargs
+    return {**kwargs, "verify": ssl_context}
+
+
 class _DefaultHttpxClient(httpx.Client):
     def __init__(self, **kwargs: Any) -> None:
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        if kwargs.get("http2") and kwargs.get("transport") is None:
+            kwargs.setdefault("limits", DEFAULT_HTTP2_CONNECTION_LIMITS)
+            kwargs["transport"] = HTTP2Transport(
+                verify=kwargs.get("verify", True),
+                cert=kwargs.get("cert"),
+                trust_env=kwargs.get("trust_env", True),
+                http1=kwargs.get("http1", True),
+                limits=kwargs["limits"],
+            )
         kwargs.setdefault("limits", DEFAULT_CONNECTION_LIMITS)
         kwargs.setdefault("follow_redirects", True)
         super().__init__(**kwargs)
@@ -835,6 +1054,36 @@ else:
 
 
 class SyncHttpxClientWrapper(DefaultHttpxClient):
+    """The default HTTP client, which replaces its connection pool after the process forks.
+
+    Connections inherited from the parent process are still in use there, so a forked
+    child must neither send requests over them nor close them.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._init_kwargs = kwargs
+        self._fork_generation = _fork_generation
+
+    @override
+    def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        if self._fork_generation != _fork_generation:
+            self._reset_after_fork()
+        return super().send(request, **kwargs)
+
+    @override
+    def close(self) -> None:
+        if self._fork_generation != _fork_generation:
+            self._reset_after_fork()
+        super().close()
+
+    def _reset_after_fork(self) -> None:
+        log.debug("Process was forked; creating a new connection pool")
+        fresh = DefaultHttpxClient(**_reuse_ssl_context(self._transport, self._init_kwargs))  # pyright: ignore[reportPrivateUsage]
+        self._transport = fresh._transport  # pyright: ignore[reportPrivateUsage]
+        self._mounts = fresh._mounts  # pyright: ignore[reportPrivateUsage]
+        self._fork_generation = _fork_generation
+
     def __del__(self) -> None:
         if self.is_closed:
             return
@@ -860,6 +1109,21 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
         _strict_response_validation: bool,
+        rate_limiter: RateLimiter | None = None,
+        http2: bool = False,
+        pool_metrics: PoolMetrics | None = None,
+        request_timing: bool = False,
+        on_timing: Callable[[RequestTiming], object] | None = None,
+        json_codec: JSONCodec | JSONCodecName | None = None,
+        lazy_parsing: bool = False,
+        max_stream_resumes: int = DEFAULT_MAX_STREAM_RESUMES,
+        stream_metrics: StreamMetrics | None = None,
+        stream_idle_timeout: float | None = None,
+        response_cache: ResponseCache | None = None,
+        catalog_cache: CatalogCache | None = None,
+        preflight: Preflight | None = None,
+        singleflight: Singleflight | None = None,
+        hedging: Hedging | None = None,
     ) -> None:
         if not is_given(timeout):
             # if the user passed in a custom http client with a non-default
@@ -895,7 +1159,25 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             base_url=base_url,
             # cast to a valid type because mypy doesn't understand our type narrowing
             timeout=cast(Timeout, timeout),
+            http2=http2,
         )
+        self._http2 = http2
+        self._rate_limiter = rate_limiter
+        self._pool_metrics = pool_metrics
+        if pool_metrics is not None:
+            pool_metrics._attach(self._client)
+        self._request_timing = request_timing or on_timing is not None
+        self._on_timing = on_timing
+        self._json_codec = get_json_codec(json_codec) if isinstance(json_codec, str) else json_codec
+        self._lazy_parsing = lazy_parsing
+        self._max_stream_resumes = max_stream_resumes
+        self._stream_metrics = stream_metrics
+        self._stream_idle_timeout = stream_idle_timeout
+        self._response_cache = response_cache
+        self._catalog_cache = catalog_cache
+        self._preflight = preflight
+        self._singleflight = singleflight
+        self._hedging = hedging
 
     def is_closed(self) -> bool:
         return self._client.is_closed
@@ -989,6 +1271,26 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             # ensure the idempotency key is reused between requests
             input_options.idempotency_key = self._idempotency_key()
 
+        transform_time = pop_transform_time()
+        timing = RequestTiming(transform=transform_time) if self._request_timing else None
+
+        self._check_preflight(input_options.url, self._preflight_body(input_options))
+        cache_mode = self._take_cache_mode(input_options)
+        cache_key, cached = self._lookup_cached_response(input_options, mode=cache_mode, stream=stream)
+        catalog_key, catalog_cached, stale = self._lookup_catalog(input_options, mode=cache_mode, stream=stream)
+        if stale:
+            self._refresh_catalog(catalog_key, input_options)
+        if cached is None:
+            cached = catalog_cached
+        if cached is not None:
+            return self._process_response(
+                cast_to=cast_to,
+                options=input_options,
+                response=cached,
+                stream=False,
+                stream_cls=stream_cls,
+            )
+
         response: httpx.Response | None = None
         max_retries = input_options.get_max_retries(self.max_retries)
 
@@ -998,8 +1300,12 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             options = self._prepare_options(options)
 
             remaining_retries = max_retries - retries_taken
+            build_started = time.perf_counter()
             request = self._build_request(options, retries_taken=retries_taken)
             self._prepare_request(request)
+            self._add_conditional_headers(catalog_key, request)
+            if timing is not None:
+                timing.build_request = time.perf_counter() - build_started
 
             kwargs: HttpxSendArgs = {}
             if self.custom_auth is not None:
@@ -1012,9 +1318,10 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
 
             response = None
             try:
-                response = self._client.send(
+                response = self._send_request(
                     request,
                     stream=stream or self._should_stream_response_body(request=request),
+                    timing=timing,
                     **kwargs,
                 )
             except httpx.TimeoutException as err:
@@ -1054,6 +1361,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
                 response.reason_phrase,
                 response.headers,
             )
+            response = self._update_catalog(catalog_key, response)
 
             try:
                 response.raise_for_status()
@@ -1081,14 +1389,119 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             break
 
         assert response is not None, "could not resolve response (should never happen)"
-        return self._process_response(
+        result = self._process_response(
             cast_to=cast_to,
             options=options,
             response=response,
             stream=stream,
             stream_cls=stream_cls,
             retries_taken=retries_taken,
+            timing=timing,
         )
+        self._store_cached_response(cache_key, response)
+        if timing is not None:
+            self._finish_timing(timing, retries_taken=retries_taken)
+        return result
+
+    def _check_preflight(self, path: str, body: object | None) -> None:
+        """Raises a `PreflightError` if the body has specs that the API would reject."""
+        if body is not None and self._preflight is not None:
+            self._preflight._check(self, path, body)
+
+    def _refresh_catalog(self, key: str | None, options: FinalRequestOptions) -> None:
+        """Refreshes a stale catalog response in a background thread."""
+        cache = self._catalog_cache
+        if key is None or cache is None or not cache._begin_refresh(key):
+            return
+
+        refresh_options = self._catalog_refresh_options(options)
+
+        def refresh() -> None:
+            try:
+                self.request(httpx.Response, refresh_options)
+            except Exception:
+                log.debug("Could not refresh a cached catalog", exc_info=True)
+            finally:
+                cache._end_refresh(key)
+
+        threading.Thread(target=refresh, name="swarms-client-catalog-refresh", daemon=True).start()
+
+    def _send_request(
+        self,
+        request: httpx.Request,
+        *,
+        stream: bool,
+        timing: RequestTiming | None = None,
+        **kwargs: Unpack[HttpxSendArgs],
+    ) -> httpx.Response:
+        key = self._singleflight_key(request, stream=stream)
+        if key is None:
+            return self._send_hedged(request, stream=stream, timing=timing, **kwargs)
+
+        assert self._singleflight is not None
+        return self._singleflight._send(
+            key,
+            request,
+            lambda: self._send_hedged(request, stream=stream, timing=timing, **kwargs),
+        )
+
+    def _send_hedged(
+        self,
+        request: httpx.Request,
+        *,
+        stream: bool,
+        timing: RequestTiming | None = None,
+        **kwargs: Unpack[HttpxSendArgs],
+    ) -> httpx.Response:
+        if not self._should_hedge(request, stream=stream):
+            return self._send_attempt(request, stream=stream, timing=timing, **kwargs)
+
+        assert self._hedging is not None
+        return self._hedging._send(
+            request,
+            self._endpoint_path(request),
+            lambda attempt: self._send_attempt(
+                attempt,
+                stream=stream,
+                # the hedged request isn't part of the timing of this one
+                timing=timing if attempt is request else None,
+                **kwargs,
+            ),
+        )
+
+    def _send_attempt(
+        self,
+        request: httpx.Request,
+        *,
+        stream: bool,
+        timing: RequestTiming | None = None,
+        **kwargs: Unpack[HttpxSendArgs],
+    ) -> httpx.Response:
+        response = self._send_traced(request, stream=stream, timing=timing, **kwargs)
+        if self._rate_limiter is not None:
+            self._rate_limiter.observe(response)
+        return response
+
+    def _send_traced(
+        self,
+        request: httpx.Request,
+        *,
+        stream: bool,
+        timing: RequestTiming | None = None,
+        **kwargs: Unpack[HttpxSendArgs],
+    ) -> httpx.Response:
+        if timing is None:
+            if self._pool_metrics is None:
+                return self._client.send(request, stream=stream, **kwargs)
+            timing = RequestTiming()
+
+        timing._start_attempt()
+        request.extensions["trace"] = timing._trace
+        try:
+            return self._client.send(request, stream=stream, **kwargs)
+        finally:
+            if self._pool_metrics is not None:
+                self._pool_metrics._record_attempt(request.url, timing)
 
     def _sleep_for_retry(
         self,
@@ -1120,6 +1533,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
         stream: bool,
         stream_cls: type[Stream[Any]] | type[AsyncStream[Any]] | None,
         retries_taken: int = 0,
+        timing: RequestTiming | None = None,
     ) -> ResponseT:
         origin = get_origin(cast_to) or cast_to
 
@@ -1147,6 +1561,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
                     stream_cls=stream_cls,
                     options=options,
                     retries_taken=retries_taken,
+                    timing=timing,
                 ),
             )
 
@@ -1163,6 +1578,7 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
             stream_cls=stream_cls,
             options=options,
             retries_taken=retries_taken,
+            timing=timing,
         )
         if bool(response.request.headers.get(RAW_RESPONSE_HEADER)):
             return cast(ResponseT, api_response)
@@ -1358,6 +1774,15 @@ class SyncAPIClient(BaseClient[httpx.Client, Stream[Any]]):
 class _DefaultAsyncHttpxClient(httpx.AsyncClient):
     def __init__(self, **kwargs: Any) -> None:
         kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+        if kwargs.get("http2") and kwargs.get("transport") is None:
+            kwargs.setdefault("limits", DEFAULT_HTTP2_CONNECTION_LIMITS)
+            kwargs["transport"] = AsyncHTTP2Transport(
+                verify=kwargs.get("verify", True),
+                cert=kwargs.get("cert"),
+                trust_env=kwargs.get("trust_env", True),
+                http1=kwargs.get("http1", True),
+                limits=kwargs["limits"],
+            )
         kwargs.setdefault("limits", DEFAULT_CONNECTION_LIMITS)
         kwargs.setdefault("follow_redirects", True)
         super().__init__(**kwargs)
@@ -1387,6 +1812,36 @@ else:
 
 
 class AsyncHttpxClientWrapper(DefaultAsyncHttpxClient):
+    """The default async HTTP client, which replaces its connection pool after the process forks.
+
+    Connections inherited from the parent process are still in use there, so a forked
+    child must neither send requests over them nor close them.
+    """
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._init_kwargs = kwargs
+        self._fork_generation = _fork_generation
+
+    @override
+    async def send(self, request: httpx.Request, **kwargs: Any) -> httpx.Response:
+        if self._fork_generation != _fork_generation:
+            self._reset_after_fork()
+        return await super().send(request, **kwargs)
+
+    @override
+    async def aclose(self) -> None:
+        if self._fork_generation != _fork_generation:
+            self._reset_after_fork()
+        await super().aclose()
+
+    def _reset_after_fork(self) -> None:
+        log.debug("Process was forked; creating a new connection pool")
+        fresh = DefaultAsyncHttpxClient(**_reuse_ssl_context(self._transport, self._init_kwargs))  # pyright: ignore[reportPrivateUsage]
+        self._transport = fresh._transport  # pyright: ignore[reportPrivateUsage]
+        self._mounts = fresh._mounts  # pyright: ignore[reportPrivateUsage]
+        self._fork_generation = _fork_generation
+
     def __del__(self) -> None:
         if self.is_closed:
             return
@@ -1401,6 +1856,7 @@ class AsyncHttpxClientWrapper(DefaultAsyncHttpxClient):
 class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
     _client: httpx.AsyncClient
     _default_stream_cls: type[AsyncStream[Any]] | None = None
+    _concurrency_limiter: AdaptiveConcurrencyLimiter | None = None
 
     def __init__(
         self,
@@ -1413,6 +1869,22 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         http_client: httpx.AsyncClient | None = None,
         custom_headers: Mapping[str, str] | None = None,
         custom_query: Mapping[str, object] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
+        http2: bool = False,
+        pool_metrics: PoolMetrics | None = None,
+        request_timing: bool = False,
+        on_timing: Callable[[RequestTiming], object] | None = None,
+        json_codec: JSONCodec | JSONCodecName | None = None,
+        lazy_parsing: bool = False,
+        max_stream_resumes: int = DEFAULT_MAX_STREAM_RESUMES,
+        stream_metrics: StreamMetrics | None = None,
+        stream_idle_timeout: float | None = None,
+        response_cache: ResponseCache | None = None,
+        catalog_cache: CatalogCache | None = None,
+        preflight: Preflight | None = None,
+        singleflight: Singleflight | None = None,
+        hedging: Hedging | None = None,
     ) -> None:
         if not is_given(timeout):
             # if the user passed in a custom http client with a non-default
@@ -1448,7 +1920,26 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             base_url=base_url,
             # cast to a valid type because mypy doesn't understand our type narrowing
             timeout=cast(Timeout, timeout),
+            http2=http2,
         )
+        self._http2 = http2
+        self._rate_limiter = rate_limiter
+        self._pool_metrics = pool_metrics
+        if pool_metrics is not None:
+            pool_metrics._attach(self._client)
+        self._request_timing = request_timing or on_timing is not None
+        self._on_timing = on_timing
+        self._json_codec = get_json_codec(json_codec) if isinstance(json_codec, str) else json_codec
+        self._lazy_parsing = lazy_parsing
+        self._max_stream_resumes = max_stream_resumes
+        self._stream_metrics = stream_metrics
+        self._stream_idle_timeout = stream_idle_timeout
+        self._response_cache = response_cache
+        self._catalog_cache = catalog_cache
+        self._preflight = preflight
+        self._singleflight = singleflight
+        self._hedging = hedging
+        self._concurrency_limiter = concurrency_limiter
 
     def is_closed(self) -> bool:
         return self._client.is_closed
@@ -1544,6 +2035,26 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             # ensure the idempotency key is reused between requests
             input_options.idempotency_key = self._idempotency_key()
 
+        transform_time = pop_transform_time()
+        timing = RequestTiming(transform=transform_time) if self._request_timing else None
+
+        await self._check_preflight(input_options.url, self._preflight_body(input_options))
+        cache_mode = self._take_cache_mode(input_options)
+        cache_key, cached = self._lookup_cached_response(input_options, mode=cache_mode, stream=stream)
+        catalog_key, catalog_cached, stale = self._lookup_catalog(input_options, mode=cache_mode, stream=stream)
+        if stale:
+            await self._refresh_catalog(catalog_key, input_options)
+        if cached is None:
+            cached = catalog_cached
+        if cached is not None:
+            return await self._process_response(
+                cast_to=cast_to,
+                options=input_options,
+                response=cached,
+                stream=False,
+                stream_cls=stream_cls,
+            )
+
         response: httpx.Response | None = None
         max_retries = input_options.get_max_retries(self.max_retries)
 
@@ -1553,8 +2064,12 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             options = await self._prepare_options(options)
 
             remaining_retries = max_retries - retries_taken
+            build_started = time.perf_counter()
             request = self._build_request(options, retries_taken=retries_taken)
             await self._prepare_request(request)
+            self._add_conditional_headers(catalog_key, request)
+            if timing is not None:
+                timing.build_request = time.perf_counter() - build_started
 
             kwargs: HttpxSendArgs = {}
             if self.custom_auth is not None:
@@ -1567,9 +2082,10 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
 
             response = None
             try:
-                response = await self._client.send(
+                response = await self._send_request(
                     request,
                     stream=stream or self._should_stream_response_body(request=request),
+                    timing=timing,
                     **kwargs,
                 )
             except httpx.TimeoutException as err:
@@ -1609,6 +2125,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
                 response.reason_phrase,
                 response.headers,
             )
+            response = self._update_catalog(catalog_key, response)
 
             try:
                 response.raise_for_status()
@@ -1636,14 +2153,146 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             break
 
         assert response is not None, "could not resolve response (should never happen)"
-        return await self._process_response(
+        result = await self._process_response(
             cast_to=cast_to,
             options=options,
             response=response,
             stream=stream,
             stream_cls=stream_cls,
             retries_taken=retries_taken,
+            timing=timing,
         )
+        self._store_cached_response(cache_key, response)
+        if timing is not None:
+            self._finish_timing(timing, retries_taken=retries_taken)
+        return result
+
+    async def _check_preflight(self, path: str, body: object | None) -> None:
+        """Raises a `PreflightError` if the body has specs that the API would reject."""
+        if body is not None and self._preflight is not None:
+            await self._preflight._acheck(self, path, body)
+
+    async def _refresh_catalog(self, key: str | None, options: FinalRequestOptions) -> None:
+        """Refreshes a stale catalog response in a background task."""
+        cache = self._catalog_cache
+        if key is None or cache is None:
+            return
+
+        if get_async_library() != "asyncio":
+            # there's no task group to start a background task in, so the stale response is
+            # returned as is, and the next request for it refreshes it
+            cache._defer_refresh(key)
+            return
+
+        if not cache._begin_refresh(key):
+            return
+
+        refresh_options = self._catalog_refresh_options(options)
+
+        async def refresh() -> None:
+            try:
+                await self.request(httpx.Response, refresh_options)
+            except Exception:
+                log.debug("Could not refresh a cached catalog", exc_info=True)
+            finally:
+                cache._end_refresh(key)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        cache._tasks.add(task)
+        task.add_done_callback(cache._tasks.discard)
+
+    async def _send_request(
+        self,
+        request: httpx.Request,
+        *,
+        stream: bool,
+        timing: RequestTiming | None = None,
+        **kwargs: Unpack[HttpxSendArgs],
+    ) -> httpx.Response:
+        key = self._singleflight_key(request, stream=stream)
+        if key is None:
+            return await self._send_hedged(request, stream=stream, timing=timing, **kwargs)
+
+        assert self._singleflight is not None
+        return await self._singleflight._asend(
+            key,
+            request,
+            lambda: self._send_hedged(request, stream=stream, timing=timing, **kwargs),
+        )
+
+    async def _send_hedged(
+        self,
+        request: httpx.Request,
+        *,
+        stream: bool,
+        timing: RequestTiming | None = None,
+        **kwargs: Unpack[HttpxSendArgs],
+    ) -> httpx.Response:
+        if not self._should_hedge(request, stream=stream):
+            return await self._send_attempt(request, stream=stream, timing=timing, **kwargs)
+
+        assert self._hedging is not None
+        return await self._hedging._asend(
+            request,
+            self._endpoint_path(request),
+            lambda attempt: self._send_attempt(
+                attempt,
+                stream=stream,
+                # the hedged request isn't part of the timing of this one
+                timing=timing if attempt is request else None,
+                **kwargs,
+            ),
+        )
+
+    async def _send_attempt(
+        self,
+        request: httpx.Request,
+        *,
+        stream: bool,
+        timing: RequestTiming | None = None,
+        **kwargs: Unpack[HttpxSendArgs],
+    ) -> httpx.Response:
+        limiter = self._concurrency_limiter
+        if limiter is None:
+            response = await self._send_traced(request, stream=stream, timing=timing, **kwargs)
+        else:
+            # note: for streamed responses the slot is released as soon as the
+            # response headers have been received
+            started_at = await limiter.acquire()
+            result: httpx.Response | None = None
+            timed_out = False
+            try:
+                result = response = await self._send_traced(request, stream=stream, timing=timing, **kwargs)
+            except httpx.TimeoutException:
+                timed_out = True
+                raise
+            finally:
+                limiter.release(started_at, response=result, timed_out=timed_out)
+
+        if self._rate_limiter is not None:
+            self._rate_limiter.observe(response)
+        return response
+
+    async def _send_traced(
+        self,
+        request: httpx.Request,
+        *,
+        stream: bool,
+        timing: RequestTiming | None = None,
+        **kwargs: Unpack[HttpxSendArgs],
+    ) -> httpx.Response:
+        if timing is None:
+            if self._pool_metrics is None:
+                return await self._client.send(request, stream=stream, **kwargs)
+            timing = RequestTiming()
+
+        timing._start_attempt()
+        request.extensions["trace"] = timing._atrace
+        try:
+            return await self._client.send(request, stream=stream, **kwargs)
+        finally:
+            if self._pool_metrics is not None:
+                self._pool_metrics._record_attempt(request.url, timing)
 
     async def _sleep_for_retry(
         self,
@@ -1675,6 +2324,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
         stream: bool,
         stream_cls: type[Stream[Any]] | type[AsyncStream[Any]] | None,
         retries_taken: int = 0,
+        timing: RequestTiming | None = None,
     ) -> ResponseT:
         origin = get_origin(cast_to) or cast_to
 
@@ -1702,6 +2352,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
                     stream_cls=stream_cls,
                     options=options,
                     retries_taken=retries_taken,
+                    timing=timing,
                 ),
             )
 
@@ -1718,6 +2369,7 @@ class AsyncAPIClient(BaseClient[httpx.AsyncClient, AsyncStream[Any]]):
             stream_cls=stream_cls,
             options=options,
             retries_taken=retries_taken,
+            timing=timing,
         )
         if bool(response.request.headers.get(RAW_RESPONSE_HEADER)):
             return cast(ResponseT, api_response)
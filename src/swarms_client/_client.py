@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Union, Mapping
+import logging
+from typing import Any, Union, Mapping, Callable
 from typing_extensions import Self, override
 
 import httpx
@@ -23,6 +24,7 @@ from ._types import (
     RequestOptions,
 )
 from ._utils import is_given, get_async_library
+from ._models import FinalRequestOptions
 from ._version import __version__
 from ._response import (
     to_raw_response_wrapper,
@@ -32,16 +34,36 @@ from ._response import (
 )
 from .resources import health, models, reasoning_agents
 from ._streaming import Stream as Stream, AsyncStream as AsyncStream
+from .lib.timing import RequestTiming
+from .lib.warmup import (
+    DEFAULT_KEEPALIVE_INTERVAL,
+    DEFAULT_WARMUP_CONNECTIONS,
+    KeepAlive,
+    AsyncKeepAlive,
+    warm_connections,
+    async_warm_connections,
+)
 from ._exceptions import APIStatusError
+from .lib.hedging import Hedging
 from ._base_client import (
     DEFAULT_MAX_RETRIES,
+    DEFAULT_MAX_STREAM_RESUMES,
     SyncAPIClient,
     AsyncAPIClient,
     make_request_options,
 )
+from .lib.preflight import Preflight
+from .lib.json_codec import JSONCodec, JSONCodecName
+from .lib.rate_limit import RATE_LIMITS_PATH, RateLimiter
+from .lib.concurrency import AdaptiveConcurrencyLimiter
 from .resources.agent import agent
+from .lib.pool_metrics import PoolMetrics
+from .lib.singleflight import Singleflight
 from .resources.client import client
 from .resources.swarms import swarms
+from .lib.catalog_cache import CatalogCache
+from .lib.stream_resume import StreamMetrics
+from .lib.response_cache import ResponseCache
 
 __all__ = [
     "Timeout",
@@ -54,6 +76,8 @@ __all__ = [
     "AsyncClient",
 ]
 
+log: logging.Logger = logging.getLogger(__name__)
+
 
 class SwarmsClient(SyncAPIClient):
     health: health.HealthResource
@@ -81,6 +105,40 @@ class SwarmsClient(SyncAPIClient):
         # We provide a `DefaultHttpxClient` class that you can pass to retain the default values we use for `limits`, `timeout` & `follow_redirects`.
         # See the [httpx documentation](https://www.python-httpx.org/api/#client) for more details.
         http_client: httpx.Client | None = None,
+        # Use HTTP/2, which multiplexes many concurrent requests over each connection. Requires the `http2` extra.
+        # This has no effect when a custom `http_client` is given, pass `http2=True` to that client instead.
+        http2: bool = False,
+        # Wait locally instead of exceeding the per-minute, per-hour & per-day request limits of the API key.
+        # A limiter can be shared between multiple clients, see `RateLimiter` for details.
+        rate_limiter: RateLimiter | None = None,
+        # Record connection pool waits and connection reuse, see `PoolMetrics` for details.
+        pool_metrics: PoolMetrics | None = None,
+        # Record a breakdown of where the time of each request went, available as `response.timing` on raw responses.
+        request_timing: bool = False,
+        # Called with the `RequestTiming` of every successful request, implies `request_timing=True`.
+        on_timing: Callable[[RequestTiming], object] | None = None,
+        # Encode request bodies and decode responses with a faster JSON library, see `JSONCodec` for details.
+        # `"auto"` uses orjson or msgspec if either is installed, and the standard library otherwise.
+        json_codec: JSONCodec | JSONCodecName | None = None,
+        # Only decode large fields typed `object`, such as `SwarmRunResponse.output`, when they are first accessed; needs msgspec.
+        lazy_parsing: bool = False,
+        # The number of times a streamed response reconnects with `Last-Event-ID` after its connection drops.
+        max_stream_resumes: int = DEFAULT_MAX_STREAM_RESUMES,
+        # Count dropped connections, resumes and replayed events of streamed responses, see `StreamMetrics` for details.
+        stream_metrics: StreamMetrics | None = None,
+        # Abort a streamed response that sends nothing, not even a heartbeat comment, for this many seconds.
+        # Unlike the `read` timeout, this doesn't apply to the wait for the response headers.
+        stream_idle_timeout: float | None = None,
+        # Answer repeated run requests from a local cache, see `ResponseCache` for details.
+        response_cache: ResponseCache | None = None,
+        # Cache the model and swarm type catalogs, see `CatalogCache` for details.
+        catalog_cache: CatalogCache | None = None,
+        # Validate swarm and agent specs against the catalogs before sending them, see `Preflight` for details.
+        preflight: Preflight | None = None,
+        # Share one request between identical run requests that are in flight at the same time, see `Singleflight`.
+        singleflight: Singleflight | None = None,
+        # Send a second request when a read-only `GET` request is slower than usual, see `Hedging` for details.
+        hedging: Hedging | None = None,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -110,8 +168,23 @@ class SwarmsClient(SyncAPIClient):
             max_retries=max_retries,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
             custom_headers=default_headers,
             custom_query=default_query,
+            rate_limiter=rate_limiter,
+            pool_metrics=pool_metrics,
+            request_timing=request_timing,
+            on_timing=on_timing,
+            json_codec=json_codec,
+            lazy_parsing=lazy_parsing,
+            max_stream_resumes=max_stream_resumes,
+            stream_metrics=stream_metrics,
+            stream_idle_timeout=stream_idle_timeout,
+            response_cache=response_cache,
+            catalog_cache=catalog_cache,
+            preflight=preflight,
+            singleflight=singleflight,
+            hedging=hedging,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -157,6 +230,22 @@ class SwarmsClient(SyncAPIClient):
             '"Could not resolve authentication method. Expected the api_key to be set. Or for the `x-api-key` headers to be explicitly omitted"'
         )
 
+    @override
+    def _prepare_options(self, options: FinalRequestOptions) -> FinalRequestOptions:
+        options = super()._prepare_options(options)
+
+        rate_limiter = self._rate_limiter
+        if rate_limiter is not None and options.url != RATE_LIMITS_PATH:
+            if rate_limiter.should_sync():
+                try:
+                    rate_limiter.sync(self.client.rate.get_limits())
+                except Exception:
+                    log.debug("Could not sync the client-side rate limiter", exc_info=True)
+
+            rate_limiter.acquire()
+
+        return options
+
     def copy(
         self,
         *,
@@ -164,6 +253,21 @@ class SwarmsClient(SyncAPIClient):
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.Client | None = None,
+        http2: bool | None = None,
+        rate_limiter: RateLimiter | None = None,
+        pool_metrics: PoolMetrics | None = None,
+        request_timing: bool | None = None,
+        on_timing: Callable[[RequestTiming], object] | None = None,
+        json_codec: JSONCodec | JSONCodecName | None = None,
+        lazy_parsing: bool | None = None,
+        max_stream_resumes: int | None = None,
+        stream_metrics: StreamMetrics | None = None,
+        stream_idle_timeout: float | None = None,
+        response_cache: ResponseCache | None = None,
+        catalog_cache: CatalogCache | None = None,
+        preflight: Preflight | None = None,
+        singleflight: Singleflight | None = None,
+        hedging: Hedging | None = None,
         max_retries: int | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
@@ -196,12 +300,29 @@ class SwarmsClient(SyncAPIClient):
         elif set_default_query is not None:
             params = set_default_query
 
-        http_client = http_client or self._client
+        http2 = self._http2 if http2 is None else http2
+        if http_client is None and http2 == self._http2:
+            http_client = self._client
         return self.__class__(
             api_key=api_key or self.api_key,
             base_url=base_url or self.base_url,
             timeout=self.timeout if isinstance(timeout, NotGiven) else timeout,
             http_client=http_client,
+            http2=http2,
+            rate_limiter=rate_limiter or self._rate_limiter,
+            pool_metrics=pool_metrics or self._pool_metrics,
+            request_timing=self._request_timing if request_timing is None else request_timing,
+            on_timing=on_timing or self._on_timing,
+            json_codec=json_codec or self._json_codec,
+            lazy_parsing=self._lazy_parsing if lazy_parsing is None else lazy_parsing,
+            max_stream_resumes=self._max_stream_resumes if max_stream_resumes is None else max_stream_resumes,
+            stream_metrics=stream_metrics or self._stream_metrics,
+            stream_idle_timeout=self._stream_idle_timeout if stream_idle_timeout is None else stream_idle_timeout,
+            response_cache=response_cache or self._response_cache,
+            catalog_cache=catalog_cache or self._catalog_cache,
+            preflight=preflight or self._preflight,
+            singleflight=singleflight or self._singleflight,
+            hedging=hedging or self._hedging,
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
             default_headers=headers,
             default_query=params,
@@ -212,6 +333,43 @@ class SwarmsClient(SyncAPIClient):
     # client.with_options(timeout=10).foo.create(...)
     with_options = copy
 
+    def warmup(self, connections: int = DEFAULT_WARMUP_CONNECTIONS) -> int:
+        """
+        Open keep-alive connections to the API ahead of time, so that the next requests
+        don't have to wait for DNS resolution and the TCP & TLS handshakes.
+
+        Returns the number of connections that were opened; errors are only logged.
+
+        Args:
+          connections: The number of connections to open, this should not exceed the
+              `max_keepalive_connections` of the connection pool.
+        """
+        return warm_connections(self, connections)
+
+    def keepalive(
+        self,
+        *,
+        interval: float = DEFAULT_KEEPALIVE_INTERVAL,
+        connections: int = DEFAULT_WARMUP_CONNECTIONS,
+    ) -> KeepAlive:
+        """
+        Start warming up `connections` connections every `interval` seconds from a
+        background thread, so that idle pooled connections aren't closed before the
+        next burst of requests arrives.
+
+        ```py
+        with client.keepalive(connections=8):
+            ...
+        ```
+
+        Args:
+          interval: The number of seconds between pings, this should be lower than the
+              `keepalive_expiry` of the connection pool.
+
+          connections: The number of connections to keep open.
+        """
+        return KeepAlive(self, interval=interval, connections=connections)
+
     def get_root(
         self,
         *,
@@ -302,6 +460,43 @@ class AsyncSwarmsClient(AsyncAPIClient):
         # We provide a `DefaultAsyncHttpxClient` class that you can pass to retain the default values we use for `limits`, `timeout` & `follow_redirects`.
         # See the [httpx documentation](https://www.python-httpx.org/api/#asyncclient) for more details.
         http_client: httpx.AsyncClient | None = None,
+        # Use HTTP/2, which multiplexes many concurrent requests over each connection. Requires the `http2` extra.
+        # This has no effect when a custom `http_client` is given, pass `http2=True` to that client instead.
+        http2: bool = False,
+        # Wait locally instead of exceeding the per-minute, per-hour & per-day request limits of the API key.
+        # A limiter can be shared between multiple clients, see `RateLimiter` for details.
+        rate_limiter: RateLimiter | None = None,
+        # Record connection pool waits and connection reuse, see `PoolMetrics` for details.
+        pool_metrics: PoolMetrics | None = None,
+        # Record a breakdown of where the time of each request went, available as `response.timing` on raw responses.
+        request_timing: bool = False,
+        # Called with the `RequestTiming` of every successful request, implies `request_timing=True`.
+        on_timing: Callable[[RequestTiming], object] | None = None,
+        # Encode request bodies and decode responses with a faster JSON library, see `JSONCodec` for details.
+        # `"auto"` uses orjson or msgspec if either is installed, and the standard library otherwise.
+        json_codec: JSONCodec | JSONCodecName | None = None,
+        # Only decode large fields typed `object`, such as `SwarmRunResponse.output`, when they are first accessed; needs msgspec.
+        lazy_parsing: bool = False,
+        # The number of times a streamed response reconnects with `Last-Event-ID` after its connection drops.
+        max_stream_resumes: int = DEFAULT_MAX_STREAM_RESUMES,
+        # Count dropped connections, resumes and replayed events of streamed responses, see `StreamMetrics` for details.
+        stream_metrics: StreamMetrics | None = None,
+        # Abort a streamed response that sends nothing, not even a heartbeat comment, for this many seconds.
+        # Unlike the `read` timeout, this doesn't apply to the wait for the response headers.
+        stream_idle_timeout: float | None = None,
+        # Answer repeated run requests from a local cache, see `ResponseCache` for details.
+        response_cache: ResponseCache | None = None,
+        # Cache the model and swarm type catalogs, see `CatalogCache` for details.
+        catalog_cache: CatalogCache | None = None,
+        # Validate swarm and agent specs against the catalogs before sending them, see `Preflight` for details.
+        preflight: Preflight | None = None,
+        # Share one request between identical run requests that are in flight at the same time, see `Singleflight`.
+        singleflight: Singleflight | None = None,
+        # Send a second request when a read-only `GET` request is slower than usual, see `Hedging` for details.
+        hedging: Hedging | None = None,
+        # Adaptively limit the number of requests in flight based on latency and overload responses.
+        # A limiter can be shared between multiple clients, see `AdaptiveConcurrencyLimiter` for details.
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
         # Enable or disable schema validation for data returned by the API.
         # When enabled an error APIResponseValidationError is raised
         # if the API responds with invalid data for the expected schema.
@@ -331,8 +526,24 @@ class AsyncSwarmsClient(AsyncAPIClient):
             max_retries=max_retries,
             timeout=timeout,
             http_client=http_client,
+            http2=http2,
             custom_headers=default_headers,
             custom_query=default_query,
+            rate_limiter=rate_limiter,
+            pool_metrics=pool_metrics,
+            request_timing=request_timing,
+            on_timing=on_timing,
+            json_codec=json_codec,
+            lazy_parsing=lazy_parsing,
+            max_stream_resumes=max_stream_resumes,
+            stream_metrics=stream_metrics,
+            stream_idle_timeout=stream_idle_timeout,
+            response_cache=response_cache,
+            catalog_cache=catalog_cache,
+            preflight=preflight,
+            singleflight=singleflight,
+            hedging=hedging,
+            concurrency_limiter=concurrency_limiter,
             _strict_response_validation=_strict_response_validation,
         )
 
@@ -378,6 +589,22 @@ class AsyncSwarmsClient(AsyncAPIClient):
             '"Could not resolve authentication method. Expected the api_key to be set. Or for the `x-api-key` headers to be explicitly omitted"'
         )
 
+    @override
+    async def _prepare_options(self, options: FinalRequestOptions) -> FinalRequestOptions:
+        options = await super()._prepare_options(options)
+
+        rate_limiter = self._rate_limiter
+        if rate_limiter is not None and options.url != RATE_LIMITS_PATH:
+            if rate_limiter.should_sync():
+                try:
+                    rate_limiter.sync(await self.client.rate.get_limits())
+                except Exception:
+                    log.debug("Could not sync the client-side rate limiter", exc_info=True)
+
+            await rate_limiter.aacquire()
+
+        return options
+
     def copy(
         self,
         *,
@@ -385,6 +612,22 @@ class AsyncSwarmsClient(AsyncAPIClient):
         base_url: str | httpx.URL | None = None,
         timeout: float | Timeout | None | NotGiven = NOT_GIVEN,
         http_client: httpx.AsyncClient | None = None,
+        http2: bool | None = None,
+        rate_limiter: RateLimiter | None = None,
+        pool_metrics: PoolMetrics | None = None,
+        request_timing: bool | None = None,
+        on_timing: Callable[[RequestTiming], object] | None = None,
+        json_codec: JSONCodec | JSONCodecName | None = None,
+        lazy_parsing: bool | None = None,
+        max_stream_resumes: int | None = None,
+        stream_metrics: StreamMetrics | None = None,
+        stream_idle_timeout: float | None = None,
+        response_cache: ResponseCache | None = None,
+        catalog_cache: CatalogCache | None = None,
+        preflight: Preflight | None = None,
+        singleflight: Singleflight | None = None,
+        hedging: Hedging | None = None,
+        concurrency_limiter: AdaptiveConcurrencyLimiter | None = None,
         max_retries: int | NotGiven = NOT_GIVEN,
         default_headers: Mapping[str, str] | None = None,
         set_default_headers: Mapping[str, str] | None = None,
@@ -417,12 +660,30 @@ class AsyncSwarmsClient(AsyncAPIClient):
         elif set_default_query is not None:
             params = set_default_query
 
-        http_client = http_client or self._client
+        http2 = self._http2 if http2 is None else http2
+        if http_client is None and http2 == self._http2:
+            http_client = self._client
         return self.__class__(
             api_key=api_key or self.api_key,
             base_url=base_url or self.base_url,
             timeout=self.timeout if isinstance(timeout, NotGiven) else timeout,
             http_client=http_client,
+            http2=http2,
+            rate_limiter=rate_limiter or self._rate_limiter,
+            pool_metrics=pool_metrics or self._pool_metrics,
+            request_timing=self._request_timing if request_timing is None else request_timing,
+            on_timing=on_timing or self._on_timing,
+            json_codec=json_codec or self._json_codec,
+            lazy_parsing=self._lazy_parsing if lazy_parsing is None else lazy_parsing,
+            max_stream_resumes=self._max_stream_resumes if max_stream_resumes is None else max_stream_resumes,
+            stream_metrics=stream_metrics or self._stream_metrics,
+            stream_idle_timeout=self._stream_idle_timeout if stream_idle_timeout is None else stream_idle_timeout,
+            response_cache=response_cache or self._response_cache,
+            catalog_cache=catalog_cache or self._catalog_cache,
+            preflight=preflight or self._preflight,
+            singleflight=singleflight or self._singleflight,
+            hedging=hedging or self._hedging,
+            concurrency_limiter=concurrency_limiter or self._concurrency_limiter,
             max_retries=max_retries if is_given(max_retries) else self.max_retries,
             default_headers=headers,
             default_query=params,
@@ -433,6 +694,43 @@ class AsyncSwarmsClient(AsyncAPIClient):
     # client.with_options(timeout=10).foo.create(...)
     with_options = copy
 
+    async def warmup(self, connections: int = DEFAULT_WARMUP_CONNECTIONS) -> int:
+        """
+        Open keep-alive connections to the API ahead of time, so that the next requests
+        don't have to wait for DNS resolution and the TCP & TLS handshakes.
+
+        Returns the number of connections that were opened; errors are only logged.
+
+        Args:
+          connections: The number of connections to open, this should not exceed the
+              `max_keepalive_connections` of the connection pool.
+        """
+        return await async_warm_connections(self, connections)
+
+    def keepalive(
+        self,
+        *,
+        interval: float = DEFAULT_KEEPALIVE_INTERVAL,
+        connections: int = DEFAULT_WARMUP_CONNECTIONS,
+    ) -> AsyncKeepAlive:
+        """
+        Warm up `connections` connections every `interval` seconds from a background
+        task for as long as the returned context manager is entered, so that idle pooled
+        connections aren't closed before the next burst of requests arrives.
+
+        ```py
+        async with client.keepalive(connections=8):
+            ...
+        ```
+
+        Args:
+          interval: The number of seconds between pings, this should be lower than the
+              `keepalive_expiry` of the connection pool.
+
+          connections: The number of connections to keep open.
+        """
+        return AsyncKeepAlive(self, interval=interval, connections=connections)
+
     async def get_root(
         self,
         *,
@@ -8,9 +8,15 @@ OVERRIDE_CAST_TO_HEADER = "____stainless_override_cast_to"
 # default timeout is 1 minute
 DEFAULT_TIMEOUT = httpx.Timeout(timeout=60, connect=5.0)
 DEFAULT_MAX_RETRIES = 2
+DEFAULT_MAX_STREAM_RESUMES = 2
 DEFAULT_CONNECTION_LIMITS = httpx.Limits(
     max_connections=100, max_keepalive_connections=20
 )
 
+# with HTTP/2 many requests share each connection, so far fewer connections are needed
+# and they can be kept alive for longer
+DEFAULT_HTTP2_CONNECTION_LIMITS = httpx.Limits(max_connections=10, max_keepalive_connections=10, keepalive_expiry=30.0)
+DEFAULT_HTTP2_MAX_STREAMS = 100
+
 INITIAL_RETRY_DELAY = 0.5
 MAX_RETRY_DELAY = 8.0
@@ -8,6 +8,7 @@ from typing import (
     Type,
     Union,
     Generic,
+    Mapping,
     TypeVar,
     Callable,
     Optional,
@@ -199,61 +200,7 @@ class BaseModel(pydantic.BaseModel):
         _fields_set: set[str] | None = None,
         **values: object,
     ) -> ModelT:
-        m = __cls.__new__(__cls)
-        fields_values: dict[str, object] = {}
-
-        config = get_model_config(__cls)
-        populate_by_name = (
-            config.allow_population_by_field_name
-            if isinstance(config, _ConfigProtocol)
-            else config.get("populate_by_name")
-        )
-
-        if _fields_set is None:
-            _fields_set = set()
-
-        model_fields = get_model_fields(__cls)
-        for name, field in model_fields.items():
-            key = field.alias
-            if key is None or (key not in values and populate_by_name):
-                key = name
-
-            if key in values:
-                fields_values[name] = _construct_field(
-                    value=values[key], field=field, key=key
-                )
-                _fields_set.add(name)
-            else:
-                fields_values[name] = field_get_default(field)
-
-        extra_field_type = _get_extra_fields_type(__cls)
-
-        _extra = {}
-        for key, value in values.items():
-            if key not in model_fields:
-                parsed = construct_type(value=value, type_=extra_field_type) if extra_field_type is not None else value
-
-                if PYDANTIC_V2:
-                    _extra[key] = parsed
-                else:
-                    _fields_set.add(key)
-                    fields_values[key] = parsed
-
-        object.__setattr__(m, "__dict__", fields_values)
-
-        if PYDANTIC_V2:
-            # these properties are copied from Pydantic's `model_construct()` method
-            object.__setattr__(m, "__pydantic_private__", None)
-            object.__setattr__(m, "__pydantic_extra__", _extra)
-            object.__setattr__(m, "__pydantic_fields_set__", _fields_set)
-        else:
-            # init_private_attributes() does not exist in v2
-            m._init_private_attributes()  # type: ignore
-
-            # copied from Pydantic v1's `construct()` method
-            object.__setattr__(m, "__fields_set__", _fields_set)
-
-        return m
+        return cast(ModelT, _get_model_constructor(__cls)(values, _fields_set))
 
     if not TYPE_CHECKING:
         # type checkers incorrectly complain about this assignment
@@ -377,21 +324,111 @@ class BaseModel(pydantic.BaseModel):
             )
 
 
-def _construct_field(value: object, field: FieldInfo, key: str) -> object:
-    if value is None:
-        return field_get_default(field)
+_base_model_construct = BaseModel.construct.__func__  # type: ignore[attr-defined]
 
-    if PYDANTIC_V2:
-        type_ = field.annotation
-    else:
-        type_ = cast(type, field.outer_type_)  # type: ignore
 
-    if type_ is None:
-        raise RuntimeError(f"Unexpected field type is None for {key}")
+class _ModelConstructor:
+    """Builds instances of a model class from API data without validation, see `BaseModel.construct()`.
 
-    return construct_type(
-        value=value, type_=type_, metadata=getattr(field, "metadata", None)
-    )
+    The model config, fields and the construction plans of their types are resolved on first use,
+    instead of for every instance, and again if the model is rebuilt.
+    """
+
+    def __init__(self, cls: type[pydantic.BaseModel]) -> None:
+        self._cls = cls
+        self._model_fields: dict[str, FieldInfo] | None = None
+
+    def _compile(self, model_fields: dict[str, FieldInfo]) -> None:
+        config = get_model_config(self._cls)
+        self._populate_by_name = (
+            config.allow_population_by_field_name
+            if isinstance(config, _ConfigProtocol)
+            else config.get("populate_by_name")
+        )
+
+        fields: list[tuple[str, str | None, _ConstructPlan | None, FieldInfo]] = []
+        for name, field in model_fields.items():
+            if PYDANTIC_V2:
+                type_ = field.annotation
+            else:
+                type_ = cast(type, field.outer_type_)  # type: ignore
+
+            plan = None if type_ is None else _get_construct_plan(type_, tuple(getattr(field, "metadata", None) or ()))
+            fields.append((name, field.alias, plan, field))
+
+        extra_field_type = _get_extra_fields_type(self._cls)
+        self._fields = fields
+        self._extra_plan = None if extra_field_type is None else _get_construct_plan(extra_field_type, ())
+
+        # a model with unresolved forward references may still change when it is rebuilt
+        if getattr(self._cls, "__pydantic_complete__", True):
+            self._model_fields = model_fields
+
+    def __call__(self, values: Mapping[str, object], fields_set: set[str] | None = None) -> Any:
+        model_fields = get_model_fields(self._cls)
+        if model_fields is not self._model_fields:
+            self._compile(model_fields)
+
+        cls = self._cls
+        m = cls.__new__(cls)
+        fields_values: dict[str, object] = {}
+        populate_by_name = self._populate_by_name
+
+        if fields_set is None:
+            fields_set = set()
+
+        for name, key, plan, field in self._fields:
+            if key is None or (key not in values and populate_by_name):
+                key = name
+
+            if key in values:
+                value = values[key]
+                if value is None:
+                    fields_values[name] = field_get_default(field)
+                elif plan is None:
+                    raise RuntimeError(f"Unexpected field type is None for {key}")
+                else:
+                    fields_values[name] = plan(value)
+                fields_set.add(name)
+            else:
+                fields_values[name] = field_get_default(field)
+
+        extra_plan = self._extra_plan
+        _extra = {}
+        for key, value in values.items():
+            if key not in model_fields:
+                if not isinstance(key, str):
+                    # `cls.construct(**values)` would fail the same way
+                    raise TypeError("keywords must be strings")
+
+                parsed = value if extra_plan is None else extra_plan(value)
+
+                if PYDANTIC_V2:
+                    _extra[key] = parsed
+                else:
+                    fields_set.add(key)
+                    fields_values[key] = parsed
+
+        object.__setattr__(m, "__dict__", fields_values)
+
+        if PYDANTIC_V2:
+            # these properties are copied from Pydantic's `model_construct()` method
+            object.__setattr__(m, "__pydantic_private__", None)
+            object.__setattr__(m, "__pydantic_extra__", _extra)
+            object.__setattr__(m, "__pydantic_fields_set__", fields_set)
+        else:
+            # init_private_attributes() does not exist in v2
+            m._init_private_attributes()  # type: ignore
+
+            # copied from Pydantic v1's `construct()` method
+            object.__setattr__(m, "__fields_set__", fields_set)
+
+        return m
+
+
+@lru_cache(maxsize=8096)
+def _get_model_constructor(cls: type[pydantic.BaseModel]) -> _ModelConstructor:
+    return _ModelConstructor(cls)
 
 
 def _get_extra_fields_type(cls: type[pydantic.BaseModel]) -> type | None:
@@ -469,26 +506,55 @@ def construct_type(
 
     If the given value does not match the expected type then it is returned as-is.
     """
+    meta: tuple[Any, ...] = tuple(metadata) if metadata else ()
+    return _get_construct_plan(cast("type[object]", type_), meta)(value)
+
 
+_ConstructPlan = Callable[[object], object]
+
+# the types that `validate_type()` returns values of as is, when a union has one of them as a
+# variant and the value is of exactly that type
+_PASSTHROUGH_VARIANTS = frozenset({str, int, float, bool, type(None)})
+
+# returned by union fast paths for values that have to be validated
+_VALIDATE = object()
+
+
+def _construct_as_is(value: object) -> object:
+    return value
+
+
+def _get_construct_plan(type_: type[object], meta: tuple[Any, ...]) -> _ConstructPlan:
+    try:
+        return _cached_construct_plan(type_, meta)
+    except TypeError:
+        # e.g. `Annotated` metadata that can't be hashed
+        return _compile_construct_plan(type_, meta)
+
+
+@lru_cache(maxsize=8096)
+def _cached_construct_plan(type_: type[object], meta: tuple[Any, ...]) -> _ConstructPlan:
+    return _compile_construct_plan(type_, meta)
+
+
+def _compile_construct_plan(type_: type[object], meta: tuple[Any, ...]) -> _ConstructPlan:
+    """Compiles the coercion `construct_type()` applies to values of the given type.
+
+    Everything that only depends on the type, e.g. unwrapping `Annotated` types, resolving
+    generic origins & args and union variants, is done once per type instead of for every value.
+    """
     # store a reference to the original type we were given before we extract any inner
     # types so that we can properly resolve forward references in `TypeAliasType` annotations
     original_type = None
 
-    # we allow `object` as the input type because otherwise, passing things like
-    # `Literal['value']` will be reported as a type error by type checkers
-    type_ = cast("type[object]", type_)
     if is_type_alias_type(type_):
         original_type = type_  # type: ignore[unreachable]
         type_ = type_.__value__  # type: ignore[unreachable]
 
     # unwrap `Annotated[T, ...]` -> `T`
-    if metadata is not None and len(metadata) > 0:
-        meta: tuple[Any, ...] = tuple(metadata)
-    elif is_annotated_type(type_):
+    if not meta and is_annotated_type(type_):
         meta = get_args(type_)[1:]
         type_ = extract_type_arg(type_, 0)
-    else:
-        meta = tuple()
 
     # we need to use the origin class for any types that are subscripted generics
     # e.g. Dict[str, object]
@@ -496,10 +562,77 @@ def construct_type(
     args = get_args(type_)
 
     if is_union(origin):
+        return _compile_union_plan(cast("type[object]", original_type or type_), type_, args, meta)
+
+    if origin == dict:
+        items_plan: _ConstructPlan | None = None
+
+        def dict_plan(value: object) -> object:
+            nonlocal items_plan
+
+            if type(value) is not dict and not is_mapping(value):
+                return value
+            if items_plan is None:
+                _, items_type = args  # Dict[_, items_type]
+                items_plan = _get_construct_plan(items_type, ())
+            if items_plan is _construct_as_is:
+                return dict(value)
+            return {key: items_plan(item) for key, item in value.items()}
+
+        return dict_plan
+
+    if (
+        not is_literal_type(type_)
+        and inspect.isclass(origin)
+        and (issubclass(origin, BaseModel) or issubclass(origin, GenericModel))
+    ):
+        return _compile_model_plan(cast(Any, type_))
+
+    if origin == list:
+        inner_plan: _ConstructPlan | None = None
+
+        def list_plan(value: object) -> object:
+            nonlocal inner_plan
+
+            if not is_list(value):
+                return value
+            if inner_plan is None:
+                inner_plan = _get_construct_plan(args[0], ())  # List[inner_type]
+            if inner_plan is _construct_as_is:
+                return list(value)
+            return [inner_plan(entry) for entry in value]
+
+        return list_plan
+
+    if origin == float:
+        return _construct_float
+
+    if type_ == datetime:
+        return _construct_datetime
+
+    if type_ == date:
+        return _construct_date
+
+    return _construct_as_is
+
+
+def _compile_union_plan(validate_as: type, type_: type, args: tuple[Any, ...], meta: tuple[Any, ...]) -> _ConstructPlan:
+    # resolved on first use, as variants may refer back to this union through a type alias
+    variant_plans: list[_ConstructPlan] | None = None
+    discriminator: list[DiscriminatorDetails | None] = []
+
+    fast_path = _compile_union_fast_path(args)
+
+    def union_plan(value: object) -> object:
+        nonlocal variant_plans
+
+        if fast_path is not None:
+            result = fast_path(value)
+            if result is not _VALIDATE:
+                return result
+
         try:
-            return validate_type(
-                type_=cast("type[object]", original_type or type_), value=value
-            )
+            return validate_type(type_=validate_as, value=value)
         except Exception:
             pass
 
@@ -517,83 +650,131 @@ def construct_type(
         #
         # without this block, if the data we get is something like `{'kind': 'bar', 'value': 'foo'}` then
         # we'd end up constructing `FooType` when it should be `BarType`.
-        discriminator = _build_discriminated_union_meta(
-            union=type_, meta_annotations=meta
-        )
-        if discriminator and is_mapping(value):
-            variant_value = value.get(
-                discriminator.field_alias_from or discriminator.field_name
+        if not discriminator:
+            discriminator.append(
+                _build_discriminated_union_meta(union=type_, meta_annotations=meta)
             )
+        details = discriminator[0]
+        if details and is_mapping(value):
+            variant_value = value.get(details.field_alias_from or details.field_name)
             if variant_value and isinstance(variant_value, str):
-                variant_type = discriminator.mapping.get(variant_value)
+                variant_type = details.mapping.get(variant_value)
                 if variant_type:
                     return construct_type(type_=variant_type, value=value)
 
+        if variant_plans is None:
+            variant_plans = [_get_construct_plan(variant, ()) for variant in args]
+
         # if the data is not valid, use the first variant that doesn't fail while deserializing
-        for variant in args:
+        for variant_plan in variant_plans:
             try:
-                return construct_type(value=value, type_=variant)
+                return variant_plan(value)
             except Exception:
                 continue
 
         raise RuntimeError(f"Could not convert data into a valid instance of {type_}")
 
-    if origin == dict:
-        if not is_mapping(value):
-            return value
+    return union_plan
 
-        _, items_type = get_args(type_)  # Dict[_, items_type]
-        return {
-            key: construct_type(value=item, type_=items_type)
-            for key, item in value.items()
-        }
 
-    if (
-        not is_literal_type(type_)
-        and inspect.isclass(origin)
-        and (issubclass(origin, BaseModel) or issubclass(origin, GenericModel))
-    ):
+def _compile_union_fast_path(args: tuple[Any, ...]) -> _ConstructPlan | None:
+    """Returns a plan that gives the same result as `validate_type()` for the common values of
+    simple unions, e.g. `Optional[str]`, without going through pydantic.
+
+    The plan returns `_VALIDATE` for any other value.
+    """
+    if not PYDANTIC_V2:
+        # pydantic v1 coerces values to the first variant that accepts them, e.g. `5` to `"5"`
+        return None
+
+    variants = set(args)
+    if variants <= _PASSTHROUGH_VARIANTS:
+        exact_types = frozenset(variants)
+        to_float = float in variants and int not in variants and bool not in variants
+
+        def passthrough(value: object) -> object:
+            # smart mode unions return values that are an exact match for a variant as is
+            if type(value) in exact_types:
+                return value
+            if to_float and type(value) is int:
+                try:
+                    return float(value)  # type: ignore[arg-type]
+                except OverflowError:
+                    pass
+            return _VALIDATE
+
+        return passthrough
+
+    variants.discard(type(None))
+    if len(variants) != 1:
+        return None
+
+    (variant,) = variants
+    if variant is object or variant is Any:
+        return _construct_as_is
+
+    if get_origin(variant) is dict and get_args(variant) in ((str, object), (str, Any)):
+
+        def copy_dict(value: object) -> object:
+            if type(value) is dict and all(type(key) is str for key in value):
+                return dict(value)
+            return _VALIDATE
+
+        return copy_dict
+
+    return None
+
+
+def _compile_model_plan(type_: Any) -> _ConstructPlan:
+    constructor = (
+        _get_model_constructor(type_) if getattr(type_.construct, "__func__", None) is _base_model_construct else None
+    )
+
+    def construct_model(entry: Mapping[str, object]) -> object:
+        if constructor is None or "_fields_set" in entry:
+            # the class overrides `construct()`, or the data would clash with its arguments
+            return type_.construct(**entry)
+        return constructor(entry)
+
+    def model_plan(value: object) -> object:
         if is_list(value):
             return [
-                cast(Any, type_).construct(**entry) if is_mapping(entry) else entry
+                construct_model(entry)
+                if type(entry) is dict or is_mapping(entry)
+                else entry
                 for entry in value
             ]
 
-        if is_mapping(value):
-            if issubclass(type_, BaseModel):
-                return type_.construct(**value)  # type: ignore[arg-type]
+        if type(value) is dict or is_mapping(value):
+            return construct_model(value)
+
+        return value
 
-            return cast(Any, type_).construct(**value)
+    return model_plan
 
-    if origin == list:
-        if not is_list(value):
+
+def _construct_float(value: object) -> object:
+    if isinstance(value, int):
+        coerced = float(value)
+        if coerced != value:
             return value
+        return coerced
 
-        inner_type = args[0]  # List[inner_type]
-        return [construct_type(value=entry, type_=inner_type) for entry in value]
+    return value
 
-    if origin == float:
-        if isinstance(value, int):
-            coerced = float(value)
-            if coerced != value:
-                return value
-            return coerced
 
+def _construct_datetime(value: object) -> object:
+    try:
+        return parse_datetime(value)  # type: ignore
+    except Exception:
         return value
 
-    if type_ == datetime:
-        try:
-            return parse_datetime(value)  # type: ignore
-        except Exception:
-            return value
 
-    if type_ == date:
-        try:
-            return parse_date(value)  # type: ignore
-        except Exception:
-            return value
-
-    return value
+def _construct_date(value: object) -> object:
+    try:
+        return parse_date(value)  # type: ignore
+    except Exception:
+        return value
 
 
 @runtime_checkable
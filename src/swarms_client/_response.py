@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import time
 import inspect
 import logging
 import datetime
@@ -41,9 +42,11 @@ from ._streaming import (
     extract_stream_chunk_type,
 )
 from ._exceptions import SwarmsClientError, APIResponseValidationError
+from .lib.lazy_parsing import construct_lazy
 
 if TYPE_CHECKING:
     from ._models import FinalRequestOptions
+    from .lib.timing import RequestTiming
     from ._base_client import BaseClient
 
 
@@ -69,6 +72,9 @@ class BaseAPIResponse(Generic[R]):
     retries_taken: int
     """The number of retries made. If no retries happened this will be `0`"""
 
+    timing: RequestTiming | None
+    """The timing breakdown of the request, if the client was created with `request_timing=True`"""
+
     def __init__(
         self,
         *,
@@ -79,6 +85,7 @@ class BaseAPIResponse(Generic[R]):
         stream_cls: type[Stream[Any]] | type[AsyncStream[Any]] | None,
         options: FinalRequestOptions,
         retries_taken: int = 0,
+        timing: RequestTiming | None = None,
     ) -> None:
         self._cast_to = cast_to
         self._client = client
@@ -88,6 +95,7 @@ class BaseAPIResponse(Generic[R]):
         self._options = options
         self.http_response = raw
         self.retries_taken = retries_taken
+        self.timing = timing
 
     @property
     def headers(self) -> httpx.Headers:
@@ -252,7 +260,7 @@ class BaseAPIResponse(Generic[R]):
         if not content_type.endswith("json"):
             if is_basemodel(cast_to):
                 try:
-                    data = response.json()
+                    data = self._client._decode_json(response)
                 except Exception as exc:
                     log.debug(
                         "Could not read JSON from response data due to %s - %s",
@@ -278,13 +286,43 @@ class BaseAPIResponse(Generic[R]):
             # handle the response however you need to.
             return response.text  # type: ignore
 
-        data = response.json()
+        timing = self.timing
+        if (
+            self._client._lazy_parsing
+            and not self._client._strict_response_validation
+            and inspect.isclass(cast_to)
+            and issubclass(cast_to, BaseModel)
+        ):
+            started = time.perf_counter()
+            model = construct_lazy(cast_to, response.content, self._client._loads_json)
+            if model is not None:
+                if timing is not None:
+                    # the body is only partially decoded, which is all counted as decoding
+                    timing.decode = time.perf_counter() - started
+                    timing.construct = 0.0
+                return cast(R, model)
+
+        if timing is None:
+            data = self._client._decode_json(response)
+
+            return self._client._process_response_data(
+                data=data,
+                cast_to=cast_to,  # type: ignore
+                response=response,
+            )
 
-        return self._client._process_response_data(
-            data=data,
-            cast_to=cast_to,  # type: ignore
-            response=response,
-        )
+        started = time.perf_counter()
+        data = self._client._decode_json(response)
+        decoded = time.perf_counter()
+        try:
+            return self._client._process_response_data(
+                data=data,
+                cast_to=cast_to,  # type: ignore
+                response=response,
+            )
+        finally:
+            timing.decode = decoded - started
+            timing.construct = time.perf_counter() - decoded
 
 
 class APIResponse(BaseAPIResponse[R]):
@@ -357,7 +395,7 @@ class APIResponse(BaseAPIResponse[R]):
     def json(self) -> object:
         """Read and decode the JSON response content."""
         self.read()
-        return self.http_response.json()
+        return self._client._decode_json(self.http_response)
 
     def close(self) -> None:
         """Close the response and release the connection.
@@ -457,7 +495,7 @@ class AsyncAPIResponse(BaseAPIResponse[R]):
     async def json(self) -> object:
         """Read and decode the JSON response content."""
         await self.read()
-        return self.http_response.json()
+        return self._client._decode_json(self.http_response)
 
     async def close(self) -> None:
         """Close the response and release the connection.
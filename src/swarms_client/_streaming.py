@@ -2,9 +2,19 @@
 from __future__ import annotations
 
 import json
+import time
 import inspect
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, Iterator, AsyncIterator, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Tuple,
+    Generic,
+    TypeVar,
+    Iterator,
+    AsyncIterator,
+    cast,
+)
 from typing_extensions import (
     Self,
     Protocol,
@@ -14,9 +24,22 @@ from typing_extensions import (
     runtime_checkable,
 )
 
+import anyio
 import httpx
 
-from ._utils import extract_type_var_from_base
+from ._utils import is_mapping, extract_type_var_from_base
+from .lib.timing import RequestTiming
+from ._exceptions import APIError
+from .lib.stream_tee import (
+    DEFAULT_TEE_BUFFER_SIZE,
+    TeePolicy,
+    TeeStream,
+    AsyncTeeStream,
+    tee_stream,
+    async_tee_stream,
+)
+from .lib.stream_idle import _apply_idle_timeout
+from .lib.stream_resume import _StreamResumeState
 
 if TYPE_CHECKING:
     from ._client import SwarmsClient, AsyncSwarmsClient
@@ -43,8 +66,15 @@ class Stream(Generic[_T]):
         self._cast_to = cast_to
         self._client = client
         self._decoder = client._make_sse_decoder()
+        self._resume = _StreamResumeState(max_resumes=client._max_stream_resumes, metrics=client._stream_metrics)
+        _apply_idle_timeout(response, client._stream_idle_timeout)
         self._iterator = self.__stream__()
 
+    @property
+    def resumes(self) -> int:
+        """The number of times the stream reconnected after its connection dropped."""
+        return self._resume.resumes
+
     def __next__(self) -> _T:
         return self._iterator.__next__()
 
@@ -53,21 +83,101 @@ class Stream(Generic[_T]):
             yield item
 
     def _iter_events(self) -> Iterator[ServerSentEvent]:
-        yield from self._decoder.iter_bytes(self.response.iter_bytes())
+        resume = self._resume
+        while True:
+            try:
+                for sse in self._decoder.iter_bytes(self.response.iter_bytes()):
+                    if resume.observe(sse):
+                        yield sse
+                return
+            except httpx.TransportError:
+                if not resume.disconnected():
+                    raise
+
+            self.response.close()
+            self._reconnect()
+
+    def _reconnect(self) -> None:
+        resume = self._resume
+        while True:
+            time.sleep(resume.delay)
+            request = resume.resume_request(self.response.request)
+            try:
+                response = self._send_resume(request)
+            except httpx.TransportError:
+                if not resume.disconnected():
+                    raise
+                continue
+
+            if response.is_success:
+                break
+
+            response.read()
+            response.close()
+            if not (self._client._should_retry(response) and resume.disconnected()):
+                raise self._client._make_status_error_from_response(response)
+
+        self.response = response
+        self._decoder = self._client._make_sse_decoder()
+        _apply_idle_timeout(response, self._client._stream_idle_timeout)
+        resume.resumed()
+
+    def _send_resume(self, request: httpx.Request) -> httpx.Response:
+        # a resume is a request of its own, so it's limited and measured like any other
+        client = self._client
+        if client._rate_limiter is not None:
+            client._rate_limiter.acquire()
+
+        timing = RequestTiming() if client._request_timing else None
+        response = client._send_request(request, stream=True, timing=timing)
+        if timing is not None:
+            client._finish_timing(timing, retries_taken=0)
+        return response
 
     def __stream__(self) -> Iterator[_T]:
         cast_to = cast(Any, self._cast_to)
-        response = self.response
         process_data = self._client._process_response_data
+        codec = self._client._json_codec
+        loads = json.loads if codec is None else codec.loads
         iterator = self._iter_events()
 
         for sse in iterator:
-            yield process_data(data=sse.json(), cast_to=cast_to, response=response)
+            # the data is parsed from the bytes it was received as, without decoding it to a `str` first
+            raw_data = sse.raw_data
+            if not raw_data:
+                # e.g. an event that only sets the `id` or `retry` of the stream
+                continue
+
+            if raw_data.startswith(b"[DONE]"):
+                break
+
+            data = loads(raw_data)
+            # the stream is read from a new response after every resume
+            response = self.response
+            if sse.event == "error":
+                raise _make_error(data, response)
+
+            yield process_data(data=data, cast_to=cast_to, response=response)
 
         # Ensure the entire stream is consumed
         for _sse in iterator:
             ...
 
+    def tee(
+        self,
+        n: int = 2,
+        *,
+        buffer_size: int = DEFAULT_TEE_BUFFER_SIZE,
+        policy: TeePolicy = "block",
+    ) -> Tuple[TeeStream[_T], ...]:
+        """Splits the stream into `n` streams that each yield every item.
+
+        The response is only read once, and every consumer buffers up to `buffer_size` items
+        that it hasn't received yet. `policy` decides what happens when a consumer falls
+        further behind, see `swarms_client.lib.stream_tee` for details.
+        """
+        return tee_stream(self, n, buffer_size=buffer_size, policy=policy)
+
     def __enter__(self) -> Self:
         return self
 
@@ -106,8 +216,15 @@ class AsyncStream(Generic[_T]):
         self._cast_to = cast_to
         self._client = client
         self._decoder = client._make_sse_decoder()
+        self._resume = _StreamResumeState(max_resumes=client._max_stream_resumes, metrics=client._stream_metrics)
+        _apply_idle_timeout(response, client._stream_idle_timeout)
         self._iterator = self.__stream__()
 
+    @property
+    def resumes(self) -> int:
+        """The number of times the stream reconnected after its connection dropped."""
+        return self._resume.resumes
+
     async def __anext__(self) -> _T:
         return await self._iterator.__anext__()
 
@@ -116,22 +233,101 @@ class AsyncStream(Generic[_T]):
             yield item
 
     async def _iter_events(self) -> AsyncIterator[ServerSentEvent]:
-        async for sse in self._decoder.aiter_bytes(self.response.aiter_bytes()):
-            yield sse
+        resume = self._resume
+        while True:
+            try:
+                async for sse in self._decoder.aiter_bytes(self.response.aiter_bytes()):
+                    if resume.observe(sse):
+                        yield sse
+                return
+            except httpx.TransportError:
+                if not resume.disconnected():
+                    raise
+
+            await self.response.aclose()
+            await self._reconnect()
+
+    async def _reconnect(self) -> None:
+        resume = self._resume
+        while True:
+            await anyio.sleep(resume.delay)
+            request = resume.resume_request(self.response.request)
+            try:
+                response = await self._send_resume(request)
+            except httpx.TransportError:
+                if not resume.disconnected():
+                    raise
+                continue
+
+            if response.is_success:
+                break
+
+            await response.aread()
+            await response.aclose()
+            if not (self._client._should_retry(response) and resume.disconnected()):
+                raise self._client._make_status_error_from_response(response)
+
+        self.response = response
+        self._decoder = self._client._make_sse_decoder()
+        _apply_idle_timeout(response, self._client._stream_idle_timeout)
+        resume.resumed()
+
+    async def _send_resume(self, request: httpx.Request) -> httpx.Response:
+        # a resume is a request of its own, so it's limited and measured like any other
+        client = self._client
+        if client._rate_limiter is not None:
+            await client._rate_limiter.aacquire()
+
+        timing = RequestTiming() if client._request_timing else None
+        response = await client._send_request(request, stream=True, timing=timing)
+        if timing is not None:
+            client._finish_timing(timing, retries_taken=0)
+        return response
 
     async def __stream__(self) -> AsyncIterator[_T]:
         cast_to = cast(Any, self._cast_to)
-        response = self.response
         process_data = self._client._process_response_data
+        codec = self._client._json_codec
+        loads = json.loads if codec is None else codec.loads
         iterator = self._iter_events()
 
         async for sse in iterator:
-            yield process_data(data=sse.json(), cast_to=cast_to, response=response)
+            # the data is parsed from the bytes it was received as, without decoding it to a `str` first
+            raw_data = sse.raw_data
+            if not raw_data:
+                # e.g. an event that only sets the `id` or `retry` of the stream
+                continue
+
+            if raw_data.startswith(b"[DONE]"):
+                break
+
+            data = loads(raw_data)
+            # the stream is read from a new response after every resume
+            response = self.response
+            if sse.event == "error":
+                raise _make_error(data, response)
+
+            yield process_data(data=data, cast_to=cast_to, response=response)
 
         # Ensure the entire stream is consumed
         async for _sse in iterator:
             ...
 
+    def tee(
+        self,
+        n: int = 2,
+        *,
+        buffer_size: int = DEFAULT_TEE_BUFFER_SIZE,
+        policy: TeePolicy = "block",
+    ) -> Tuple[AsyncTeeStream[_T], ...]:
+        """Splits the stream into `n` streams that each yield every item.
+
+        The response is only read once, and every consumer buffers up to `buffer_size` items
+        that it hasn't received yet. `policy` decides what happens when a consumer falls
+        further behind, see `swarms_client.lib.stream_tee` for details.
+        """
+        return async_tee_stream(self, n, buffer_size=buffer_size, policy=policy)
+
     async def __aenter__(self) -> Self:
         return self
 
@@ -152,6 +348,15 @@ class AsyncStream(Generic[_T]):
         await self.response.aclose()
 
 
+def _make_error(data: object, response: httpx.Response) -> APIError:
+    # the API reports failures that happen after the stream started as an `error` event
+    error = data.get("error", data) if is_mapping(data) else data
+    message = error.get("message") if is_mapping(error) else error
+    if not message or not isinstance(message, str):
+        message = "An error occurred during streaming"
+    return APIError(message=message, request=response.request, body=error)
+
+
 class ServerSentEvent:
     def __init__(
         self,
@@ -160,12 +365,14 @@ class ServerSentEvent:
         data: str | None = None,
         id: str | None = None,
         retry: int | None = None,
+        raw_data: bytes | None = None,
     ) -> None:
-        if data is None:
+        if data is None and raw_data is None:
             data = ""
 
         self._id = id
         self._data = data
+        self._raw_data = raw_data
         self._event = event or None
         self._retry = retry
 
@@ -183,75 +390,110 @@ class ServerSentEvent:
 
     @property
     def data(self) -> str:
+        if self._data is None:
+            assert self._raw_data is not None
+            self._data = str(self._raw_data, "utf-8")
         return self._data
 
+    @property
+    def raw_data(self) -> bytes:
+        """The data of the event as UTF-8 encoded bytes."""
+        if self._raw_data is None:
+            assert self._data is not None
+            self._raw_data = self._data.encode("utf-8")
+        return self._raw_data
+
     def json(self) -> Any:
-        return json.loads(self.data)
+        return json.loads(self.raw_data)
 
     @override
     def __repr__(self) -> str:
         return f"ServerSentEvent(event={self.event}, data={self.data}, id={self.id}, retry={self.retry})"
 
 
+_CR = ord("\r")
+
+
 class SSEDecoder:
-    _data: list[str]
+    _data: list[bytes]
     _event: str | None
     _retry: int | None
     _last_event_id: str | None
+    _buffer: bytearray
+    _skip_lf: bool
 
     def __init__(self) -> None:
         self._event = None
         self._data = []
         self._last_event_id = None
         self._retry = None
+        self._buffer = bytearray()
+        self._skip_lf = False
 
     def iter_bytes(self, iterator: Iterator[bytes]) -> Iterator[ServerSentEvent]:
         """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
-        for chunk in self._iter_chunks(iterator):
-            # Split before decoding so splitlines() only uses \r and \n
-            for raw_line in chunk.splitlines():
-                line = raw_line.decode("utf-8")
-                sse = self.decode(line)
-                if sse:
-                    yield sse
-
-    def _iter_chunks(self, iterator: Iterator[bytes]) -> Iterator[bytes]:
-        """Given an iterator that yields raw binary data, iterate over it and yield individual SSE chunks"""
-        data = b""
         for chunk in iterator:
-            for line in chunk.splitlines(keepends=True):
-                data += line
-                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield data
-                    data = b""
-        if data:
-            yield data
+            yield from self._decode_chunk(chunk)
+        self._flush()
 
     async def aiter_bytes(
         self, iterator: AsyncIterator[bytes]
     ) -> AsyncIterator[ServerSentEvent]:
         """Given an iterator that yields raw binary data, iterate over it & yield every event encountered"""
-        async for chunk in self._aiter_chunks(iterator):
-            # Split before decoding so splitlines() only uses \r and \n
-            for raw_line in chunk.splitlines():
-                line = raw_line.decode("utf-8")
-                sse = self.decode(line)
-                if sse:
-                    yield sse
-
-    async def _aiter_chunks(
-        self, iterator: AsyncIterator[bytes]
-    ) -> AsyncIterator[bytes]:
-        """Given an iterator that yields raw binary data, iterate over it and yield individual SSE chunks"""
-        data = b""
         async for chunk in iterator:
-            for line in chunk.splitlines(keepends=True):
-                data += line
-                if data.endswith((b"\r\r", b"\n\n", b"\r\n\r\n")):
-                    yield data
-                    data = b""
-        if data:
-            yield data
+            for sse in self._decode_chunk(chunk):
+                yield sse
+        self._flush()
+
+    def _decode_chunk(self, chunk: bytes) -> list[ServerSentEvent]:
+        """Decodes the complete lines in the buffer and returns the events they finish.
+
+        Only the new data is searched for line endings, `bytes.splitlines()` splits
+        on `\r\n`, `\r` and `\n` only, and just the incomplete last line is kept.
+        """
+        if not chunk:
+            # e.g. between the two halves of a `\r\n`, which must not end the line twice
+            return []
+
+        buffer = self._buffer
+        searched = len(buffer)
+        buffer += chunk
+
+        if self._skip_lf and buffer[:1] == b"\n":
+            # the second half of a `\r\n` that was split between chunks
+            del buffer[:1]
+        self._skip_lf = False
+
+        end = max(buffer.rfind(b"\n", searched), buffer.rfind(b"\r", searched)) + 1
+        if not end:
+            return []
+
+        lines = buffer[:end].splitlines()
+        # a trailing `\r` may be followed by a `\n` in the next chunk
+        self._skip_lf = end == len(buffer) and buffer[end - 1] == _CR
+        del buffer[:end]
+
+        events: list[ServerSentEvent] = []
+        for line in lines:
+            sse = self._decode_line(line)
+            if sse:
+                events.append(sse)
+        return events
+
+    def _flush(self) -> None:
+        # like a final line without a line ending, which can't finish an event
+        if self._buffer:
+            self._decode_line(self._buffer)
+            self._buffer.clear()
+
+    def _decode_line(self, line: bytes | bytearray) -> ServerSentEvent | None:
+        if line[:5] == b"data:":
+            # the data is kept as bytes, so that it can be parsed without decoding it first
+            value = line[6:] if line[5:6] == b" " else line[5:]
+            self._data.append(bytes(value))
+            return None
+
+        return self.decode(str(line, "utf-8"))
 
     def decode(self, line: str) -> ServerSentEvent | None:
         # See: https://html.spec.whatwg.org/multipage/server-sent-events.html#event-stream-interpretation  # noqa: E501
@@ -267,7 +509,7 @@ class SSEDecoder:
 
             sse = ServerSentEvent(
                 event=self._event,
-                data="\n".join(self._data),
+                raw_data=b"\n".join(self._data),
                 id=self._last_event_id,
                 retry=self._retry,
             )
@@ -280,6 +522,8 @@ class SSEDecoder:
             return sse
 
         if line.startswith(":"):
+            # a comment, e.g. a heartbeat, which already reset the stream's idle timeout
+            # by arriving, see `swarms_client.lib.stream_idle`
             return None
 
         fieldname, _, value = line.partition(":")
@@ -290,7 +534,7 @@ class SSEDecoder:
         if fieldname == "event":
             self._event = value
         elif fieldname == "data":
-            self._data.append(value)
+            self._data.append(value.encode("utf-8"))
         elif fieldname == "id":
             if "\0" in value:
                 pass
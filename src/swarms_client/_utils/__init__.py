@@ -52,6 +52,7 @@ from ._transform import (
     transform as transform,
     async_transform as async_transform,
     maybe_transform as maybe_transform,
+    pop_transform_time as pop_transform_time,
     async_maybe_transform as async_maybe_transform,
 )
 from ._reflection import (
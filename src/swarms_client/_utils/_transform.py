@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import io
+import time
 import base64
 import pathlib
-from typing import Any, Mapping, TypeVar, cast
+from typing import Any, Dict, List, Tuple, Mapping, TypeVar, Callable, Optional, cast
 from datetime import date, datetime
+from itertools import islice
+from contextvars import ContextVar
 from typing_extensions import (
     Literal,
     get_args,
@@ -32,7 +35,7 @@ from ._typing import (
     is_annotated_type,
     strip_annotated_type,
 )
-from .._compat import get_origin, model_dump, is_typeddict
+from .._compat import get_origin, model_dump, is_typeddict, is_literal_type
 
 _T = TypeVar("_T")
 
@@ -43,6 +46,17 @@ _T = TypeVar("_T")
 
 PropertyFormat = Literal["iso8601", "base64", "custom"]
 
+# time spent in `maybe_transform()` since the last request was made, for `RequestTiming.transform`
+_transform_time: ContextVar[float] = ContextVar("_transform_time", default=0.0)
+
+
+def pop_transform_time() -> float:
+    """Returns the time spent transforming params in this context since the last call, and resets it."""
+    elapsed = _transform_time.get()
+    if elapsed:
+        _transform_time.set(0.0)
+    return elapsed
+
 
 class PropertyInfo:
     """Metadata class to be used in Annotated types to provide information about a given type.
@@ -88,7 +102,12 @@ def maybe_transform(
     """
     if data is None:
         return None
-    return transform(data, expected_type)
+
+    started = time.perf_counter()
+    try:
+        return transform(data, expected_type)
+    finally:
+        _transform_time.set(_transform_time.get() + time.perf_counter() - started)
 
 
 # Wrapper over _transform_recursive providing fake types
@@ -111,7 +130,7 @@ def transform(
 
     It should be noted that the transformations that this function does are not represented in the type system.
     """
-    transformed = _transform_recursive(data, annotation=cast(type, expected_type))
+    transformed = _compile_plan(cast(type, expected_type), cast(type, expected_type))(data)
     return cast(_T, transformed)
 
 
@@ -296,6 +315,220 @@ def _transform_typeddict(
     return result
 
 
+_Plan = Callable[[object], object]
+
+
+# values of these types never need transforming, checking for them first avoids
+# the comparatively slow `isinstance()` checks against `Mapping` and `BaseModel`
+_PLAIN_TYPES = frozenset({str, int, float, bool, type(None), list, dict})
+
+
+def _is_model(data: object) -> bool:
+    return type(data) not in _PLAIN_TYPES and isinstance(data, pydantic.BaseModel)
+
+
+def _dump_model(data: object) -> object:
+    if _is_model(data):
+        return model_dump(cast(pydantic.BaseModel, data), exclude_unset=True, mode="json")
+    return data
+
+
+@lru_cache(maxsize=8096)
+def _compile_plan(annotation: type, inner_type: type) -> _Plan:
+    """Compiles the transformation `_transform_recursive()` applies to data of the given type.
+
+    Everything that only depends on the type, i.e. unwrapping `Annotated` / `Required` types, resolving
+    union members, TypedDict type hints, aliases & formats, is done once per type instead of for every value.
+
+    The returned plan only copies containers whose contents actually change, so data that needs no
+    transformation, e.g. most params without any `PropertyInfo` metadata, is returned as is.
+    """
+    stripped_type = strip_annotated_type(inner_type)
+    origin = get_origin(stripped_type) or stripped_type
+    leaf = _compile_leaf(annotation)
+
+    if is_typeddict(stripped_type):
+        return _compile_typeddict(stripped_type, leaf)
+
+    if origin == dict:
+        items_plan = _compile_plan(get_args(stripped_type)[1], get_args(stripped_type)[1])
+
+        def dict_plan(data: object) -> object:
+            if type(data) is dict or is_mapping(data):
+                return _transform_values(cast("Mapping[str, object]", data), items_plan)
+            return leaf(data)
+
+        return dict_plan
+
+    if is_list_type(stripped_type) or is_iterable_type(stripped_type):
+        is_list_only = is_list_type(stripped_type)
+        item_type = extract_type_arg(stripped_type, 0)
+        # for some types there is no need to transform anything, so we can skip that work
+        item_plan = None if _no_transform_needed(item_type) else _compile_plan(annotation, item_type)
+
+        def list_plan(data: object) -> object:
+            if is_list_only:
+                if not is_list(data):
+                    return leaf(data)
+            elif not is_iterable(data) or isinstance(data, str):
+                return leaf(data)
+
+            # dicts are technically iterable, but it is an iterable on the keys of the dict and is not usually
+            # intended as an iterable, so we don't transform it.
+            if isinstance(data, dict):
+                return cast(object, data)
+
+            # we always need to convert to a list to ensure the data is json-serializable
+            items = data if is_list(data) else list(data)
+            if item_plan is None:
+                return items
+            return _transform_items(items, item_plan)
+
+        return list_plan
+
+    if is_union_type(stripped_type):
+        # For union types we run the transformation against all subtypes to ensure that everything is transformed.
+        subplans = [_compile_plan(annotation, subtype) for subtype in get_args(stripped_type)]
+        if all(subplan is _dump_model for subplan in subplans):
+            return _dump_model
+
+        def union_plan(data: object) -> object:
+            for subplan in subplans:
+                data = subplan(data)
+            return data
+
+        return union_plan
+
+    return leaf
+
+
+def _compile_leaf(annotation: type) -> _Plan:
+    annotated_type = _get_annotated_type(annotation)
+    if annotated_type is None:
+        return _dump_model
+
+    # ignore the first argument as it is the actual type
+    for info in get_args(annotated_type)[1:]:
+        if isinstance(info, PropertyInfo) and info.format is not None:
+            return _compile_format(info.format, info.format_template)
+
+    return _dump_model
+
+
+def _compile_format(format_: PropertyFormat, format_template: str | None) -> _Plan:
+    def format_plan(data: object) -> object:
+        if isinstance(data, pydantic.BaseModel):
+            return model_dump(data, exclude_unset=True, mode="json")
+        return _format_data(data, format_, format_template)
+
+    return format_plan
+
+
+def _compile_typeddict(expected_type: type, leaf: _Plan) -> _Plan:
+    # resolved on first use, so that recursive TypedDicts can refer to their own plan
+    fields: Optional[Dict[str, Tuple[str, _Plan]]] = None
+
+    def typeddict_plan(data: object) -> object:
+        nonlocal fields
+        if type(data) is not dict and not is_mapping(data):
+            return leaf(data)
+
+        if fields is None:
+            fields = {
+                key: (_maybe_transform_key(key, type_), _compile_plan(type_, type_))
+                for key, type_ in get_type_hints(expected_type, include_extras=True).items()
+            }
+        return _transform_fields(data, fields)
+
+    return typeddict_plan
+
+
+def _transform_fields(data: Mapping[str, object], fields: Dict[str, Tuple[str, _Plan]]) -> Mapping[str, object]:
+    # the result is only copied from `data` once a key or value changes
+    result: Optional[Dict[str, object]] = None if isinstance(data, dict) else {}
+    for index, (key, value) in enumerate(data.items()):
+        if not is_given(value):
+            # we don't need to include `NotGiven` values here as they'll
+            # be stripped out before the request is sent anyway
+            if result is None:
+                result = dict(islice(data.items(), index))
+            continue
+
+        field = fields.get(key)
+        if field is None:
+            # we do not have a type annotation for this field, leave it as is
+            new_key, new_value = key, value
+        else:
+            new_key, new_value = field[0], field[1](value)
+
+        if result is None:
+            if new_key == key and new_value is value:
+                continue
+            result = dict(islice(data.items(), index))
+        result[new_key] = new_value
+
+    return data if result is None else result
+
+
+def _transform_values(data: Mapping[str, object], plan: _Plan) -> Mapping[str, object]:
+    if plan is _dump_model and isinstance(data, dict) and not any(_is_model(value) for value in data.values()):
+        # the common case of e.g. `Dict[str, object]` values, which are passed through
+        return data
+
+    result: Optional[Dict[str, object]] = None if isinstance(data, dict) else {}
+    for index, (key, value) in enumerate(data.items()):
+        new_value = plan(value)
+        if result is None:
+            if new_value is value:
+                continue
+            result = dict(islice(data.items(), index))
+        result[key] = new_value
+
+    return data if result is None else result
+
+
+def _transform_items(data: List[object], plan: _Plan) -> List[object]:
+    if plan is _dump_model and not any(_is_model(item) for item in data):
+        return data
+
+    result: Optional[List[object]] = None
+    for index, item in enumerate(data):
+        new_item = plan(item)
+        if result is None:
+            if new_item is item:
+                continue
+            result = data[:index]
+        result.append(new_item)
+
+    return data if result is None else result
+
+
+@lru_cache(maxsize=8096)
+def _has_format(type_: type) -> bool:
+    """Whether any part of the given type has a `PropertyInfo` format, which may require reading files."""
+    return _find_format(type_, set())
+
+
+def _find_format(type_: type, seen: set[int]) -> bool:
+    if id(type_) in seen:
+        return False
+    seen.add(id(type_))
+
+    annotated_type = _get_annotated_type(type_)
+    if annotated_type is not None:
+        if any(isinstance(info, PropertyInfo) and info.format is not None for info in get_args(annotated_type)[1:]):
+            return True
+
+    stripped_type = strip_annotated_type(type_)
+    if is_typeddict(stripped_type):
+        hints = get_type_hints(stripped_type, include_extras=True)
+        return any(_find_format(hint, seen) for hint in hints.values())
+
+    if is_literal_type(stripped_type):
+        return False
+    return any(_find_format(arg, seen) for arg in get_args(stripped_type))
+
+
 async def async_maybe_transform(
     data: object,
     expected_type: object,
@@ -306,7 +539,12 @@ async def async_maybe_transform(
     """
     if data is None:
         return None
-    return await async_transform(data, expected_type)
+
+    started = time.perf_counter()
+    try:
+        return await async_transform(data, expected_type)
+    finally:
+        _transform_time.set(_transform_time.get() + time.perf_counter() - started)
 
 
 async def async_transform(
@@ -328,6 +566,10 @@ async def async_transform(
 
     It should be noted that the transformations that this function does are not represented in the type system.
     """
+    if not _has_format(cast(type, expected_type)):
+        # without formats nothing is read from files, so the sync plan can be used as is
+        return transform(data, expected_type)
+
     transformed = await _async_transform_recursive(
         data, annotation=cast(type, expected_type)
     )
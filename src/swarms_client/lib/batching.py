@@ -0,0 +1,326 @@
+"""Client-side micro-batching for `agent.run()`.
+
+Concurrent `agent.run()` calls made through a batcher are buffered for a short
+window and sent together as a single `/v1/agent/batch/completions` request. Each
+caller is then resolved with the entry of the batch response that matches its
+own request, so callers keep the exact same `AgentRunResponse` return type.
+
+```py
+batcher = client.agent.batcher(max_batch_size=50, max_wait=0.02)
+
+# called concurrently from many threads
+response = batcher.run(agent_config=spec, task="Summarise this document")
+```
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Dict, List, Union, Iterable, Optional
+
+import anyio
+import httpx
+
+from .._types import NOT_GIVEN, Query, Headers, NotGiven
+from .._utils import is_list, is_given, is_mapping
+from .._models import construct_type
+from .preflight import AGENT_PATH
+from .._exceptions import APIResponseValidationError
+from ..types.agent_spec_param import AgentSpecParam
+from ..types.agent_run_response import AgentRunResponse
+from ..types.agent_completion_param import AgentCompletionParam
+
+if TYPE_CHECKING:
+    from .._response import APIResponse, AsyncAPIResponse
+    from ..resources.agent.batch import BatchResource, AsyncBatchResource
+    from ..types.agent.batch_run_response import BatchRunResponse
+
+__all__ = ["AgentRunBatcher", "AsyncAgentRunBatcher", "DEFAULT_MAX_BATCH_SIZE", "DEFAULT_MAX_WAIT"]
+
+DEFAULT_MAX_BATCH_SIZE = 32
+"""The maximum number of `agent.run()` calls that are coalesced into a single batch request."""
+
+DEFAULT_MAX_WAIT = 0.01
+"""The number of seconds the first call in a batch waits for other calls to join it."""
+
+
+class _Slot:
+    __slots__ = ("params", "response", "error")
+
+    def __init__(self, params: AgentCompletionParam) -> None:
+        self.params = params
+        self.response: AgentRunResponse | None = None
+        self.error: BaseException | None = None
+
+    def result(self) -> AgentRunResponse:
+        if self.error is not None:
+            raise self.error
+        assert self.response is not None, "batch slot was never resolved (should never happen)"
+        return self.response
+
+
+def _build_params(
+    *,
+    agent_config: Optional[AgentSpecParam] | NotGiven,
+    history: Union[Dict[str, object], Iterable[Dict[str, str]], None] | NotGiven,
+    img: Optional[str] | NotGiven,
+    imgs: Optional[List[str]] | NotGiven,
+    stream: Optional[bool] | NotGiven,
+    task: Optional[str] | NotGiven,
+) -> AgentCompletionParam:
+    params: AgentCompletionParam = {}
+    if is_given(agent_config):
+        params["agent_config"] = agent_config
+    if is_given(history):
+        params["history"] = history
+    if is_given(img):
+        params["img"] = img
+    if is_given(imgs):
+        params["imgs"] = imgs
+    if is_given(stream):
+        params["stream"] = stream
+    if is_given(task):
+        params["task"] = task
+    return params
+
+
+def _resolve_slots(
+    slots: List[_Slot],
+    raw: APIResponse[BatchRunResponse] | AsyncAPIResponse[BatchRunResponse],
+    parsed: BatchRunResponse,
+) -> None:
+    results = parsed.results
+    if not is_list(results) or len(results) != len(slots):
+        error = APIResponseValidationError(
+            response=raw.http_response,
+            body=results,
+            message=f"Expected the batch response to contain {len(slots)} results but received {_describe(results)}",
+        )
+        for slot in slots:
+            slot.error = error
+        return
+
+    for slot, entry in zip(slots, results):
+        if not is_mapping(entry):
+            slot.error = APIResponseValidationError(
+                response=raw.http_response,
+                body=entry,
+                message=f"Expected a batch result entry to be an object but received {type(entry)}",
+            )
+            continue
+
+        slot.response = construct_type(type_=AgentRunResponse, value=entry)  # type: ignore[assignment]
+
+
+def _describe(results: object) -> str:
+    if is_list(results):
+        return f"{len(results)}"
+    return f"{type(results)}"
+
+
+class _Batch:
+    def __init__(self) -> None:
+        self.slots: List[_Slot] = []
+        self.full = threading.Event()
+        self.done = threading.Event()
+
+
+class AgentRunBatcher:
+    """Coalesces concurrent `agent.run()` calls into `agent.batch.run()` requests.
+
+    The first call that arrives while no batch is open becomes the batch leader; it waits
+    up to `max_wait` seconds for other calls to join, or until `max_batch_size` calls have
+    joined, and then sends the whole batch on behalf of every caller.
+
+    Request options such as `extra_headers` and `timeout` apply to the batch request as a
+    whole and are therefore configured once on the batcher instead of per call.
+    """
+
+    def __init__(
+        self,
+        batch: BatchResource,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("`max_batch_size` must be at least 1")
+        if max_wait < 0:
+            raise ValueError("`max_wait` cannot be negative")
+
+        self._batch = batch
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._extra_headers = extra_headers
+        self._extra_query = extra_query
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._current: _Batch | None = None
+
+    def run(
+        self,
+        *,
+        agent_config: Optional[AgentSpecParam] | NotGiven = NOT_GIVEN,
+        history: Union[Dict[str, object], Iterable[Dict[str, str]], None] | NotGiven = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        imgs: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        stream: Optional[bool] | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+    ) -> AgentRunResponse:
+        """
+        Run an agent with the specified task as part of the next batch request.
+
+        Accepts the same arguments as `client.agent.run()`.
+        """
+        params = _build_params(agent_config=agent_config, history=history, img=img, imgs=imgs, stream=stream, task=task)
+        # an invalid spec is rejected on its own, instead of failing the batch it would have joined
+        self._batch._client._check_preflight(AGENT_PATH, params)
+        slot = _Slot(params)
+
+        with self._lock:
+            batch = self._current
+            is_leader = batch is None
+            if batch is None:
+                batch = self._current = _Batch()
+
+            batch.slots.append(slot)
+            if len(batch.slots) >= self._max_batch_size:
+                self._current = None
+                batch.full.set()
+
+        if not is_leader:
+            batch.done.wait()
+            return slot.result()
+
+        try:
+            batch.full.wait(self._max_wait)
+        finally:
+            with self._lock:
+                if self._current is batch:
+                    self._current = None
+
+            self._send(batch)
+
+        return slot.result()
+
+    def _send(self, batch: _Batch) -> None:
+        try:
+            raw = self._batch.with_raw_response.run(
+                body=[slot.params for slot in batch.slots],
+                extra_headers=self._extra_headers,
+                extra_query=self._extra_query,
+                timeout=self._timeout,
+            )
+            _resolve_slots(batch.slots, raw, raw.parse())
+        except Exception as err:
+            for slot in batch.slots:
+                slot.error = err
+        finally:
+            batch.done.set()
+
+
+class _AsyncBatch:
+    def __init__(self) -> None:
+        self.slots: List[_Slot] = []
+        self.full = anyio.Event()
+        self.done = anyio.Event()
+
+
+class AsyncAgentRunBatcher:
+    """Coalesces concurrent `agent.run()` calls into `agent.batch.run()` requests.
+
+    The first call that arrives while no batch is open becomes the batch leader; it waits
+    up to `max_wait` seconds for other calls to join, or until `max_batch_size` calls have
+    joined, and then sends the whole batch on behalf of every caller. The batch request is
+    shielded from cancellation of the leader so that the other callers are always resolved.
+
+    Request options such as `extra_headers` and `timeout` apply to the batch request as a
+    whole and are therefore configured once on the batcher instead of per call.
+    """
+
+    def __init__(
+        self,
+        batch: AsyncBatchResource,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("`max_batch_size` must be at least 1")
+        if max_wait < 0:
+            raise ValueError("`max_wait` cannot be negative")
+
+        self._batch = batch
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._extra_headers = extra_headers
+        self._extra_query = extra_query
+        self._timeout = timeout
+        self._current: _AsyncBatch | None = None
+
+    async def run(
+        self,
+        *,
+        agent_config: Optional[AgentSpecParam] | NotGiven = NOT_GIVEN,
+        history: Union[Dict[str, object], Iterable[Dict[str, str]], None] | NotGiven = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        imgs: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        stream: Optional[bool] | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+    ) -> AgentRunResponse:
+        """
+        Run an agent with the specified task as part of the next batch request.
+
+        Accepts the same arguments as `client.agent.run()`.
+        """
+        params = _build_params(agent_config=agent_config, history=history, img=img, imgs=imgs, stream=stream, task=task)
+        # an invalid spec is rejected on its own, instead of failing the batch it would have joined
+        await self._batch._client._check_preflight(AGENT_PATH, params)
+        slot = _Slot(params)
+
+        batch = self._current
+        is_leader = batch is None
+        if batch is None:
+            batch = self._current = _AsyncBatch()
+
+        batch.slots.append(slot)
+        if len(batch.slots) >= self._max_batch_size:
+            self._current = None
+            batch.full.set()
+
+        if not is_leader:
+            await batch.done.wait()
+            return slot.result()
+
+        try:
+            with anyio.move_on_after(self._max_wait):
+                await batch.full.wait()
+        finally:
+            if self._current is batch:
+                self._current = None
+
+            with anyio.CancelScope(shield=True):
+                await self._send(batch)
+
+        return slot.result()
+
+    async def _send(self, batch: _AsyncBatch) -> None:
+        try:
+            raw = await self._batch.with_raw_response.run(
+                body=[slot.params for slot in batch.slots],
+                extra_headers=self._extra_headers,
+                extra_query=self._extra_query,
+                timeout=self._timeout,
+            )
+            _resolve_slots(batch.slots, raw, await raw.parse())
+        except Exception as err:
+            for slot in batch.slots:
+                slot.error = err
+        finally:
+            batch.done.set()
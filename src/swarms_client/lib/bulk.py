@@ -0,0 +1,283 @@
+"""Bounded-concurrency bulk execution of swarm and agent runs.
+
+```py
+async with client.swarms.map(tasks, template=swarm_spec, concurrency=32) as results:
+    async for result in results:
+        if result.error is not None:
+            log.warning("task %d failed: %s", result.index, result.error)
+        else:
+            store(result.index, result.response)
+```
+
+Inputs are pulled lazily from the given (async) iterable, so at most `concurrency`
+inputs are held in memory at any point in time, regardless of how many there are.
+"""
+
+from __future__ import annotations
+
+from types import TracebackType
+from typing import (
+    Any,
+    Dict,
+    Union,
+    Generic,
+    Mapping,
+    TypeVar,
+    Callable,
+    Iterable,
+    Awaitable,
+    AsyncIterable,
+    AsyncIterator,
+)
+from typing_extensions import Self, override
+
+import anyio
+from anyio.abc import TaskGroup
+from anyio.streams.memory import MemoryObjectSendStream, MemoryObjectReceiveStream
+
+__all__ = ["BulkInput", "BulkMap", "BulkResult", "DEFAULT_BULK_CONCURRENCY"]
+
+BulkInput = Union[str, Mapping[str, object]]
+"""A single bulk input: either a task string or a mapping of parameters that override the template."""
+
+_ItemT = TypeVar("_ItemT")
+_ResponseT = TypeVar("_ResponseT")
+
+DEFAULT_BULK_CONCURRENCY = 20
+"""The default number of runs in flight at once.
+
+This matches the number of keep-alive connections in `DEFAULT_CONNECTION_LIMITS` so that
+bulk runs keep reusing warm connections instead of opening and discarding new ones.
+"""
+
+
+class BulkResult(Generic[_ItemT, _ResponseT]):
+    """The outcome of a single input to a bulk `map()` call."""
+
+    index: int
+    """The position of the input in the given iterable."""
+
+    item: _ItemT
+    """The input this result was produced for."""
+
+    response: _ResponseT | None
+    """The parsed API response, or `None` if the run failed."""
+
+    error: Exception | None
+    """The error raised while running this input, or `None` if the run succeeded."""
+
+    def __init__(
+        self,
+        *,
+        index: int,
+        item: _ItemT,
+        response: _ResponseT | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        self.index = index
+        self.item = item
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> _ResponseT:
+        """Returns the response, or raises the error this input failed with."""
+        if self.error is not None:
+            raise self.error
+        return self.response  # type: ignore[return-value]
+
+    @override
+    def __repr__(self) -> str:
+        if self.error is not None:
+            return f"BulkResult(index={self.index}, error={self.error!r})"
+        return f"BulkResult(index={self.index}, response={self.response!r})"
+
+
+def merge_params(template: Mapping[str, object], item: object, *, key: str) -> Dict[str, Any]:
+    """Merge a single bulk input into the template parameters.
+
+    String inputs are assigned to `key`, mapping inputs override individual template parameters.
+    Bulk runs are never streamed, so `stream` is dropped, and a truthy `stream` is rejected.
+    """
+    if isinstance(item, str):
+        params = {**template, key: item}
+    elif isinstance(item, Mapping):
+        params = {**template, **item}  # type: ignore[dict-item]
+    else:
+        raise TypeError(f"Expected a bulk input to be a string or a mapping but got {type(item)}")
+
+    if params.pop("stream", None):
+        raise ValueError("Bulk runs can't be streamed, remove `stream` from the template and the inputs")
+    return params
+
+
+async def _aiter(items: Union[Iterable[_ItemT], AsyncIterable[_ItemT]]) -> AsyncIterator[_ItemT]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+class _SourceError:
+    """Carries an error raised by the inputs to the consumer, so that it's raised on its own."""
+
+    def __init__(self, error: Exception) -> None:
+        self.error = error
+
+
+_Received = Union[BulkResult[_ItemT, _ResponseT], _SourceError]
+
+
+async def _run_one(
+    run: Callable[[_ItemT], Awaitable[_ResponseT]],
+    index: int,
+    item: _ItemT,
+    results: MemoryObjectSendStream[Any],
+) -> None:
+    result: BulkResult[_ItemT, _ResponseT]
+    async with results:
+        try:
+            response = await run(item)
+        except Exception as err:
+            result = BulkResult(index=index, item=item, error=err)
+        else:
+            result = BulkResult(index=index, item=item, response=response)
+        await results.send(result)
+
+
+async def _feed(
+    run: Callable[[_ItemT], Awaitable[_ResponseT]],
+    items: Union[Iterable[_ItemT], AsyncIterable[_ItemT]],
+    slots: anyio.Semaphore,
+    task_group: TaskGroup,
+    results: MemoryObjectSendStream[Any],
+) -> None:
+    """Starts a run for every input, pulling the next input only once a slot is free."""
+    async with results:
+        source = _aiter(items)
+        index = 0
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    item = await source.__anext__()
+                except StopAsyncIteration:
+                    return
+                except Exception as err:
+                    await results.send(_SourceError(err))
+                    return
+
+                task_group.start_soon(_run_one, run, index, item, results.clone())
+                index += 1
+        finally:
+            await source.aclose()  # type: ignore[attr-defined]
+
+
+class BulkMap(Generic[_ItemT, _ResponseT]):
+    """The results of a bulk `map()` call, as an async context manager that runs the inputs.
+
+    Results are yielded as soon as they complete, or in input order if `ordered` is set.
+    In ordered mode, completed results that are waiting for an earlier input count towards
+    the concurrency limit so that a slow input cannot cause unbounded buffering.
+
+    The runs are started in an `anyio` task group that is entered with `async with`, so this
+    works with every backend that the async client supports, and leaving the block always
+    cancels the runs that are still in flight, even if the results weren't exhausted.
+    """
+
+    def __init__(
+        self,
+        run: Callable[[_ItemT], Awaitable[_ResponseT]],
+        items: Union[Iterable[_ItemT], AsyncIterable[_ItemT]],
+        *,
+        concurrency: int,
+        ordered: bool,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("`concurrency` must be at least 1")
+
+        self._run = run
+        self._items = items
+        self._concurrency = concurrency
+        self._ordered = ordered
+        self._task_group: TaskGroup | None = None
+        self._entered = False
+        self._completed: Dict[int, BulkResult[_ItemT, _ResponseT]] = {}
+        self._next_to_yield = 0
+        self._holds_slot = False
+
+    async def __aenter__(self) -> Self:
+        if self._entered:
+            raise RuntimeError("The results of a bulk `map()` call can only be iterated once")
+        self._entered = True
+
+        # a slot is taken before an input is pulled and given back once its result was
+        # received, so at most `concurrency` results are ever waiting in the stream
+        self._slots = anyio.Semaphore(self._concurrency)
+        self._send_results: MemoryObjectSendStream[Any]
+        self._receive_results: MemoryObjectReceiveStream[Any]
+        self._send_results, self._receive_results = anyio.create_memory_object_stream(self._concurrency)
+
+        task_group = anyio.create_task_group()
+        await task_group.__aenter__()
+        task_group.start_soon(_feed, self._run, self._items, self._slots, task_group, self._send_results)
+        self._task_group = task_group
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        task_group = self._task_group
+        if task_group is None:
+            return
+        self._task_group = None
+
+        # cancels the runs that are still in flight; the error that left the block, if any,
+        # is raised on its own rather than as part of an exception group of the task group
+        task_group.cancel_scope.cancel()
+        try:
+            await task_group.__aexit__(None, None, None)
+        finally:
+            self._send_results.close()
+            self._receive_results.close()
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> BulkResult[_ItemT, _ResponseT]:
+        if self._task_group is None:
+            raise RuntimeError(
+                "The results of a bulk `map()` call must be iterated inside `async with`, "
+                "e.g. `async with client.swarms.map(...) as results: async for result in results: ...`"
+            )
+
+        if self._holds_slot:
+            # the previous result was handed to the caller, so its slot can go to the next input
+            self._slots.release()
+            self._holds_slot = False
+
+        while True:
+            if self._next_to_yield in self._completed:
+                self._next_to_yield += 1
+                self._holds_slot = True
+                return self._completed.pop(self._next_to_yield - 1)
+
+            try:
+                received: _Received[_ItemT, _ResponseT] = await self._receive_results.receive()
+            except anyio.EndOfStream:
+                raise StopAsyncIteration from None
+            if isinstance(received, _SourceError):
+                raise received.error
+
+            if not self._ordered:
+                self._holds_slot = True
+                return received
+            self._completed[received.index] = received
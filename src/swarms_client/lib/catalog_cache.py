@@ -0,0 +1,219 @@
+"""Caching of the catalog endpoints.
+
+The available models, swarm types and reasoning agent types change rarely, but services
+that validate `model_name` or `swarm_type` against them would otherwise fetch them on every
+request. A `CatalogCache` keeps the responses of `models.list_available()`,
+`swarms.check_available()` and `reasoning_agents.list_types()`:
+
+```py
+catalog = CatalogCache(ttl=300, stale_while_revalidate=3600)
+client = SwarmsClient(catalog_cache=catalog)
+async_client = AsyncSwarmsClient(catalog_cache=catalog)
+
+client.models.list_available()  # fetched
+await async_client.models.list_available()  # from the cache
+```
+
+A response is fresh for `ttl` seconds, and is returned without a request. For another
+`stale_while_revalidate` seconds it is still returned immediately, while a single
+background request refreshes it: in a thread for `SwarmsClient` and in a task for
+`AsyncSwarmsClient` on asyncio. On trio, where the client has no task group to start one
+in, the stale response is returned and the next request for it fetches it again. Older
+responses are fetched again before returning.
+
+Refreshes are conditional requests with `If-None-Match` and `If-Modified-Since` when the
+server sent an `ETag` or a `Last-Modified` header, so an unchanged catalog costs a `304 Not
+Modified` instead of the full body.
+
+A cache can be shared between clients, including sync and async clients in the same
+process, and between threads. Like the `ResponseCache`, single requests can skip it with the
+`X-Swarms-Cache: bypass` header, or fetch the catalog again with `X-Swarms-Cache: refresh`.
+"""
+
+from __future__ import annotations
+
+import time
+import hashlib
+import threading
+from typing import Any, Set, Dict, Tuple, Iterable, Optional
+from typing_extensions import Literal, TypedDict
+
+import httpx
+
+from .response_cache import CACHE_HEADER
+
+__all__ = ["CatalogCache", "CatalogStats", "CATALOG_PATHS"]
+
+CATALOG_PATHS: Tuple[str, ...] = (
+    "/v1/models/available",
+    "/v1/swarms/available",
+    "/v1/reasoning-agent/types",
+)
+"""The endpoints whose responses are cached by default."""
+
+_State = Literal["fresh", "stale"]
+
+
+class CatalogStats(TypedDict):
+    hits: int
+    """The number of requests that were answered with a fresh response from the cache."""
+
+    stale_hits: int
+    """The number of requests that were answered with a stale response while it was refreshed."""
+
+    misses: int
+    """The number of requests that had to wait for the API, including refreshes."""
+
+    not_modified: int
+    """The number of conditional requests that the server answered with `304 Not Modified`."""
+
+
+class _Entry:
+    __slots__ = ("content_type", "body", "etag", "last_modified", "fetched_at")
+
+    def __init__(self, response: httpx.Response, fetched_at: float) -> None:
+        self.content_type = response.headers.get("content-type")
+        self.body = response.content
+        self.etag = response.headers.get("etag")
+        self.last_modified = response.headers.get("last-modified")
+        self.fetched_at = fetched_at
+
+    def response(self, request: httpx.Request) -> httpx.Response:
+        headers = {CACHE_HEADER: "hit"}
+        if self.content_type is not None:
+            headers["content-type"] = self.content_type
+        if self.etag is not None:
+            headers["etag"] = self.etag
+        if self.last_modified is not None:
+            headers["last-modified"] = self.last_modified
+        return httpx.Response(200, headers=headers, content=self.body, request=request)
+
+
+class CatalogCache:
+    """A cache of catalog responses with a TTL and stale-while-revalidate refreshes."""
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 300.0,
+        stale_while_revalidate: float = 3600.0,
+        paths: Iterable[str] = CATALOG_PATHS,
+    ) -> None:
+        if ttl < 0:
+            raise ValueError(f"Expected `ttl` to be at least 0, got {ttl}")
+        if stale_while_revalidate < 0:
+            raise ValueError(f"Expected `stale_while_revalidate` to be at least 0, got {stale_while_revalidate}")
+
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.paths = frozenset(paths)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, _Entry] = {}
+        self._refreshing: Set[str] = set()
+        # entries that are fetched again by their next request, instead of in the background
+        self._due: Set[str] = set()
+        # keeps the background refreshes of async clients from being garbage collected
+        self._tasks: Set[Any] = set()
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._not_modified = 0
+
+    def stats(self) -> CatalogStats:
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return CatalogStats(
+                hits=self._hits,
+                stale_hits=self._stale_hits,
+                misses=self._misses,
+                not_modified=self._not_modified,
+            )
+
+    def clear(self) -> None:
+        """Removes every cached response."""
+        with self._lock:
+            self._entries.clear()
+            self._due.clear()
+
+    def _key(self, request: httpx.Request, path: str) -> Optional[str]:
+        """Returns the cache key of a request to `path`, relative to the base URL,
+        or `None` if its response isn't cached.
+        """
+        if request.method != "GET" or path not in self.paths:
+            return None
+
+        digest = hashlib.sha256()
+        digest.update(str(request.url).encode())
+        digest.update(b"\0")
+        digest.update(request.headers.get("x-api-key", "").encode())
+        return digest.hexdigest()
+
+    def _get(self, key: str, request: httpx.Request) -> Tuple[Optional[_State], Optional[httpx.Response]]:
+        """Returns whether the cached response is fresh or stale, and the response if it can be used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            age = 0.0 if entry is None else time.monotonic() - entry.fetched_at
+            if entry is None or age > self.ttl + self.stale_while_revalidate or key in self._due:
+                self._due.discard(key)
+                self._misses += 1
+                return None, None
+
+            if age <= self.ttl:
+                self._hits += 1
+                return "fresh", entry.response(request)
+
+            self._stale_hits += 1
+            return "stale", entry.response(request)
+
+    def _miss(self) -> None:
+        with self._lock:
+            self._misses += 1
+
+    def _conditional_headers(self, key: str) -> Dict[str, str]:
+        with self._lock:
+            entry = self._entries.get(key)
+        headers: Dict[str, str] = {}
+        if entry is not None:
+            if entry.etag is not None:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified is not None:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def _update(self, key: str, response: httpx.Response) -> httpx.Response:
+        """Stores a fetched catalog, and replaces a `304 Not Modified` with the cached response."""
+        now = time.monotonic()
+        if response.status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None:
+                    # e.g. the cache was cleared while the request was in flight
+                    return response
+                entry.fetched_at = now
+                self._due.discard(key)
+                self._not_modified += 1
+            response.close()
+            return entry.response(response.request)
+
+        if response.status_code == 200:
+            with self._lock:
+                self._entries[key] = _Entry(response, now)
+                self._due.discard(key)
+        return response
+
+    def _begin_refresh(self, key: str) -> bool:
+        """Returns whether a background refresh should start, at most one per entry at a time."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def _end_refresh(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def _defer_refresh(self, key: str) -> None:
+        """Makes the next request for the entry fetch it again, for clients that can't refresh it in the background."""
+        with self._lock:
+            self._due.add(key)
@@ -0,0 +1,213 @@
+"""Adaptive client-side concurrency limiting.
+
+Instead of relying on a fixed number of connections, an `AdaptiveConcurrencyLimiter`
+discovers how many concurrent requests the API can currently sustain. It slowly raises
+the number of requests allowed in flight while latency stays flat, and backs off
+multiplicatively as soon as the API signals overload.
+
+```py
+limiter = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=100)
+client = AsyncSwarmsClient(concurrency_limiter=limiter)
+
+...
+print(limiter.limit, limiter.in_flight)
+```
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Deque, Optional
+from collections import deque
+from typing_extensions import TypedDict
+
+import anyio
+import httpx
+
+from .._constants import DEFAULT_CONNECTION_LIMITS
+
+__all__ = ["AdaptiveConcurrencyLimiter", "ConcurrencyLimiterStats"]
+
+
+class ConcurrencyLimiterStats(TypedDict):
+    limit: int
+    """The number of requests currently allowed in flight."""
+
+    in_flight: int
+    """The number of requests currently in flight."""
+
+    queued: int
+    """The number of requests waiting for a slot."""
+
+    latency_short: Optional[float]
+    """The recent average latency in seconds, over roughly `short_window` requests."""
+
+    latency_long: Optional[float]
+    """The baseline average latency in seconds, over roughly `long_window` requests."""
+
+    backoffs: int
+    """The number of times the limit has been decreased."""
+
+
+def _is_overloaded(response: httpx.Response) -> bool:
+    if response.status_code == 429 or response.status_code >= 500:
+        return True
+
+    should_retry_header = response.headers.get("x-should-retry")
+    if should_retry_header == "true":
+        return True
+
+    return False
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits the number of in-flight requests of an `AsyncSwarmsClient` to an adaptive limit.
+
+    The limit follows an AIMD scheme with a latency gradient:
+
+    - every successful response while the limit is being used raises the limit by `1 / limit`,
+      i.e. by roughly one for every `limit` requests that complete.
+    - a 429 or 5xx response, a response with `x-should-retry: true` or a timeout multiplies the
+      limit by `backoff_ratio`.
+    - when the recent average latency rises above `latency_tolerance` times the long-term
+      average, the limit is scaled down by the ratio between the two.
+
+    Decreases are applied at most once per recent average latency so that a burst of failures
+    from requests that were already in flight only counts as a single overload signal.
+
+    A limiter can be shared between multiple clients that talk to the same API, e.g. clients
+    created with `.with_options()`, and must only be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = DEFAULT_CONNECTION_LIMITS.max_keepalive_connections or 20,
+        min_limit: int = 1,
+        max_limit: int = DEFAULT_CONNECTION_LIMITS.max_connections or 100,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        short_window: int = 10,
+        long_window: int = 100,
+    ) -> None:
+        if min_limit < 1:
+            raise ValueError("`min_limit` must be at least 1")
+        if max_limit < min_limit:
+            raise ValueError("`max_limit` must not be lower than `min_limit`")
+        if not min_limit <= initial_limit <= max_limit:
+            raise ValueError("`initial_limit` must be between `min_limit` and `max_limit`")
+        if not 0 < backoff_ratio < 1:
+            raise ValueError("`backoff_ratio` must be between 0 and 1")
+        if latency_tolerance < 1:
+            raise ValueError("`latency_tolerance` must be at least 1")
+        if short_window < 1 or long_window < short_window:
+            raise ValueError("`long_window` must be at least `short_window`, which must be at least 1")
+
+        self._limit = float(initial_limit)
+        self._min_limit = min_limit
+        self._max_limit = max_limit
+        self._backoff_ratio = backoff_ratio
+        self._latency_tolerance = latency_tolerance
+        self._short_alpha = 2 / (short_window + 1)
+        self._long_alpha = 2 / (long_window + 1)
+
+        self._in_flight = 0
+        self._waiters: Deque[anyio.Event] = deque()
+        self._latency_short: float | None = None
+        self._latency_long: float | None = None
+        self._last_decrease = float("-inf")
+        self._backoffs = 0
+
+    @property
+    def limit(self) -> int:
+        """The number of requests currently allowed in flight."""
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """The number of requests currently in flight."""
+        return self._in_flight
+
+    def stats(self) -> ConcurrencyLimiterStats:
+        """Returns a snapshot of the limiter's current state."""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "latency_short": self._latency_short,
+            "latency_long": self._latency_long,
+            "backoffs": self._backoffs,
+        }
+
+    async def acquire(self) -> float:
+        """Waits until a request may be sent and returns the time it started at.
+
+        Every call must be paired with a call to `release()`.
+        """
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return time.monotonic()
+
+        event = anyio.Event()
+        self._waiters.append(event)
+        try:
+            await event.wait()
+        except BaseException:
+            if event.is_set():
+                # we were handed a slot at the same time as we were cancelled
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(event)
+            raise
+
+        return time.monotonic()
+
+    def release(
+        self,
+        started_at: float,
+        *,
+        response: httpx.Response | None = None,
+        timed_out: bool = False,
+    ) -> None:
+        """Releases the slot taken by `acquire()` and feeds the outcome of the request into the limit.
+
+        Requests that failed without a response for reasons other than a timeout do not affect the limit.
+        """
+        now = time.monotonic()
+        in_flight = self._in_flight
+        self._in_flight -= 1
+
+        if timed_out or (response is not None and _is_overloaded(response)):
+            self._decrease(now, self._backoff_ratio)
+        elif response is not None:
+            self._on_success(now, now - started_at, in_flight)
+
+        self._wake()
+
+    def _on_success(self, now: float, latency: float, in_flight: int) -> None:
+        if self._latency_short is None or self._latency_long is None:
+            self._latency_short = self._latency_long = latency
+        else:
+            self._latency_short += self._short_alpha * (latency - self._latency_short)
+            self._latency_long += self._long_alpha * (latency - self._latency_long)
+
+        threshold = self._latency_long * self._latency_tolerance
+        if self._latency_short > threshold:
+            self._decrease(now, max(self._backoff_ratio, threshold / self._latency_short))
+        elif in_flight >= self._limit / 2:
+            # only grow the limit while it is actually being used
+            self._limit = min(self._max_limit, self._limit + 1 / self._limit)
+
+    def _decrease(self, now: float, ratio: float) -> None:
+        if now - self._last_decrease < (self._latency_short or 0):
+            return
+
+        self._last_decrease = now
+        self._backoffs += 1
+        self._limit = max(self._min_limit, self._limit * ratio)
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            self._in_flight += 1
+            self._waiters.popleft().set()
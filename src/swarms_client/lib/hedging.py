@@ -0,0 +1,292 @@
+"""Hedged requests for the read-only `GET` endpoints.
+
+`health.check()`, `models.list_available()`, `swarms.check_available()`, `swarms.get_logs()`,
+`reasoning_agents.list_types()` and `client.rate.get_limits()` have no side effects, so when
+one of them takes unusually long, usually because of a slow connection, it's safe to send it
+again instead of waiting. With `Hedging`, a second request is sent when the first one hasn't
+been answered after the observed 95th percentile latency of its endpoint, and the first
+response wins:
+
+```py
+hedging = Hedging(percentile=0.95, budget=0.05)
+client = SwarmsClient(hedging=hedging)
+
+client.models.list_available()
+
+print(hedging.stats())
+```
+
+The latencies of the last `window` requests to each endpoint are kept, and requests are only
+hedged once there are `min_samples` of them, or after a fixed `delay` if one is given. To
+cap the extra load, every request earns `budget` hedges, and a request is only hedged when
+a whole one has been earned: with the default of `0.05`, at most 5% of the requests are
+sent twice.
+
+The hedged request is sent while the first one still has its connection, so it uses another
+connection of the pool, except over HTTP/2, where both share a connection. With
+`AsyncSwarmsClient` the losing request is cancelled. `SwarmsClient` sends both requests from
+background threads, in a copy of the caller's `contextvars` context, so that the caller can
+return as soon as either one is answered. The losing one is left to finish there and then
+closed, since a blocking request can't be interrupted.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+import queue
+import threading
+import contextvars
+from typing import Any, Dict, List, Deque, Tuple, Callable, Iterable, Optional, Awaitable
+from collections import deque
+from typing_extensions import TypedDict
+
+import anyio
+import httpx
+
+__all__ = ["Hedging", "HedgingStats", "HEDGED_PATHS"]
+
+HEDGED_PATHS: Tuple[str, ...] = (
+    "/health",
+    "/v1/models/available",
+    "/v1/swarms/available",
+    "/v1/swarm/logs",
+    "/v1/reasoning-agent/types",
+    "/v1/rate/limits",
+)
+"""The endpoints whose requests are hedged by default."""
+
+# the most hedges that can be saved up, so that a burst after a quiet period stays small
+_MAX_SAVED_HEDGES = 10.0
+
+_Outcome = Tuple[bool, Optional[httpx.Response], Optional[Exception]]
+
+
+class HedgingStats(TypedDict):
+    requests: int
+    """The number of requests to hedged endpoints, not counting the hedged requests."""
+
+    hedges: int
+    """The number of additional requests that were sent because the first one was slow."""
+
+    hedge_wins: int
+    """The number of hedged requests that were answered before the request they hedged."""
+
+
+class Hedging:
+    """Sends a second request when a read-only request is slower than usual, and uses the first response.
+
+    An instance can be shared between clients, and is safe to use from multiple threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float = 0.95,
+        delay: Optional[float] = None,
+        budget: float = 0.05,
+        window: int = 200,
+        min_samples: int = 20,
+        paths: Iterable[str] = HEDGED_PATHS,
+    ) -> None:
+        if not 0 < percentile < 1:
+            raise ValueError(f"Expected `percentile` to be between 0 and 1, got {percentile}")
+        if delay is not None and delay < 0:
+            raise ValueError(f"Expected `delay` to be at least 0, got {delay}")
+        if budget < 0:
+            raise ValueError(f"Expected `budget` to be at least 0, got {budget}")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError(
+                f"Expected `min_samples` to be at least 1 and at most `window`, got {min_samples} and {window}"
+            )
+
+        self.percentile = percentile
+        self.delay = delay
+        self.budget = budget
+        self.window = window
+        self.min_samples = min_samples
+        self.paths = frozenset(paths)
+        self._lock = threading.Lock()
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._saved_hedges = 0.0
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+
+    def stats(self) -> HedgingStats:
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return HedgingStats(requests=self._requests, hedges=self._hedges, hedge_wins=self._hedge_wins)
+
+    def _applies(self, request: httpx.Request, path: str) -> bool:
+        """Returns whether a request to `path`, relative to the base URL, is hedged."""
+        return request.method == "GET" and path in self.paths
+
+    def _start(self, path: str) -> Optional[float]:
+        """Counts a request, and returns how long to wait before hedging it, or `None` if it can't be hedged."""
+        with self._lock:
+            self._requests += 1
+            self._saved_hedges = min(self._saved_hedges + self.budget, _MAX_SAVED_HEDGES)
+            if self._saved_hedges < 1:
+                return None
+            if self.delay is not None:
+                return self.delay
+
+            latencies = self._latencies.get(path)
+            if latencies is None or len(latencies) < self.min_samples:
+                return None
+            ordered = sorted(latencies)
+            return ordered[math.ceil(self.percentile * len(ordered)) - 1]
+
+    def _take_hedge(self) -> bool:
+        with self._lock:
+            if self._saved_hedges < 1:
+                return False
+            self._saved_hedges -= 1
+            self._hedges += 1
+            return True
+
+    def _finish(self, path: str, started: float, *, hedge_won: bool) -> None:
+        """Records the latency that the caller saw."""
+        latency = time.monotonic() - started
+        with self._lock:
+            latencies = self._latencies.get(path)
+            if latencies is None:
+                latencies = self._latencies[path] = deque(maxlen=self.window)
+            latencies.append(latency)
+            if hedge_won:
+                self._hedge_wins += 1
+
+    def _send(
+        self, request: httpx.Request, path: str, send: Callable[[httpx.Request], httpx.Response]
+    ) -> httpx.Response:
+        delay = self._start(path)
+        started = time.monotonic()
+        if delay is None:
+            response = send(request)
+            self._finish(path, started, hedge_won=False)
+            return response
+
+        outcomes: queue.Queue[_Outcome] = queue.Queue()
+        decided = threading.Lock()
+        won: List[bool] = []
+
+        def attempt(attempt_request: httpx.Request, hedge: bool) -> None:
+            try:
+                response = send(attempt_request)
+            except Exception as err:
+                outcomes.put((hedge, None, err))
+                return
+            with decided:
+                if won:
+                    # the other request was answered first, and nobody is waiting for this one
+                    response.close()
+                    return
+                outcomes.put((hedge, response, None))
+
+        def start(attempt_request: httpx.Request, hedge: bool) -> None:
+            # the request is sent with the context variables of the caller, e.g. for logging or tracing
+            context = contextvars.copy_context()
+            threading.Thread(
+                target=context.run,
+                args=(attempt, attempt_request, hedge),
+                name="swarms-client-hedged-request",
+                daemon=True,
+            ).start()
+
+        start(request, False)
+        pending = 1
+        try:
+            outcome: Optional[_Outcome] = outcomes.get(timeout=delay)
+        except queue.Empty:
+            outcome = None
+            if self._take_hedge():
+                start(_copy_request(request), True)
+                pending += 1
+
+        errors: List[Exception] = []
+        while True:
+            if outcome is None:
+                outcome = outcomes.get()
+            hedge, result, error = outcome
+            pending -= 1
+            if result is not None:
+                with decided:
+                    won.append(True)
+                    _close_late_responses(outcomes)
+                self._finish(path, started, hedge_won=hedge)
+                return result
+
+            assert error is not None
+            errors.append(error)
+            if pending == 0:
+                raise errors[0]
+            outcome = None
+
+    async def _asend(
+        self, request: httpx.Request, path: str, send: Callable[[httpx.Request], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        delay = self._start(path)
+        started = time.monotonic()
+        if delay is None:
+            response = await send(request)
+            self._finish(path, started, hedge_won=False)
+            return response
+
+        settled = anyio.Event()
+        winner: List[Tuple[bool, httpx.Response]] = []
+        errors: List[Exception] = []
+        pending = 1
+
+        async def attempt(attempt_request: httpx.Request, hedge: bool) -> None:
+            nonlocal pending
+            try:
+                response = await send(attempt_request)
+            except Exception as err:
+                errors.append(err)
+                pending -= 1
+                if pending == 0:
+                    settled.set()
+                return
+            if winner:
+                # both requests were answered at the same time
+                await response.aclose()
+                return
+            winner.append((hedge, response))
+            settled.set()
+
+        async with anyio.create_task_group() as task_group:
+            task_group.start_soon(attempt, request, False)
+            with anyio.move_on_after(delay):
+                await settled.wait()
+            if not settled.is_set() and self._take_hedge():
+                pending += 1
+                task_group.start_soon(attempt, _copy_request(request), True)
+            await settled.wait()
+            # cancels the losing request
+            task_group.cancel_scope.cancel()
+
+        if not winner:
+            raise errors[0]
+        hedge, response = winner[0]
+        self._finish(path, started, hedge_won=hedge)
+        return response
+
+
+def _copy_request(request: httpx.Request) -> httpx.Request:
+    """Returns a copy of a `GET` request that can be sent at the same time as the original."""
+    extensions: Dict[str, Any] = dict(request.extensions)
+    # the trace of the original request belongs to its timing
+    extensions.pop("trace", None)
+    return httpx.Request(request.method, request.url, headers=request.headers, extensions=extensions)
+
+
+def _close_late_responses(outcomes: queue.Queue[_Outcome]) -> None:
+    """Closes the response of the other request, if it was answered at the same time."""
+    while True:
+        try:
+            _, response, _ = outcomes.get_nowait()
+        except queue.Empty:
+            return
+        if response is not None:
+            response.close()
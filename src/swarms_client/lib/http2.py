@@ -0,0 +1,248 @@
+"""HTTP/2 transports that multiplex requests over a small number of connections.
+
+httpx sends every HTTP/2 request to the same origin over a single connection, so no
+more than `MAX_CONCURRENT_STREAMS` requests (at most 100) can be in flight at a time
+and any others wait for a free stream. These transports open another connection
+instead, once every connection already carries `max_streams_per_connection` streams.
+
+They are used by the default HTTP clients when `http2=True` is passed to the client:
+
+```py
+client = AsyncSwarmsClient(http2=True)
+```
+"""
+
+from __future__ import annotations
+
+import ssl
+import threading
+from typing import Any, List, Generic, TypeVar, Callable, Iterator, AsyncIterator
+
+import httpx
+
+from .._constants import DEFAULT_HTTP2_MAX_STREAMS, DEFAULT_HTTP2_CONNECTION_LIMITS
+
+__all__ = ["HTTP2Transport", "AsyncHTTP2Transport"]
+
+_TransportT = TypeVar("_TransportT", httpx.HTTPTransport, httpx.AsyncHTTPTransport)
+
+
+def _check_h2_installed() -> None:
+    try:
+        import h2  # noqa: F401  # pyright: ignore[reportUnusedImport]
+    except ImportError:
+        raise ImportError(
+            "Using http2=True, but the 'h2' package is not installed. "
+            "Make sure to install this package with the `http2` extra, e.g. `pip install swarms-client[http2]`"
+        ) from None
+
+
+def _shard_limits(limits: httpx.Limits, max_streams_per_connection: int) -> httpx.Limits:
+    # a shard only needs more than one connection if the server doesn't support HTTP/2
+    return httpx.Limits(
+        max_connections=max_streams_per_connection,
+        max_keepalive_connections=max_streams_per_connection,
+        keepalive_expiry=limits.keepalive_expiry,
+    )
+
+
+class _Shard(Generic[_TransportT]):
+    __slots__ = ("transport", "in_flight")
+
+    def __init__(self, transport: _TransportT) -> None:
+        self.transport: _TransportT = transport
+        self.in_flight = 0
+
+
+class _TrackedStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close()
+
+
+class _AsyncTrackedStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, on_close: Callable[[], None]) -> None:
+        self._stream = stream
+        self._on_close: Callable[[], None] | None = on_close
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            on_close, self._on_close = self._on_close, None
+            if on_close is not None:
+                on_close()
+
+
+class HTTP2Transport(httpx.BaseTransport):
+    """An HTTP/2 transport that spreads requests over up to `limits.max_connections` connections.
+
+    A request is sent over the connection with the fewest requests in flight, and a new
+    connection is only opened once each connection already carries `max_streams_per_connection`
+    requests. `max_streams_per_connection` should not exceed the `MAX_CONCURRENT_STREAMS` that
+    the server allows, as requests over that limit wait for a stream of their connection.
+
+    If the server doesn't negotiate HTTP/2, every connection slot behaves like an HTTP/1.1
+    connection pool of `max_streams_per_connection` connections.
+    """
+
+    def __init__(
+        self,
+        *,
+        verify: ssl.SSLContext | str | bool = True,
+        cert: Any = None,
+        trust_env: bool = True,
+        http1: bool = True,
+        limits: httpx.Limits = DEFAULT_HTTP2_CONNECTION_LIMITS,
+        max_streams_per_connection: int = DEFAULT_HTTP2_MAX_STREAMS,
+    ) -> None:
+        _check_h2_installed()
+        if max_streams_per_connection < 1:
+            raise ValueError("`max_streams_per_connection` must be at least 1")
+
+        # every connection shares the same SSL context, which is expensive to create
+        self._ssl_context = (
+            verify
+            if isinstance(verify, ssl.SSLContext)
+            else httpx.create_ssl_context(verify=verify, cert=cert, trust_env=trust_env)
+        )
+        self._trust_env = trust_env
+        self._http1 = http1
+        self._max_connections = limits.max_connections
+        self._max_streams = max_streams_per_connection
+        self._shard_limits = _shard_limits(limits, max_streams_per_connection)
+        self._lock = threading.Lock()
+        self._shards: List[_Shard[httpx.HTTPTransport]] = []
+
+    def _checkout(self) -> _Shard[httpx.HTTPTransport]:
+        with self._lock:
+            shard = min(self._shards, key=lambda shard: shard.in_flight, default=None)
+            if shard is None or (
+                shard.in_flight >= self._max_streams
+                and (self._max_connections is None or len(self._shards) < self._max_connections)
+            ):
+                shard = _Shard(
+                    httpx.HTTPTransport(
+                        verify=self._ssl_context,
+                        trust_env=self._trust_env,
+                        http1=self._http1,
+                        http2=True,
+                        limits=self._shard_limits,
+                    )
+                )
+                self._shards.append(shard)
+
+            shard.in_flight += 1
+            return shard
+
+    def _checkin(self, shard: _Shard[httpx.HTTPTransport]) -> None:
+        with self._lock:
+            shard.in_flight -= 1
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        shard = self._checkout()
+        try:
+            response = shard.transport.handle_request(request)
+        except BaseException:
+            self._checkin(shard)
+            raise
+
+        assert isinstance(response.stream, httpx.SyncByteStream)
+        response.stream = _TrackedStream(response.stream, lambda: self._checkin(shard))
+        return response
+
+    def close(self) -> None:
+        with self._lock:
+            shards, self._shards = self._shards, []
+        for shard in shards:
+            shard.transport.close()
+
+
+class AsyncHTTP2Transport(httpx.AsyncBaseTransport):
+    """An HTTP/2 transport that spreads requests over up to `limits.max_connections` connections.
+
+    See `HTTP2Transport` for details.
+    """
+
+    def __init__(
+        self,
+        *,
+        verify: ssl.SSLContext | str | bool = True,
+        cert: Any = None,
+        trust_env: bool = True,
+        http1: bool = True,
+        limits: httpx.Limits = DEFAULT_HTTP2_CONNECTION_LIMITS,
+        max_streams_per_connection: int = DEFAULT_HTTP2_MAX_STREAMS,
+    ) -> None:
+        _check_h2_installed()
+        if max_streams_per_connection < 1:
+            raise ValueError("`max_streams_per_connection` must be at least 1")
+
+        # every connection shares the same SSL context, which is expensive to create
+        self._ssl_context = (
+            verify
+            if isinstance(verify, ssl.SSLContext)
+            else httpx.create_ssl_context(verify=verify, cert=cert, trust_env=trust_env)
+        )
+        self._trust_env = trust_env
+        self._http1 = http1
+        self._max_connections = limits.max_connections
+        self._max_streams = max_streams_per_connection
+        self._shard_limits = _shard_limits(limits, max_streams_per_connection)
+        self._shards: List[_Shard[httpx.AsyncHTTPTransport]] = []
+
+    def _checkout(self) -> _Shard[httpx.AsyncHTTPTransport]:
+        # there is no `await` in here, so no other task can check out a shard in the meantime
+        shard = min(self._shards, key=lambda shard: shard.in_flight, default=None)
+        if shard is None or (
+            shard.in_flight >= self._max_streams
+            and (self._max_connections is None or len(self._shards) < self._max_connections)
+        ):
+            shard = _Shard(
+                httpx.AsyncHTTPTransport(
+                    verify=self._ssl_context,
+                    trust_env=self._trust_env,
+                    http1=self._http1,
+                    http2=True,
+                    limits=self._shard_limits,
+                )
+            )
+            self._shards.append(shard)
+
+        shard.in_flight += 1
+        return shard
+
+    def _checkin(self, shard: _Shard[httpx.AsyncHTTPTransport]) -> None:
+        shard.in_flight -= 1
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        shard = self._checkout()
+        try:
+            response = await shard.transport.handle_async_request(request)
+        except BaseException:
+            self._checkin(shard)
+            raise
+
+        assert isinstance(response.stream, httpx.AsyncByteStream)
+        response.stream = _AsyncTrackedStream(response.stream, lambda: self._checkin(shard))
+        return response
+
+    async def aclose(self) -> None:
+        shards, self._shards = self._shards, []
+        for shard in shards:
+            await shard.transport.aclose()
@@ -0,0 +1,158 @@
+"""Pluggable JSON encoding and decoding.
+
+By default request bodies are encoded by httpx, and response bodies and streamed events
+are decoded, with the standard library's `json` module. For large payloads, e.g. long
+`messages` histories or big swarm outputs, a faster codec can take a measurable share of
+CPU time off every request:
+
+```py
+client = SwarmsClient(json_codec="auto")  # orjson or msgspec if installed, the standard library otherwise
+```
+
+Codecs encode straight to `bytes`, which are sent as the request body as is, and decode
+from the raw response bytes without decoding them to a `str` first.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Any, List, Union
+from typing_extensions import Literal
+
+__all__ = ["JSONCodec", "OrjsonCodec", "MsgspecCodec", "JSONCodecName", "get_json_codec"]
+
+JSONCodecName = Literal["auto", "stdlib", "orjson", "msgspec"]
+
+
+def _missing_package(package: str) -> ImportError:
+    return ImportError(
+        f"Using json_codec={package!r}, but the '{package}' package is not installed. "
+        f"Make sure to install this package with the `{package}` extra, e.g. `pip install swarms-client[{package}]`"
+    )
+
+
+def _check_finite(obj: object) -> None:
+    """Raises the error of the standard library for `NaN` and infinite floats, which orjson and
+    msgspec encode as `null` instead.
+    """
+    stack: List[object] = [obj]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                raise ValueError("Out of range float values are not JSON compliant")
+        elif isinstance(value, dict):
+            stack.extend(value.keys())
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+
+
+class JSONCodec:
+    """Encodes request bodies and decodes response bodies with the standard library.
+
+    Subclass this to plug in another JSON library; `dumps()` must return UTF-8 encoded bytes.
+    """
+
+    name: str = "stdlib"
+
+    def dumps(self, obj: object) -> bytes:
+        # the same output as the `json=` encoding of httpx
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """Uses [orjson](https://github.com/ijl/orjson), requires the `orjson` extra.
+
+    Like the standard library, `NaN` and infinite floats are rejected with a `ValueError`.
+    Values it can't encode, such as integers that don't fit in 64 bits, fall back to the
+    standard library.
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError:
+            raise _missing_package("orjson") from None
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: object) -> bytes:
+        try:
+            encoded: bytes = self._orjson.dumps(obj, option=self._options)
+        except TypeError:
+            return super().dumps(obj)
+        if b"null" in encoded:
+            # only a body with a `null` can have had a non-finite float
+            _check_finite(obj)
+        return encoded
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """Uses [msgspec](https://github.com/jcrist/msgspec), requires the `msgspec` extra.
+
+    Decode errors are raised as `json.JSONDecodeError`, and `NaN` and infinite floats are
+    rejected with a `ValueError`, like the standard library does. Values msgspec can't encode, such as integers that don't fit in 64 bits, fall back to
+    the standard library.
+    """
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        try:
+            import msgspec
+        except ImportError:
+            raise _missing_package("msgspec") from None
+
+        self._decode_error = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: object) -> bytes:
+        try:
+            encoded = self._encoder.encode(obj)
+        except (TypeError, OverflowError):
+            return super().dumps(obj)
+        if b"null" in encoded:
+            # only a body with a `null` can have had a non-finite float
+            _check_finite(obj)
+        return encoded
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as exc:
+            document = data if isinstance(data, str) else data.decode("utf-8", errors="replace")
+            raise json.JSONDecodeError(str(exc), document, 0) from exc
+
+
+def get_json_codec(name: JSONCodecName = "auto") -> JSONCodec:
+    """Returns the codec of the given name; `"auto"` picks the fastest one that is installed."""
+    if name == "stdlib":
+        return JSONCodec()
+    if name == "orjson":
+        return OrjsonCodec()
+    if name == "msgspec":
+        return MsgspecCodec()
+    if name != "auto":
+        raise ValueError(f"Unknown JSON codec {name!r}, expected one of 'auto', 'stdlib', 'orjson' or 'msgspec'")
+
+    for codec_cls in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec_cls()
+        except ImportError:
+            continue
+    return JSONCodec()
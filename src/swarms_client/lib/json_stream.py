@@ -0,0 +1,211 @@
+"""Incremental decoding of JSON arrays from a response body.
+
+Batch endpoints respond with a JSON array of results, or an object that holds one. Instead
+of waiting for the whole body and decoding it at once, `JSONArrayDecoder` is fed the body
+chunk by chunk as it arrives and returns every element as soon as it is complete:
+
+```py
+for result in client.swarms.batch.run_iter(body=swarms):
+    store(result)
+```
+
+Only the element that is currently being received is buffered, so memory use is bounded
+by the largest element instead of the whole body.
+"""
+
+from __future__ import annotations
+
+import re
+import json
+from typing import Any, List, Callable, Iterable, Iterator, Optional, AsyncIterable, AsyncIterator
+
+__all__ = ["JSONArrayDecoder", "iter_json_array", "aiter_json_array"]
+
+_Loads = Callable[[bytes], Any]
+
+# the rest of a string that has been opened, up to and including the closing quote
+_STRING_END = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# as much of the rest of an unterminated string as can be skipped without splitting an escape
+_STRING_PART = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*', re.DOTALL)
+_STRUCTURAL = re.compile(rb'["\[\]{},]')
+_WHITESPACE = b" \t\n\r"
+
+_QUOTE = ord('"')
+_COMMA = ord(",")
+_OPENING = (ord("["), ord("{"))
+
+
+class JSONArrayDecoder:
+    """Decodes the elements of a JSON array from the chunks of a document as they arrive.
+
+    By default the document must be an array. With `key`, it must be an object and the
+    elements of the array at that key are decoded; the other values of the object are
+    skipped, and a missing or `null` array has no elements.
+    """
+
+    def __init__(self, *, key: Optional[str] = None, loads: _Loads = json.loads) -> None:
+        self._key = key
+        self._loads = loads
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._string_start = 0
+        self._expect_key = False
+        self._last_key: Optional[str] = None
+        # the depth of the elements of the array that is being decoded, if it has been opened
+        self._array_depth: Optional[int] = None
+        self._element_start = 0
+        self._elements = 0
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole document has been received."""
+        return self._done
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Adds the next chunk of the document and returns the elements it completed."""
+        if not chunk:
+            return []
+
+        self._buffer += chunk
+        elements: List[Any] = []
+        try:
+            self._scan(elements)
+        finally:
+            self._compact()
+        return elements
+
+    def close(self) -> None:
+        """Checks that the whole document has been received."""
+        if not self._done:
+            self._error("Expecting the rest of the JSON document", len(self._buffer))
+
+    def _scan(self, elements: List[Any]) -> None:
+        buffer = self._buffer
+        while self._pos < len(buffer):
+            if self._done:
+                if buffer[self._pos :].strip(_WHITESPACE):
+                    self._error("Extra data", self._pos)
+                self._pos = len(buffer)
+                return
+
+            if self._in_string:
+                match = _STRING_END.match(buffer, self._pos)
+                if match is None:
+                    self._pos = _STRING_PART.match(buffer, self._pos).end()  # type: ignore[union-attr]
+                    return
+
+                self._pos = match.end()
+                self._in_string = False
+                if self._expect_key and self._depth == 1:
+                    self._last_key = self._loads(bytes(buffer[self._string_start : self._pos]))
+                    self._expect_key = False
+                continue
+
+            match = _STRUCTURAL.search(buffer, self._pos)
+            start = len(buffer) if match is None else match.start()
+            if self._depth == 0 and buffer[self._pos : start].strip(_WHITESPACE):
+                self._error("Expecting '[' or '{'", self._pos)
+            if match is None:
+                self._pos = len(buffer)
+                return
+
+            self._pos = match.end()
+            char = buffer[start]
+            if char == _QUOTE:
+                if self._depth == 0:
+                    self._error("Expecting '[' or '{'", start)
+                self._in_string = True
+                self._string_start = start
+            elif char in _OPENING:
+                self._open(char, start)
+            elif char == _COMMA:
+                if self._depth == self._array_depth:
+                    self._element(elements, start)
+                    self._element_start = self._pos
+                elif self._depth == 1 and self._key is not None:
+                    self._expect_key = True
+            else:
+                self._close(elements, start)
+
+    def _open(self, char: int, start: int) -> None:
+        if self._depth == 0:
+            expected = b"[" if self._key is None else b"{"
+            if char != expected[0]:
+                self._error(f"Expecting {expected.decode()!r}", start)
+            if self._key is None:
+                self._array_depth = 1
+                self._element_start = self._pos
+            else:
+                self._expect_key = True
+        elif (
+            self._depth == 1
+            and self._key is not None
+            and self._last_key == self._key
+            and char == _OPENING[0]
+            and self._array_depth is None
+        ):
+            self._array_depth = 2
+            self._element_start = self._pos
+
+        self._depth += 1
+
+    def _close(self, elements: List[Any], start: int) -> None:
+        if self._depth == 0:
+            self._error("Unexpected closing bracket", start)
+
+        if self._depth == self._array_depth:
+            if self._elements or bytes(self._buffer[self._element_start : start]).strip(_WHITESPACE):
+                self._element(elements, start)
+            # an array at a key that comes again is not decoded twice
+            self._array_depth = -1
+
+        self._depth -= 1
+        if self._depth == 0:
+            self._done = True
+
+    def _element(self, elements: List[Any], end: int) -> None:
+        try:
+            elements.append(self._loads(bytes(self._buffer[self._element_start : end])))
+        except json.JSONDecodeError as exc:
+            self._error(exc.msg, self._element_start + exc.pos)
+        self._elements += 1
+
+    def _compact(self) -> None:
+        # drop everything that has been scanned and that isn't part of an incomplete value
+        keep = self._pos
+        if self._in_string and self._expect_key:
+            keep = min(keep, self._string_start)
+        if self._array_depth is not None and self._array_depth > 0:
+            keep = min(keep, self._element_start)
+        if keep == 0:
+            return
+
+        del self._buffer[:keep]
+        self._pos -= keep
+        self._string_start -= keep
+        self._element_start -= keep
+
+    def _error(self, message: str, pos: int) -> None:
+        raise json.JSONDecodeError(message, self._buffer.decode("utf-8", errors="replace"), max(pos, 0))
+
+
+def iter_json_array(chunks: Iterable[bytes], *, key: Optional[str] = None, loads: _Loads = json.loads) -> Iterator[Any]:
+    """Yields the elements of the JSON array in the given chunks as soon as each is complete."""
+    decoder = JSONArrayDecoder(key=key, loads=loads)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    decoder.close()
+
+
+async def aiter_json_array(
+    chunks: AsyncIterable[bytes], *, key: Optional[str] = None, loads: _Loads = json.loads
+) -> AsyncIterator[Any]:
+    """Yields the elements of the JSON array in the given chunks as soon as each is complete."""
+    decoder = JSONArrayDecoder(key=key, loads=loads)
+    async for chunk in chunks:
+        for element in decoder.feed(chunk):
+            yield element
+    decoder.close()
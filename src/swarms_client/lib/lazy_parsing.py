@@ -0,0 +1,241 @@
+"""Lazy parsing of large response fields.
+
+Fields typed `object`, such as `SwarmRunResponse.output`, `AgentRunResponse.outputs` and
+`SwarmGetLogsResponse.logs`, hold arbitrary JSON and can be tens of MB of conversation
+history. With `lazy_parsing=True`, the response body is scanned once and these fields are
+only decoded the first time they are accessed; until then they are kept as a `memoryview`
+of the raw body, so callers that only read metadata never pay for them:
+
+```py
+client = SwarmsClient(lazy_parsing=True)
+
+run = client.swarms.run(...)
+print(run.job_id, run.usage, run.execution_time)  # `run.output` is never decoded
+```
+
+Lazily parsed models are instances of a subclass of the response model that decodes any
+pending fields before they are dumped, compared, copied or pickled.
+
+The body is scanned with msgspec, which is several times faster than decoding it. Without
+msgspec, scanning the body would be slower than decoding it, so `lazy_parsing=True` has no
+effect and responses are parsed eagerly.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any, Dict, Tuple, Union, Callable, Optional, cast
+
+import pydantic
+
+from .._compat import PYDANTIC_V2, get_model_fields, field_get_default
+from .._models import BaseModel, construct_type
+from .._utils._utils import lru_cache
+
+__all__ = ["construct_lazy", "is_lazy", "pending_fields", "scan_object"]
+
+_Loads = Callable[[bytes], Any]
+
+# the annotations of fields that hold arbitrary JSON
+_ARBITRARY_JSON_TYPES = (object, Any, Optional[object], Optional[Any])
+
+
+def scan_object(body: bytes, lazy_keys: frozenset[str]) -> Tuple[bytes, Dict[str, memoryview]] | None:
+    """Splits a JSON object into the values of `lazy_keys` and the rest of the object.
+
+    Returns the rest of the object as JSON, and a zero-copy view of the body for each of the
+    given keys that holds an object, array or string. Returns `None` if the body isn't a
+    well-formed JSON object, so that it can be decoded as usual, with the usual errors, or
+    if msgspec isn't installed, so that it's decoded eagerly.
+    """
+    decoder = _raw_decoder()
+    if decoder is None:
+        return None
+
+    try:
+        raw_values = decoder.decode(body)
+    except Exception:
+        return None
+
+    lazy: Dict[str, memoryview] = {}
+    rest: list[bytes] = []
+    for key, raw in raw_values.items():
+        value = memoryview(raw)
+        if key in lazy_keys and value[:1] in (b"{", b"[", b'"'):
+            lazy[key] = value
+        else:
+            rest.append(json.dumps(key).encode() + b":" + bytes(value))
+
+    return b"{" + b",".join(rest) + b"}", lazy
+
+
+@lru_cache(maxsize=None)
+def _raw_decoder() -> Any:
+    try:
+        import msgspec
+    except ImportError:
+        return None
+
+    return msgspec.json.Decoder(Dict[str, msgspec.Raw])
+
+
+@lru_cache(maxsize=None)
+def _lazy_fields(cls: type[BaseModel]) -> Dict[str, str]:
+    """Returns the aliases of the fields that can be parsed lazily, mapped to their names."""
+    if not PYDANTIC_V2:
+        return {}
+
+    return {
+        field.alias or name: name
+        for name, field in get_model_fields(cls).items()
+        if field.annotation in _ARBITRARY_JSON_TYPES
+    }
+
+
+class _LazyFields:
+    """Decodes the pending fields of a lazily parsed model on first access."""
+
+    __slots__ = ()
+
+    if TYPE_CHECKING:
+        _lazy_pending: Dict[str, memoryview]
+        _lazy_loads: _Loads
+        __dict__: Dict[str, Any]
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_lazy_"):
+            raise AttributeError(name)
+
+        try:
+            raw = self._lazy_pending[name]
+        except (AttributeError, KeyError):
+            return super().__getattr__(name)  # type: ignore[misc]
+
+        value = self._lazy_loads(bytes(raw))
+        fields = get_model_fields(cast("type[BaseModel]", type(self)))
+        field = fields[name]
+        if value is None:
+            value = field_get_default(field)
+        else:
+            value = construct_type(value=value, type_=field.annotation, metadata=field.metadata)
+
+        # keep the fields in the order they would have been in if decoded eagerly
+        values = {**self.__dict__, name: value}
+        object.__setattr__(self, "__dict__", {key: values[key] for key in fields if key in values})
+        self._lazy_pending.pop(name, None)
+        return value
+
+    def _decode_pending(self) -> None:
+        for name in list(getattr(self, "_lazy_pending", ())):
+            getattr(self, name)
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        self._decode_pending()
+        return super().model_dump(**kwargs)  # type: ignore[misc, no-any-return]
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        self._decode_pending()
+        return super().model_dump_json(**kwargs)  # type: ignore[misc, no-any-return]
+
+    def model_copy(self, **kwargs: Any) -> Any:
+        self._decode_pending()
+        return super().model_copy(**kwargs)  # type: ignore[misc]
+
+    def __copy__(self) -> Any:
+        self._decode_pending()
+        return super().__copy__()  # type: ignore[misc]
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> Any:
+        self._decode_pending()
+        return super().__deepcopy__(memo)  # type: ignore[misc]
+
+    def __eq__(self, other: object) -> bool:
+        # pydantic only considers models of the same class equal
+        self._decode_pending()
+        if isinstance(other, _LazyFields):
+            other._decode_pending()
+        if not isinstance(other, pydantic.BaseModel) or _model_class(other) is not _model_class(self):
+            return NotImplemented
+
+        return (
+            self.__dict__ == other.__dict__
+            and self.__pydantic_private__ == other.__pydantic_private__  # type: ignore[attr-defined]
+            and self.__pydantic_extra__ == other.__pydantic_extra__  # type: ignore[attr-defined]
+        )
+
+    def __iter__(self) -> Any:
+        self._decode_pending()
+        return super().__iter__()  # type: ignore[misc]
+
+    def __repr_args__(self) -> Any:
+        self._decode_pending()
+        return super().__repr_args__()  # type: ignore[misc]
+
+    def __reduce__(self) -> Union[str, Tuple[Any, ...]]:
+        # unpickle as the model class itself, as this subclass can't be imported
+        self._decode_pending()
+        return (_unpickle, (_model_class(self), self.__getstate__()))  # type: ignore[attr-defined]
+
+
+def _model_class(model: object) -> type:
+    if isinstance(model, _LazyFields):
+        return type(model).__bases__[1]
+    return type(model)
+
+
+def _unpickle(cls: type[pydantic.BaseModel], state: Dict[str, Any]) -> pydantic.BaseModel:
+    model = cls.__new__(cls)
+    model.__setstate__(state)
+    return model
+
+
+@lru_cache(maxsize=None)
+def _lazy_model(cls: type[BaseModel]) -> type[BaseModel]:
+    namespace = {
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__slots__": ("_lazy_pending", "_lazy_loads"),
+    }
+    return type(cls.__name__, (_LazyFields, cls), namespace)
+
+
+def construct_lazy(cls: type[BaseModel], body: bytes, loads: _Loads) -> BaseModel | None:
+    """Constructs the model from the response body, leaving its `object` fields undecoded.
+
+    Returns `None` if the model has no such fields, the body isn't a JSON object or msgspec
+    isn't installed, in which case the body should be decoded eagerly.
+    """
+    lazy_fields = _lazy_fields(cls)
+    if not lazy_fields:
+        return None
+
+    scanned = scan_object(body, frozenset(lazy_fields))
+    if scanned is None:
+        return None
+
+    rest, lazy = scanned
+    data = loads(rest)
+    if not lazy:
+        return construct_type(type_=cls, value=data)  # type: ignore[return-value]
+
+    model: Any = construct_type(type_=_lazy_model(cls), value=data)
+    pending = {lazy_fields[key]: raw for key, raw in lazy.items()}
+    for name in pending:
+        # until it is accessed, the field is only in the fields set
+        model.__dict__.pop(name, None)
+        model.__pydantic_fields_set__.add(name)
+
+    object.__setattr__(model, "_lazy_pending", pending)
+    object.__setattr__(model, "_lazy_loads", loads)
+    return model  # type: ignore[no-any-return]
+
+
+def is_lazy(model: pydantic.BaseModel) -> bool:
+    """Whether any fields of the model are still waiting to be decoded."""
+    return bool(pending_fields(model))
+
+
+def pending_fields(model: pydantic.BaseModel) -> Dict[str, int]:
+    """The names of the fields of the model that haven't been decoded yet, mapped to their size in bytes."""
+    pending: Dict[str, memoryview] = getattr(model, "_lazy_pending", {})
+    return {name: raw.nbytes for name, raw in pending.items()}
@@ -0,0 +1,258 @@
+"""Connection pool instrumentation.
+
+A `PoolMetrics` instance records how long requests wait for a connection from the pool
+of the underlying httpx client, and whether they were sent over a new or a reused
+connection. Its `stats()` also include the live number of active and idle connections,
+so that pool limits can be sized from data.
+
+The live counts are read from the connection pools of httpcore 1.x. With other versions,
+or if the pools can't be read, they are `None` while the recorded counters still work.
+
+```py
+metrics = PoolMetrics()
+client = SwarmsClient(pool_metrics=metrics)
+
+...
+stats = metrics.stats()
+print(stats["active"], stats["idle"], stats["reuse_ratio"], stats["wait_buckets"])
+```
+"""
+
+from __future__ import annotations
+
+import weakref
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union, Iterable, Optional, Sequence
+from typing_extensions import TypedDict
+
+import httpx
+import httpcore
+
+if TYPE_CHECKING:
+    from .timing import RequestTiming
+
+__all__ = ["PoolMetrics", "PoolStats", "HostPoolStats", "DEFAULT_WAIT_BUCKETS"]
+
+DEFAULT_WAIT_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+"""The upper bounds, in seconds, of the buckets of the pool wait histogram."""
+
+
+class HostPoolStats(TypedDict):
+    active: Optional[int]
+    """The number of connections to this host with a request in flight, `None` if the pools can't be read."""
+
+    idle: Optional[int]
+    """The number of idle keep-alive connections to this host, `None` if the pools can't be read."""
+
+    new_connections: int
+    """The number of requests to this host that had to open a new connection."""
+
+    reused_connections: int
+    """The number of requests to this host that were sent over a pooled connection."""
+
+
+class PoolStats(TypedDict):
+    active: Optional[int]
+    """The number of connections with a request in flight, including connections being opened,
+    `None` if the pools can't be read.
+    """
+
+    idle: Optional[int]
+    """The number of idle keep-alive connections, `None` if the pools can't be read."""
+
+    queued: Optional[int]
+    """The number of requests currently waiting for a connection, `None` if the pools can't be read."""
+
+    requests: int
+    """The number of requests that were sent."""
+
+    new_connections: int
+    """The number of requests that had to open a new connection."""
+
+    reused_connections: int
+    """The number of requests that were sent over a pooled connection."""
+
+    reuse_ratio: Optional[float]
+    """The share of requests that were sent over a pooled connection, `None` before any request was sent."""
+
+    wait_count: int
+    """The number of recorded pool waits."""
+
+    wait_sum: float
+    """The total time requests spent waiting for a connection, in seconds."""
+
+    wait_max: float
+    """The longest time a request spent waiting for a connection, in seconds."""
+
+    wait_buckets: List[Tuple[float, int]]
+    """Cumulative histogram of pool waits as `(upper_bound, count)` pairs, ending with `inf`."""
+
+    hosts: Dict[str, HostPoolStats]
+    """The stats above broken down per `host:port`."""
+
+
+# the pools are read through private attributes of httpcore that are only known for 1.x
+_POOLS_READABLE = httpcore.__version__.split(".")[0] == "1"
+
+
+def _host_key(host: str, port: int | None, scheme: str) -> str:
+    if port is None:
+        port = 443 if scheme == "https" else 80
+    return f"{host}:{port}"
+
+
+def _iter_pools(http_client: Union[httpx.Client, httpx.AsyncClient]) -> Iterable[Any]:
+    transports = [http_client._transport, *http_client._mounts.values()]  # pyright: ignore[reportPrivateUsage]
+    for transport in transports:
+        # the HTTP/2 transports hold a connection pool per shard
+        shards = getattr(transport, "_shards", None)
+        if shards is not None:
+            for shard in list(shards):
+                pool = getattr(shard.transport, "_pool", None)
+                if pool is not None:
+                    yield pool
+            continue
+
+        pool = getattr(transport, "_pool", None)
+        if pool is not None:
+            yield pool
+
+
+class PoolMetrics:
+    """Records connection pool waits and connection reuse of the clients it is passed to.
+
+    Waits are measured from the moment a request is handed to the httpx client until it
+    starts opening a new connection or starts sending over a pooled one, using the httpx
+    `trace` request extension. Requests sent through a custom transport that doesn't
+    support the extension are counted, but not as new or reused connections.
+
+    A single instance can be shared between clients, e.g. those created with `.with_options()`,
+    and is thread-safe.
+    """
+
+    def __init__(self, *, buckets: Sequence[float] = DEFAULT_WAIT_BUCKETS) -> None:
+        if list(buckets) != sorted(buckets) or any(bound <= 0 for bound in buckets):
+            raise ValueError("`buckets` must be positive and sorted in ascending order")
+
+        self._bounds = [*buckets, float("inf")]
+        self._lock = threading.Lock()
+        self._http_clients: weakref.WeakSet[Union[httpx.Client, httpx.AsyncClient]] = weakref.WeakSet()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._requests = 0
+        self._new = 0
+        self._reused = 0
+        self._wait_sum = 0.0
+        self._wait_max = 0.0
+        self._bucket_counts = [0] * len(self._bounds)
+        self._hosts: Dict[str, List[int]] = {}
+
+    def reset(self) -> None:
+        """Clears all recorded waits and connection counts."""
+        with self._lock:
+            self._reset()
+
+    def _attach(self, http_client: Union[httpx.Client, httpx.AsyncClient]) -> None:
+        with self._lock:
+            self._http_clients.add(http_client)
+
+    def _record_attempt(self, url: httpx.URL, timing: RequestTiming) -> None:
+        # requests that never got a connection, e.g. because of a pool timeout, still record their wait
+        self._record(_host_key(url.host, url.port, url.scheme), timing._waited(), new=timing.new_connection)
+
+    def _record(self, host: str, wait: float, *, new: bool | None) -> None:
+        with self._lock:
+            self._requests += 1
+            self._wait_sum += wait
+            self._wait_max = max(self._wait_max, wait)
+            for i, bound in enumerate(self._bounds):
+                if wait <= bound:
+                    self._bucket_counts[i] += 1
+                    break
+
+            if new is None:
+                return
+
+            host_counts = self._hosts.setdefault(host, [0, 0])
+            if new:
+                self._new += 1
+                host_counts[0] += 1
+            else:
+                self._reused += 1
+                host_counts[1] += 1
+
+    def stats(self) -> PoolStats:
+        """Returns the recorded counters together with a snapshot of the connection pools."""
+        with self._lock:
+            http_clients = list(self._http_clients)
+            wait_buckets: List[Tuple[float, int]] = []
+            total = 0
+            for bound, count in zip(self._bounds, self._bucket_counts):
+                total += count
+                wait_buckets.append((bound, total))
+
+            recorded_hosts = {host: (new, reused) for host, (new, reused) in self._hosts.items()}
+            connections = self._new + self._reused
+            stats: PoolStats = {
+                "active": None,
+                "idle": None,
+                "queued": None,
+                "requests": self._requests,
+                "new_connections": self._new,
+                "reused_connections": self._reused,
+                "reuse_ratio": self._reused / connections if connections else None,
+                "wait_count": total,
+                "wait_sum": self._wait_sum,
+                "wait_max": self._wait_max,
+                "wait_buckets": wait_buckets,
+                "hosts": {},
+            }
+
+        pools = _read_pools(http_clients) if _POOLS_READABLE else None
+        if pools is not None:
+            stats["active"], stats["idle"], stats["queued"], live_hosts = pools
+        else:
+            live_hosts = {}
+
+        for host in [*recorded_hosts, *(host for host in live_hosts if host not in recorded_hosts)]:
+            new, reused = recorded_hosts.get(host, (0, 0))
+            active, idle = live_hosts.get(host, (0, 0)) if pools is not None else (None, None)
+            stats["hosts"][host] = {
+                "active": active,
+                "idle": idle,
+                "new_connections": new,
+                "reused_connections": reused,
+            }
+        return stats
+
+
+def _read_pools(
+    http_clients: Iterable[Union[httpx.Client, httpx.AsyncClient]],
+) -> Optional[Tuple[int, int, int, Dict[str, Tuple[int, int]]]]:
+    """Returns the active, idle and queued connections, and the active and idle ones per host,
+    or `None` if the pools don't look like the ones of httpcore 1.x.
+    """
+    active = idle = queued = 0
+    hosts: Dict[str, Tuple[int, int]] = {}
+    try:
+        # the pools are read without holding their locks, so this is a best-effort snapshot
+        for http_client in http_clients:
+            for pool in _iter_pools(http_client):
+                queued += sum(1 for request in list(pool._requests) if request.is_queued())
+                for connection in list(pool.connections):
+                    if connection.is_closed():
+                        continue
+
+                    origin = connection._origin
+                    host = _host_key(origin.host.decode("ascii"), origin.port, origin.scheme.decode("ascii"))
+                    host_active, host_idle = hosts.get(host, (0, 0))
+                    if connection.is_idle():
+                        idle += 1
+                        hosts[host] = (host_active, host_idle + 1)
+                    else:
+                        active += 1
+                        hosts[host] = (host_active + 1, host_idle)
+    except (AttributeError, TypeError):
+        return None
+    return active, idle, queued, hosts
@@ -0,0 +1,321 @@
+"""Local validation of swarm and agent specs before they are sent.
+
+A typo in a `model_name`, a `swarm_type` the API doesn't support or a `max_tokens` above the
+tokens allowed per agent would otherwise only be reported by the API, after a full round
+trip, and fail a whole batch. With a `Preflight` validator, `swarms.run()`, `agent.run()`
+and both `batch.run()` methods check their specs against the API's catalogs first, and
+raise a `PreflightError` that lists every problem instead of sending the request:
+
+```py
+client = SwarmsClient(preflight=Preflight(), catalog_cache=CatalogCache())
+
+client.swarms.run(
+    swarm_type="SequentialWorkflow",
+    agents=[{"agent_name": "writer", "model_name": "gpt-4o-mnii"}],
+    task="...",
+)
+# PreflightError: agents[0].model_name: unknown model 'gpt-4o-mnii', did you mean 'gpt-4o-mini'?
+```
+
+The catalogs come from `models.list_available()`, `swarms.check_available()` and
+`client.rate.get_limits()`, and are fetched once every `ttl` seconds, through the client's
+`CatalogCache` if it has one. The result of validating a spec is memoised by the fields
+that are checked, so validating the same specs again costs a few dictionary lookups.
+
+Checks whose catalog can't be fetched, or has an unexpected shape, are skipped, so that the
+validator never fails a request that the API would have accepted.
+"""
+
+from __future__ import annotations
+
+import time
+import difflib
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Callable, Hashable, Iterable, Optional, FrozenSet
+
+from .._utils import is_list, is_mapping
+from .rate_limit import RATE_LIMITS_PATH
+from .._exceptions import APIError, SwarmsClientError
+from ..types.model_list_available_response import ModelListAvailableResponse
+from ..types.swarm_check_available_response import SwarmCheckAvailableResponse
+from ..types.client.rate_get_limits_response import RateGetLimitsResponse
+
+if TYPE_CHECKING:
+    from .._base_client import SyncAPIClient, AsyncAPIClient
+
+__all__ = ["Preflight", "PreflightError", "PREFLIGHT_PATHS"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+MODELS_PATH = "/v1/models/available"
+SWARM_TYPES_PATH = "/v1/swarms/available"
+
+SWARM_PATH = "/v1/swarm/completions"
+SWARM_BATCH_PATH = "/v1/swarm/batch/completions"
+AGENT_PATH = "/v1/agent/completions"
+AGENT_BATCH_PATH = "/v1/agent/batch/completions"
+
+PREFLIGHT_PATHS = frozenset({SWARM_PATH, SWARM_BATCH_PATH, AGENT_PATH, AGENT_BATCH_PATH})
+"""The endpoints whose request bodies are validated."""
+
+# how long to wait before fetching a catalog again after it couldn't be fetched
+_FAILED_FETCH_TTL = 30.0
+
+# memoised results are dropped once there are this many, e.g. with generated max_tokens
+_MAX_MEMO_SIZE = 4096
+
+_Problems = Tuple[str, ...]
+
+
+class PreflightError(SwarmsClientError):
+    """Raised instead of sending a request whose specs are known to be rejected by the API."""
+
+    problems: List[str]
+    """Every problem that was found, prefixed with the path of the field in the request body."""
+
+    def __init__(self, problems: List[str]) -> None:
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+
+class _Catalogs:
+    """A snapshot of the catalogs, and the specs that were validated against it."""
+
+    def __init__(
+        self,
+        *,
+        models: Optional[FrozenSet[str]],
+        swarm_types: Optional[FrozenSet[str]],
+        tokens_per_agent: Optional[int],
+        expires: float,
+    ) -> None:
+        self.models = models
+        self.swarm_types = swarm_types
+        self.tokens_per_agent = tokens_per_agent
+        self.expires = expires
+        self.memo: Dict[Hashable, _Problems] = {}
+
+
+class Preflight:
+    """Validates swarm and agent specs against the API's catalogs before they are sent.
+
+    An instance can be shared between clients of the same account, and is safe to use from
+    multiple threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 300.0,
+        models: bool = True,
+        swarm_types: bool = True,
+        max_tokens: bool = True,
+    ) -> None:
+        self.ttl = ttl
+        self.check_models = models
+        self.check_swarm_types = swarm_types
+        self.check_max_tokens = max_tokens
+        self.paths = PREFLIGHT_PATHS
+        self._lock = threading.Lock()
+        self._catalogs: Optional[_Catalogs] = None
+
+    def clear(self) -> None:
+        """Drops the catalogs, so that they are fetched again before the next validation."""
+        with self._lock:
+            self._catalogs = None
+
+    def _check(self, client: SyncAPIClient, path: str, body: object) -> None:
+        catalogs = self._current()
+        if catalogs is None:
+            catalogs = self._store(self._fetch(lambda fetch_path, cast_to: client.get(fetch_path, cast_to=cast_to)))
+        _raise_for(_validate(catalogs, path, body))
+
+    async def _acheck(self, client: AsyncAPIClient, path: str, body: object) -> None:
+        catalogs = self._current()
+        if catalogs is None:
+            results: Dict[str, Any] = {}
+            for fetch_path, cast_to in self._requests():
+                try:
+                    results[fetch_path] = await client.get(fetch_path, cast_to=cast_to)
+                except APIError as err:
+                    log.debug("Could not fetch %s for preflight validation: %s", fetch_path, err)
+            catalogs = self._store(self._parse(results))
+        _raise_for(_validate(catalogs, path, body))
+
+    def _current(self) -> Optional[_Catalogs]:
+        with self._lock:
+            catalogs = self._catalogs
+        if catalogs is None or catalogs.expires <= time.monotonic():
+            return None
+        return catalogs
+
+    def _store(self, catalogs: _Catalogs) -> _Catalogs:
+        with self._lock:
+            self._catalogs = catalogs
+        return catalogs
+
+    def _requests(self) -> List[Tuple[str, type]]:
+        requests: List[Tuple[str, type]] = []
+        if self.check_models:
+            requests.append((MODELS_PATH, ModelListAvailableResponse))
+        if self.check_swarm_types:
+            requests.append((SWARM_TYPES_PATH, SwarmCheckAvailableResponse))
+        if self.check_max_tokens:
+            requests.append((RATE_LIMITS_PATH, RateGetLimitsResponse))
+        return requests
+
+    def _fetch(self, get: Callable[[str, type], Any]) -> _Catalogs:
+        results: Dict[str, Any] = {}
+        for fetch_path, cast_to in self._requests():
+            try:
+                results[fetch_path] = get(fetch_path, cast_to)
+            except APIError as err:
+                log.debug("Could not fetch %s for preflight validation: %s", fetch_path, err)
+        return self._parse(results)
+
+    def _parse(self, results: Dict[str, Any]) -> _Catalogs:
+        models = results.get(MODELS_PATH)
+        swarm_types = results.get(SWARM_TYPES_PATH)
+        limits = results.get(RATE_LIMITS_PATH)
+
+        catalogs = _Catalogs(
+            models=None if models is None else _names(models.models),
+            swarm_types=None if swarm_types is None else _names(swarm_types.swarm_types),
+            tokens_per_agent=None if limits is None or limits.limits is None else limits.limits.tokens_per_agent,
+            expires=0.0,
+        )
+        # the checks of catalogs that couldn't be fetched are skipped until they're fetched again
+        ttl = self.ttl if len(results) == len(self._requests()) else min(self.ttl, _FAILED_FETCH_TTL)
+        catalogs.expires = time.monotonic() + ttl
+        return catalogs
+
+
+def _names(catalog: object) -> Optional[FrozenSet[str]]:
+    """Returns the names in a catalog, which is either a list of names or of objects with a name, or a mapping by name."""
+    if is_mapping(catalog):
+        return frozenset(str(name) for name in catalog)
+    if not is_list(catalog):
+        return None
+
+    names: List[str] = []
+    for item in catalog:
+        if isinstance(item, str):
+            names.append(item)
+        elif is_mapping(item):
+            name = item.get("name") or item.get("model_name") or item.get("id") or item.get("swarm_type")
+            if not isinstance(name, str):
+                return None
+            names.append(name)
+        else:
+            return None
+    return frozenset(names)
+
+
+def _raise_for(problems: List[str]) -> None:
+    if problems:
+        raise PreflightError(problems)
+
+
+def _validate(catalogs: _Catalogs, path: str, body: object) -> List[str]:
+    problems: List[str] = []
+    if path == SWARM_PATH:
+        _validate_swarm(catalogs, body, "", problems)
+    elif path == AGENT_PATH:
+        _validate_agent_run(catalogs, body, "", problems)
+    elif is_list(body):
+        validate = _validate_swarm if path == SWARM_BATCH_PATH else _validate_agent_run
+        for index, item in enumerate(body):
+            validate(catalogs, item, f"body[{index}].", problems)
+    return problems
+
+
+def _validate_swarm(catalogs: _Catalogs, spec: object, prefix: str, problems: List[str]) -> None:
+    if not is_mapping(spec):
+        return
+
+    fingerprint = (
+        "swarm",
+        spec.get("swarm_type"),
+        spec.get("heavy_swarm_question_agent_model_name"),
+        spec.get("heavy_swarm_worker_model_name"),
+    )
+    for problem in _memoised(catalogs, fingerprint, lambda: _swarm_problems(catalogs, fingerprint)):
+        problems.append(prefix + problem)
+
+    agents = spec.get("agents")
+    if is_list(agents):
+        for index, agent in enumerate(agents):
+            _validate_agent(catalogs, agent, f"{prefix}agents[{index}].", problems)
+
+
+def _validate_agent_run(catalogs: _Catalogs, params: object, prefix: str, problems: List[str]) -> None:
+    if is_mapping(params):
+        _validate_agent(catalogs, params.get("agent_config"), f"{prefix}agent_config.", problems)
+
+
+def _validate_agent(catalogs: _Catalogs, spec: object, prefix: str, problems: List[str]) -> None:
+    if not is_mapping(spec):
+        return
+
+    fingerprint = ("agent", spec.get("model_name"), spec.get("max_tokens"))
+    for problem in _memoised(catalogs, fingerprint, lambda: _agent_problems(catalogs, fingerprint)):
+        problems.append(prefix + problem)
+
+
+def _memoised(catalogs: _Catalogs, fingerprint: Tuple[Any, ...], validate: Callable[[], _Problems]) -> _Problems:
+    memo = catalogs.memo
+    try:
+        return memo[fingerprint]
+    except KeyError:
+        pass
+    except TypeError:
+        # e.g. a list given through `extra_body`, which can't be memoised
+        return validate()
+
+    result = validate()
+    if len(memo) >= _MAX_MEMO_SIZE:
+        memo.clear()
+    memo[fingerprint] = result
+    return result
+
+
+def _swarm_problems(catalogs: _Catalogs, fingerprint: Tuple[Any, ...]) -> _Problems:
+    _, swarm_type, question_model, worker_model = fingerprint
+    problems: List[str] = []
+    if isinstance(swarm_type, str) and catalogs.swarm_types is not None and swarm_type not in catalogs.swarm_types:
+        problems.append(
+            f"swarm_type: unsupported swarm type {swarm_type!r}{_suggestion(swarm_type, catalogs.swarm_types)}"
+        )
+    for field, model in (
+        ("heavy_swarm_question_agent_model_name", question_model),
+        ("heavy_swarm_worker_model_name", worker_model),
+    ):
+        problem = _model_problem(catalogs, model)
+        if problem is not None:
+            problems.append(f"{field}: {problem}")
+    return tuple(problems)
+
+
+def _agent_problems(catalogs: _Catalogs, fingerprint: Tuple[Any, ...]) -> _Problems:
+    _, model, max_tokens = fingerprint
+    problems: List[str] = []
+    problem = _model_problem(catalogs, model)
+    if problem is not None:
+        problems.append(f"model_name: {problem}")
+
+    limit = catalogs.tokens_per_agent
+    if isinstance(max_tokens, int) and limit is not None and max_tokens > limit:
+        problems.append(f"max_tokens: {max_tokens} is above the limit of {limit} tokens per agent")
+    return tuple(problems)
+
+
+def _model_problem(catalogs: _Catalogs, model: object) -> Optional[str]:
+    if not isinstance(model, str) or catalogs.models is None or model in catalogs.models:
+        return None
+    return f"unknown model {model!r}{_suggestion(model, catalogs.models)}"
+
+
+def _suggestion(value: str, names: Iterable[str]) -> str:
+    matches = difflib.get_close_matches(value, sorted(names), n=1)
+    return f", did you mean {matches[0]!r}?" if matches else ""
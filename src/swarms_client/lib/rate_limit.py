@@ -0,0 +1,297 @@
+"""Proactive client-side rate limiting.
+
+A `RateLimiter` keeps a token bucket for each of the per-minute, per-hour and per-day
+request limits of the API key. The buckets are seeded from `client.client.rate.get_limits()`,
+re-synced periodically and from response headers, and requests that would exceed a limit
+wait locally instead of being sent, rejected with a 429 and retried.
+
+```py
+client = SwarmsClient(rate_limiter=RateLimiter())
+```
+"""
+
+from __future__ import annotations
+
+import time
+import logging
+import threading
+import email.utils
+from typing import TYPE_CHECKING, Dict, List, Tuple, Iterator, Optional
+from datetime import datetime, timezone
+from contextlib import contextmanager
+
+import anyio
+import httpx
+
+from .._exceptions import SwarmsClientError
+
+if TYPE_CHECKING:
+    from ..types.client.rate_get_limits_response import RateGetLimitsResponse
+
+__all__ = ["RateLimiter", "RateLimitWaitTimeout", "RATE_LIMITS_PATH"]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+RATE_LIMITS_PATH = "/v1/rate/limits"
+"""Requests to this path are used to sync the limiter and are never rate limited themselves."""
+
+WINDOWS: Tuple[Tuple[str, float], ...] = (("minute", 60.0), ("hour", 3600.0), ("day", 86400.0))
+
+# layout of the limiter state, followed by `_CAPACITY`, `_TOKENS` & `_UPDATED_AT` for every window
+_BLOCKED_UNTIL = 0
+_NEXT_SYNC = 1
+_HEADER_SIZE = 2
+_CAPACITY = 0
+_TOKENS = 1
+_UPDATED_AT = 2
+_WINDOW_SIZE = 3
+
+STATE_SIZE = _HEADER_SIZE + _WINDOW_SIZE * len(WINDOWS)
+
+
+class RateLimitWaitTimeout(SwarmsClientError):
+    """Raised when a request would have to wait longer than the limiter's `max_wait` to be sent."""
+
+    wait: float
+    """The number of seconds the request would have had to wait."""
+
+    def __init__(self, wait: float) -> None:
+        super().__init__(f"Request would exceed the client-side rate limit for another {wait:.2f} seconds")
+        self.wait = wait
+
+
+def _parse_reset_time(value: str) -> float | None:
+    try:
+        reset = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+    if reset.tzinfo is None:
+        reset = reset.replace(tzinfo=timezone.utc)
+    return reset.timestamp()
+
+
+def _parse_retry_after(headers: httpx.Headers) -> float | None:
+    retry_ms_header = headers.get("retry-after-ms")
+    if retry_ms_header is not None:
+        try:
+            return float(retry_ms_header) / 1000
+        except ValueError:
+            pass
+
+    retry_header = headers.get("retry-after")
+    if retry_header is None:
+        return None
+
+    try:
+        return float(retry_header)
+    except ValueError:
+        pass
+
+    retry_date_tuple = email.utils.parsedate_tz(retry_header)
+    if retry_date_tuple is None:
+        return None
+    return email.utils.mktime_tz(retry_date_tuple) - time.time()
+
+
+def _parse_int_header(headers: httpx.Headers, name: str) -> int | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Token bucket rate limiter for the per-minute, per-hour and per-day request limits of an API key.
+
+    Each request takes one token from every bucket and, if a bucket is empty, waits until it has
+    refilled; tokens are reserved up front so that waiting requests are sent in the order they
+    arrived. Buckets refill continuously at `limit / window` tokens per second.
+
+    The limiter learns the limits of the API key by calling `client.client.rate.get_limits()` on the
+    first request and then every `resync_interval` seconds. It also honours
+    `x-ratelimit-limit-{minute,hour,day}` and `x-ratelimit-remaining-{minute,hour,day}` response
+    headers when the API sends them, and pauses all requests for the duration of the `retry-after`
+    header of a 429 response. Until the first sync has completed, requests are not limited.
+
+    If a request would have to wait for more than `max_wait` seconds, `RateLimitWaitTimeout` is
+    raised instead of waiting, e.g. once the daily limit has been used up.
+
+    A limiter is thread-safe and can be shared between multiple clients using the same API key,
+    including sync and async clients.
+    """
+
+    def __init__(self, *, resync_interval: float = 60.0, max_wait: float | None = None) -> None:
+        if resync_interval <= 0:
+            raise ValueError("`resync_interval` must be positive")
+        if max_wait is not None and max_wait < 0:
+            raise ValueError("`max_wait` cannot be negative")
+
+        self._resync_interval = resync_interval
+        self._max_wait = max_wait
+        self._lock = threading.Lock()
+        self._state: List[float] = [0.0] * STATE_SIZE
+
+    @contextmanager
+    def _locked(self) -> Iterator[List[float]]:
+        """Yields the mutable limiter state while holding the lock."""
+        with self._lock:
+            yield self._state
+
+    def limits(self) -> Dict[str, Optional[int]]:
+        """Returns the currently known limit for each window, or `None` if it is not known yet."""
+        with self._locked() as state:
+            return {
+                name: int(state[_HEADER_SIZE + i * _WINDOW_SIZE + _CAPACITY]) or None
+                for i, (name, _period) in enumerate(WINDOWS)
+            }
+
+    def should_sync(self) -> bool:
+        """Returns `True` if the caller should fetch the current limits and pass them to `sync()`.
+
+        Only one caller is told to sync per `resync_interval`, even if the sync fails.
+        """
+        now = time.time()
+        with self._locked() as state:
+            if now < state[_NEXT_SYNC]:
+                return False
+
+            state[_NEXT_SYNC] = now + self._resync_interval
+            return True
+
+    def sync(self, limits: RateGetLimitsResponse) -> None:
+        """Updates the buckets from the response of `client.client.rate.get_limits()`."""
+        now = time.time()
+        with self._locked() as state:
+            for i, (name, _period) in enumerate(WINDOWS):
+                limit: int | None = None
+                remaining: int | None = None
+                reset_at: float | None = None
+
+                if limits.limits is not None:
+                    limit = getattr(limits.limits, f"maximum_requests_per_{name}")
+                if limits.rate_limits is not None:
+                    usage = getattr(limits.rate_limits, name)
+                    limit = usage.limit
+                    remaining = usage.remaining
+                    reset_at = _parse_reset_time(usage.reset_time)
+
+                self._update_window(state, i, now, limit=limit, remaining=remaining)
+                if remaining is not None and remaining <= 0 and reset_at is not None:
+                    state[_BLOCKED_UNTIL] = max(state[_BLOCKED_UNTIL], reset_at)
+
+    def observe(self, response: httpx.Response) -> None:
+        """Updates the buckets from the headers of an API response."""
+        now = time.time()
+        headers = response.headers
+        with self._locked() as state:
+            for i, (name, _period) in enumerate(WINDOWS):
+                self._update_window(
+                    state,
+                    i,
+                    now,
+                    limit=_parse_int_header(headers, f"x-ratelimit-limit-{name}"),
+                    remaining=_parse_int_header(headers, f"x-ratelimit-remaining-{name}"),
+                )
+
+            if response.status_code == 429:
+                # our view of the limits is evidently out of date
+                state[_NEXT_SYNC] = now
+                retry_after = _parse_retry_after(headers)
+                if retry_after is not None and retry_after > 0:
+                    state[_BLOCKED_UNTIL] = max(state[_BLOCKED_UNTIL], now + retry_after)
+
+    def acquire(self) -> None:
+        """Blocks until a request may be sent without exceeding the rate limits."""
+        wait = self._reserve()
+        if wait > 0:
+            log.debug("Waiting %.3f seconds for the client-side rate limiter", wait)
+            try:
+                time.sleep(wait)
+            except BaseException:
+                self._refund()
+                raise
+
+    async def aacquire(self) -> None:
+        """Waits until a request may be sent without exceeding the rate limits."""
+        wait = self._reserve()
+        if wait > 0:
+            log.debug("Waiting %.3f seconds for the client-side rate limiter", wait)
+            try:
+                await anyio.sleep(wait)
+            except BaseException:
+                self._refund()
+                raise
+
+    def _reserve(self) -> float:
+        now = time.time()
+        with self._locked() as state:
+            wait = max(0.0, state[_BLOCKED_UNTIL] - now)
+            for i, (_name, period) in enumerate(WINDOWS):
+                offset = _HEADER_SIZE + i * _WINDOW_SIZE
+                capacity = state[offset + _CAPACITY]
+                if capacity <= 0:
+                    continue
+
+                tokens = self._refill(state, offset, period, now)
+                if tokens < 1:
+                    wait = max(wait, (1 - tokens) * period / capacity)
+
+            if self._max_wait is not None and wait > self._max_wait:
+                raise RateLimitWaitTimeout(wait)
+
+            for i in range(len(WINDOWS)):
+                offset = _HEADER_SIZE + i * _WINDOW_SIZE
+                if state[offset + _CAPACITY] > 0:
+                    state[offset + _TOKENS] -= 1
+
+            return wait
+
+    def _refund(self) -> None:
+        with self._locked() as state:
+            for i in range(len(WINDOWS)):
+                offset = _HEADER_SIZE + i * _WINDOW_SIZE
+                if state[offset + _CAPACITY] > 0:
+                    state[offset + _TOKENS] = min(state[offset + _CAPACITY], state[offset + _TOKENS] + 1)
+
+    @staticmethod
+    def _refill(state: List[float], offset: int, period: float, now: float) -> float:
+        capacity = state[offset + _CAPACITY]
+        elapsed = max(0.0, now - state[offset + _UPDATED_AT])
+        tokens = min(capacity, state[offset + _TOKENS] + elapsed * capacity / period)
+        state[offset + _TOKENS] = tokens
+        state[offset + _UPDATED_AT] = now
+        return tokens
+
+    @classmethod
+    def _update_window(
+        cls,
+        state: List[float],
+        index: int,
+        now: float,
+        *,
+        limit: int | None,
+        remaining: int | None,
+    ) -> None:
+        offset = _HEADER_SIZE + index * _WINDOW_SIZE
+        period = WINDOWS[index][1]
+        seeded = state[offset + _CAPACITY] > 0
+
+        if limit is not None and limit > 0:
+            if seeded:
+                cls._refill(state, offset, period, now)
+            else:
+                state[offset + _TOKENS] = limit
+                state[offset + _UPDATED_AT] = now
+            state[offset + _CAPACITY] = limit
+            state[offset + _TOKENS] = min(state[offset + _TOKENS], limit)
+            seeded = True
+
+        if remaining is not None and seeded:
+            # requests we have reserved tokens for may not have reached the API yet,
+            # so we never hand out more tokens than we already had
+            tokens = cls._refill(state, offset, period, now)
+            state[offset + _TOKENS] = min(tokens, remaining)
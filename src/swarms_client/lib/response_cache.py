@@ -0,0 +1,326 @@
+"""Client-side cache of deterministic run responses.
+
+Regression suites and many production calls run the same agents, with `temperature=0`, on
+the same tasks. With a `ResponseCache`, the response to such a request is stored under a
+hash of its endpoint and canonicalized JSON body, and an identical request is answered from
+the cache, as a fully constructed `SwarmRunResponse`, `AgentRunResponse` or
+`ReasoningAgentCreateCompletionResponse`, without sending anything:
+
+```py
+cache = ResponseCache(max_entries=512, ttl=24 * 3600, path="~/.cache/swarms/responses.db")
+client = SwarmsClient(response_cache=cache)
+
+run = client.swarms.run(task="...", agents=[...])  # sent to the API
+run = client.swarms.run(task="...", agents=[...])  # answered from the cache
+
+print(cache.stats())
+```
+
+Entries are kept in an in-memory LRU of `max_entries` responses and, if a `path` is given,
+in a SQLite database of at most `max_disk_bytes` of response bodies that is shared between
+processes and survives restarts. Entries expire `ttl` seconds after they were stored, in
+both tiers.
+
+Single requests can skip the cache with the `X-Swarms-Cache` header, which isn't sent to the
+API: `"bypass"` neither reads nor writes the cache, and `"refresh"` sends the request and
+replaces the cached response:
+
+```py
+client.swarms.run(task="...", extra_headers={CACHE_HEADER: "refresh"})
+```
+
+Responses from the cache carry an `X-Swarms-Cache: hit` header, see `.with_raw_response`.
+Only successful, non-streamed responses are cached, and the cache key includes the API key,
+so that clients of different accounts can share a cache without seeing each other's runs.
+"""
+
+from __future__ import annotations
+
+import os
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from typing import Any, Tuple, Union, Iterable, Optional, MutableMapping, cast
+from collections import OrderedDict
+from typing_extensions import Literal, TypedDict
+
+import httpx
+
+__all__ = ["ResponseCache", "CacheStats", "CacheMode", "CACHE_HEADER", "CACHEABLE_PATHS"]
+
+CACHE_HEADER = "X-Swarms-Cache"
+"""The request header that makes a single request skip the cache, and the response header that marks cache hits."""
+
+CacheMode = Literal["bypass", "refresh"]
+
+CACHEABLE_PATHS: Tuple[str, ...] = (
+    "/v1/swarm/completions",
+    "/v1/agent/completions",
+    "/v1/reasoning-agent/completions",
+)
+"""The endpoints whose responses are cached by default."""
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    expires REAL,
+    accessed REAL NOT NULL,
+    status INTEGER NOT NULL,
+    content_type TEXT,
+    body BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+class CacheStats(TypedDict):
+    hits: int
+    """The number of requests that were answered from the cache."""
+
+    disk_hits: int
+    """The number of hits that were read from the on-disk tier, included in `hits`."""
+
+    misses: int
+    """The number of cacheable requests that were sent to the API, including refreshed ones."""
+
+    stores: int
+    """The number of responses that were added to the cache."""
+
+    evictions: int
+    """The number of entries that were removed to stay within `max_entries` or `max_disk_bytes`."""
+
+
+class _Entry:
+    __slots__ = ("status", "content_type", "body", "expires")
+
+    def __init__(self, status: int, content_type: Optional[str], body: bytes, expires: Optional[float]) -> None:
+        self.status = status
+        self.content_type = content_type
+        self.body = body
+        self.expires = expires
+
+    def expired(self, now: float) -> bool:
+        return self.expires is not None and self.expires <= now
+
+
+class ResponseCache:
+    """A cache of run responses, keyed by endpoint and request body.
+
+    An instance can be shared between clients and is safe to use from multiple threads.
+    The on-disk tier is read and written synchronously, also by the async client; these are
+    small indexed SQLite queries, but a `path` on a slow file system adds their latency.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 1024,
+        ttl: Optional[float] = 3600.0,
+        path: Union[str, "os.PathLike[str]", None] = None,
+        max_disk_bytes: int = 256 * 1024 * 1024,
+        paths: Iterable[str] = CACHEABLE_PATHS,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError(f"Expected `max_entries` to be at least 1, got {max_entries}")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"Expected `ttl` to be positive or None, got {ttl}")
+
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_disk_bytes = max_disk_bytes
+        self.paths = frozenset(paths)
+        self._lock = threading.Lock()
+        self._memory: OrderedDict[str, _Entry] = OrderedDict()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._disk_bytes = 0
+        if path is not None:
+            path = os.path.expanduser(os.fspath(path))
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.executescript(_SCHEMA)
+            self._disk_bytes = self._disk_size()
+
+    def stats(self) -> CacheStats:
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self._evictions,
+            )
+
+    def clear(self) -> None:
+        """Removes every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM responses")
+                self._disk_bytes = 0
+
+    def close(self) -> None:
+        """Closes the on-disk tier; the in-memory tier keeps working."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def _key(self, request: httpx.Request, path: str) -> Optional[str]:
+        """Returns the cache key of a request to `path`, relative to the base URL,
+        or `None` if its response isn't cached.
+        """
+        if path not in self.paths:
+            return None
+        return _request_key(request)
+
+    def _get(self, key: str, request: httpx.Request) -> Optional[httpx.Response]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and entry.expired(now):
+                del self._memory[key]
+                entry = None
+
+            if entry is not None:
+                self._memory.move_to_end(key)
+            elif self._db is not None:
+                entry = self._disk_get(key, now)
+                if entry is not None:
+                    self._disk_hits += 1
+                    self._memory_put(key, entry)
+
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+
+        headers = {CACHE_HEADER: "hit"}
+        if entry.content_type is not None:
+            headers["content-type"] = entry.content_type
+        return httpx.Response(entry.status, headers=headers, content=entry.body, request=request)
+
+    def _miss(self) -> None:
+        with self._lock:
+            self._misses += 1
+
+    def _put(self, key: str, response: httpx.Response) -> None:
+        if response.status_code != 200:
+            return
+
+        expires = None if self.ttl is None else time.time() + self.ttl
+        entry = _Entry(response.status_code, response.headers.get("content-type"), response.content, expires)
+        with self._lock:
+            self._stores += 1
+            self._memory_put(key, entry)
+            if self._db is not None:
+                self._disk_put(key, entry)
+
+    def _memory_put(self, key: str, entry: _Entry) -> None:
+        memory = self._memory
+        memory[key] = entry
+        memory.move_to_end(key)
+        while len(memory) > self.max_entries:
+            memory.popitem(last=False)
+            self._evictions += 1
+
+    def _disk_get(self, key: str, now: float) -> Optional[_Entry]:
+        assert self._db is not None
+        row = self._db.execute(
+            "SELECT expires, status, content_type, body FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        entry = _Entry(row[1], row[2], bytes(row[3]), row[0])
+        if entry.expired(now):
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._disk_bytes -= len(entry.body)
+            return None
+
+        self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+        return entry
+
+    def _disk_put(self, key: str, entry: _Entry) -> None:
+        assert self._db is not None
+        if len(entry.body) > self.max_disk_bytes:
+            return
+
+        # a replaced row's body no longer counts towards the size
+        replaced = self._db.execute("SELECT LENGTH(body) FROM responses WHERE key = ?", (key,)).fetchone()
+        if replaced is not None:
+            self._disk_bytes -= replaced[0]
+        self._db.execute(
+            "INSERT OR REPLACE INTO responses (key, expires, accessed, status, content_type, body)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (key, entry.expires, time.time(), entry.status, entry.content_type, entry.body),
+        )
+        self._disk_bytes += len(entry.body)
+        if self._disk_bytes > self.max_disk_bytes:
+            self._disk_evict()
+
+    def _disk_evict(self) -> None:
+        assert self._db is not None
+        db = self._db
+        # other processes may have written to the same file, so start from the actual size
+        db.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),))
+        size = self._disk_size()
+        if size > self.max_disk_bytes:
+            evicted: list[Tuple[str]] = []
+            for key, length in db.execute("SELECT key, LENGTH(body) FROM responses ORDER BY accessed"):
+                evicted.append((key,))
+                size -= length
+                if size <= self.max_disk_bytes:
+                    break
+            db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+            self._evictions += len(evicted)
+        self._disk_bytes = size
+
+    def _disk_size(self) -> int:
+        assert self._db is not None
+        size: int = self._db.execute("SELECT COALESCE(SUM(LENGTH(body)), 0) FROM responses").fetchone()[0]
+        return size
+
+
+def _request_key(request: httpx.Request) -> Optional[str]:
+    """Returns a hash of the endpoint, API key and canonicalized JSON body of a request,
+    or `None` if its body isn't JSON.
+    """
+    try:
+        body = json.loads(request.content) if request.content else None
+    except ValueError:
+        # e.g. a multipart body
+        return None
+
+    digest = hashlib.sha256()
+    digest.update(request.method.encode())
+    digest.update(b"\0")
+    digest.update(str(request.url).encode())
+    digest.update(b"\0")
+    digest.update(request.headers.get("x-api-key", "").encode())
+    digest.update(b"\0")
+    # the same body, whatever the order of its keys or the JSON library that encoded it
+    digest.update(json.dumps(body, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode())
+    return digest.hexdigest()
+
+
+def _pop_cache_mode(headers: MutableMapping[str, Any]) -> Optional[CacheMode]:
+    """Removes the `X-Swarms-Cache` header from the given headers and returns its value."""
+    for name in list(headers):
+        if name.lower() == CACHE_HEADER.lower():
+            value = headers.pop(name)
+            if value in ("bypass", "refresh"):
+                return cast(CacheMode, value)
+            raise ValueError(f"Unknown {CACHE_HEADER} header value {value!r}, expected 'bypass' or 'refresh'")
+    return None
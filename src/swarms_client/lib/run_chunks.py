@@ -0,0 +1,51 @@
+"""The chunks streamed by `swarms.run(stream=True)` and `agent.run(stream=True)`.
+
+These models are provisional: the OpenAPI spec doesn't define the events of streamed runs
+yet, so they're written by hand with every field optional, and will be replaced by the
+generated types once the spec describes them. Fields that the API sends and that aren't
+listed here are still available as attributes, like on every other response model.
+"""
+
+from typing import Dict, Optional
+
+from .._models import BaseModel
+
+__all__ = ["SwarmRunChunk", "AgentRunChunk"]
+
+
+class SwarmRunChunk(BaseModel):
+    """A part of the output of a streamed swarm run."""
+
+    agent_name: Optional[str] = None
+    """The name of the agent that produced this part of the output."""
+
+    content: Optional[str] = None
+    """The output produced since the previous chunk."""
+
+    job_id: Optional[str] = None
+    """The unique identifier for the swarm completion."""
+
+    type: Optional[str] = None
+    """The kind of chunk, e.g. incremental output or the end of an agent's turn."""
+
+    usage: Optional[Dict[str, object]] = None
+    """The usage of the swarm, usually only sent with the last chunk."""
+
+
+class AgentRunChunk(BaseModel):
+    """A part of the output of a streamed agent run."""
+
+    content: Optional[str] = None
+    """The output produced since the previous chunk."""
+
+    job_id: Optional[str] = None
+    """The unique identifier for the agent completion."""
+
+    name: Optional[str] = None
+    """The name of the agent."""
+
+    type: Optional[str] = None
+    """The kind of chunk, e.g. incremental output or the end of the completion."""
+
+    usage: Optional[Dict[str, object]] = None
+    """Usage statistics for the agent completion, usually only sent with the last chunk."""
@@ -0,0 +1,120 @@
+"""Rate limiting that is shared between processes on the same host.
+
+When many worker processes use the same API key, each `RateLimiter` would otherwise
+assume that it has the whole quota to itself. A `SharedRateLimiter` keeps its token
+buckets in a memory-mapped file instead, so that every process using the same file
+draws from the same quota.
+
+```py
+# in every worker process, e.g. in a gunicorn `post_fork` hook or celery `worker_process_init`
+client = SwarmsClient(rate_limiter=SharedRateLimiter("/tmp/swarms-client-quota"))
+```
+"""
+
+from __future__ import annotations
+
+import os
+import mmap
+import struct
+import threading
+from typing import TYPE_CHECKING, Any, List, Iterator
+from contextlib import contextmanager
+from typing_extensions import override
+
+from .rate_limit import STATE_SIZE, RateLimiter
+
+if TYPE_CHECKING:
+    import fcntl
+else:
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
+
+__all__ = ["SharedRateLimiter"]
+
+_MAGIC = b"SWRL\x00\x00\x00\x01"
+_STATE = struct.Struct(f"<{STATE_SIZE}d")
+_FILE_SIZE = len(_MAGIC) + _STATE.size
+
+
+class SharedRateLimiter(RateLimiter):
+    """A `RateLimiter` whose state is shared by every process that uses the same `path`.
+
+    The state lives in a small memory-mapped file that is guarded by a POSIX record lock,
+    so no external service is required. Limits are synced from the API by a single process
+    per `resync_interval`, and a `429` seen by any process pauses all of them.
+
+    The file is created if it doesn't exist yet. A limiter created before the process forks
+    keeps working in the child processes, but creating it after the fork is recommended.
+
+    Only supported on POSIX platforms.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        resync_interval: float = 60.0,
+        max_wait: float | None = None,
+    ) -> None:
+        if fcntl is None:
+            raise RuntimeError("SharedRateLimiter is only supported on platforms that provide `fcntl`")
+
+        super().__init__(resync_interval=resync_interval, max_wait=max_wait)
+
+        self._path = os.fspath(path)
+        self._fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        self._pid = os.getpid()
+        self._thread_lock = threading.Lock()
+
+        try:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(self._fd).st_size != _FILE_SIZE or os.pread(self._fd, len(_MAGIC), 0) != _MAGIC:
+                    os.ftruncate(self._fd, 0)
+                    os.pwrite(self._fd, _MAGIC + bytes(_STATE.size), 0)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+            self._mmap = mmap.mmap(self._fd, _FILE_SIZE)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def close(self) -> None:
+        """Release the file backing this limiter.
+
+        The limiter will *not* be usable after this.
+        """
+        if not self._mmap.closed:
+            self._mmap.close()
+            os.close(self._fd)
+
+    def __enter__(self) -> SharedRateLimiter:
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        self.close()
+
+    @contextmanager
+    @override
+    def _locked(self) -> Iterator[List[float]]:
+        if os.getpid() != self._pid:
+            # the thread lock may have been held by another thread while the process forked
+            self._pid = os.getpid()
+            self._thread_lock = threading.Lock()
+
+        # record locks are held per process, so threads of the same process are serialised separately
+        with self._thread_lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                state = list(_STATE.unpack_from(self._mmap, len(_MAGIC)))
+                yield state
+                _STATE.pack_into(self._mmap, len(_MAGIC), *state)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
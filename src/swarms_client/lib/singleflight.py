@@ -0,0 +1,234 @@
+"""De-duplication of identical requests that are in flight at the same time.
+
+Upstream retries, or several workers picking up the same job, often send the same
+`swarms.run()` or `agent.run()` payload while an identical request is still running. With a
+`Singleflight`, such requests share a single HTTP request: the first one is sent, and the
+others wait for its response instead of running the same swarm again:
+
+```py
+singleflight = Singleflight()
+client = AsyncSwarmsClient(singleflight=singleflight)
+
+# one request is sent, and both calls return the same run
+await asyncio.gather(
+    client.swarms.run(task="...", agents=[...]),
+    client.swarms.run(task="...", agents=[...]),
+)
+
+print(singleflight.stats())  # {'sent': 1, 'shared': 1}
+```
+
+Requests are identical when they have the same method, URL, headers and JSON body, in any key
+order; only the headers that the client sets differently for every attempt, such as the retry
+count, are ignored. Every caller gets its own copy of the response, which it parses and checks
+for errors itself, so all of them return equal results or raise the same kind of error; a copy
+of a connection error of the shared request is raised by every caller. Each caller then
+retries on its own, and identical retries are shared again.
+
+Callers keep their own timeout: one that waits for another's request longer than its
+`connect`, `write`, `read` and `pool` timeouts together raises a timeout error, and a
+cancelled caller stops waiting without affecting the others. If the caller that sent the
+request is cancelled, one of the waiting callers sends it again.
+
+Streamed responses are never shared. An instance can be shared between sync clients in any
+thread, and between async clients on the same event loop; sync and async requests are never
+shared with each other.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+from typing import Any, Dict, List, Tuple, Union, Callable, Iterable, Optional, Awaitable
+from typing_extensions import TypedDict
+
+import anyio
+import httpx
+
+from .response_cache import _request_key
+
+__all__ = ["Singleflight", "SingleflightStats", "DEDUPLICATED_PATHS"]
+
+DEDUPLICATED_PATHS: Tuple[str, ...] = (
+    "/v1/swarm/completions",
+    "/v1/swarm/batch/completions",
+    "/v1/agent/completions",
+    "/v1/agent/batch/completions",
+    "/v1/reasoning-agent/completions",
+)
+"""The endpoints whose requests are de-duplicated by default."""
+
+# the headers that describe the encoding of the body as it was received, not of the decoded copies
+_ENCODING_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding"})
+
+# the headers that the client sets for every attempt, or that only change how it reads the response
+_PER_ATTEMPT_HEADERS = frozenset(
+    {"content-length", "x-stainless-retry-count", "x-stainless-read-timeout", "x-stainless-raw-response"}
+)
+
+
+class SingleflightStats(TypedDict):
+    sent: int
+    """The number of requests that were sent, while no identical request was in flight."""
+
+    shared: int
+    """The number of requests that were answered with the response of an identical request instead of being sent."""
+
+
+class _Flight:
+    __slots__ = ("done", "status_code", "headers", "content", "error", "abandoned")
+
+    def __init__(self, done: Union[threading.Event, anyio.Event]) -> None:
+        self.done = done
+        self.status_code = 0
+        self.headers: List[Tuple[str, str]] = []
+        self.content = b""
+        self.error: Optional[Exception] = None
+        self.abandoned = False
+
+    def land(self, response: httpx.Response) -> None:
+        self.status_code = response.status_code
+        self.headers = [
+            (name, value) for name, value in response.headers.multi_items() if name.lower() not in _ENCODING_HEADERS
+        ]
+        self.content = response.content
+
+    def response(self, request: httpx.Request) -> httpx.Response:
+        if self.error is not None:
+            # every caller raises its own copy, so that they don't change each other's traceback
+            error = _copy_error(self.error)
+            if error is self.error:
+                raise error
+            raise error from self.error
+        return httpx.Response(self.status_code, headers=self.headers, content=self.content, request=request)
+
+
+class Singleflight:
+    """Shares the response of a request with identical requests that are made while it's in flight."""
+
+    def __init__(self, *, paths: Iterable[str] = DEDUPLICATED_PATHS) -> None:
+        self.paths = frozenset(paths)
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._async_flights: Dict[str, _Flight] = {}
+        self._sent = 0
+        self._shared = 0
+
+    def stats(self) -> SingleflightStats:
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return SingleflightStats(sent=self._sent, shared=self._shared)
+
+    def _key(self, request: httpx.Request, path: str) -> Optional[str]:
+        """Returns the key of requests identical to one to `path`, relative to the base URL,
+        or `None` if the request isn't de-duplicated.
+        """
+        if path not in self.paths:
+            return None
+        body_key = _request_key(request)
+        if body_key is None:
+            return None
+
+        digest = hashlib.sha256(body_key.encode())
+        for name, value in sorted(request.headers.multi_items()):
+            if name not in _PER_ATTEMPT_HEADERS:
+                digest.update(b"\0")
+                digest.update(f"{name}:{value}".encode())
+        return digest.hexdigest()
+
+    def _join(self, flights: Dict[str, _Flight], key: str, new: Callable[[], _Flight]) -> Tuple[_Flight, bool]:
+        """Returns the flight of identical requests, and whether the caller should send the request."""
+        with self._lock:
+            flight = flights.get(key)
+            if flight is not None:
+                return flight, False
+            flight = flights[key] = new()
+            self._sent += 1
+            return flight, True
+
+    def _land(self, flights: Dict[str, _Flight], key: str, flight: _Flight) -> None:
+        with self._lock:
+            # identical requests made from now on are sent again
+            if flights.get(key) is flight:
+                del flights[key]
+
+    def _share(self, flight: _Flight, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            self._shared += 1
+        return flight.response(request)
+
+    def _send(self, key: str, request: httpx.Request, send: Callable[[], httpx.Response]) -> httpx.Response:
+        while True:
+            flight, leader = self._join(self._flights, key, lambda: _Flight(threading.Event()))
+            if leader:
+                try:
+                    response = send()
+                except Exception as err:
+                    flight.error = err
+                    raise
+                except BaseException:
+                    flight.abandoned = True
+                    raise
+                else:
+                    flight.land(response)
+                finally:
+                    self._land(self._flights, key, flight)
+                    flight.done.set()
+                return response
+
+            assert isinstance(flight.done, threading.Event)
+            if not flight.done.wait(_wait_timeout(request)):
+                raise httpx.ReadTimeout("Timed out waiting for an identical request", request=request)
+            if not flight.abandoned:
+                return self._share(flight, request)
+
+    async def _asend(
+        self, key: str, request: httpx.Request, send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        while True:
+            flight, leader = self._join(self._async_flights, key, lambda: _Flight(anyio.Event()))
+            if leader:
+                try:
+                    response = await send()
+                except Exception as err:
+                    flight.error = err
+                    raise
+                except BaseException:
+                    # e.g. the caller was cancelled
+                    flight.abandoned = True
+                    raise
+                else:
+                    flight.land(response)
+                finally:
+                    self._land(self._async_flights, key, flight)
+                    flight.done.set()
+                return response
+
+            assert isinstance(flight.done, anyio.Event)
+            with anyio.move_on_after(_wait_timeout(request)):
+                await flight.done.wait()
+            if not flight.done.is_set():
+                raise httpx.ReadTimeout("Timed out waiting for an identical request", request=request)
+            if not flight.abandoned:
+                return self._share(flight, request)
+
+
+def _copy_error(error: Exception) -> Exception:
+    try:
+        return copy.copy(error)
+    except Exception:
+        # e.g. an exception whose constructor takes other arguments than its `args`
+        return error
+
+
+def _wait_timeout(request: httpx.Request) -> Optional[float]:
+    """Returns the longest time that the request itself could have taken without timing out."""
+    timeout: Dict[str, Any] = request.extensions.get("timeout", {})
+    total = 0.0
+    for phase in ("connect", "write", "read", "pool"):
+        value = timeout.get(phase)
+        if value is None:
+            return None
+        total += value
+    return total
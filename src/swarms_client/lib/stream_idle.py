@@ -0,0 +1,39 @@
+"""Idle timeout for server-sent event streams.
+
+A swarm run can go quiet for minutes while its agents think, so a streamed response can't
+be bounded by the client's `read` timeout without making that timeout too long to notice
+a dead connection. `stream_idle_timeout` bounds the time between two reads of a streamed
+body instead, and only applies once the response headers have arrived:
+
+```py
+client = SwarmsClient(timeout=httpx.Timeout(60, connect=5), stream_idle_timeout=15)
+
+for chunk in client.swarms.run(task="...", stream=True):
+    ...
+```
+
+Every byte the server sends resets the timeout, including the comment lines (`: ping`)
+that servers send as heartbeats while there are no events, so the timeout should be longer
+than the server's heartbeat interval. When it expires the stream raises `httpx.ReadTimeout`
+and, like after any dropped connection, is resumed if its events have IDs.
+"""
+
+from __future__ import annotations
+
+import httpx
+
+
+def _apply_idle_timeout(response: httpx.Response, idle_timeout: float | None) -> None:
+    """Makes the remaining reads of the response's body time out after `idle_timeout` seconds.
+
+    The transport looks up the read timeout in the request's `timeout` extension when the
+    body is read, and the same dict is passed to any request that resumes the stream, so the
+    timeout also bounds the wait for a resumed stream's headers.
+    """
+    if idle_timeout is None:
+        return
+
+    extensions = response.request.extensions
+    timeout = extensions.get("timeout") or {}
+    # httpx builds the `timeout` extension for each request, so this doesn't change the client's timeout
+    extensions["timeout"] = {**timeout, "read": idle_timeout}
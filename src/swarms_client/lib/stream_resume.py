@@ -0,0 +1,154 @@
+"""Resumption of server-sent event streams after a dropped connection.
+
+When the connection of a streamed request drops before the stream has ended, the stream
+reconnects and sends the ID of the last event it received in the `Last-Event-ID` header,
+so that the server continues the stream instead of starting the run over. The stream waits
+for the reconnection time the server sent in a `retry` field, if any, and events that the
+server replays are skipped based on their IDs. Only the IDs of the most recent events are
+kept for this, since a server only replays the end of the stream.
+
+```py
+metrics = StreamMetrics()
+client = SwarmsClient(max_stream_resumes=5, stream_metrics=metrics)
+
+for chunk in client.swarms.run(task="...", stream=True):
+    ...
+
+print(metrics.stats())
+```
+
+Streams whose events have no IDs can't be resumed, so they fail as before.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Deque, Optional
+from collections import deque
+from typing_extensions import TypedDict
+
+import httpx
+
+from .._constants import INITIAL_RETRY_DELAY
+
+if TYPE_CHECKING:
+    from .._streaming import ServerSentEvent
+
+__all__ = ["StreamMetrics", "StreamStats"]
+
+# the number of most recent event IDs that are kept to recognise replayed events
+_REPLAY_WINDOW = 1000
+
+
+class StreamStats(TypedDict):
+    disconnects: int
+    """The number of times a stream's connection dropped before it ended, or an attempt to reconnect failed."""
+
+    resumes: int
+    """The number of times a stream reconnected and continued after a dropped connection."""
+
+    failed_resumes: int
+    """The number of dropped connections that ended a stream with an error instead of being resumed."""
+
+    duplicates: int
+    """The number of replayed events that were skipped because they had already been received."""
+
+
+class StreamMetrics:
+    """Counts the dropped connections, resumes and replayed events of streamed requests.
+
+    An instance can be shared between clients and is safe to use from multiple threads.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._disconnects = 0
+        self._resumes = 0
+        self._failed_resumes = 0
+        self._duplicates = 0
+
+    def stats(self) -> StreamStats:
+        """Returns a snapshot of the counters."""
+        with self._lock:
+            return StreamStats(
+                disconnects=self._disconnects,
+                resumes=self._resumes,
+                failed_resumes=self._failed_resumes,
+                duplicates=self._duplicates,
+            )
+
+    def _record(self, *, disconnects: int = 0, resumes: int = 0, failed_resumes: int = 0, duplicates: int = 0) -> None:
+        with self._lock:
+            self._disconnects += disconnects
+            self._resumes += resumes
+            self._failed_resumes += failed_resumes
+            self._duplicates += duplicates
+
+
+class _StreamResumeState:
+    """Tracks what a stream needs to resume, shared by `Stream` and `AsyncStream`."""
+
+    def __init__(self, *, max_resumes: int, metrics: Optional[StreamMetrics]) -> None:
+        self.max_resumes = max_resumes
+        self.metrics = metrics
+        self.resumes = 0
+        self.last_event_id: Optional[str] = None
+        self.retry: Optional[int] = None
+        self._seen: Deque[str] = deque(maxlen=_REPLAY_WINDOW)
+        self._replaying = False
+
+    @property
+    def delay(self) -> float:
+        """The number of seconds to wait before reconnecting."""
+        return INITIAL_RETRY_DELAY if self.retry is None else self.retry / 1000
+
+    def observe(self, sse: ServerSentEvent) -> bool:
+        """Records a received event and returns whether it is new."""
+        if sse.retry is not None:
+            self.retry = sse.retry
+
+        if self._replaying:
+            # the events before the first unseen one are a replay of the end of the stream
+            if sse.id is not None and sse.id in self._seen:
+                if self.metrics is not None:
+                    self.metrics._record(duplicates=1)
+                return False
+            self._replaying = False
+
+        if sse.id is not None:
+            # an empty ID resets the last event ID, after which the stream can't be resumed
+            self.last_event_id = sse.id or None
+            if sse.id:
+                self._seen.append(sse.id)
+        return True
+
+    def disconnected(self) -> bool:
+        """Records a dropped connection and returns whether the stream should be resumed."""
+        can_resume = self.last_event_id is not None and self.resumes < self.max_resumes
+        if self.metrics is not None:
+            self.metrics._record(disconnects=1, failed_resumes=0 if can_resume else 1)
+        return can_resume
+
+    def resume_request(self, request: httpx.Request) -> httpx.Request:
+        """Returns a copy of the stream's request that asks the server to continue after the last event."""
+        assert self.last_event_id is not None
+
+        self.resumes += 1
+        headers = request.headers.copy()
+        headers["Last-Event-ID"] = self.last_event_id
+        extensions = dict(request.extensions)
+        # the trace of the first request belongs to its timing
+        extensions.pop("trace", None)
+        return httpx.Request(
+            request.method,
+            request.url,
+            headers=headers,
+            content=request.content,
+            extensions=extensions,
+        )
+
+    def resumed(self) -> None:
+        """Records that the stream reconnected."""
+        self._replaying = True
+        if self.metrics is not None:
+            self.metrics._record(resumes=1)
@@ -0,0 +1,368 @@
+"""Fan-out of a single stream to several consumers.
+
+`Stream.tee()` and `AsyncStream.tee()` split a stream into independent streams that each
+yield every item, while the response is only read once:
+
+```py
+stream = await client.swarms.run(task="...", stream=True)
+to_user, to_storage, to_metrics = stream.tee(3, buffer_size=256, policy="block")
+
+async with anyio.create_task_group() as tg:
+    tg.start_soon(forward, to_user)
+    tg.start_soon(persist, to_storage)
+    tg.start_soon(aggregate, to_metrics)
+```
+
+Items that one consumer has received but another hasn't yet are buffered per consumer, up
+to `buffer_size` items. What happens when a consumer falls that far behind depends on the
+policy:
+
+- `"block"`: reading from the response waits until the slow consumer catches up, so the
+  fastest consumer can only be `buffer_size` items ahead of the slowest one. Consumers
+  must run concurrently, in tasks or threads, or a full buffer blocks forever.
+- `"drop"`: the oldest item in the slow consumer's buffer is dropped, see `dropped`.
+- `"spill"`: further items for the slow consumer are pickled to a temporary file and read
+  back in order once it catches up.
+
+An error while reading the response is raised to every consumer once it has received the
+items before it. Cancelling the consumer that is reading the response also ends it, so the
+other consumers raise a `RuntimeError` instead of seeing a stream that looks complete.
+"""
+
+from __future__ import annotations
+
+import pickle
+import tempfile
+import threading
+from typing import IO, TYPE_CHECKING, List, Tuple, Generic, TypeVar, Iterator, Optional, AsyncIterator
+from collections import deque
+from typing_extensions import Self, Literal
+
+import anyio
+
+if TYPE_CHECKING:
+    from .._streaming import Stream, AsyncStream
+
+__all__ = ["TeePolicy", "TeeStream", "AsyncTeeStream", "DEFAULT_TEE_BUFFER_SIZE"]
+
+_T = TypeVar("_T")
+
+TeePolicy = Literal["block", "drop", "spill"]
+
+DEFAULT_TEE_BUFFER_SIZE = 256
+"""The default number of items buffered for each consumer of a teed stream."""
+
+
+class _Buffer(Generic[_T]):
+    """The items one consumer of a teed stream hasn't received yet."""
+
+    def __init__(self, size: int, policy: TeePolicy) -> None:
+        self.size = size
+        self.policy = policy
+        self.dropped = 0
+        self.closed = False
+        self._items: deque[_T] = deque()
+        self._spill: Optional[IO[bytes]] = None
+        self._spilled = 0
+        self._spill_read = 0
+
+    def __len__(self) -> int:
+        return len(self._items) + self._spilled
+
+    @property
+    def full(self) -> bool:
+        return len(self._items) >= self.size
+
+    def push(self, item: _T) -> None:
+        if self._spilled or (self.policy == "spill" and self.full):
+            # once an item was spilled, later items are spilled too until it was read back
+            self._spill_item(item)
+            return
+
+        if self.policy == "drop" and self.full:
+            self._items.popleft()
+            self.dropped += 1
+        self._items.append(item)
+
+    def pop(self) -> _T:
+        if self._items:
+            return self._items.popleft()
+
+        assert self._spill is not None and self._spilled
+        self._spill.seek(self._spill_read)
+        item: _T = pickle.load(self._spill)
+        self._spill_read = self._spill.tell()
+        self._spilled -= 1
+        if not self._spilled:
+            self._spill.seek(0)
+            self._spill.truncate()
+            self._spill_read = 0
+        return item
+
+    def close(self) -> None:
+        self.closed = True
+        self._items.clear()
+        self._spilled = 0
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def _spill_item(self, item: _T) -> None:
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile()
+        self._spill.seek(0, 2)
+        pickle.dump(item, self._spill, protocol=pickle.HIGHEST_PROTOCOL)
+        self._spilled += 1
+
+
+class _CutShort(RuntimeError):
+    """Raised to the other consumers when the one reading the response was interrupted."""
+
+    def __init__(self) -> None:
+        super().__init__("The stream ended early because the consumer reading it was cancelled or interrupted")
+
+
+def _check_args(n: int, buffer_size: int, policy: TeePolicy) -> None:
+    if n < 1:
+        raise ValueError(f"Expected at least 1 consumer, got {n}")
+    if buffer_size < 1:
+        raise ValueError(f"Expected a buffer size of at least 1, got {buffer_size}")
+    if policy not in ("block", "drop", "spill"):
+        raise ValueError(f"Unknown slow consumer policy {policy!r}, expected 'block', 'drop' or 'spill'")
+
+
+class _Tee(Generic[_T]):
+    def __init__(self, source: Stream[_T], n: int, buffer_size: int, policy: TeePolicy) -> None:
+        _check_args(n, buffer_size, policy)
+        self._source = source
+        self._iterator = iter(source)
+        self._policy = policy
+        self._cond = threading.Condition()
+        self._reading = False
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self.buffers: List[_Buffer[_T]] = [_Buffer(buffer_size, policy) for _ in range(n)]
+
+    def next(self, buffer: _Buffer[_T]) -> _T:
+        while True:
+            with self._cond:
+                while True:
+                    if buffer.closed:
+                        raise StopIteration
+                    if buffer:
+                        item = buffer.pop()
+                        self._cond.notify_all()
+                        return item
+                    if self._done:
+                        buffer.close()
+                        if isinstance(self._error, _CutShort):
+                            raise _CutShort()
+                        if self._error is not None:
+                            raise self._error
+                        raise StopIteration
+                    if not self._reading and not self._must_wait(buffer):
+                        break
+                    self._cond.wait()
+                self._reading = True
+
+            try:
+                item = next(self._iterator)
+            except StopIteration:
+                self._finish(None)
+            except Exception as exc:
+                self._finish(exc)
+                raise
+            except BaseException:
+                # e.g. a `KeyboardInterrupt`, which also ended the response's iterator
+                self._finish(_CutShort())
+                raise
+            else:
+                with self._cond:
+                    self._distribute(item)
+                    self._reading = False
+                    self._cond.notify_all()
+
+    def close(self, buffer: _Buffer[_T]) -> None:
+        with self._cond:
+            buffer.close()
+            self._cond.notify_all()
+            if not all(buffer.closed for buffer in self.buffers):
+                return
+        self._source.close()
+
+    def _must_wait(self, reader: _Buffer[_T]) -> bool:
+        # with the block policy, only read once every other consumer has room for the item
+        return self._policy == "block" and any(
+            buffer.full for buffer in self.buffers if buffer is not reader and not buffer.closed
+        )
+
+    def _distribute(self, item: _T) -> None:
+        for buffer in self.buffers:
+            if not buffer.closed:
+                buffer.push(item)
+
+    def _finish(self, error: Optional[BaseException]) -> None:
+        with self._cond:
+            self._done = True
+            self._error = error
+            self._reading = False
+            self._cond.notify_all()
+
+
+class TeeStream(Generic[_T]):
+    """One of the streams returned by `Stream.tee()`.
+
+    Consumers can be iterated from different threads.
+    """
+
+    def __init__(self, tee: _Tee[_T], buffer: _Buffer[_T]) -> None:
+        self._tee = tee
+        self._buffer = buffer
+
+    @property
+    def dropped(self) -> int:
+        """The number of items this consumer missed because it fell behind, with the `"drop"` policy."""
+        return self._buffer.dropped
+
+    @property
+    def buffered(self) -> int:
+        """The number of items waiting to be received by this consumer."""
+        return len(self._buffer)
+
+    def __next__(self) -> _T:
+        return self._tee.next(self._buffer)
+
+    def __iter__(self) -> Iterator[_T]:
+        return self
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stops receiving items; the response is closed once every consumer is closed."""
+        self._tee.close(self._buffer)
+
+
+class _AsyncTee(Generic[_T]):
+    def __init__(self, source: AsyncStream[_T], n: int, buffer_size: int, policy: TeePolicy) -> None:
+        _check_args(n, buffer_size, policy)
+        self._source = source
+        self._iterator = source.__aiter__()
+        self._policy = policy
+        self._changed = anyio.Event()
+        self._reading = False
+        self._done = False
+        self._error: Optional[BaseException] = None
+        self.buffers: List[_Buffer[_T]] = [_Buffer(buffer_size, policy) for _ in range(n)]
+
+    async def next(self, buffer: _Buffer[_T]) -> _T:
+        while True:
+            if buffer.closed:
+                raise StopAsyncIteration
+            if buffer:
+                item = buffer.pop()
+                self._notify()
+                return item
+            if self._done:
+                buffer.close()
+                if isinstance(self._error, _CutShort):
+                    raise _CutShort()
+                if self._error is not None:
+                    raise self._error
+                raise StopAsyncIteration
+            if self._reading or self._must_wait(buffer):
+                await self._changed.wait()
+                continue
+
+            self._reading = True
+            try:
+                item = await self._iterator.__anext__()
+            except StopAsyncIteration:
+                self._done = True
+            except Exception as exc:
+                self._done = True
+                self._error = exc
+                raise
+            except BaseException:
+                # the consumer that was reading was cancelled, and the cancellation also ended
+                # the response's iterator, so the others must not see a complete stream
+                self._done = True
+                self._error = _CutShort()
+                raise
+            else:
+                self._distribute(item)
+            finally:
+                self._reading = False
+                self._notify()
+
+    async def close(self, buffer: _Buffer[_T]) -> None:
+        buffer.close()
+        self._notify()
+        if all(buffer.closed for buffer in self.buffers):
+            await self._source.close()
+
+    def _notify(self) -> None:
+        # wake up every consumer that waits for an item, for room or for the response
+        self._changed.set()
+        self._changed = anyio.Event()
+
+    def _must_wait(self, reader: _Buffer[_T]) -> bool:
+        return self._policy == "block" and any(
+            buffer.full for buffer in self.buffers if buffer is not reader and not buffer.closed
+        )
+
+    def _distribute(self, item: _T) -> None:
+        for buffer in self.buffers:
+            if not buffer.closed:
+                buffer.push(item)
+
+
+class AsyncTeeStream(Generic[_T]):
+    """One of the streams returned by `AsyncStream.tee()`."""
+
+    def __init__(self, tee: _AsyncTee[_T], buffer: _Buffer[_T]) -> None:
+        self._tee = tee
+        self._buffer = buffer
+
+    @property
+    def dropped(self) -> int:
+        """The number of items this consumer missed because it fell behind, with the `"drop"` policy."""
+        return self._buffer.dropped
+
+    @property
+    def buffered(self) -> int:
+        """The number of items waiting to be received by this consumer."""
+        return len(self._buffer)
+
+    async def __anext__(self) -> _T:
+        return await self._tee.next(self._buffer)
+
+    def __aiter__(self) -> AsyncIterator[_T]:
+        return self
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Stops receiving items; the response is closed once every consumer is closed."""
+        await self._tee.close(self._buffer)
+
+
+def tee_stream(
+    source: Stream[_T], n: int, *, buffer_size: int = DEFAULT_TEE_BUFFER_SIZE, policy: TeePolicy = "block"
+) -> Tuple[TeeStream[_T], ...]:
+    tee = _Tee(source, n, buffer_size, policy)
+    return tuple(TeeStream(tee, buffer) for buffer in tee.buffers)
+
+
+def async_tee_stream(
+    source: AsyncStream[_T], n: int, *, buffer_size: int = DEFAULT_TEE_BUFFER_SIZE, policy: TeePolicy = "block"
+) -> Tuple[AsyncTeeStream[_T], ...]:
+    tee = _AsyncTee(source, n, buffer_size, policy)
+    return tuple(AsyncTeeStream(tee, buffer) for buffer in tee.buffers)
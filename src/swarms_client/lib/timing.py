@@ -0,0 +1,164 @@
+"""Per-request timing breakdowns.
+
+With `request_timing=True`, or an `on_timing` callback, every API call records how long
+each of its phases took, from transforming the params to constructing the response model,
+so that time spent in the SDK can be told apart from network and server time.
+
+```py
+client = SwarmsClient(on_timing=lambda timing: metrics.observe(timing.as_dict()))
+
+response = client.with_raw_response.swarms.run(...)
+print(response.timing)
+```
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Optional
+
+__all__ = ["RequestTiming"]
+
+# httpcore prefixes its trace events with the name of the module that sent them
+_TRACE_PREFIXES = ("connection.", "http11.", "http2.")
+
+
+class RequestTiming:
+    """The timing breakdown of a single API call; all durations are in seconds.
+
+    The network phases are measured with the httpx `trace` request extension and describe
+    the last attempt if the request was retried. They are `None` if the phase didn't happen,
+    e.g. `connect` and `tls` when a pooled connection was reused, or if the transport doesn't
+    support tracing.
+
+    The response body of a streamed response is downloaded after the call returns, so its
+    `body` is only known once the response has been read or closed.
+    """
+
+    transform: Optional[float]
+    """Time spent transforming the params of the call before the request was made."""
+
+    build_request: Optional[float]
+    """Time spent building the `httpx.Request` for the last attempt."""
+
+    decode: Optional[float]
+    """Time spent decoding the JSON response body."""
+
+    construct: Optional[float]
+    """Time spent constructing the response model from the decoded JSON."""
+
+    total: Optional[float]
+    """Time from the start of the call until it returned, including retries and parsing."""
+
+    retries_taken: int
+    """The number of retries made."""
+
+    def __init__(self, *, transform: float | None = None) -> None:
+        self.transform = transform
+        self.build_request = None
+        self.decode = None
+        self.construct = None
+        self.total = None
+        self.retries_taken = 0
+        self._started = time.perf_counter()
+        self._attempt_started = self._started
+        self._events: Dict[str, float] = {}
+
+    def _start_attempt(self) -> None:
+        self._attempt_started = time.perf_counter()
+        self._events = {}
+
+    def _finish(self, *, retries_taken: int) -> None:
+        self.total = time.perf_counter() - self._started
+        self.retries_taken = retries_taken
+
+    def _trace(self, name: str, _info: Dict[str, Any]) -> None:
+        for prefix in _TRACE_PREFIXES:
+            if name.startswith(prefix):
+                self._events.setdefault(name[len(prefix) :], time.perf_counter())
+                return
+
+    async def _atrace(self, name: str, info: Dict[str, Any]) -> None:
+        self._trace(name, info)
+
+    def _between(self, start: str, end: str) -> float | None:
+        started = self._events.get(start)
+        ended = self._events.get(end)
+        if started is None or ended is None:
+            return None
+        return ended - started
+
+    def _waited(self) -> float:
+        """The pool wait of the last attempt, or the time since it started if it never got a connection."""
+        pool_wait = self.pool_wait
+        if pool_wait is None:
+            return time.perf_counter() - self._attempt_started
+        return pool_wait
+
+    @property
+    def new_connection(self) -> Optional[bool]:
+        """Whether the last attempt opened a new connection, `None` if it is not known."""
+        if not self._events:
+            return None
+        return "connect_tcp.started" in self._events
+
+    @property
+    def pool_wait(self) -> Optional[float]:
+        """Time spent waiting for a connection from the pool, or until a new one could be opened."""
+        acquired = self._events.get("connect_tcp.started", self._events.get("send_request_headers.started"))
+        if acquired is None:
+            return None
+        return acquired - self._attempt_started
+
+    @property
+    def dns(self) -> Optional[float]:
+        """Always `None`: the host is resolved while connecting, and httpx doesn't time it separately."""
+        return None
+
+    @property
+    def connect(self) -> Optional[float]:
+        """Time spent resolving the host and opening the TCP connection."""
+        return self._between("connect_tcp.started", "connect_tcp.complete")
+
+    @property
+    def tls(self) -> Optional[float]:
+        """Time spent on the TLS handshake."""
+        return self._between("start_tls.started", "start_tls.complete")
+
+    @property
+    def send(self) -> Optional[float]:
+        """Time spent sending the request headers and body."""
+        return self._between("send_request_headers.started", "receive_response_headers.started")
+
+    @property
+    def ttfb(self) -> Optional[float]:
+        """Time from sending the request until the response headers arrived, i.e. server time plus round trip."""
+        return self._between("receive_response_headers.started", "receive_response_headers.complete")
+
+    @property
+    def body(self) -> Optional[float]:
+        """Time spent downloading the response body."""
+        return self._between("receive_response_body.started", "response_closed.started")
+
+    def as_dict(self) -> Dict[str, Optional[float]]:
+        """Returns every phase by name, e.g. for exporting as metrics."""
+        return {
+            "transform": self.transform,
+            "build_request": self.build_request,
+            "pool_wait": self.pool_wait,
+            "dns": self.dns,
+            "connect": self.connect,
+            "tls": self.tls,
+            "send": self.send,
+            "ttfb": self.ttfb,
+            "body": self.body,
+            "decode": self.decode,
+            "construct": self.construct,
+            "total": self.total,
+        }
+
+    def __repr__(self) -> str:
+        phases = ", ".join(
+            f"{name}={value * 1000:.2f}ms" for name, value in self.as_dict().items() if value is not None
+        )
+        return f"RequestTiming({phases})"
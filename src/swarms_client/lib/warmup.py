@@ -0,0 +1,228 @@
+"""Pre-warming of pooled connections.
+
+The first request made after the client is created, or after its connections have been
+idle for a while, also has to resolve the API host and complete the TCP & TLS handshakes.
+`client.warmup()` pays that cost ahead of time by opening keep-alive connections with cheap
+`health.check()` requests, and `client.keepalive()` keeps them open while the client is idle.
+
+```py
+client = SwarmsClient()
+client.warmup(connections=8)
+
+with client.keepalive(connections=8):
+    serve_requests()
+```
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from typing import TYPE_CHECKING, Any
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio
+
+if TYPE_CHECKING:
+    from anyio.abc import TaskGroup
+
+    from .._client import SwarmsClient, AsyncSwarmsClient
+
+__all__ = [
+    "KeepAlive",
+    "AsyncKeepAlive",
+    "warm_connections",
+    "async_warm_connections",
+    "DEFAULT_WARMUP_CONNECTIONS",
+    "DEFAULT_KEEPALIVE_INTERVAL",
+]
+
+log: logging.Logger = logging.getLogger(__name__)
+
+DEFAULT_WARMUP_CONNECTIONS = 1
+"""The number of connections opened by `client.warmup()` and `client.keepalive()` by default."""
+
+DEFAULT_KEEPALIVE_INTERVAL = 4.0
+"""The number of seconds between keep-alive pings.
+
+This is below the 5 second `keepalive_expiry` that httpx applies to idle pooled connections by default.
+"""
+
+
+def _validate_connections(connections: int) -> None:
+    if connections < 1:
+        raise ValueError("`connections` must be at least 1")
+
+
+def warm_connections(client: SwarmsClient, connections: int = DEFAULT_WARMUP_CONNECTIONS) -> int:
+    """Opens `connections` keep-alive connections to the API and returns how many were opened.
+
+    Every connection is held by an in-flight `health.check()` request until all of the
+    requests have received their response headers, so that each of them has to use a
+    different connection. The connections are then returned to the pool once the
+    response bodies have been read.
+
+    Errors are logged rather than raised, as warming up is only ever an optimisation.
+    """
+    _validate_connections(connections)
+
+    lock = threading.Lock()
+    pending = connections
+    all_sent = threading.Event()
+
+    def _sent() -> None:
+        nonlocal pending
+        with lock:
+            pending -= 1
+            if pending == 0:
+                all_sent.set()
+
+    def _open_connection() -> bool:
+        sent = False
+        try:
+            with client.with_streaming_response.health.check() as response:
+                sent = True
+                _sent()
+                all_sent.wait()
+                response.read()
+            return True
+        except Exception:
+            log.debug("Could not warm up a connection", exc_info=True)
+            return False
+        finally:
+            if not sent:
+                _sent()
+
+    with ThreadPoolExecutor(max_workers=connections, thread_name_prefix="swarms-client-warmup") as executor:
+        futures = [executor.submit(_open_connection) for _ in range(connections)]
+    return sum(future.result() for future in futures)
+
+
+async def async_warm_connections(client: AsyncSwarmsClient, connections: int = DEFAULT_WARMUP_CONNECTIONS) -> int:
+    """Opens `connections` keep-alive connections to the API and returns how many were opened.
+
+    See `warm_connections()` for details.
+    """
+    _validate_connections(connections)
+
+    pending = connections
+    all_sent = anyio.Event()
+    opened = 0
+
+    def _sent() -> None:
+        nonlocal pending
+        pending -= 1
+        if pending == 0:
+            all_sent.set()
+
+    async def _open_connection() -> None:
+        nonlocal opened
+        sent = False
+        try:
+            async with client.with_streaming_response.health.check() as response:
+                sent = True
+                _sent()
+                await all_sent.wait()
+                await response.read()
+        except Exception:
+            log.debug("Could not warm up a connection", exc_info=True)
+        else:
+            opened += 1
+        finally:
+            if not sent:
+                _sent()
+
+    async with anyio.create_task_group() as task_group:
+        for _ in range(connections):
+            task_group.start_soon(_open_connection)
+    return opened
+
+
+def _validate_interval(interval: float) -> None:
+    if interval <= 0:
+        raise ValueError("`interval` must be positive")
+
+
+class KeepAlive:
+    """Periodically warms up the connections of a client from a background thread.
+
+    The pings start as soon as the instance is created and continue until `stop()` is
+    called or the `with` block that it is used in is exited.
+    """
+
+    def __init__(
+        self,
+        client: SwarmsClient,
+        *,
+        interval: float = DEFAULT_KEEPALIVE_INTERVAL,
+        connections: int = DEFAULT_WARMUP_CONNECTIONS,
+    ) -> None:
+        _validate_interval(interval)
+        _validate_connections(connections)
+
+        self._client = client
+        self._interval = interval
+        self._connections = connections
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="swarms-client-keepalive", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops sending pings, waiting for any ping that is in flight to finish."""
+        self._stopped.set()
+        if self._thread is not threading.current_thread():
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self._interval):
+            warm_connections(self._client, self._connections)
+
+    def __enter__(self) -> KeepAlive:
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        self.stop()
+
+
+class AsyncKeepAlive:
+    """Periodically warms up the connections of a client from a background task.
+
+    The task runs for as long as the `async with` block that the instance is used in.
+    """
+
+    def __init__(
+        self,
+        client: AsyncSwarmsClient,
+        *,
+        interval: float = DEFAULT_KEEPALIVE_INTERVAL,
+        connections: int = DEFAULT_WARMUP_CONNECTIONS,
+    ) -> None:
+        _validate_interval(interval)
+        _validate_connections(connections)
+
+        self._client = client
+        self._interval = interval
+        self._connections = connections
+        self._task_group: TaskGroup | None = None
+
+    async def _run(self) -> None:
+        while True:
+            await anyio.sleep(self._interval)
+            await async_warm_connections(self._client, self._connections)
+
+    async def __aenter__(self) -> AsyncKeepAlive:
+        if self._task_group is not None:
+            raise RuntimeError("This keep-alive is already running")
+
+        self._task_group = anyio.create_task_group()
+        await self._task_group.__aenter__()
+        self._task_group.start_soon(self._run)
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        task_group = self._task_group
+        assert task_group is not None
+        self._task_group = None
+
+        task_group.cancel_scope.cancel()
+        await task_group.__aexit__(*args)
@@ -2,7 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Union, Iterable, Optional
+from typing import (
+    Dict,
+    List,
+    Union,
+    Iterable,
+    Optional,
+    AsyncIterable,
+    cast,
+    overload,
+)
+from typing_extensions import Literal
 
 import httpx
 
@@ -18,6 +28,12 @@ from ...types import agent_run_params
 from ..._types import NOT_GIVEN, Body, Query, Headers, NotGiven
 from ..._utils import maybe_transform, async_maybe_transform
 from ..._compat import cached_property
+from ...lib.bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    BulkMap,
+    BulkInput,
+    merge_params,
+)
 from ..._resource import SyncAPIResource, AsyncAPIResource
 from ..._response import (
     to_raw_response_wrapper,
@@ -25,7 +41,15 @@ from ..._response import (
     async_to_raw_response_wrapper,
     async_to_streamed_response_wrapper,
 )
+from ..._streaming import Stream, AsyncStream
 from ..._base_client import make_request_options
+from ...lib.batching import (
+    DEFAULT_MAX_WAIT,
+    DEFAULT_MAX_BATCH_SIZE,
+    AgentRunBatcher,
+    AsyncAgentRunBatcher,
+)
+from ...lib.run_chunks import AgentRunChunk
 from ...types.agent_spec_param import AgentSpecParam
 from ...types.agent_run_response import AgentRunResponse
 
@@ -56,16 +80,15 @@ class AgentResource(SyncAPIResource):
         """
         return AgentResourceWithStreamingResponse(self)
 
+    @overload
     def run(
         self,
         *,
         agent_config: Optional[AgentSpecParam] | NotGiven = NOT_GIVEN,
-        history: (
-            Union[Dict[str, object], Iterable[Dict[str, str]], None] | NotGiven
-        ) = NOT_GIVEN,
+        history: (Union[Dict[str, object], Iterable[Dict[str, str]], None] | NotGiven) = NOT_GIVEN,
         img: Optional[str] | NotGiven = NOT_GIVEN,
         imgs: Optional[List[str]] | NotGiven = NOT_GIVEN,
-        stream: Optional[bool] | NotGiven = NOT_GIVEN,
+        stream: Optional[Literal[False]] | NotGiven = NOT_GIVEN,
         task: Optional[str] | NotGiven = NOT_GIVEN,
         # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
         # The extra values given here take precedence over values defined on the client or passed to this method.
@@ -101,6 +124,118 @@ class AgentResource(SyncAPIResource):
 
           timeout: Override the client-level default timeout for this request, in seconds
         """
+        ...
+
+    @overload
+    def run(
+        self,
+        *,
+        stream: Literal[True],
+        agent_config: Optional[AgentSpecParam] | NotGiven = NOT_GIVEN,
+        history: (Union[Dict[str, object], Iterable[Dict[str, str]], None] | NotGiven) = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        imgs: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> Stream[AgentRunChunk]:
+        """
+        Run an agent with the specified task.
+
+        Args:
+          stream: A flag indicating whether the agent should stream its output. If set, a
+              `Stream[AgentRunChunk]` is returned that yields the output as it is generated.
+
+          agent_config: The configuration of the agent to be completed.
+
+          history: The history of the agent's previous tasks and responses. Can be either a
+              dictionary or a list of message objects.
+
+          img: An optional image URL that may be associated with the agent's task or
+              representation.
+
+          imgs: A list of image URLs that may be associated with the agent's task or
+              representation.
+
+          task: The task to be completed by the agent.
+
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          extra_body: Add additional JSON properties to the request
+
+          timeout: Override the client-level default timeout for this request, in seconds
+        """
+        ...
+
+    @overload
+    def run(
+        self,
+        *,
+        stream: bool,
+        agent_config: Optional[AgentSpecParam] | NotGiven = NOT_GIVEN,
+        history: (Union[Dict[str, object], Iterable[Dict[str, str]], None] | NotGiven) = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        imgs: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AgentRunResponse | Stream[AgentRunChunk]:
+        """
+        Run an agent with the specified task.
+
+        Args:
+          stream: A flag indicating whether the agent should stream its output. If set, a
+              `Stream[AgentRunChunk]` is returned that yields the output as it is generated.
+
+          agent_config: The configuration of the agent to be completed.
+
+          history: The history of the agent's previous tasks and responses. Can be either a
+              dictionary or a list of message objects.
+
+          img: An optional image URL that may be associated with the agent's task or
+              representation.
+
+          imgs: A list of image URLs that may be associated with the agent's task or
+              representation.
+
+          task: The task to be completed by the agent.
+
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          extra_body: Add additional JSON properties to the request
+
+          timeout: Override the client-level default timeout for this request, in seconds
+        """
+        ...
+
+    def run(
+        self,
+        *,
+        agent_config: Optional[AgentSpecParam] | NotGiven = NOT_GIVEN,
+        history: (Union[Dict[str, object], Iterable[Dict[str, str]], None] | NotGiven) = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        imgs: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        stream: Optional[Literal[False]] | Literal[True] | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AgentRunResponse | Stream[AgentRunChunk]:
         return self._post(
             "/v1/agent/completions",
             body=maybe_transform(
@@ -121,6 +256,43 @@ class AgentResource(SyncAPIResource):
                 timeout=timeout,
             ),
             cast_to=AgentRunResponse,
+            stream=stream or False,
+            stream_cls=Stream[AgentRunChunk],
+        )
+
+    def batcher(
+        self,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # These apply to every batch request sent by the batcher.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AgentRunBatcher:
+        """
+        Create a micro-batcher that coalesces concurrent `.run()` calls into
+        `/v1/agent/batch/completions` requests.
+
+        Args:
+          max_batch_size: The maximum number of calls sent in a single batch request.
+
+          max_wait: The number of seconds the first call in a batch waits for other calls to join it.
+
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          timeout: Override the client-level default timeout for each batch request, in seconds
+        """
+        return AgentRunBatcher(
+            self.batch,
+            max_batch_size=max_batch_size,
+            max_wait=max_wait,
+            extra_headers=extra_headers,
+            extra_query=extra_query,
+            timeout=timeout,
         )
 
 
@@ -148,16 +320,15 @@ class AsyncAgentResource(AsyncAPIResource):
         """
         return AsyncAgentResourceWithStreamingResponse(self)
 
+    @overload
     async def run(
         self,
         *,
         agent_config: Optional[AgentSpecParam] | NotGiven = NOT_GIVEN,
-        history: (
-            Union[Dict[str, object], Iterable[Dict[str, str]], None] | NotGiven
-        ) = NOT_GIVEN,
+        history: (Union[Dict[str, object], Iterable[Dict[str, str]], None] | NotGiven) = NOT_GIVEN,
         img: Optional[str] | NotGiven = NOT_GIVEN,
         imgs: Optional[List[str]] | NotGiven = NOT_GIVEN,
-        stream: Optional[bool] | NotGiven = NOT_GIVEN,
+        stream: Optional[Literal[False]] | NotGiven = NOT_GIVEN,
         task: Optional[str] | NotGiven = NOT_GIVEN,
         # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
         # The extra values given here take precedence over values defined on the client or passed to this method.
@@ -193,6 +364,118 @@ class AsyncAgentResource(AsyncAPIResource):
 
           timeout: Override the client-level default timeout for this request, in seconds
         """
+        ...
+
+    @overload
+    async def run(
+        self,
+        *,
+        stream: Literal[True],
+        agent_config: Optional[AgentSpecParam] | NotGiven = NOT_GIVEN,
+        history: (Union[Dict[str, object], Iterable[Dict[str, str]], None] | NotGiven) = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        imgs: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AsyncStream[AgentRunChunk]:
+        """
+        Run an agent with the specified task.
+
+        Args:
+          stream: A flag indicating whether the agent should stream its output. If set, a
+              `AsyncStream[AgentRunChunk]` is returned that yields the output as it is generated.
+
+          agent_config: The configuration of the agent to be completed.
+
+          history: The history of the agent's previous tasks and responses. Can be either a
+              dictionary or a list of message objects.
+
+          img: An optional image URL that may be associated with the agent's task or
+              representation.
+
+          imgs: A list of image URLs that may be associated with the agent's task or
+              representation.
+
+          task: The task to be completed by the agent.
+
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          extra_body: Add additional JSON properties to the request
+
+          timeout: Override the client-level default timeout for this request, in seconds
+        """
+        ...
+
+    @overload
+    async def run(
+        self,
+        *,
+        stream: bool,
+        agent_config: Optional[AgentSpecParam] | NotGiven = NOT_GIVEN,
+        history: (Union[Dict[str, object], Iterable[Dict[str, str]], None] | NotGiven) = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        imgs: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AgentRunResponse | AsyncStream[AgentRunChunk]:
+        """
+        Run an agent with the specified task.
+
+        Args:
+          stream: A flag indicating whether the agent should stream its output. If set, a
+              `AsyncStream[AgentRunChunk]` is returned that yields the output as it is generated.
+
+          agent_config: The configuration of the agent to be completed.
+
+          history: The history of the agent's previous tasks and responses. Can be either a
+              dictionary or a list of message objects.
+
+          img: An optional image URL that may be associated with the agent's task or
+              representation.
+
+          imgs: A list of image URLs that may be associated with the agent's task or
+              representation.
+
+          task: The task to be completed by the agent.
+
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          extra_body: Add additional JSON properties to the request
+
+          timeout: Override the client-level default timeout for this request, in seconds
+        """
+        ...
+
+    async def run(
+        self,
+        *,
+        agent_config: Optional[AgentSpecParam] | NotGiven = NOT_GIVEN,
+        history: (Union[Dict[str, object], Iterable[Dict[str, str]], None] | NotGiven) = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        imgs: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        stream: Optional[Literal[False]] | Literal[True] | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AgentRunResponse | AsyncStream[AgentRunChunk]:
         return await self._post(
             "/v1/agent/completions",
             body=await async_maybe_transform(
@@ -213,8 +496,104 @@ class AsyncAgentResource(AsyncAPIResource):
                 timeout=timeout,
             ),
             cast_to=AgentRunResponse,
+            stream=stream or False,
+            stream_cls=AsyncStream[AgentRunChunk],
+        )
+
+    def batcher(
+        self,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # These apply to every batch request sent by the batcher.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AsyncAgentRunBatcher:
+        """
+        Create a micro-batcher that coalesces concurrent `.run()` calls into
+        `/v1/agent/batch/completions` requests.
+
+        Args:
+          max_batch_size: The maximum number of calls sent in a single batch request.
+
+          max_wait: The number of seconds the first call in a batch waits for other calls to join it.
+
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          timeout: Override the client-level default timeout for each batch request, in seconds
+        """
+        return AsyncAgentRunBatcher(
+            self.batch,
+            max_batch_size=max_batch_size,
+            max_wait=max_wait,
+            extra_headers=extra_headers,
+            extra_query=extra_query,
+            timeout=timeout,
         )
 
+    def map(
+        self,
+        tasks: Union[Iterable[BulkInput], AsyncIterable[BulkInput]],
+        *,
+        template: AgentSpecParam,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        ordered: bool = False,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # These apply to every request sent for the given tasks.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> BulkMap[BulkInput, AgentRunResponse]:
+        """
+        Run an agent for every given task with at most `concurrency` runs in flight.
+
+        Tasks are consumed lazily, and errors are captured per task instead of
+        aborting the remaining runs. The runs are started when the returned results are
+        entered with `async with`, and the ones still in flight are cancelled when it's left:
+
+        ```py
+        async with client.agent.map(tasks, template=template) as results:
+            async for result in results:
+                ...
+        ```
+
+        Args:
+          tasks: An iterable or async iterable of tasks. Each task is either a string, which
+              is sent as the `task`, or a mapping of `.run()` parameters such as `task`, `img`
+              or `history`.
+
+          template: The agent specification shared by every run.
+
+          concurrency: The maximum number of runs in flight at once.
+
+          ordered: Yield results in the order of the given tasks instead of as they complete.
+
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          extra_body: Add additional JSON properties to the request
+
+          timeout: Override the client-level default timeout for each request, in seconds
+        """
+
+        async def run(task: BulkInput) -> AgentRunResponse:
+            response = await self.run(
+                **merge_params({"agent_config": template}, task, key="task"),
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+            return cast(AgentRunResponse, response)
+
+        return BulkMap(run, tasks, concurrency=concurrency, ordered=ordered)
+
 
 class AgentResourceWithRawResponse:
     def __init__(self, agent: AgentResource) -> None:
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Iterable
+from typing import Dict, Iterable, Iterator, AsyncIterator
 
 import httpx
 
@@ -17,6 +17,7 @@ from ..._response import (
     async_to_streamed_response_wrapper,
 )
 from ..._base_client import make_request_options
+from ...lib.json_stream import iter_json_array, aiter_json_array
 from ...types.swarm_spec_param import SwarmSpecParam
 from ...types.swarms.batch_run_response import BatchRunResponse
 
@@ -78,6 +79,42 @@ class BatchResource(SyncAPIResource):
             cast_to=BatchRunResponse,
         )
 
+    def run_iter(
+        self,
+        *,
+        body: Iterable[SwarmSpecParam],
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> Iterator[Dict[str, object]]:
+        """
+        Like `run()`, but yields each result as soon as it has been received
+        instead of waiting for the whole response.
+
+        The request is sent when iteration starts, and only the result that is being
+        received is held in memory.
+
+        Args:
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          extra_body: Add additional JSON properties to the request
+
+          timeout: Override the client-level default timeout for this request, in seconds
+        """
+        with self.with_streaming_response.run(
+            body=body,
+            extra_headers=extra_headers,
+            extra_query=extra_query,
+            extra_body=extra_body,
+            timeout=timeout,
+        ) as response:
+            yield from iter_json_array(response.iter_bytes(), loads=self._client._loads_json)
+
 
 class AsyncBatchResource(AsyncAPIResource):
     @cached_property
@@ -134,6 +171,43 @@ class AsyncBatchResource(AsyncAPIResource):
             cast_to=BatchRunResponse,
         )
 
+    async def run_iter(
+        self,
+        *,
+        body: Iterable[SwarmSpecParam],
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AsyncIterator[Dict[str, object]]:
+        """
+        Like `run()`, but yields each result as soon as it has been received
+        instead of waiting for the whole response.
+
+        The request is sent when iteration starts, and only the result that is being
+        received is held in memory.
+
+        Args:
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          extra_body: Add additional JSON properties to the request
+
+          timeout: Override the client-level default timeout for this request, in seconds
+        """
+        async with self.with_streaming_response.run(
+            body=body,
+            extra_headers=extra_headers,
+            extra_query=extra_query,
+            extra_body=extra_body,
+            timeout=timeout,
+        ) as response:
+            async for result in aiter_json_array(response.iter_bytes(), loads=self._client._loads_json):
+                yield result
+
 
 class BatchResourceWithRawResponse:
     def __init__(self, batch: BatchResource) -> None:
@@ -2,7 +2,16 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Union, Iterable, Optional
+from typing import (
+    Dict,
+    List,
+    Union,
+    Iterable,
+    Optional,
+    AsyncIterable,
+    cast,
+    overload,
+)
 from typing_extensions import Literal
 
 import httpx
@@ -19,6 +28,12 @@ from ...types import swarm_run_params
 from ..._types import NOT_GIVEN, Body, Query, Headers, NotGiven
 from ..._utils import maybe_transform, async_maybe_transform
 from ..._compat import cached_property
+from ...lib.bulk import (
+    DEFAULT_BULK_CONCURRENCY,
+    BulkMap,
+    BulkInput,
+    merge_params,
+)
 from ..._resource import SyncAPIResource, AsyncAPIResource
 from ..._response import (
     to_raw_response_wrapper,
@@ -26,8 +41,11 @@ from ..._response import (
     async_to_raw_response_wrapper,
     async_to_streamed_response_wrapper,
 )
+from ..._streaming import Stream, AsyncStream
 from ..._base_client import make_request_options
+from ...lib.run_chunks import SwarmRunChunk
 from ...types.agent_spec_param import AgentSpecParam
+from ...types.swarm_spec_param import SwarmSpecParam
 from ...types.swarm_run_response import SwarmRunResponse
 from ...types.swarm_get_logs_response import SwarmGetLogsResponse
 from ...types.swarm_check_available_response import SwarmCheckAvailableResponse
@@ -107,6 +125,7 @@ class SwarmsResource(SyncAPIResource):
             cast_to=SwarmGetLogsResponse,
         )
 
+    @overload
     def run(
         self,
         *,
@@ -117,14 +136,12 @@ class SwarmsResource(SyncAPIResource):
         heavy_swarm_worker_model_name: Optional[str] | NotGiven = NOT_GIVEN,
         img: Optional[str] | NotGiven = NOT_GIVEN,
         max_loops: Optional[int] | NotGiven = NOT_GIVEN,
-        messages: (
-            Union[Iterable[Dict[str, object]], Dict[str, object], None] | NotGiven
-        ) = NOT_GIVEN,
+        messages: (Union[Iterable[Dict[str, object]], Dict[str, object], None] | NotGiven) = NOT_GIVEN,
         name: Optional[str] | NotGiven = NOT_GIVEN,
         rearrange_flow: Optional[str] | NotGiven = NOT_GIVEN,
         rules: Optional[str] | NotGiven = NOT_GIVEN,
         service_tier: Optional[str] | NotGiven = NOT_GIVEN,
-        stream: Optional[bool] | NotGiven = NOT_GIVEN,
+        stream: Optional[Literal[False]] | NotGiven = NOT_GIVEN,
         swarm_type: Optional[
             Literal[
                 "AgentRearrange",
@@ -143,6 +160,9 @@ class SwarmsResource(SyncAPIResource):
                 "CouncilAsAJudge",
                 "InteractiveGroupChat",
                 "HeavySwarm",
+            ]
+        ]
+        | NotGiven = NOT_GIVEN,
         task: Optional[str] | NotGiven = NOT_GIVEN,
         tasks: Optional[List[str]] | NotGiven = NOT_GIVEN,
         # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
@@ -204,6 +224,258 @@ class SwarmsResource(SyncAPIResource):
 
           timeout: Override the client-level default timeout for this request, in seconds
         """
+        ...
+
+    @overload
+    def run(
+        self,
+        *,
+        stream: Literal[True],
+        agents: Optional[Iterable[AgentSpecParam]] | NotGiven = NOT_GIVEN,
+        description: Optional[str] | NotGiven = NOT_GIVEN,
+        heavy_swarm_loops_per_agent: Optional[int] | NotGiven = NOT_GIVEN,
+        heavy_swarm_question_agent_model_name: Optional[str] | NotGiven = NOT_GIVEN,
+        heavy_swarm_worker_model_name: Optional[str] | NotGiven = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        max_loops: Optional[int] | NotGiven = NOT_GIVEN,
+        messages: (Union[Iterable[Dict[str, object]], Dict[str, object], None] | NotGiven) = NOT_GIVEN,
+        name: Optional[str] | NotGiven = NOT_GIVEN,
+        rearrange_flow: Optional[str] | NotGiven = NOT_GIVEN,
+        rules: Optional[str] | NotGiven = NOT_GIVEN,
+        service_tier: Optional[str] | NotGiven = NOT_GIVEN,
+        swarm_type: Optional[
+            Literal[
+                "AgentRearrange",
+                "MixtureOfAgents",
+                "SpreadSheetSwarm",
+                "SequentialWorkflow",
+                "ConcurrentWorkflow",
+                "GroupChat",
+                "MultiAgentRouter",
+                "AutoSwarmBuilder",
+                "HiearchicalSwarm",
+                "auto",
+                "MajorityVoting",
+                "MALT",
+                "DeepResearchSwarm",
+                "CouncilAsAJudge",
+                "InteractiveGroupChat",
+                "HeavySwarm",
+            ]
+        ]
+        | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+        tasks: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> Stream[SwarmRunChunk]:
+        """
+        Run a swarm with the specified task.
+
+        Args:
+          stream: A flag indicating whether the swarm should stream its output. If set, a
+              `Stream[SwarmRunChunk]` is returned that yields the output as it is generated.
+
+          agents: A list of agents or specifications that define the agents participating in the
+              swarm.
+
+          description: A comprehensive description of the swarm's objectives, capabilities, and
+              intended outcomes.
+
+          heavy_swarm_loops_per_agent: The number of loops to run per agent in the heavy swarm.
+
+          heavy_swarm_question_agent_model_name: The model name to use for the question agent in the heavy swarm.
+
+          heavy_swarm_worker_model_name: The model name to use for the worker agent in the heavy swarm.
+
+          img: An optional image URL that may be associated with the swarm's task or
+              representation.
+
+          max_loops: The maximum number of execution loops allowed for the swarm, enabling repeated
+              processing if needed.
+
+          messages: A list of messages that the swarm should complete.
+
+          name: The name of the swarm, which serves as an identifier for the group of agents and
+              their collective task.
+
+          rearrange_flow: Instructions on how to rearrange the flow of tasks among agents, if applicable.
+
+          rules: Guidelines or constraints that govern the behavior and interactions of the
+              agents within the swarm.
+
+          service_tier: The service tier to use for processing. Options: 'standard' (default) or 'flex'
+              for lower cost but slower processing.
+
+          swarm_type: The classification of the swarm, indicating its operational style and
+              methodology.
+
+          task: The specific task or objective that the swarm is designed to accomplish.
+
+          tasks: A list of tasks that the swarm should complete.
+
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          extra_body: Add additional JSON properties to the request
+
+          timeout: Override the client-level default timeout for this request, in seconds
+        """
+        ...
+
+    @overload
+    def run(
+        self,
+        *,
+        stream: bool,
+        agents: Optional[Iterable[AgentSpecParam]] | NotGiven = NOT_GIVEN,
+        description: Optional[str] | NotGiven = NOT_GIVEN,
+        heavy_swarm_loops_per_agent: Optional[int] | NotGiven = NOT_GIVEN,
+        heavy_swarm_question_agent_model_name: Optional[str] | NotGiven = NOT_GIVEN,
+        heavy_swarm_worker_model_name: Optional[str] | NotGiven = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        max_loops: Optional[int] | NotGiven = NOT_GIVEN,
+        messages: (Union[Iterable[Dict[str, object]], Dict[str, object], None] | NotGiven) = NOT_GIVEN,
+        name: Optional[str] | NotGiven = NOT_GIVEN,
+        rearrange_flow: Optional[str] | NotGiven = NOT_GIVEN,
+        rules: Optional[str] | NotGiven = NOT_GIVEN,
+        service_tier: Optional[str] | NotGiven = NOT_GIVEN,
+        swarm_type: Optional[
+            Literal[
+                "AgentRearrange",
+                "MixtureOfAgents",
+                "SpreadSheetSwarm",
+                "SequentialWorkflow",
+                "ConcurrentWorkflow",
+                "GroupChat",
+                "MultiAgentRouter",
+                "AutoSwarmBuilder",
+                "HiearchicalSwarm",
+                "auto",
+                "MajorityVoting",
+                "MALT",
+                "DeepResearchSwarm",
+                "CouncilAsAJudge",
+                "InteractiveGroupChat",
+                "HeavySwarm",
+            ]
+        ]
+        | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+        tasks: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> SwarmRunResponse | Stream[SwarmRunChunk]:
+        """
+        Run a swarm with the specified task.
+
+        Args:
+          stream: A flag indicating whether the swarm should stream its output. If set, a
+              `Stream[SwarmRunChunk]` is returned that yields the output as it is generated.
+
+          agents: A list of agents or specifications that define the agents participating in the
+              swarm.
+
+          description: A comprehensive description of the swarm's objectives, capabilities, and
+              intended outcomes.
+
+          heavy_swarm_loops_per_agent: The number of loops to run per agent in the heavy swarm.
+
+          heavy_swarm_question_agent_model_name: The model name to use for the question agent in the heavy swarm.
+
+          heavy_swarm_worker_model_name: The model name to use for the worker agent in the heavy swarm.
+
+          img: An optional image URL that may be associated with the swarm's task or
+              representation.
+
+          max_loops: The maximum number of execution loops allowed for the swarm, enabling repeated
+              processing if needed.
+
+          messages: A list of messages that the swarm should complete.
+
+          name: The name of the swarm, which serves as an identifier for the group of agents and
+              their collective task.
+
+          rearrange_flow: Instructions on how to rearrange the flow of tasks among agents, if applicable.
+
+          rules: Guidelines or constraints that govern the behavior and interactions of the
+              agents within the swarm.
+
+          service_tier: The service tier to use for processing. Options: 'standard' (default) or 'flex'
+              for lower cost but slower processing.
+
+          swarm_type: The classification of the swarm, indicating its operational style and
+              methodology.
+
+          task: The specific task or objective that the swarm is designed to accomplish.
+
+          tasks: A list of tasks that the swarm should complete.
+
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          extra_body: Add additional JSON properties to the request
+
+          timeout: Override the client-level default timeout for this request, in seconds
+        """
+        ...
+
+    def run(
+        self,
+        *,
+        agents: Optional[Iterable[AgentSpecParam]] | NotGiven = NOT_GIVEN,
+        description: Optional[str] | NotGiven = NOT_GIVEN,
+        heavy_swarm_loops_per_agent: Optional[int] | NotGiven = NOT_GIVEN,
+        heavy_swarm_question_agent_model_name: Optional[str] | NotGiven = NOT_GIVEN,
+        heavy_swarm_worker_model_name: Optional[str] | NotGiven = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        max_loops: Optional[int] | NotGiven = NOT_GIVEN,
+        messages: (Union[Iterable[Dict[str, object]], Dict[str, object], None] | NotGiven) = NOT_GIVEN,
+        name: Optional[str] | NotGiven = NOT_GIVEN,
+        rearrange_flow: Optional[str] | NotGiven = NOT_GIVEN,
+        rules: Optional[str] | NotGiven = NOT_GIVEN,
+        service_tier: Optional[str] | NotGiven = NOT_GIVEN,
+        stream: Optional[Literal[False]] | Literal[True] | NotGiven = NOT_GIVEN,
+        swarm_type: Optional[
+            Literal[
+                "AgentRearrange",
+                "MixtureOfAgents",
+                "SpreadSheetSwarm",
+                "SequentialWorkflow",
+                "ConcurrentWorkflow",
+                "GroupChat",
+                "MultiAgentRouter",
+                "AutoSwarmBuilder",
+                "HiearchicalSwarm",
+                "auto",
+                "MajorityVoting",
+                "MALT",
+                "DeepResearchSwarm",
+                "CouncilAsAJudge",
+                "InteractiveGroupChat",
+                "HeavySwarm",
+            ]
+        ]
+        | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+        tasks: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> SwarmRunResponse | Stream[SwarmRunChunk]:
         return self._post(
             "/v1/swarm/completions",
             body=maybe_transform(
@@ -234,6 +506,8 @@ class SwarmsResource(SyncAPIResource):
                 timeout=timeout,
             ),
             cast_to=SwarmRunResponse,
+            stream=stream or False,
+            stream_cls=Stream[SwarmRunChunk],
         )
 
 
@@ -309,6 +583,7 @@ class AsyncSwarmsResource(AsyncAPIResource):
             cast_to=SwarmGetLogsResponse,
         )
 
+    @overload
     async def run(
         self,
         *,
@@ -319,14 +594,12 @@ class AsyncSwarmsResource(AsyncAPIResource):
         heavy_swarm_worker_model_name: Optional[str] | NotGiven = NOT_GIVEN,
         img: Optional[str] | NotGiven = NOT_GIVEN,
         max_loops: Optional[int] | NotGiven = NOT_GIVEN,
-        messages: (
-            Union[Iterable[Dict[str, object]], Dict[str, object], None] | NotGiven
-        ) = NOT_GIVEN,
+        messages: (Union[Iterable[Dict[str, object]], Dict[str, object], None] | NotGiven) = NOT_GIVEN,
         name: Optional[str] | NotGiven = NOT_GIVEN,
         rearrange_flow: Optional[str] | NotGiven = NOT_GIVEN,
         rules: Optional[str] | NotGiven = NOT_GIVEN,
         service_tier: Optional[str] | NotGiven = NOT_GIVEN,
-        stream: Optional[bool] | NotGiven = NOT_GIVEN,
+        stream: Optional[Literal[False]] | NotGiven = NOT_GIVEN,
         swarm_type: Optional[
             Literal[
                 "AgentRearrange",
@@ -344,7 +617,10 @@ class AsyncSwarmsResource(AsyncAPIResource):
                 "DeepResearchSwarm",
                 "CouncilAsAJudge",
                 "InteractiveGroupChat",
+                "HeavySwarm",
             ]
+        ]
+        | NotGiven = NOT_GIVEN,
         task: Optional[str] | NotGiven = NOT_GIVEN,
         tasks: Optional[List[str]] | NotGiven = NOT_GIVEN,
         # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
@@ -406,6 +682,258 @@ class AsyncSwarmsResource(AsyncAPIResource):
 
           timeout: Override the client-level default timeout for this request, in seconds
         """
+        ...
+
+    @overload
+    async def run(
+        self,
+        *,
+        stream: Literal[True],
+        agents: Optional[Iterable[AgentSpecParam]] | NotGiven = NOT_GIVEN,
+        description: Optional[str] | NotGiven = NOT_GIVEN,
+        heavy_swarm_loops_per_agent: Optional[int] | NotGiven = NOT_GIVEN,
+        heavy_swarm_question_agent_model_name: Optional[str] | NotGiven = NOT_GIVEN,
+        heavy_swarm_worker_model_name: Optional[str] | NotGiven = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        max_loops: Optional[int] | NotGiven = NOT_GIVEN,
+        messages: (Union[Iterable[Dict[str, object]], Dict[str, object], None] | NotGiven) = NOT_GIVEN,
+        name: Optional[str] | NotGiven = NOT_GIVEN,
+        rearrange_flow: Optional[str] | NotGiven = NOT_GIVEN,
+        rules: Optional[str] | NotGiven = NOT_GIVEN,
+        service_tier: Optional[str] | NotGiven = NOT_GIVEN,
+        swarm_type: Optional[
+            Literal[
+                "AgentRearrange",
+                "MixtureOfAgents",
+                "SpreadSheetSwarm",
+                "SequentialWorkflow",
+                "ConcurrentWorkflow",
+                "GroupChat",
+                "MultiAgentRouter",
+                "AutoSwarmBuilder",
+                "HiearchicalSwarm",
+                "auto",
+                "MajorityVoting",
+                "MALT",
+                "DeepResearchSwarm",
+                "CouncilAsAJudge",
+                "InteractiveGroupChat",
+                "HeavySwarm",
+            ]
+        ]
+        | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+        tasks: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> AsyncStream[SwarmRunChunk]:
+        """
+        Run a swarm with the specified task.
+
+        Args:
+          stream: A flag indicating whether the swarm should stream its output. If set, a
+              `AsyncStream[SwarmRunChunk]` is returned that yields the output as it is generated.
+
+          agents: A list of agents or specifications that define the agents participating in the
+              swarm.
+
+          description: A comprehensive description of the swarm's objectives, capabilities, and
+              intended outcomes.
+
+          heavy_swarm_loops_per_agent: The number of loops to run per agent in the heavy swarm.
+
+          heavy_swarm_question_agent_model_name: The model name to use for the question agent in the heavy swarm.
+
+          heavy_swarm_worker_model_name: The model name to use for the worker agent in the heavy swarm.
+
+          img: An optional image URL that may be associated with the swarm's task or
+              representation.
+
+          max_loops: The maximum number of execution loops allowed for the swarm, enabling repeated
+              processing if needed.
+
+          messages: A list of messages that the swarm should complete.
+
+          name: The name of the swarm, which serves as an identifier for the group of agents and
+              their collective task.
+
+          rearrange_flow: Instructions on how to rearrange the flow of tasks among agents, if applicable.
+
+          rules: Guidelines or constraints that govern the behavior and interactions of the
+              agents within the swarm.
+
+          service_tier: The service tier to use for processing. Options: 'standard' (default) or 'flex'
+              for lower cost but slower processing.
+
+          swarm_type: The classification of the swarm, indicating its operational style and
+              methodology.
+
+          task: The specific task or objective that the swarm is designed to accomplish.
+
+          tasks: A list of tasks that the swarm should complete.
+
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          extra_body: Add additional JSON properties to the request
+
+          timeout: Override the client-level default timeout for this request, in seconds
+        """
+        ...
+
+    @overload
+    async def run(
+        self,
+        *,
+        stream: bool,
+        agents: Optional[Iterable[AgentSpecParam]] | NotGiven = NOT_GIVEN,
+        description: Optional[str] | NotGiven = NOT_GIVEN,
+        heavy_swarm_loops_per_agent: Optional[int] | NotGiven = NOT_GIVEN,
+        heavy_swarm_question_agent_model_name: Optional[str] | NotGiven = NOT_GIVEN,
+        heavy_swarm_worker_model_name: Optional[str] | NotGiven = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        max_loops: Optional[int] | NotGiven = NOT_GIVEN,
+        messages: (Union[Iterable[Dict[str, object]], Dict[str, object], None] | NotGiven) = NOT_GIVEN,
+        name: Optional[str] | NotGiven = NOT_GIVEN,
+        rearrange_flow: Optional[str] | NotGiven = NOT_GIVEN,
+        rules: Optional[str] | NotGiven = NOT_GIVEN,
+        service_tier: Optional[str] | NotGiven = NOT_GIVEN,
+        swarm_type: Optional[
+            Literal[
+                "AgentRearrange",
+                "MixtureOfAgents",
+                "SpreadSheetSwarm",
+                "SequentialWorkflow",
+                "ConcurrentWorkflow",
+                "GroupChat",
+                "MultiAgentRouter",
+                "AutoSwarmBuilder",
+                "HiearchicalSwarm",
+                "auto",
+                "MajorityVoting",
+                "MALT",
+                "DeepResearchSwarm",
+                "CouncilAsAJudge",
+                "InteractiveGroupChat",
+                "HeavySwarm",
+            ]
+        ]
+        | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+        tasks: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> SwarmRunResponse | AsyncStream[SwarmRunChunk]:
+        """
+        Run a swarm with the specified task.
+
+        Args:
+          stream: A flag indicating whether the swarm should stream its output. If set, a
+              `AsyncStream[SwarmRunChunk]` is returned that yields the output as it is generated.
+
+          agents: A list of agents or specifications that define the agents participating in the
+              swarm.
+
+          description: A comprehensive description of the swarm's objectives, capabilities, and
+              intended outcomes.
+
+          heavy_swarm_loops_per_agent: The number of loops to run per agent in the heavy swarm.
+
+          heavy_swarm_question_agent_model_name: The model name to use for the question agent in the heavy swarm.
+
+          heavy_swarm_worker_model_name: The model name to use for the worker agent in the heavy swarm.
+
+          img: An optional image URL that may be associated with the swarm's task or
+              representation.
+
+          max_loops: The maximum number of execution loops allowed for the swarm, enabling repeated
+              processing if needed.
+
+          messages: A list of messages that the swarm should complete.
+
+          name: The name of the swarm, which serves as an identifier for the group of agents and
+              their collective task.
+
+          rearrange_flow: Instructions on how to rearrange the flow of tasks among agents, if applicable.
+
+          rules: Guidelines or constraints that govern the behavior and interactions of the
+              agents within the swarm.
+
+          service_tier: The service tier to use for processing. Options: 'standard' (default) or 'flex'
+              for lower cost but slower processing.
+
+          swarm_type: The classification of the swarm, indicating its operational style and
+              methodology.
+
+          task: The specific task or objective that the swarm is designed to accomplish.
+
+          tasks: A list of tasks that the swarm should complete.
+
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          extra_body: Add additional JSON properties to the request
+
+          timeout: Override the client-level default timeout for this request, in seconds
+        """
+        ...
+
+    async def run(
+        self,
+        *,
+        agents: Optional[Iterable[AgentSpecParam]] | NotGiven = NOT_GIVEN,
+        description: Optional[str] | NotGiven = NOT_GIVEN,
+        heavy_swarm_loops_per_agent: Optional[int] | NotGiven = NOT_GIVEN,
+        heavy_swarm_question_agent_model_name: Optional[str] | NotGiven = NOT_GIVEN,
+        heavy_swarm_worker_model_name: Optional[str] | NotGiven = NOT_GIVEN,
+        img: Optional[str] | NotGiven = NOT_GIVEN,
+        max_loops: Optional[int] | NotGiven = NOT_GIVEN,
+        messages: (Union[Iterable[Dict[str, object]], Dict[str, object], None] | NotGiven) = NOT_GIVEN,
+        name: Optional[str] | NotGiven = NOT_GIVEN,
+        rearrange_flow: Optional[str] | NotGiven = NOT_GIVEN,
+        rules: Optional[str] | NotGiven = NOT_GIVEN,
+        service_tier: Optional[str] | NotGiven = NOT_GIVEN,
+        stream: Optional[Literal[False]] | Literal[True] | NotGiven = NOT_GIVEN,
+        swarm_type: Optional[
+            Literal[
+                "AgentRearrange",
+                "MixtureOfAgents",
+                "SpreadSheetSwarm",
+                "SequentialWorkflow",
+                "ConcurrentWorkflow",
+                "GroupChat",
+                "MultiAgentRouter",
+                "AutoSwarmBuilder",
+                "HiearchicalSwarm",
+                "auto",
+                "MajorityVoting",
+                "MALT",
+                "DeepResearchSwarm",
+                "CouncilAsAJudge",
+                "InteractiveGroupChat",
+                "HeavySwarm",
+            ]
+        ]
+        | NotGiven = NOT_GIVEN,
+        task: Optional[str] | NotGiven = NOT_GIVEN,
+        tasks: Optional[List[str]] | NotGiven = NOT_GIVEN,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # The extra values given here take precedence over values defined on the client or passed to this method.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> SwarmRunResponse | AsyncStream[SwarmRunChunk]:
         return await self._post(
             "/v1/swarm/completions",
             body=await async_maybe_transform(
@@ -436,8 +964,68 @@ class AsyncSwarmsResource(AsyncAPIResource):
                 timeout=timeout,
             ),
             cast_to=SwarmRunResponse,
+            stream=stream or False,
+            stream_cls=AsyncStream[SwarmRunChunk],
         )
 
+    def map(
+        self,
+        tasks: Union[Iterable[BulkInput], AsyncIterable[BulkInput]],
+        *,
+        template: SwarmSpecParam,
+        concurrency: int = DEFAULT_BULK_CONCURRENCY,
+        ordered: bool = False,
+        # Use the following arguments if you need to pass additional parameters to the API that aren't available via kwargs.
+        # These apply to every request sent for the given tasks.
+        extra_headers: Headers | None = None,
+        extra_query: Query | None = None,
+        extra_body: Body | None = None,
+        timeout: float | httpx.Timeout | None | NotGiven = NOT_GIVEN,
+    ) -> BulkMap[BulkInput, SwarmRunResponse]:
+        """
+        Run a swarm for every given task with at most `concurrency` runs in flight.
+
+        Tasks are consumed lazily, and errors are captured per task instead of
+        aborting the remaining runs. The runs are started when the returned results are
+        entered with `async with`, and the ones still in flight are cancelled when it's left:
+
+        ```py
+        async with client.swarms.map(tasks, template=template) as results:
+            async for result in results:
+                ...
+        ```
+
+        Args:
+          tasks: An iterable or async iterable of tasks. Each task is either a string, which
+              replaces the template's `task`, or a mapping of parameters that override the template.
+
+          template: The swarm specification shared by every run.
+
+          concurrency: The maximum number of runs in flight at once.
+
+          ordered: Yield results in the order of the given tasks instead of as they complete.
+
+          extra_headers: Send extra headers
+
+          extra_query: Add additional query parameters to the request
+
+          extra_body: Add additional JSON properties to the request
+
+          timeout: Override the client-level default timeout for each request, in seconds
+        """
+
+        async def run(task: BulkInput) -> SwarmRunResponse:
+            response = await self.run(
+                **merge_params(template, task, key="task"),
+                extra_headers=extra_headers,
+                extra_query=extra_query,
+                extra_body=extra_body,
+                timeout=timeout,
+            )
+            return cast(SwarmRunResponse, response)
+
+        return BulkMap(run, tasks, concurrency=concurrency, ordered=ordered)
+
 
 class SwarmsResourceWithRawResponse:
     def __init__(self, swarms: SwarmsResource) -> None:
@@ -48,11 +48,17 @@ class TestAgent:
             history={"foo": "bar"},
             img="img",
             imgs=["string"],
-            stream=True,
+            stream=False,
             task="task",
         )
         assert_matches_type(AgentRunResponse, agent, path=["response"])
 
+    @pytest.mark.skip(reason="Prism tests are disabled")
+    @parametrize
+    def test_method_run_streaming(self, client: SwarmsClient) -> None:
+        agent_stream = client.agent.run(stream=True)
+        agent_stream.response.close()
+
     @pytest.mark.skip(reason="Prism tests are disabled")
     @parametrize
     def test_raw_response_run(self, client: SwarmsClient) -> None:
@@ -115,11 +121,17 @@ class TestAsyncAgent:
             history={"foo": "bar"},
             img="img",
             imgs=["string"],
-            stream=True,
+            stream=False,
             task="task",
         )
         assert_matches_type(AgentRunResponse, agent, path=["response"])
 
+    @pytest.mark.skip(reason="Prism tests are disabled")
+    @parametrize
+    async def test_method_run_streaming(self, async_client: AsyncSwarmsClient) -> None:
+        agent_stream = await async_client.agent.run(stream=True)
+        await agent_stream.response.aclose()
+
     @pytest.mark.skip(reason="Prism tests are disabled")
     @parametrize
     async def test_raw_response_run(self, async_client: AsyncSwarmsClient) -> None:
@@ -118,13 +118,19 @@ class TestSwarms:
             rearrange_flow="rearrange_flow",
             rules="rules",
             service_tier="service_tier",
-            stream=True,
+            stream=False,
             swarm_type="AgentRearrange",
             task="task",
             tasks=["string"],
         )
         assert_matches_type(SwarmRunResponse, swarm, path=["response"])
 
+    @pytest.mark.skip(reason="Prism tests are disabled")
+    @parametrize
+    def test_method_run_streaming(self, client: SwarmsClient) -> None:
+        swarm_stream = client.swarms.run(stream=True)
+        swarm_stream.response.close()
+
     @pytest.mark.skip(reason="Prism tests are disabled")
     @parametrize
     def test_raw_response_run(self, client: SwarmsClient) -> None:
@@ -261,13 +267,19 @@ class TestAsyncSwarms:
             rearrange_flow="rearrange_flow",
             rules="rules",
             service_tier="service_tier",
-            stream=True,
+            stream=False,
             swarm_type="AgentRearrange",
             task="task",
             tasks=["string"],
         )
         assert_matches_type(SwarmRunResponse, swarm, path=["response"])
 
+    @pytest.mark.skip(reason="Prism tests are disabled")
+    @parametrize
+    async def test_method_run_streaming(self, async_client: AsyncSwarmsClient) -> None:
+        swarm_stream = await async_client.swarms.run(stream=True)
+        await swarm_stream.response.aclose()
+
     @pytest.mark.skip(reason="Prism tests are disabled")
     @parametrize
     async def test_raw_response_run(self, async_client: AsyncSwarmsClient) -> None:
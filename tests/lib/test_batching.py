@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import os
+import json
+import asyncio
+from typing import Any, List
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient, APIResponseValidationError
+from swarms_client.types import AgentRunResponse
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+
+def _echo_batch(request: httpx.Request) -> httpx.Response:
+    body: List[Any] = json.loads(request.content)
+    return httpx.Response(
+        200,
+        json={
+            "batch_id": "batch-1",
+            "total_requests": len(body),
+            "results": [{"name": entry["agent_config"]["agent_name"], "outputs": entry["task"]} for entry in body],
+        },
+    )
+
+
+class TestAgentRunBatcher:
+    @pytest.mark.respx(base_url=base_url)
+    def test_coalesces_concurrent_calls(self, client: SwarmsClient, respx_mock: MockRouter) -> None:
+        route = respx_mock.post("/v1/agent/batch/completions").mock(side_effect=_echo_batch)
+        batcher = client.agent.batcher(max_batch_size=4, max_wait=5)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [
+                pool.submit(batcher.run, agent_config={"agent_name": f"agent-{i}"}, task=f"task-{i}") for i in range(4)
+            ]
+            responses = [future.result(timeout=10) for future in futures]
+
+        assert route.call_count == 1
+        for i, response in enumerate(responses):
+            assert isinstance(response, AgentRunResponse)
+            assert response.name == f"agent-{i}"
+            assert response.outputs == f"task-{i}"
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_flushes_after_max_wait(self, client: SwarmsClient, respx_mock: MockRouter) -> None:
+        route = respx_mock.post("/v1/agent/batch/completions").mock(side_effect=_echo_batch)
+        batcher = client.agent.batcher(max_batch_size=10, max_wait=0.01)
+
+        response = batcher.run(agent_config={"agent_name": "solo"}, task="hello")
+
+        assert route.call_count == 1
+        assert json.loads(route.calls[0].request.content) == [{"agent_config": {"agent_name": "solo"}, "task": "hello"}]
+        assert response.outputs == "hello"
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_mismatched_results(self, client: SwarmsClient, respx_mock: MockRouter) -> None:
+        respx_mock.post("/v1/agent/batch/completions").mock(
+            return_value=httpx.Response(200, json={"results": [{"name": "a"}, {"name": "b"}]})
+        )
+        batcher = client.agent.batcher(max_wait=0)
+
+        with pytest.raises(APIResponseValidationError, match="contain 1 results but received 2"):
+            batcher.run(task="hello")
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_request_error_propagates_to_every_caller(self, client: SwarmsClient, respx_mock: MockRouter) -> None:
+        respx_mock.post("/v1/agent/batch/completions").mock(return_value=httpx.Response(400, json={"error": "bad"}))
+        batcher = client.with_options(max_retries=0).agent.batcher(max_batch_size=2, max_wait=5)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            futures = [pool.submit(batcher.run, task=f"task-{i}") for i in range(2)]
+            for future in futures:
+                with pytest.raises(Exception, match="Error code: 400"):
+                    future.result(timeout=10)
+
+    def test_invalid_arguments(self, client: SwarmsClient) -> None:
+        with pytest.raises(ValueError, match="max_batch_size"):
+            client.agent.batcher(max_batch_size=0)
+
+        with pytest.raises(ValueError, match="max_wait"):
+            client.agent.batcher(max_wait=-1)
+
+
+class TestAsyncAgentRunBatcher:
+    @pytest.mark.respx(base_url=base_url)
+    async def test_coalesces_concurrent_calls(self, async_client: AsyncSwarmsClient, respx_mock: MockRouter) -> None:
+        route = respx_mock.post("/v1/agent/batch/completions").mock(side_effect=_echo_batch)
+        batcher = async_client.agent.batcher(max_batch_size=3, max_wait=5)
+
+        responses = await asyncio.gather(
+            *[batcher.run(agent_config={"agent_name": f"agent-{i}"}, task=f"task-{i}") for i in range(6)]
+        )
+
+        assert route.call_count == 2
+        assert [response.outputs for response in responses] == [f"task-{i}" for i in range(6)]
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_flushes_after_max_wait(self, async_client: AsyncSwarmsClient, respx_mock: MockRouter) -> None:
+        route = respx_mock.post("/v1/agent/batch/completions").mock(side_effect=_echo_batch)
+        batcher = async_client.agent.batcher(max_batch_size=10, max_wait=0.01)
+
+        responses = await asyncio.gather(
+            batcher.run(agent_config={"agent_name": "a"}, task="one"),
+            batcher.run(agent_config={"agent_name": "b"}, task="two"),
+        )
+
+        assert route.call_count == 1
+        assert [response.name for response in responses] == ["a", "b"]
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_leader_cancellation_still_resolves_followers(
+        self, async_client: AsyncSwarmsClient, respx_mock: MockRouter
+    ) -> None:
+        route = respx_mock.post("/v1/agent/batch/completions").mock(side_effect=_echo_batch)
+        batcher = async_client.agent.batcher(max_batch_size=10, max_wait=0.05)
+
+        leader = asyncio.ensure_future(batcher.run(agent_config={"agent_name": "leader"}, task="one"))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(batcher.run(agent_config={"agent_name": "follower"}, task="two"))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        response = await asyncio.wait_for(follower, timeout=10)
+        assert response.name == "follower"
+        assert route.call_count == 1
+        with pytest.raises(asyncio.CancelledError):
+            await leader
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import os
+import json
+import asyncio
+from typing import Any, Dict, List, TypeVar, Iterator, AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import AsyncSwarmsClient, InternalServerError
+from swarms_client.types import AgentRunResponse, SwarmRunResponse
+from swarms_client.lib.bulk import BulkMap, BulkResult
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+
+_ResponseT = TypeVar("_ResponseT")
+
+
+class _Server:
+    """Echoes the requested task back after a task-dependent delay and records peak concurrency."""
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.bodies: List[Dict[str, Any]] = []
+
+    async def swarm(self, request: httpx.Request) -> httpx.Response:
+        body = await self._handle(request)
+        if body["task"] == "fail":
+            return httpx.Response(500, json={"detail": "boom"})
+        return httpx.Response(200, json={"job_id": "job", "status": "success", "output": body["task"]})
+
+    async def agent(self, request: httpx.Request) -> httpx.Response:
+        body = await self._handle(request)
+        return httpx.Response(200, json={"name": body["agent_config"]["agent_name"], "outputs": body["task"]})
+
+    async def _handle(self, request: httpx.Request) -> Dict[str, Any]:
+        body: Dict[str, Any] = json.loads(request.content)
+        self.bodies.append(body)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            # later tasks finish first so that unordered results come back out of order
+            index = int(body["task"].rpartition("-")[2]) if body["task"].startswith("task-") else 0
+            await asyncio.sleep(0.002 * (20 - index))
+        finally:
+            self.in_flight -= 1
+        return body
+
+
+async def _collect(results: BulkMap[Any, _ResponseT]) -> List[BulkResult[Any, _ResponseT]]:
+    async with results:
+        return [result async for result in results]
+
+
+class TestSwarmsMap:
+    @pytest.mark.respx(base_url=base_url)
+    async def test_bounds_concurrency(self, async_client: AsyncSwarmsClient, respx_mock: MockRouter) -> None:
+        server = _Server()
+        respx_mock.post("/v1/swarm/completions").mock(side_effect=server.swarm)
+
+        tasks = [f"task-{i}" for i in range(20)]
+        results = await _collect(async_client.swarms.map(tasks, template={"name": "bulk", "task": "x"}, concurrency=4))
+
+        assert server.max_in_flight == 4
+        assert sorted(result.index for result in results) == list(range(20))
+        assert [result.index for result in results] != list(range(20))
+        for result in results:
+            assert result.ok
+            assert isinstance(result.response, SwarmRunResponse)
+            assert result.response.output == f"task-{result.index}"
+        assert all(body["name"] == "bulk" for body in server.bodies)
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_ordered(self, async_client: AsyncSwarmsClient, respx_mock: MockRouter) -> None:
+        server = _Server()
+        respx_mock.post("/v1/swarm/completions").mock(side_effect=server.swarm)
+
+        tasks = [{"task": f"task-{i}"} for i in range(10)]
+        results = await _collect(async_client.swarms.map(tasks, template={"name": "bulk"}, concurrency=3, ordered=True))
+
+        assert server.max_in_flight <= 3
+        assert [result.index for result in results] == list(range(10))
+        assert [result.unwrap().output for result in results] == [f"task-{i}" for i in range(10)]
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_captures_errors_per_item(self, async_client: AsyncSwarmsClient, respx_mock: MockRouter) -> None:
+        server = _Server()
+        respx_mock.post("/v1/swarm/completions").mock(side_effect=server.swarm)
+
+        results: List[BulkResult[Any, SwarmRunResponse]] = []
+        async with async_client.with_options(max_retries=0).swarms.map(
+            ["a", "fail", "b"], template={"name": "bulk"}, ordered=True
+        ) as received:
+            async for result in received:
+                results.append(result)
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert isinstance(results[1].error, InternalServerError)
+        assert results[1].item == "fail"
+        with pytest.raises(InternalServerError):
+            results[1].unwrap()
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_consumes_input_lazily(self, async_client: AsyncSwarmsClient, respx_mock: MockRouter) -> None:
+        server = _Server()
+        respx_mock.post("/v1/swarm/completions").mock(side_effect=server.swarm)
+
+        pulled = 0
+
+        def tasks() -> Iterator[str]:
+            nonlocal pulled
+            for i in range(1_000_000):
+                pulled += 1
+                yield f"task-{i}"
+
+        async with async_client.swarms.map(tasks(), template={"name": "bulk"}, concurrency=5) as results:
+            async for result in results:
+                assert result.ok
+                break
+
+        assert pulled <= 6
+        # leaving the block cancelled the runs that were still in flight
+        assert server.in_flight == 0
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_async_iterable_input(self, async_client: AsyncSwarmsClient, respx_mock: MockRouter) -> None:
+        server = _Server()
+        respx_mock.post("/v1/swarm/completions").mock(side_effect=server.swarm)
+
+        async def tasks() -> AsyncIterator[str]:
+            for i in range(5):
+                yield f"task-{i}"
+
+        outputs = {result.unwrap().output for result in await _collect(async_client.swarms.map(tasks(), template={}))}
+
+        assert outputs == {f"task-{i}" for i in range(5)}
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_runs_are_not_streamed(self, async_client: AsyncSwarmsClient, respx_mock: MockRouter) -> None:
+        server = _Server()
+        route = respx_mock.post("/v1/swarm/completions").mock(side_effect=server.swarm)
+
+        results = await _collect(
+            async_client.swarms.map(
+                ["a", {"task": "b", "stream": True}, {"task": "c", "stream": False}],
+                template={"name": "bulk"},
+                ordered=True,
+            )
+        )
+        streamed = await _collect(async_client.swarms.map(["d"], template={"stream": True}))
+
+        assert [result.ok for result in results] == [True, False, True]
+        assert isinstance(results[1].error, ValueError)
+        assert isinstance(streamed[0].error, ValueError)
+        assert route.call_count == 2
+        assert all("stream" not in body for body in server.bodies)
+
+    async def test_invalid_concurrency(self, async_client: AsyncSwarmsClient) -> None:
+        with pytest.raises(ValueError, match="concurrency"):
+            async_client.swarms.map(["a"], template={}, concurrency=0)
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_results_are_iterated_in_a_block(
+        self, async_client: AsyncSwarmsClient, respx_mock: MockRouter
+    ) -> None:
+        route = respx_mock.post("/v1/swarm/completions").mock(side_effect=_Server().swarm)
+        results = async_client.swarms.map(["a"], template={})
+
+        with pytest.raises(RuntimeError, match="async with"):
+            async for _ in results:
+                pass
+        assert route.call_count == 0
+
+        assert len(await _collect(results)) == 1
+        with pytest.raises(RuntimeError, match="once"):
+            await _collect(results)
+
+
+@pytest.mark.parametrize("backend", ["asyncio", "trio"])
+@pytest.mark.respx(base_url=base_url)
+def test_map_on_every_backend(backend: str, respx_mock: MockRouter) -> None:
+    if backend == "trio":
+        pytest.importorskip("trio")
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, max_in_flight
+        task = json.loads(request.content)["task"]
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        try:
+            await anyio.sleep(0.002 * (10 - int(task)))
+        finally:
+            in_flight -= 1
+        return httpx.Response(200, json={"job_id": "job", "status": "success", "output": task})
+
+    respx_mock.post("/v1/swarm/completions").mock(side_effect=respond)
+
+    def tasks() -> Iterator[str]:
+        yield from (str(i) for i in range(10))
+        raise RuntimeError("no more tasks")
+
+    async def main() -> None:
+        async with AsyncSwarmsClient(base_url=base_url, api_key="My API Key") as client:
+            outputs: List[Any] = []
+            with pytest.raises(RuntimeError, match="no more tasks"):
+                async with client.swarms.map(tasks(), template={}, concurrency=3, ordered=True) as results:
+                    async for result in results:
+                        outputs.append(result.unwrap().output)
+            assert outputs == [str(i) for i in range(len(outputs))]
+
+            async with client.swarms.map(map(str, range(10)), template={}, concurrency=3) as results:
+                async for _ in results:
+                    break
+            assert in_flight == 0
+
+            with anyio.move_on_after(0.005):
+                async with client.swarms.map(map(str, range(10)), template={}, concurrency=3) as results:
+                    async for _ in results:
+                        pass
+            assert in_flight == 0
+
+    # in a thread of its own, so that the event loop of the other tests is left alone
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pool.submit(lambda: anyio.run(main, backend=backend)).result()
+
+    assert max_in_flight == 3
+
+
+class TestAgentMap:
+    @pytest.mark.respx(base_url=base_url)
+    async def test_map(self, async_client: AsyncSwarmsClient, respx_mock: MockRouter) -> None:
+        server = _Server()
+        respx_mock.post("/v1/agent/completions").mock(side_effect=server.agent)
+
+        results = await _collect(
+            async_client.agent.map(
+                ["first", {"task": "second", "img": "https://example.com/a.png"}],
+                template={"agent_name": "bulk-agent"},
+                ordered=True,
+            )
+        )
+
+        assert [result.unwrap().outputs for result in results] == ["first", "second"]
+        assert all(isinstance(result.response, AgentRunResponse) for result in results)
+        assert sorted(server.bodies, key=lambda body: body["task"]) == [
+            {"agent_config": {"agent_name": "bulk-agent"}, "task": "first"},
+            {"agent_config": {"agent_name": "bulk-agent"}, "task": "second", "img": "https://example.com/a.png"},
+        ]
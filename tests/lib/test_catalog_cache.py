@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import Any, List
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient
+from swarms_client.lib.catalog_cache import CatalogCache
+from swarms_client.lib.response_cache import CACHE_HEADER
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+
+class _Catalog:
+    """Serves a versioned catalog and answers conditional requests for the current version."""
+
+    def __init__(self, *, etag: bool = True) -> None:
+        self.version = 1
+        self.etag = etag
+        self.requests: List[httpx.Request] = []
+
+    @property
+    def validator(self) -> str:
+        return f'"v{self.version}"' if self.etag else f"Mon, 0{self.version} Jan 2024 00:00:00 GMT"
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        condition = request.headers.get("if-none-match" if self.etag else "if-modified-since")
+        if condition == self.validator:
+            return httpx.Response(304)
+
+        header = "etag" if self.etag else "last-modified"
+        return httpx.Response(
+            200, json={"models": [f"model-v{self.version}"], "success": True}, headers={header: self.validator}
+        )
+
+
+def _age(cache: CatalogCache, seconds: float) -> None:
+    for entry in cache._entries.values():
+        entry.fetched_at -= seconds
+
+
+def _wait_for_refreshes(cache: CatalogCache) -> None:
+    deadline = time.monotonic() + 5
+    while cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not cache._refreshing
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_fresh_responses_skip_the_network(respx_mock: MockRouter) -> None:
+    catalog = _Catalog()
+    route = respx_mock.get("/v1/models/available").mock(side_effect=catalog)
+    cache = CatalogCache(ttl=60)
+
+    with SwarmsClient(base_url=base_url, api_key=api_key, catalog_cache=cache) as client:
+        first = client.models.list_available()
+        second = client.models.list_available()
+
+    assert route.call_count == 1
+    assert second == first
+    assert second.models == ["model-v1"]
+    assert cache.stats() == {"hits": 1, "stale_hits": 0, "misses": 1, "not_modified": 0}
+
+
+@pytest.mark.respx(base_url=f"{base_url}/api")
+def test_base_url_with_a_path(respx_mock: MockRouter) -> None:
+    route = respx_mock.get("/v1/models/available").mock(side_effect=_Catalog())
+    cache = CatalogCache(ttl=60)
+
+    with SwarmsClient(base_url=f"{base_url}/api", api_key=api_key, catalog_cache=cache) as client:
+        client.models.list_available()
+        client.models.list_available()
+
+    assert route.call_count == 1
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_stale_responses_are_refreshed_in_the_background(respx_mock: MockRouter) -> None:
+    catalog = _Catalog()
+    respx_mock.get("/v1/models/available").mock(side_effect=catalog)
+    cache = CatalogCache(ttl=60, stale_while_revalidate=600)
+
+    with SwarmsClient(base_url=base_url, api_key=api_key, catalog_cache=cache) as client:
+        client.models.list_available()
+        catalog.version = 2
+        _age(cache, 120)
+
+        # the stale catalog is returned right away
+        assert client.models.list_available().models == ["model-v1"]
+        _wait_for_refreshes(cache)
+        assert client.models.list_available().models == ["model-v2"]
+
+    assert len(catalog.requests) == 2
+    assert catalog.requests[1].headers["if-none-match"] == '"v1"'
+    assert CACHE_HEADER.lower() not in catalog.requests[1].headers
+    assert cache.stats() == {"hits": 1, "stale_hits": 1, "misses": 2, "not_modified": 0}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_unchanged_catalogs_are_revalidated(respx_mock: MockRouter) -> None:
+    catalog = _Catalog(etag=False)
+    respx_mock.get("/v1/models/available").mock(side_effect=catalog)
+    cache = CatalogCache(ttl=60, stale_while_revalidate=0)
+
+    with SwarmsClient(base_url=base_url, api_key=api_key, catalog_cache=cache) as client:
+        client.models.list_available()
+        _age(cache, 120)
+
+        # too old to be returned while it's refreshed, so it's revalidated first
+        response = client.models.with_raw_response.list_available()
+        assert response.parse().models == ["model-v1"]
+        assert response.headers[CACHE_HEADER] == "hit"
+
+        # the revalidated response is fresh again
+        client.models.list_available()
+
+    assert len(catalog.requests) == 2
+    assert catalog.requests[1].headers["if-modified-since"] == catalog.validator
+    assert cache.stats() == {"hits": 1, "stale_hits": 0, "misses": 2, "not_modified": 1}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_bypass_and_refresh(respx_mock: MockRouter) -> None:
+    catalog = _Catalog()
+    respx_mock.get("/v1/swarms/available").mock(side_effect=catalog)
+    cache = CatalogCache()
+
+    with SwarmsClient(base_url=base_url, api_key=api_key, catalog_cache=cache) as client:
+        client.swarms.check_available()
+        client.swarms.check_available(extra_headers={CACHE_HEADER: "bypass"})
+        catalog.version = 2
+        client.swarms.check_available(extra_headers={CACHE_HEADER: "refresh"})
+        client.swarms.check_available()
+
+    assert len(catalog.requests) == 3
+    # bypassed requests aren't conditional
+    assert "if-none-match" not in catalog.requests[1].headers
+    assert catalog.requests[2].headers["if-none-match"] == '"v1"'
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_shared_between_sync_and_async_clients(respx_mock: MockRouter) -> None:
+    catalog = _Catalog()
+    respx_mock.get("/v1/reasoning-agent/types").mock(side_effect=catalog)
+    cache = CatalogCache(ttl=60, stale_while_revalidate=600)
+
+    with SwarmsClient(base_url=base_url, api_key=api_key, catalog_cache=cache) as client:
+        first = client.reasoning_agents.list_types()
+
+    async with AsyncSwarmsClient(base_url=base_url, api_key=api_key, catalog_cache=cache) as async_client:
+        assert await async_client.reasoning_agents.list_types() == first
+
+        catalog.version = 2
+        _age(cache, 120)
+        assert await async_client.reasoning_agents.list_types() == first
+        with anyio.fail_after(5):
+            while cache._refreshing:
+                await anyio.sleep(0.01)
+        assert await async_client.reasoning_agents.list_types() == {"models": ["model-v2"], "success": True}
+
+    assert len(catalog.requests) == 2
+
+
+@pytest.mark.parametrize("backend", ["asyncio", "trio"])
+def test_stale_responses_are_returned_on_every_backend(backend: str) -> None:
+    if backend == "trio":
+        pytest.importorskip("trio")
+
+    catalog = _Catalog()
+    cache = CatalogCache(ttl=60, stale_while_revalidate=600)
+
+    async def main() -> None:
+        released = anyio.Event()
+
+        async def respond(request: httpx.Request) -> httpx.Response:
+            if catalog.version == 2:
+                # a refresh that blocked the caller would time out
+                await released.wait()
+            return catalog(request)
+
+        async with AsyncSwarmsClient(
+            base_url=base_url,
+            api_key=api_key,
+            catalog_cache=cache,
+            http_client=httpx.AsyncClient(transport=httpx.MockTransport(respond)),
+        ) as client:
+            await client.models.list_available()
+            catalog.version = 2
+            _age(cache, 120)
+
+            with anyio.fail_after(0.5):
+                assert (await client.models.list_available()).models == ["model-v1"]
+            released.set()
+            with anyio.fail_after(5):
+                while (await client.models.list_available()).models != ["model-v2"]:
+                    await anyio.sleep(0.01)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pool.submit(lambda: anyio.run(main, backend=backend)).result()
+
+    assert len(catalog.requests) == 2
+    assert catalog.requests[1].headers["if-none-match"] == '"v1"'
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_keyed_by_api_key(respx_mock: MockRouter) -> None:
+    route = respx_mock.get("/v1/models/available").mock(side_effect=_Catalog())
+    cache = CatalogCache()
+
+    with SwarmsClient(base_url=base_url, api_key=api_key, catalog_cache=cache) as client:
+        client.models.list_available()
+        client.with_options(api_key="Another API Key").models.list_available()
+        client.with_options(timeout=5).models.list_available()
+
+    assert route.call_count == 2
+
+
+@pytest.mark.parametrize("kwargs", [{"ttl": -1}, {"stale_while_revalidate": -1}])
+def test_invalid_arguments(kwargs: Any) -> None:
+    with pytest.raises(ValueError):
+        CatalogCache(**kwargs)
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import os
+import asyncio
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import RateLimitError, AsyncSwarmsClient
+from swarms_client.lib.concurrency import AdaptiveConcurrencyLimiter
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+
+def _ok() -> httpx.Response:
+    return httpx.Response(200)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    async def test_grows_while_latency_is_flat(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=4)
+
+        for _ in range(50):
+            # pretend that every request took ~1s so that timing noise doesn't register as a latency change
+            started = [await limiter.acquire() - 1 for _ in range(limiter.limit)]
+            for started_at in started:
+                limiter.release(started_at, response=_ok())
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    async def test_does_not_grow_when_unused(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+
+        for _ in range(100):
+            limiter.release(await limiter.acquire() - 1, response=_ok())
+
+        assert limiter.limit == 10
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            httpx.Response(429),
+            httpx.Response(503),
+            httpx.Response(409, headers={"x-should-retry": "true"}),
+        ],
+    )
+    async def test_backs_off_on_overload(self, response: httpx.Response) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, backoff_ratio=0.5)
+
+        limiter.release(await limiter.acquire(), response=response)
+
+        assert limiter.limit == 8
+        assert limiter.stats()["backoffs"] == 1
+
+    async def test_backs_off_on_timeout(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+
+        limiter.release(await limiter.acquire(), timed_out=True)
+
+        assert limiter.limit == 8
+
+    async def test_ignores_other_failures(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16)
+
+        limiter.release(await limiter.acquire())
+        limiter.release(await limiter.acquire(), response=httpx.Response(400))
+
+        assert limiter.limit == 16
+        assert limiter.in_flight == 0
+
+    async def test_backs_off_once_per_latency_window(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, min_limit=2)
+        # establish a latency baseline of ~1s
+        limiter.release(await limiter.acquire() - 1, response=_ok())
+
+        for _ in range(8):
+            limiter.release(await limiter.acquire(), response=httpx.Response(429))
+
+        assert limiter.limit == 8
+        assert limiter.stats()["backoffs"] == 1
+
+    async def test_backs_off_on_latency_increase(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=16, latency_tolerance=2, short_window=1)
+        limiter.release(await limiter.acquire() - 0.001, response=_ok())
+
+        limiter.release(await limiter.acquire() - 1, response=_ok())
+
+        assert limiter.limit < 16
+        stats = limiter.stats()
+        assert stats["latency_short"] is not None and stats["latency_long"] is not None
+        assert stats["latency_short"] > stats["latency_long"]
+
+    async def test_queues_requests_above_limit(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        first = await limiter.acquire()
+
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        assert limiter.stats()["queued"] == 1
+
+        limiter.release(first, response=_ok())
+        limiter.release(await asyncio.wait_for(waiter, 1), response=_ok())
+        assert limiter.in_flight == 0
+
+    async def test_cancelled_waiter_gives_up_its_place(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+        first = await limiter.acquire()
+
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        limiter.release(first, response=_ok())
+        assert limiter.stats()["queued"] == 0
+        assert limiter.in_flight == 0
+
+    def test_invalid_args(self) -> None:
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=0)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
+        with pytest.raises(ValueError):
+            AdaptiveConcurrencyLimiter(backoff_ratio=1)
+
+
+class TestClientIntegration:
+    @pytest.mark.respx(base_url=base_url)
+    async def test_limits_in_flight_requests(self, respx_mock: MockRouter) -> None:
+        in_flight = 0
+        max_in_flight = 0
+
+        async def handler(_request: httpx.Request) -> httpx.Response:
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, json={"status": "ok"})
+
+        respx_mock.get("/health").mock(side_effect=handler)
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+        client = AsyncSwarmsClient(base_url=base_url, api_key=api_key, concurrency_limiter=limiter)
+
+        await asyncio.gather(*[client.health.check() for _ in range(12)])
+
+        assert max_in_flight == 3
+        assert limiter.in_flight == 0
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_rate_limit_response_lowers_limit(self, respx_mock: MockRouter) -> None:
+        respx_mock.get("/health").mock(return_value=httpx.Response(429, json={"detail": "slow down"}))
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+        client = AsyncSwarmsClient(base_url=base_url, api_key=api_key, concurrency_limiter=limiter, max_retries=0)
+
+        with pytest.raises(RateLimitError):
+            await client.health.check()
+
+        assert limiter.limit == 5
+        assert limiter.in_flight == 0
+
+    def test_copy_shares_limiter(self) -> None:
+        limiter = AdaptiveConcurrencyLimiter()
+        client = AsyncSwarmsClient(base_url=base_url, api_key=api_key, concurrency_limiter=limiter)
+
+        assert client.with_options(timeout=10)._concurrency_limiter is limiter
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+import threading
+from typing import Any, List
+from contextvars import ContextVar
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient
+from swarms_client.lib.hedging import Hedging
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+_request_id: ContextVar[str] = ContextVar("_request_id")
+
+
+class _SlowFirst:
+    """Answers the first request after `slow` seconds and every other one right away."""
+
+    def __init__(self, *, slow: float, error: bool = False) -> None:
+        self.slow = slow
+        self.error = error
+        self.lock = threading.Lock()
+        self.requests: List[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        with self.lock:
+            self.requests.append(request)
+            first = len(self.requests) == 1
+        if first:
+            time.sleep(self.slow)
+            if self.error:
+                raise httpx.ConnectError("connection reset", request=request)
+            return httpx.Response(200, json={"models": ["first"]})
+        time.sleep(self.slow / 2 if self.error else 0)
+        return httpx.Response(200, json={"models": ["hedge"]})
+
+
+def _client(hedging: Hedging, **kwargs: Any) -> SwarmsClient:
+    return SwarmsClient(base_url=base_url, api_key=api_key, hedging=hedging, **kwargs)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_slow_requests_are_hedged(respx_mock: MockRouter) -> None:
+    server = _SlowFirst(slow=1)
+    respx_mock.get("/v1/models/available").mock(side_effect=server)
+    hedging = Hedging(delay=0.05, budget=1)
+
+    with _client(hedging) as client:
+        started = time.monotonic()
+        assert client.models.list_available().models == ["hedge"]
+        assert time.monotonic() - started < 0.8
+
+    assert len(server.requests) == 2
+    assert server.requests[0].headers["x-api-key"] == server.requests[1].headers["x-api-key"]
+    assert hedging.stats() == {"requests": 1, "hedges": 1, "hedge_wins": 1}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_requests_keep_the_context_of_the_caller(respx_mock: MockRouter) -> None:
+    server = _SlowFirst(slow=0.5)
+    seen: List[Any] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        seen.append(_request_id.get(None))
+        return server(request)
+
+    respx_mock.get("/v1/models/available").mock(side_effect=respond)
+    hedging = Hedging(delay=0.05, budget=1)
+
+    with _client(hedging) as client:
+        token = _request_id.set("req_1")
+        try:
+            client.models.list_available()
+        finally:
+            _request_id.reset(token)
+
+    assert seen == ["req_1", "req_1"]
+
+
+@pytest.mark.respx(base_url=f"{base_url}/api")
+def test_base_url_with_a_path(respx_mock: MockRouter) -> None:
+    server = _SlowFirst(slow=1)
+    respx_mock.get("/v1/models/available").mock(side_effect=server)
+    hedging = Hedging(delay=0.05, budget=1)
+
+    with SwarmsClient(base_url=f"{base_url}/api", api_key=api_key, hedging=hedging) as client:
+        assert client.models.list_available().models == ["hedge"]
+
+    assert hedging.stats() == {"requests": 1, "hedges": 1, "hedge_wins": 1}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_fast_requests_are_not_hedged(respx_mock: MockRouter) -> None:
+    route = respx_mock.get("/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+    hedging = Hedging(delay=1, budget=1)
+
+    with _client(hedging) as client:
+        client.health.check()
+
+    assert route.call_count == 1
+    assert hedging.stats() == {"requests": 1, "hedges": 0, "hedge_wins": 0}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_failed_requests_are_hedged(respx_mock: MockRouter) -> None:
+    server = _SlowFirst(slow=0.2, error=True)
+    respx_mock.get("/v1/models/available").mock(side_effect=server)
+    hedging = Hedging(delay=0.05, budget=1)
+
+    with _client(hedging, max_retries=0) as client:
+        assert client.models.list_available().models == ["hedge"]
+
+    assert hedging.stats() == {"requests": 1, "hedges": 1, "hedge_wins": 1}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_budget_caps_the_hedges(respx_mock: MockRouter) -> None:
+    def slow(_request: httpx.Request) -> httpx.Response:
+        time.sleep(0.05)
+        return httpx.Response(200, json={"swarm_types": []})
+
+    respx_mock.get("/v1/swarms/available").mock(side_effect=slow)
+    hedging = Hedging(delay=0.01, budget=0.5)
+
+    with _client(hedging) as client:
+        for _ in range(4):
+            client.swarms.check_available()
+
+    assert hedging.stats()["hedges"] == 2
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_only_get_requests_to_hedged_paths(respx_mock: MockRouter) -> None:
+    def slow(_request: httpx.Request) -> httpx.Response:
+        time.sleep(0.05)
+        return httpx.Response(200, json={"job_id": "abc"})
+
+    runs = respx_mock.post("/v1/agent/completions").mock(side_effect=slow)
+    types = respx_mock.get("/v1/reasoning-agent/types").mock(side_effect=slow)
+    hedging = Hedging(delay=0, budget=1, paths=["/v1/models/available"])
+
+    with _client(hedging) as client:
+        client.agent.run(task="a")
+        client.reasoning_agents.list_types()
+
+    assert runs.call_count == 1
+    assert types.call_count == 1
+    assert hedging.stats()["requests"] == 0
+
+
+def test_delay_is_the_observed_percentile() -> None:
+    hedging = Hedging(percentile=0.9, budget=1, window=10, min_samples=5)
+    path = "/v1/models/available"
+
+    for latency in (0.5, 0.1, 0.4):
+        hedging._finish(path, time.monotonic() - latency, hedge_won=False)
+    # not enough samples yet
+    assert hedging._start(path) is None
+
+    for latency in (0.2, 0.3, 0.6, 0.7, 0.8, 0.9, 1.0, 3.0):
+        hedging._finish(path, time.monotonic() - latency, hedge_won=False)
+    # the first latency has left the window of 10
+    assert hedging._start(path) == pytest.approx(1.0, abs=0.01)
+    assert hedging._start("/health") is None
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_loser_is_cancelled(respx_mock: MockRouter) -> None:
+    cancelled = asyncio.Event()
+    requests: List[httpx.Request] = []
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return httpx.Response(200, json={"models": [f"request-{len(requests)}"]})
+
+    respx_mock.get("/v1/models/available").mock(side_effect=respond)
+    hedging = Hedging(delay=0.05, budget=1)
+
+    async with AsyncSwarmsClient(base_url=base_url, api_key=api_key, hedging=hedging) as client:
+        started = time.monotonic()
+        assert (await client.models.list_available()).models == ["request-2"]
+        assert time.monotonic() - started < 2
+
+    assert cancelled.is_set()
+    assert hedging.stats() == {"requests": 1, "hedges": 1, "hedge_wins": 1}
+
+
+def test_copy_keeps_the_hedging() -> None:
+    hedging = Hedging()
+    client = _client(hedging)
+
+    assert client.with_options(timeout=10)._hedging is hedging
+    client.close()
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"percentile": 1}, {"delay": -1}, {"budget": -0.1}, {"min_samples": 0}, {"window": 5, "min_samples": 10}]
+)
+def test_invalid_arguments(kwargs: Any) -> None:
+    with pytest.raises(ValueError):
+        Hedging(**kwargs)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import asyncio
+import threading
+from typing import Any, Dict, List, Iterator
+
+import httpx
+import pytest
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient, DefaultHttpxClient, DefaultAsyncHttpxClient
+from swarms_client.lib.http2 import HTTP2Transport, AsyncHTTP2Transport
+
+h2 = pytest.importorskip("h2")
+
+import h2.config  # noqa: E402
+import h2.events  # noqa: E402
+import h2.connection  # noqa: E402
+
+api_key = "My API Key"
+
+
+class _H2Server:
+    """A cleartext HTTP/2 server that answers every request after `delay` seconds."""
+
+    def __init__(self) -> None:
+        self.delay = 0.0
+        self.connections = 0
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+        self.thread.start()
+        self.server = asyncio.run_coroutine_threadsafe(
+            asyncio.start_server(self._handle, "127.0.0.1", 0), self.loop
+        ).result()
+        self.url = f"http://127.0.0.1:{self.server.sockets[0].getsockname()[1]}"
+
+    async def _respond(self, conn: Any, writer: asyncio.StreamWriter, stream_id: int) -> None:
+        await asyncio.sleep(self.delay)
+        body = json.dumps({"status": str(stream_id)}).encode()
+        conn.send_headers(
+            stream_id,
+            [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(body)))],
+        )
+        conn.send_data(stream_id, body, end_stream=True)
+        writer.write(conn.data_to_send())
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        writer.write(conn.data_to_send())
+        tasks: List["asyncio.Task[None]"] = []
+
+        while True:
+            data = await reader.read(65535)
+            if not data:
+                break
+            for event in conn.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    tasks.append(asyncio.ensure_future(self._respond(conn, writer, event.stream_id)))
+                elif isinstance(event, h2.events.ConnectionTerminated):
+                    writer.close()
+                    return
+            writer.write(conn.data_to_send())
+
+        for task in tasks:
+            task.cancel()
+        writer.close()
+
+    def close(self) -> None:
+        self.server.close()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+        self.loop.close()
+
+
+@pytest.fixture
+def server() -> Iterator[_H2Server]:
+    server = _H2Server()
+    try:
+        yield server
+    finally:
+        server.close()
+
+
+def test_client_option() -> None:
+    with SwarmsClient(api_key=api_key, http2=True) as client:
+        assert isinstance(client._client._transport, HTTP2Transport)
+
+        # copies share the HTTP client, unless the protocol changes
+        assert client.copy()._client is client._client
+        http1_client = client.copy(http2=False)
+        assert not isinstance(http1_client._client._transport, HTTP2Transport)
+        http1_client.close()
+
+    with SwarmsClient(api_key=api_key) as client:
+        assert not isinstance(client._client._transport, HTTP2Transport)
+
+
+async def test_async_client_option() -> None:
+    async with AsyncSwarmsClient(api_key=api_key, http2=True) as client:
+        assert isinstance(client._client._transport, AsyncHTTP2Transport)
+        assert client.with_options(timeout=10)._client is client._client
+
+
+def test_requests_are_multiplexed(server: _H2Server) -> None:
+    http_client = DefaultHttpxClient(http2=True, http1=False)
+    with SwarmsClient(base_url=server.url, api_key=api_key, http_client=http_client) as client:
+        responses = [client.with_raw_response.health.check() for _ in range(3)]
+
+    assert [response.http_response.http_version for response in responses] == ["HTTP/2"] * 3
+    # every request is a new stream of the same connection
+    assert [response.parse().status for response in responses] == ["1", "3", "5"]
+    assert server.connections == 1
+
+
+async def test_opens_connections_for_more_streams(server: _H2Server) -> None:
+    server.delay = 0.2
+    limits = httpx.Limits(max_connections=3)
+    transport = AsyncHTTP2Transport(http1=False, limits=limits, max_streams_per_connection=2)
+    http_client = DefaultAsyncHttpxClient(transport=transport)
+
+    async with AsyncSwarmsClient(base_url=server.url, api_key=api_key, http_client=http_client) as client:
+        responses = await asyncio.gather(*[client.health.check() for _ in range(8)])
+
+        assert len(responses) == 8
+        # the last two requests are queued on the least busy connections once the limit is reached
+        assert server.connections == 3
+        in_flight: Dict[int, int] = {id(shard): shard.in_flight for shard in transport._shards}
+        assert list(in_flight.values()) == [0, 0, 0]
+
+
+def test_tracks_streams_until_closed(server: _H2Server) -> None:
+    transport = HTTP2Transport(http1=False, max_streams_per_connection=1)
+    with httpx.Client(transport=transport, base_url=server.url) as http_client:
+        with http_client.stream("GET", "/health") as first:
+            with http_client.stream("GET", "/health") as second:
+                assert [shard.in_flight for shard in transport._shards] == [1, 1]
+                second.read()
+            assert [shard.in_flight for shard in transport._shards] == [1, 0]
+            first.read()
+
+        assert [shard.in_flight for shard in transport._shards] == [0, 0]
+        assert server.connections == 2
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import os
+import sys
+import json
+from typing import Any, List, Union
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient
+from swarms_client._streaming import Stream
+from swarms_client.lib.json_codec import JSONCodec, OrjsonCodec, MsgspecCodec, get_json_codec
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+PAYLOAD = {"name": "swarm", "unicode": "héllo ✓", "nested": [{"a": 1, "b": 2.5, "c": None, "d": True}]}
+
+
+class _RecordingCodec(JSONCodec):
+    def __init__(self) -> None:
+        self.encoded: List[object] = []
+        self.decoded: List[Union[bytes, str]] = []
+
+    def dumps(self, obj: object) -> bytes:
+        self.encoded.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        self.decoded.append(data)
+        return super().loads(data)
+
+
+def _codecs() -> List[JSONCodec]:
+    codecs = [JSONCodec()]
+    for codec_cls in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(codec_cls())
+        except ImportError:
+            pass
+    return codecs
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.name)
+def test_round_trip(codec: JSONCodec) -> None:
+    encoded = codec.dumps(PAYLOAD)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded.decode()) == PAYLOAD
+
+    # integers that don't fit in 64 bits fall back to the standard library
+    assert codec.loads(codec.dumps({"big": 2**70})) == {"big": 2**70}
+
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b"{not json")
+
+
+@pytest.mark.parametrize("codec", _codecs(), ids=lambda codec: codec.name)
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), -float("inf")])
+def test_non_finite_floats_are_rejected(codec: JSONCodec, value: float) -> None:
+    with pytest.raises(ValueError, match="Out of range float values are not JSON compliant"):
+        codec.dumps({"agents": [{"temperature": value, "max_tokens": None}]})
+
+    # a real `null` is still encoded as one
+    assert codec.loads(codec.dumps({"temperature": None})) == {"temperature": None}
+
+
+def test_stdlib_codec_matches_httpx() -> None:
+    request = httpx.Request("POST", "https://example.com", json=PAYLOAD)
+    assert JSONCodec().dumps(PAYLOAD) == request.read()
+
+
+def test_get_json_codec(monkeypatch: pytest.MonkeyPatch) -> None:
+    assert get_json_codec("stdlib").name == "stdlib"
+
+    monkeypatch.setitem(sys.modules, "orjson", None)  # type: ignore[arg-type]
+    monkeypatch.setitem(sys.modules, "msgspec", None)  # type: ignore[arg-type]
+    assert get_json_codec("auto").name == "stdlib"
+    with pytest.raises(ImportError, match="orjson"):
+        get_json_codec("orjson")
+
+    with pytest.raises(ValueError, match="Unknown JSON codec"):
+        get_json_codec("simdjson")  # type: ignore[arg-type]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_client_uses_codec(respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/v1/swarm/completions").mock(
+        return_value=httpx.Response(200, json={"job_id": "abc", "output": "done"})
+    )
+    codec = _RecordingCodec()
+    client = SwarmsClient(base_url=base_url, api_key=api_key, json_codec=codec)
+
+    response = client.swarms.run(name="swarm", task="summarize")
+
+    assert response.job_id == "abc"
+    assert codec.encoded == [{"name": "swarm", "task": "summarize"}]
+    request = route.calls.last.request
+    assert request.headers["content-type"] == "application/json"
+    assert json.loads(request.content) == {"name": "swarm", "task": "summarize"}
+    # the response body is decoded from bytes
+    assert codec.decoded == [b'{"job_id":"abc","output":"done"}']
+
+    assert client.with_options(timeout=10)._json_codec is codec
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_get_requests_have_no_body(respx_mock: MockRouter) -> None:
+    route = respx_mock.get("/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+    client = SwarmsClient(base_url=base_url, api_key=api_key, json_codec="stdlib")
+
+    assert client.health.check().status == "ok"
+    assert route.calls.last.request.content == b""
+
+
+def test_stream_events_use_codec() -> None:
+    codec = _RecordingCodec()
+    client = SwarmsClient(base_url=base_url, api_key=api_key, json_codec=codec)
+    response = httpx.Response(200, content=b'data: {"index": 0}\n\ndata: {"index": 1}\n\n')
+
+    stream = Stream(cast_to=object, response=response, client=client)
+
+    assert list(stream) == [{"index": 0}, {"index": 1}]
+    # the events are parsed from the bytes they were received as
+    assert codec.decoded == [b'{"index": 0}', b'{"index": 1}']
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_client(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/swarm/completions").mock(return_value=httpx.Response(200, json={"job_id": "abc"}))
+    codec = _RecordingCodec()
+    client = AsyncSwarmsClient(base_url=base_url, api_key=api_key, json_codec=codec)
+
+    response = await client.swarms.with_raw_response.run(task="summarize")
+
+    assert (await response.json()) == {"job_id": "abc"}
+    assert codec.encoded == [{"task": "summarize"}]
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import os
+import json
+import random
+from typing import Any, List, Iterator, AsyncIterator
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient
+from swarms_client.lib.json_stream import JSONArrayDecoder, iter_json_array, aiter_json_array
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+RESULTS: List[Any] = [
+    {"output": 'a "quoted" {[bracket]}, \\ and ✓', "steps": [1, {"nested": None}]},
+    "a string, with a comma",
+    1.5,
+    [],
+    {},
+    True,
+    None,
+]
+
+
+def _chunks(body: bytes, seed: int) -> Iterator[bytes]:
+    rnd = random.Random(seed)
+    pos = 0
+    while pos < len(body):
+        size = rnd.randint(1, 8)
+        yield body[pos : pos + size]
+        pos += size
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("indent", [None, 2])
+def test_decodes_arrays_split_anywhere(seed: int, indent: Any) -> None:
+    body = json.dumps(RESULTS, indent=indent, ensure_ascii=False).encode()
+    assert list(iter_json_array(_chunks(body, seed))) == RESULTS
+
+    document = {"batch_id": "abc", "meta": {"results": [0]}, "results": RESULTS, "total_requests": 7}
+    body = json.dumps(document, indent=indent, ensure_ascii=False).encode()
+    assert list(iter_json_array(_chunks(body, seed), key="results")) == RESULTS
+
+
+def test_yields_elements_as_they_complete() -> None:
+    decoder = JSONArrayDecoder()
+
+    assert decoder.feed(b'[{"a": 1}, {"b"') == [{"a": 1}]
+    assert decoder.feed(b": 2}") == []
+    assert decoder.feed(b"]") == [{"b": 2}]
+    assert decoder.done
+    decoder.close()
+
+    # only the incomplete element is buffered
+    decoder = JSONArrayDecoder()
+    decoder.feed(b'[{"a": "' + b"x" * 10_000 + b'"}, {"b"')
+    assert len(decoder._buffer) < 10
+
+
+@pytest.mark.parametrize(
+    "body", [b"[]", b" [ ] ", b'{"results": null}', b'{"other": [1]}', b'{"results": []}'], ids=repr
+)
+def test_empty(body: bytes) -> None:
+    key = None if body.strip().startswith(b"[") else "results"
+    assert list(iter_json_array([body], key=key)) == []
+
+
+@pytest.mark.parametrize("body", [b"x[1]", b"[1,]", b"[1", b"[1] x", b'{"a": 1}', b"[1 2]", b"]", b""], ids=repr)
+def test_invalid(body: bytes) -> None:
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array([body[:1], body[1:]]))
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_swarms_batch_run_iter(respx_mock: MockRouter) -> None:
+    sent: List[int] = []
+    body = json.dumps([{"index": i} for i in range(5)]).encode()
+
+    def content() -> Iterator[bytes]:
+        for i in range(0, len(body), 16):
+            sent.append(i)
+            yield body[i : i + 16]
+
+    respx_mock.post("/v1/swarm/batch/completions").mock(return_value=httpx.Response(200, content=content()))
+    client = SwarmsClient(base_url=base_url, api_key=api_key)
+
+    results = client.swarms.batch.run_iter(body=[{"task": "summarize"}])
+    assert respx_mock.calls.call_count == 0
+
+    first = next(results)
+    assert first == {"index": 0}
+    assert len(sent) < len(range(0, len(body), 16))
+    assert [first, *results] == [{"index": i} for i in range(5)]
+    assert json.loads(respx_mock.calls.last.request.content) == [{"task": "summarize"}]
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_agent_batch_run_iter(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/agent/batch/completions").mock(
+        return_value=httpx.Response(200, json={"batch_id": "abc", "results": [{"outputs": "a"}, {"outputs": "b"}]})
+    )
+    client = SwarmsClient(base_url=base_url, api_key=api_key)
+
+    results = client.agent.batch.run_iter(body=[{"agent_config": {"agent_name": "a"}, "task": "summarize"}])
+
+    assert list(results) == [{"outputs": "a"}, {"outputs": "b"}]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_batch_run_iter(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/swarm/batch/completions").mock(return_value=httpx.Response(200, json=[{"index": 0}]))
+    respx_mock.post("/v1/agent/batch/completions").mock(return_value=httpx.Response(200, json={"results": [1, 2]}))
+    client = AsyncSwarmsClient(base_url=base_url, api_key=api_key)
+
+    assert [result async for result in client.swarms.batch.run_iter(body=[{"task": "summarize"}])] == [{"index": 0}]
+    assert [result async for result in client.agent.batch.run_iter(body=[])] == [1, 2]
+
+
+async def test_aiter_json_array() -> None:
+    async def chunks() -> AsyncIterator[bytes]:
+        for chunk in _chunks(json.dumps(RESULTS).encode(), seed=0):
+            yield chunk
+
+    assert [element async for element in aiter_json_array(chunks())] == RESULTS
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import os
+import json
+import pickle
+from typing import Any, List
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient
+from swarms_client.lib import lazy_parsing
+from swarms_client.types import AgentRunResponse, SwarmRunResponse
+from swarms_client._compat import PYDANTIC_V2
+from swarms_client._models import construct_type
+from swarms_client.lib.lazy_parsing import is_lazy, scan_object, construct_lazy, pending_fields
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+pytestmark = [
+    pytest.mark.skipif(not PYDANTIC_V2, reason="lazy parsing is only supported in pydantic v2"),
+    pytest.mark.skipif(lazy_parsing._raw_decoder() is None, reason="lazy parsing needs msgspec"),
+]
+
+RUN = {
+    "job_id": "abc",
+    "status": "success",
+    "output": [{"role": "agent", "content": 'a "quoted" {[bracket]} \\ and ✓'}] * 3,
+    "usage": {"total_tokens": 87},
+    "execution_time": 2,
+}
+
+
+class _RecordingLoads:
+    def __init__(self) -> None:
+        self.calls: List[bytes] = []
+
+    def __call__(self, data: bytes) -> Any:
+        self.calls.append(data)
+        return json.loads(data)
+
+
+def test_scan_object() -> None:
+    body = json.dumps(RUN, ensure_ascii=False, indent=2).encode()
+
+    rest, lazy = scan_object(body, frozenset({"output", "missing"}))  # type: ignore[misc]
+
+    assert json.loads(rest) == {key: value for key, value in RUN.items() if key != "output"}
+    assert list(lazy) == ["output"]
+    assert isinstance(lazy["output"], memoryview)
+    assert json.loads(bytes(lazy["output"])) == RUN["output"]
+
+    # only objects, arrays and strings are worth deferring
+    rest, lazy = scan_object(b'{"output": null, "job_id": "abc"}', frozenset({"output"}))  # type: ignore[misc]
+    assert json.loads(rest) == {"output": None, "job_id": "abc"}
+    assert lazy == {}
+
+
+@pytest.mark.parametrize("body", [b"[1, 2]", b'{"output": [1, 2}', b'{"output": 1} trailing', b"", b'"abc"'])
+def test_scan_object_invalid(body: bytes) -> None:
+    assert scan_object(body, frozenset({"output"})) is None
+
+
+def test_construct_lazy() -> None:
+    body = json.dumps(RUN).encode()
+    loads = _RecordingLoads()
+
+    run = construct_lazy(SwarmRunResponse, body, loads)
+
+    assert isinstance(run, SwarmRunResponse)
+    assert run.job_id == "abc"
+    assert run.execution_time == 2.0
+    assert pending_fields(run) == {"output": len(json.dumps(RUN["output"]))}
+    assert run.model_fields_set == set(RUN)
+    assert len(loads.calls) == 1
+
+    assert run.output == RUN["output"]
+    assert not is_lazy(run)
+    assert len(loads.calls) == 2
+    assert run.output is run.output
+
+
+def test_lazy_models_decode_before_use() -> None:
+    body = json.dumps(RUN).encode()
+    eager = construct_type(type_=SwarmRunResponse, value=json.loads(body))
+
+    def lazy() -> Any:
+        return construct_lazy(SwarmRunResponse, body, json.loads)
+
+    assert lazy() == eager
+    assert eager == lazy()
+    assert lazy().model_dump() == eager.model_dump()
+    assert lazy().to_json() == eager.to_json()
+    assert repr(lazy()) == repr(eager)
+    assert dict(lazy()) == dict(eager)
+    assert lazy().model_copy() == eager
+
+    unpickled = pickle.loads(pickle.dumps(lazy()))
+    assert type(unpickled) is SwarmRunResponse
+    assert unpickled == eager
+
+
+def test_construct_lazy_without_lazy_fields() -> None:
+    # `outputs` is null, so there is nothing to defer
+    agent_run = construct_lazy(AgentRunResponse, b'{"outputs": null, "success": true}', json.loads)
+    assert type(agent_run) is AgentRunResponse
+    assert agent_run.outputs is None
+    assert agent_run.success is True
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_client_lazy_parsing(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/swarm/completions").mock(return_value=httpx.Response(200, json=RUN))
+    client = SwarmsClient(base_url=base_url, api_key=api_key, lazy_parsing=True)
+
+    run = client.swarms.run(task="summarize")
+
+    assert run.job_id == "abc"
+    assert pending_fields(run)
+    assert run.output == RUN["output"]
+
+    assert client.with_options(timeout=10)._lazy_parsing is True
+    assert not pending_fields(client.with_options(lazy_parsing=False).swarms.run(task="summarize"))
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_client_lazy_parsing_falls_back(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/swarm/completions").mock(
+        return_value=httpx.Response(200, content=b"not json", headers={"content-type": "application/json"})
+    )
+    client = SwarmsClient(base_url=base_url, api_key=api_key, lazy_parsing=True)
+
+    # the body is decoded as usual, so the usual error is raised
+    with pytest.raises(json.JSONDecodeError):
+        client.swarms.with_raw_response.run(task="summarize").parse()
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_client_parses_eagerly_without_msgspec(respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(lazy_parsing, "_raw_decoder", lambda: None)
+    respx_mock.post("/v1/swarm/completions").mock(return_value=httpx.Response(200, json=RUN))
+    client = SwarmsClient(base_url=base_url, api_key=api_key, lazy_parsing=True)
+
+    assert construct_lazy(SwarmRunResponse, json.dumps(RUN).encode(), json.loads) is None
+    run = client.swarms.run(task="summarize")
+    assert type(run) is SwarmRunResponse
+    assert run.output == RUN["output"]
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_client_lazy_parsing(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/swarm/completions").mock(return_value=httpx.Response(200, json=RUN))
+    client = AsyncSwarmsClient(base_url=base_url, api_key=api_key, lazy_parsing=True)
+
+    run = await client.swarms.run(task="summarize")
+
+    assert pending_fields(run)
+    assert run.output == RUN["output"]
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import os
+import time
+import threading
+from typing import Any, Iterator
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient, DefaultHttpxClient
+from swarms_client.lib import pool_metrics
+from swarms_client.lib.pool_metrics import PoolMetrics
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        time.sleep(float(self.headers.get("x-delay", 0)))
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    # don't wait for idle keep-alive connections on shutdown
+    daemon_threads = True
+    block_on_close = False
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_counts_new_and_reused_connections(server_url: str) -> None:
+    metrics = PoolMetrics()
+    with SwarmsClient(base_url=server_url, api_key=api_key, pool_metrics=metrics) as client:
+        for _ in range(3):
+            client.health.check()
+
+        stats = metrics.stats()
+
+    host = server_url[len("http://") :]
+    assert stats["requests"] == 3
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 2
+    assert stats["reuse_ratio"] == pytest.approx(2 / 3)
+    assert stats["active"] == 0
+    assert stats["idle"] == 1
+    assert stats["queued"] == 0
+    assert stats["hosts"] == {host: {"active": 0, "idle": 1, "new_connections": 1, "reused_connections": 2}}
+    assert stats["wait_count"] == 3
+    assert stats["wait_buckets"][-1] == (float("inf"), 3)
+
+
+def test_records_pool_waits(server_url: str) -> None:
+    metrics = PoolMetrics(buckets=[0.1, 1.0])
+    http_client = DefaultHttpxClient(limits=httpx.Limits(max_connections=1))
+    with SwarmsClient(base_url=server_url, api_key=api_key, http_client=http_client, pool_metrics=metrics) as client:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            first = executor.submit(client.health.check, extra_headers={"x-delay": "0.3"})
+            time.sleep(0.1)
+
+            # the second request waits for the only connection to be released
+            second = executor.submit(client.health.check)
+            time.sleep(0.05)
+            live = metrics.stats()
+
+            first.result()
+            second.result()
+
+    assert live["active"] == 1
+    assert live["queued"] == 1
+
+    stats = metrics.stats()
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 1
+    assert stats["wait_buckets"] == [(0.1, 1), (1.0, 2), (float("inf"), 2)]
+    assert 0.1 < stats["wait_max"] < 1.0
+
+    metrics.reset()
+    assert metrics.stats()["requests"] == 0
+
+
+async def test_async_client(server_url: str) -> None:
+    metrics = PoolMetrics()
+    async with AsyncSwarmsClient(base_url=server_url, api_key=api_key, pool_metrics=metrics) as client:
+        await client.health.check()
+        await client.with_options(timeout=10).health.check()
+
+        stats = metrics.stats()
+
+    assert stats["new_connections"] == 1
+    assert stats["reused_connections"] == 1
+    assert stats["idle"] == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_transport_without_tracing(respx_mock: MockRouter) -> None:
+    respx_mock.get("/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+    metrics = PoolMetrics()
+    client = SwarmsClient(base_url=base_url, api_key=api_key, pool_metrics=metrics)
+
+    client.health.check()
+
+    stats = metrics.stats()
+    assert stats["requests"] == 1
+    assert stats["reuse_ratio"] is None
+    assert stats["hosts"] == {}
+
+
+def test_unreadable_pools_are_unavailable(server_url: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    metrics = PoolMetrics()
+    with SwarmsClient(base_url=server_url, api_key=api_key, pool_metrics=metrics) as client:
+        client.health.check()
+        assert metrics.stats()["idle"] == 1
+
+        # e.g. a pool of another httpcore version, without the attributes that are read
+        transport: Any = client._client._transport
+        monkeypatch.setattr(transport, "_pool", object())
+        stats = metrics.stats()
+        assert (stats["active"], stats["idle"], stats["queued"]) == (None, None, None)
+        assert list(stats["hosts"].values()) == [
+            {"active": None, "idle": None, "new_connections": 1, "reused_connections": 0}
+        ]
+
+        monkeypatch.undo()
+        monkeypatch.setattr(pool_metrics, "_POOLS_READABLE", False)
+        client.health.check()
+        stats = metrics.stats()
+
+    assert stats["idle"] is None
+    assert (stats["requests"], stats["new_connections"], stats["reused_connections"]) == (2, 1, 1)
+
+
+def test_copy_shares_metrics() -> None:
+    metrics = PoolMetrics()
+    client = SwarmsClient(base_url=base_url, api_key=api_key, pool_metrics=metrics)
+
+    assert client.with_options(timeout=10)._pool_metrics is metrics
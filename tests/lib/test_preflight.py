@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import os
+import json
+from typing import Any, List, cast
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient
+from swarms_client.lib.preflight import Preflight, PreflightError
+from swarms_client.lib.catalog_cache import CatalogCache
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+LIMITS = {
+    "limits": {
+        "maximum_requests_per_day": 1000,
+        "maximum_requests_per_hour": 100,
+        "maximum_requests_per_minute": 10,
+        "tokens_per_agent": 8192,
+    }
+}
+
+RUN = {"job_id": "abc", "status": "success"}
+
+
+def _mock_catalogs(respx_mock: MockRouter, *, models: Any = None) -> List[Any]:
+    return [
+        respx_mock.get("/v1/models/available").mock(
+            return_value=httpx.Response(200, json={"models": models or ["gpt-4o", "gpt-4o-mini", "claude-sonnet-4"]})
+        ),
+        respx_mock.get("/v1/swarms/available").mock(
+            return_value=httpx.Response(200, json={"swarm_types": ["SequentialWorkflow", "ConcurrentWorkflow"]})
+        ),
+        respx_mock.get("/v1/rate/limits").mock(return_value=httpx.Response(200, json=LIMITS)),
+    ]
+
+
+def _spec(model_name: str, **fields: Any) -> Any:
+    return {"agent_name": "writer", "model_name": model_name, **fields}
+
+
+def _client(**kwargs: Any) -> SwarmsClient:
+    return SwarmsClient(base_url=base_url, api_key=api_key, max_retries=0, **kwargs)
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+def test_invalid_swarm_specs_are_not_sent(respx_mock: MockRouter) -> None:
+    _mock_catalogs(respx_mock)
+    route = respx_mock.post("/v1/swarm/completions").mock(return_value=httpx.Response(200, json=RUN))
+
+    with _client(preflight=Preflight()) as client:
+        with pytest.raises(PreflightError) as exc_info:
+            client.swarms.run(
+                swarm_type=cast(Any, "SequentialWorkflw"),
+                agents=[
+                    _spec("gpt-4o"),
+                    _spec("gpt-4o-mnii", max_tokens=100_000),
+                ],
+                task="summarize",
+            )
+
+    assert exc_info.value.problems == [
+        "swarm_type: unsupported swarm type 'SequentialWorkflw', did you mean 'SequentialWorkflow'?",
+        "agents[1].model_name: unknown model 'gpt-4o-mnii', did you mean 'gpt-4o-mini'?",
+        "agents[1].max_tokens: 100000 is above the limit of 8192 tokens per agent",
+    ]
+    assert route.call_count == 0
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_valid_specs_are_sent_and_catalogs_are_fetched_once(respx_mock: MockRouter) -> None:
+    catalogs = _mock_catalogs(respx_mock)
+    route = respx_mock.post("/v1/agent/completions").mock(return_value=httpx.Response(200, json=RUN))
+    preflight = Preflight()
+
+    with _client(preflight=preflight) as client:
+        for _ in range(3):
+            client.agent.run(agent_config=_spec("gpt-4o", max_tokens=8192), task="t")
+        # a new client shares the fetched catalogs
+        with _client(preflight=preflight) as other:
+            other.agent.run(agent_config=_spec("claude-sonnet-4"), task="t")
+        # fields that aren't checked, and specs without checked fields, are accepted
+        client.agent.run(task="t")
+
+    assert route.call_count == 5
+    assert [catalog.call_count for catalog in catalogs] == [1, 1, 1]
+    assert len(preflight._catalogs.memo) == 2  # type: ignore[union-attr]
+
+
+@pytest.mark.respx(base_url=base_url, assert_all_called=False)
+def test_batches_report_every_item(respx_mock: MockRouter) -> None:
+    _mock_catalogs(respx_mock)
+    route = respx_mock.post("/v1/agent/batch/completions").mock(return_value=httpx.Response(200, json=[]))
+
+    with _client(preflight=Preflight()) as client:
+        with pytest.raises(PreflightError) as exc_info:
+            client.agent.batch.run(
+                body=[
+                    {"agent_config": _spec("gpt-4o"), "task": "t"},
+                    {"agent_config": _spec("gpt-5"), "task": "t"},
+                    {"agent_config": _spec("gpt-5"), "task": "t"},
+                ]
+            )
+
+    assert exc_info.value.problems == [
+        "body[1].agent_config.model_name: unknown model 'gpt-5', did you mean 'gpt-4o'?",
+        "body[2].agent_config.model_name: unknown model 'gpt-5', did you mean 'gpt-4o'?",
+    ]
+    assert route.call_count == 0
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_extra_body_is_validated(respx_mock: MockRouter) -> None:
+    _mock_catalogs(respx_mock)
+
+    with _client(preflight=Preflight()) as client:
+        with pytest.raises(PreflightError, match="unsupported swarm type 'Unknown'"):
+            client.swarms.run(task="t", extra_body={"swarm_type": "Unknown"})
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_checks_are_skipped_when_catalogs_are_unavailable(respx_mock: MockRouter) -> None:
+    respx_mock.get("/v1/models/available").mock(return_value=httpx.Response(500))
+    # an unexpected shape
+    respx_mock.get("/v1/swarms/available").mock(return_value=httpx.Response(200, json={"swarm_types": "all"}))
+    respx_mock.get("/v1/rate/limits").mock(return_value=httpx.Response(200, json=LIMITS))
+    route = respx_mock.post("/v1/swarm/completions").mock(return_value=httpx.Response(200, json=RUN))
+
+    with _client(preflight=Preflight()) as client:
+        client.swarms.run(swarm_type=cast(Any, "Anything"), agents=[_spec("anything")], task="t")
+        with pytest.raises(PreflightError, match="max_tokens"):
+            client.swarms.run(agents=[_spec("anything", max_tokens=9000)], task="t")
+
+    assert route.call_count == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_catalog_shapes(respx_mock: MockRouter) -> None:
+    _mock_catalogs(respx_mock, models=[{"name": "gpt-4o", "provider": "openai"}, {"name": "o3"}])
+    respx_mock.post("/v1/agent/completions").mock(return_value=httpx.Response(200, json=RUN))
+
+    with _client(preflight=Preflight()) as client:
+        client.agent.run(agent_config=_spec("o3"), task="t")
+        with pytest.raises(PreflightError):
+            client.agent.run(agent_config=_spec("o4"), task="t")
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_uses_the_catalog_cache(respx_mock: MockRouter) -> None:
+    catalogs = _mock_catalogs(respx_mock)
+    respx_mock.post("/v1/agent/completions").mock(return_value=httpx.Response(200, json=RUN))
+    cache = CatalogCache()
+
+    with _client(preflight=Preflight(), catalog_cache=cache) as client:
+        client.agent.run(agent_config=_spec("gpt-4o"), task="t")
+        client.models.list_available()
+
+    assert catalogs[0].call_count == 1
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_batcher_rejects_invalid_specs_on_their_own(respx_mock: MockRouter) -> None:
+    _mock_catalogs(respx_mock)
+
+    def echo(request: httpx.Request) -> httpx.Response:
+        body: List[Any] = json.loads(request.content)
+        return httpx.Response(
+            200,
+            json={"batch_id": "b", "results": [{"name": entry["agent_config"]["model_name"]} for entry in body]},
+        )
+
+    route = respx_mock.post("/v1/agent/batch/completions").mock(side_effect=echo)
+
+    with _client(preflight=Preflight()) as client:
+        batcher = client.agent.batcher(max_batch_size=2, max_wait=5)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(batcher.run, agent_config=_spec(model), task="t")
+                for model in ("gpt-4o", "gpt-4o-mnii", "claude-sonnet-4")
+            ]
+
+        assert futures[0].result().name == "gpt-4o"
+        with pytest.raises(PreflightError):
+            futures[1].result()
+        assert futures[2].result().name == "claude-sonnet-4"
+
+    assert route.call_count == 1
+    assert len(json.loads(route.calls[0].request.content)) == 2
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_client(respx_mock: MockRouter) -> None:
+    _mock_catalogs(respx_mock)
+    route = respx_mock.post("/v1/swarm/batch/completions").mock(return_value=httpx.Response(200, json=[]))
+
+    async with AsyncSwarmsClient(base_url=base_url, api_key=api_key, preflight=Preflight()) as client:
+        with pytest.raises(PreflightError) as exc_info:
+            await client.swarms.batch.run(
+                body=[
+                    {"swarm_type": "ConcurrentWorkflow", "agents": [_spec("gpt-4o")]},
+                    {"heavy_swarm_worker_model_name": "gpt-4"},
+                ]
+            )
+        assert exc_info.value.problems == [
+            "body[1].heavy_swarm_worker_model_name: unknown model 'gpt-4', did you mean 'gpt-4o'?"
+        ]
+
+        await client.swarms.batch.run(body=[{"swarm_type": "ConcurrentWorkflow"}])
+
+    assert route.call_count == 1
+
+
+def test_copy_keeps_the_validator() -> None:
+    preflight = Preflight()
+    client = _client(preflight=preflight)
+
+    assert client.with_options(timeout=10)._preflight is preflight
+    client.close()
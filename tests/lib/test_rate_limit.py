@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+from typing import Any, Dict
+from datetime import datetime, timezone, timedelta
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient
+from swarms_client.types.client import RateGetLimitsResponse
+from swarms_client.lib.rate_limit import RateLimiter, RateLimitWaitTimeout
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+
+def _usage(limit: int, remaining: int, reset_in: float = 60) -> Dict[str, Any]:
+    reset_time = datetime.now(timezone.utc) + timedelta(seconds=reset_in)
+    return {
+        "count": limit - remaining,
+        "exceeded": remaining <= 0,
+        "limit": limit,
+        "remaining": remaining,
+        "reset_time": reset_time.isoformat().replace("+00:00", "Z"),
+    }
+
+
+def _limits(*, minute: int = 100, minute_remaining: int | None = None, reset_in: float = 60) -> Dict[str, Any]:
+    return {
+        "limits": {
+            "maximum_requests_per_minute": minute,
+            "maximum_requests_per_hour": 10_000,
+            "maximum_requests_per_day": 100_000,
+            "tokens_per_agent": 1000,
+        },
+        "rate_limits": {
+            "minute": _usage(minute, minute if minute_remaining is None else minute_remaining, reset_in),
+            "hour": _usage(10_000, 10_000, 3600),
+            "day": _usage(100_000, 100_000, 86400),
+        },
+        "tier": "free",
+        "success": True,
+    }
+
+
+def _synced(**kwargs: Any) -> RateLimiter:
+    limiter = RateLimiter(max_wait=0)
+    limiter.sync(RateGetLimitsResponse.construct(**_limits(**kwargs)))
+    return limiter
+
+
+class TestRateLimiter:
+    def test_unlimited_until_synced(self) -> None:
+        limiter = RateLimiter(max_wait=0)
+
+        for _ in range(1000):
+            limiter.acquire()
+
+        assert limiter.limits() == {"minute": None, "hour": None, "day": None}
+
+    def test_sync_seeds_buckets(self) -> None:
+        limiter = _synced(minute=60, minute_remaining=3)
+
+        assert limiter.limits() == {"minute": 60, "hour": 10_000, "day": 100_000}
+        for _ in range(3):
+            limiter.acquire()
+
+        with pytest.raises(RateLimitWaitTimeout) as exc_info:
+            limiter.acquire()
+        # the minute bucket refills at one token per second
+        assert 0 < exc_info.value.wait <= 1
+
+    def test_exhausted_window_blocks_until_reset(self) -> None:
+        limiter = _synced(minute=60, minute_remaining=0, reset_in=30)
+
+        with pytest.raises(RateLimitWaitTimeout) as exc_info:
+            limiter.acquire()
+
+        assert 25 < exc_info.value.wait <= 30
+
+    def test_waits_for_tokens(self) -> None:
+        limiter = RateLimiter(max_wait=1)
+        limiter.sync(RateGetLimitsResponse.construct(**_limits(minute=600, minute_remaining=1)))
+
+        limiter.acquire()
+        start = time.monotonic()
+        limiter.acquire()
+
+        # 600 requests per minute refill a token every 0.1s
+        assert 0.05 < time.monotonic() - start < 0.5
+
+    def test_observes_headers(self) -> None:
+        limiter = _synced(minute=60)
+
+        limiter.observe(httpx.Response(200, headers={"x-ratelimit-remaining-minute": "0"}))
+
+        with pytest.raises(RateLimitWaitTimeout):
+            limiter.acquire()
+
+    def test_rate_limit_response(self) -> None:
+        limiter = _synced(minute=60)
+        assert limiter.should_sync() is True
+        assert limiter.should_sync() is False
+
+        limiter.observe(httpx.Response(429, headers={"retry-after": "5"}))
+
+        assert limiter.should_sync() is True
+        with pytest.raises(RateLimitWaitTimeout) as exc_info:
+            limiter.acquire()
+        assert 4 < exc_info.value.wait <= 5
+
+    async def test_cancelled_wait_refunds_token(self) -> None:
+        limiter = RateLimiter(max_wait=90)
+        limiter.sync(RateGetLimitsResponse.construct(**_limits(minute=1, minute_remaining=1)))
+        await limiter.aacquire()
+
+        for _ in range(2):
+            # without the refund, the second waiter would have to wait ~120s and exceed `max_wait`
+            waiter = asyncio.ensure_future(limiter.aacquire())
+            await asyncio.sleep(0)
+            assert not waiter.done()
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+
+class TestClientIntegration:
+    @pytest.mark.respx(base_url=base_url)
+    def test_sync_client(self, respx_mock: MockRouter) -> None:
+        limits_route = respx_mock.get("/v1/rate/limits").mock(
+            return_value=httpx.Response(200, json=_limits(minute=60, minute_remaining=2))
+        )
+        health_route = respx_mock.get("/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+        client = SwarmsClient(base_url=base_url, api_key=api_key, rate_limiter=RateLimiter(max_wait=0))
+
+        client.health.check()
+        client.health.check()
+        with pytest.raises(RateLimitWaitTimeout):
+            client.health.check()
+
+        assert limits_route.call_count == 1
+        assert health_route.call_count == 2
+
+    @pytest.mark.respx(base_url=base_url)
+    async def test_async_client(self, respx_mock: MockRouter) -> None:
+        limits_route = respx_mock.get("/v1/rate/limits").mock(
+            return_value=httpx.Response(200, json=_limits(minute=60, minute_remaining=1))
+        )
+        health_route = respx_mock.get("/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+        client = AsyncSwarmsClient(base_url=base_url, api_key=api_key, rate_limiter=RateLimiter(max_wait=0))
+
+        await client.health.check()
+        with pytest.raises(RateLimitWaitTimeout):
+            await client.health.check()
+
+        assert limits_route.call_count == 1
+        assert health_route.call_count == 1
+
+    @pytest.mark.respx(base_url=base_url)
+    def test_failed_sync_does_not_fail_requests(self, respx_mock: MockRouter) -> None:
+        respx_mock.get("/v1/rate/limits").mock(return_value=httpx.Response(401, json={"detail": "nope"}))
+        respx_mock.get("/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+        limiter = RateLimiter()
+        client = SwarmsClient(base_url=base_url, api_key=api_key, rate_limiter=limiter)
+
+        assert client.health.check().status == "ok"
+        assert limiter.limits() == {"minute": None, "hour": None, "day": None}
+
+    def test_copy_shares_limiter(self) -> None:
+        limiter = RateLimiter()
+        client = SwarmsClient(base_url=base_url, api_key=api_key, rate_limiter=limiter)
+
+        assert client.with_options(timeout=10)._rate_limiter is limiter
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import Any
+from pathlib import Path
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import SwarmsClient, BadRequestError, AsyncSwarmsClient
+from swarms_client.types import SwarmRunResponse
+from swarms_client.lib.response_cache import CACHE_HEADER, ResponseCache
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+RUN = {"job_id": "abc", "status": "success", "output": [{"role": "agent", "content": "done"}], "usage": {"tokens": 3}}
+
+AGENTS: Any = [{"agent_name": "writer", "model_name": "gpt-4o", "temperature": 0}]
+
+
+def _client(cache: ResponseCache, **kwargs: Any) -> SwarmsClient:
+    return SwarmsClient(base_url=base_url, api_key=api_key, response_cache=cache, **kwargs)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_hits_skip_the_network(respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/v1/swarm/completions").mock(return_value=httpx.Response(200, json=RUN))
+    cache = ResponseCache()
+
+    with _client(cache) as client:
+        first = client.swarms.run(task="summarize", agents=AGENTS)
+        second = client.swarms.run(task="summarize", agents=AGENTS)
+
+    assert route.call_count == 1
+    assert isinstance(second, SwarmRunResponse)
+    assert second == first
+    assert second.output == RUN["output"]
+    assert cache.stats() == {"hits": 1, "disk_hits": 0, "misses": 1, "stores": 1, "evictions": 0}
+
+
+@pytest.mark.respx(base_url=f"{base_url}/api")
+def test_base_url_with_a_path(respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/v1/swarm/completions").mock(return_value=httpx.Response(200, json=RUN))
+    cache = ResponseCache()
+
+    with SwarmsClient(base_url=f"{base_url}/api", api_key=api_key, response_cache=cache) as client:
+        client.swarms.run(task="summarize", agents=AGENTS)
+        client.swarms.run(task="summarize", agents=AGENTS)
+
+    assert route.call_count == 1
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_key_is_the_canonical_body(respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/v1/swarm/completions").mock(return_value=httpx.Response(200, json=RUN))
+    agent_route = respx_mock.post("/v1/agent/completions").mock(return_value=httpx.Response(200, json=RUN))
+    cache = ResponseCache()
+
+    with _client(cache) as client:
+        client.swarms.run(task="summarize", agents=AGENTS, max_loops=1)
+        # the same body, with its keys in a different order
+        client.swarms.run(max_loops=1, agents=AGENTS, task="summarize")
+        client.swarms.run(task="summarize", agents=AGENTS, max_loops=2)
+        client.agent.run(task="summarize")
+        client.with_options(api_key="Another API Key").swarms.run(task="summarize", agents=AGENTS, max_loops=1)
+
+    assert cache.stats()["hits"] == 1
+    assert route.call_count == 3
+    assert agent_route.call_count == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_bypass_and_refresh(respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/v1/agent/completions").mock(
+        side_effect=[httpx.Response(200, json={"job_id": str(i)}) for i in range(3)]
+    )
+    cache = ResponseCache()
+
+    with _client(cache) as client:
+        assert client.agent.run(task="a").job_id == "0"
+        assert client.agent.run(task="a", extra_headers={CACHE_HEADER: "bypass"}).job_id == "1"
+        assert client.agent.run(task="a").job_id == "0"
+        assert client.agent.run(task="a", extra_headers={CACHE_HEADER: "refresh"}).job_id == "2"
+        assert client.agent.run(task="a").job_id == "2"
+
+        with pytest.raises(ValueError, match="Unknown X-Swarms-Cache header value"):
+            client.agent.run(task="a", extra_headers={CACHE_HEADER: "never"})
+
+    assert all(CACHE_HEADER.lower() not in call.request.headers for call in route.calls)
+    assert cache.stats() == {"hits": 2, "disk_hits": 0, "misses": 2, "stores": 2, "evictions": 0}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_only_successful_responses_of_cacheable_paths_are_cached(respx_mock: MockRouter) -> None:
+    runs = respx_mock.post("/v1/swarm/completions").mock(
+        side_effect=[httpx.Response(400, json={"detail": "bad"}), httpx.Response(200, json=RUN)]
+    )
+    logs = respx_mock.get("/v1/swarm/logs").mock(return_value=httpx.Response(200, json={"logs": []}))
+    cache = ResponseCache()
+
+    with _client(cache, max_retries=0) as client:
+        with pytest.raises(BadRequestError):
+            client.swarms.run(task="summarize")
+        client.swarms.run(task="summarize")
+        client.swarms.get_logs()
+        client.swarms.get_logs()
+
+    assert runs.call_count == 2
+    assert logs.call_count == 2
+    assert cache.stats()["stores"] == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_raw_responses_are_marked(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/swarm/completions").mock(return_value=httpx.Response(200, json=RUN))
+    cache = ResponseCache()
+
+    with _client(cache) as client:
+        sent = client.swarms.with_raw_response.run(task="summarize")
+        cached = client.swarms.with_raw_response.run(task="summarize")
+        with client.swarms.with_streaming_response.run(task="summarize") as streamed:
+            streamed.read()
+
+    assert CACHE_HEADER not in sent.headers
+    assert cached.headers[CACHE_HEADER] == "hit"
+    assert cached.parse() == sent.parse()
+    assert CACHE_HEADER not in streamed.headers
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_ttl_and_lru_eviction(respx_mock: MockRouter, monkeypatch: pytest.MonkeyPatch) -> None:
+    route = respx_mock.post("/v1/agent/completions").mock(return_value=httpx.Response(200, json={"job_id": "abc"}))
+    cache = ResponseCache(max_entries=2, ttl=60)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+
+    with _client(cache) as client:
+        for task in ("a", "b", "a", "c", "a"):
+            client.agent.run(task=task)
+        assert route.call_count == 3
+        assert cache.stats()["evictions"] == 1
+
+        # "b" was the least recently used entry
+        client.agent.run(task="b")
+        assert route.call_count == 4
+
+        now += 61
+        client.agent.run(task="a")
+        assert route.call_count == 5
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_disk_tier(respx_mock: MockRouter, tmp_path: Path) -> None:
+    route = respx_mock.post("/v1/swarm/completions").mock(return_value=httpx.Response(200, json=RUN))
+    path = tmp_path / "cache" / "responses.db"
+
+    first = ResponseCache(path=path)
+    with _client(first) as client:
+        client.swarms.run(task="summarize")
+    first.close()
+
+    # a new process starts with an empty memory tier
+    second = ResponseCache(path=path)
+    with _client(second) as client:
+        run = client.swarms.run(task="summarize")
+        client.swarms.run(task="summarize")
+    second.close()
+
+    assert route.call_count == 1
+    assert run.job_id == "abc"
+    assert second.stats() == {"hits": 2, "disk_hits": 1, "misses": 0, "stores": 0, "evictions": 0}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_disk_tier_counts_a_replaced_entry_once(respx_mock: MockRouter, tmp_path: Path) -> None:
+    respx_mock.post("/v1/agent/completions").mock(return_value=httpx.Response(200, json={"job_id": "x" * 100}))
+    cache = ResponseCache(path=tmp_path / "responses.db", max_disk_bytes=10_000)
+
+    with _client(cache) as client:
+        for _ in range(3):
+            client.agent.run(task="a", extra_headers={CACHE_HEADER: "refresh"})
+
+    # stored three times under one key, but only counted once
+    assert cache._disk_bytes == cache._disk_size() < 200
+    cache.close()
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_disk_tier_is_size_bounded(respx_mock: MockRouter, tmp_path: Path) -> None:
+    respx_mock.post("/v1/agent/completions").mock(return_value=httpx.Response(200, json={"job_id": "x" * 100}))
+    cache = ResponseCache(max_entries=1, path=tmp_path / "responses.db", max_disk_bytes=500)
+
+    with _client(cache) as client:
+        for task in "abcdefgh":
+            client.agent.run(task=task)
+
+    assert cache._disk_size() <= 500
+    assert cache._disk_size() == cache._disk_bytes
+    # the least recently used entries were evicted
+    with _client(cache) as client:
+        client.agent.run(task="g")
+        assert cache.stats()["disk_hits"] == 1
+        client.agent.run(task="a")
+        assert cache.stats()["disk_hits"] == 1
+    assert cache.stats()["evictions"] > 0
+    cache.close()
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_client(respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/v1/reasoning-agent/completions").mock(
+        return_value=httpx.Response(200, json={"result": "ok"})
+    )
+    cache = ResponseCache()
+
+    async with AsyncSwarmsClient(base_url=base_url, api_key=api_key, response_cache=cache) as client:
+        first = await client.reasoning_agents.create_completion(task="think")
+        second = await client.reasoning_agents.create_completion(task="think")
+
+    assert route.call_count == 1
+    assert second == first
+    assert cache.stats()["hits"] == 1
+
+
+def test_copy_keeps_the_cache() -> None:
+    cache = ResponseCache()
+    client = _client(cache)
+
+    assert client.with_options(timeout=10)._response_cache is cache
+    client.close()
+
+
+@pytest.mark.parametrize("kwargs", [{"max_entries": 0}, {"ttl": 0}])
+def test_invalid_arguments(kwargs: Any) -> None:
+    with pytest.raises(ValueError):
+        ResponseCache(**kwargs)
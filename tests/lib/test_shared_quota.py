@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import sys
+import multiprocessing
+from typing import Any
+from pathlib import Path
+
+import httpx
+import pytest
+
+from swarms_client.types.client import RateGetLimitsResponse
+from swarms_client.lib.rate_limit import RateLimitWaitTimeout
+from swarms_client.lib.shared_quota import SharedRateLimiter
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="SharedRateLimiter requires fcntl")
+
+
+def _limits(*, minute: int, remaining: int) -> RateGetLimitsResponse:
+    usage = {"count": minute - remaining, "exceeded": False, "limit": minute, "remaining": remaining}
+    return RateGetLimitsResponse.construct(
+        rate_limits={
+            "minute": {**usage, "reset_time": "2030-01-01T00:00:00Z"},
+            "hour": {**usage, "limit": 100_000, "remaining": 100_000, "reset_time": "2030-01-01T00:00:00Z"},
+            "day": {**usage, "limit": 100_000, "remaining": 100_000, "reset_time": "2030-01-01T00:00:00Z"},
+        }
+    )
+
+
+def _drain(limiter: SharedRateLimiter, results: Any) -> None:
+    acquired = 0
+    for _ in range(100):
+        try:
+            limiter.acquire()
+        except RateLimitWaitTimeout:
+            break
+        acquired += 1
+    results.put(acquired)
+
+
+class TestSharedRateLimiter:
+    def test_instances_share_quota(self, tmp_path: Path) -> None:
+        path = tmp_path / "quota"
+        with SharedRateLimiter(path, max_wait=0) as first, SharedRateLimiter(path, max_wait=0) as second:
+            first.sync(_limits(minute=6000, remaining=3))
+            assert second.limits()["minute"] == 6000
+
+            first.acquire()
+            second.acquire()
+            first.acquire()
+            with pytest.raises(RateLimitWaitTimeout):
+                second.acquire()
+
+    def test_sync_is_claimed_once(self, tmp_path: Path) -> None:
+        path = tmp_path / "quota"
+        with SharedRateLimiter(path) as first, SharedRateLimiter(path) as second:
+            assert first.should_sync() is True
+            assert second.should_sync() is False
+
+            second.observe(httpx.Response(429))
+            assert first.should_sync() is True
+
+    def test_reinitialises_invalid_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "quota"
+        path.write_bytes(b"garbage")
+
+        with SharedRateLimiter(path) as limiter:
+            assert limiter.limits() == {"minute": None, "hour": None, "day": None}
+
+    @pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="requires the fork start method")
+    def test_forked_processes_share_quota(self, tmp_path: Path) -> None:
+        limiter = SharedRateLimiter(tmp_path / "quota", max_wait=0)
+        # a single token with a very low refill rate, so that exactly one worker can send a request
+        limiter.sync(_limits(minute=1, remaining=1))
+
+        ctx = multiprocessing.get_context("fork")
+        results = ctx.Queue()
+        workers = [ctx.Process(target=_drain, args=(limiter, results)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(10)
+
+        assert sorted(results.get(timeout=1) for _ in workers) == [0, 0, 0, 1]
+        limiter.close()
@@ -0,0 +1,250 @@
+from __future__ import annotations
+
+import os
+import time
+import asyncio
+import threading
+from typing import Any, List
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import SwarmsClient, APITimeoutError, BadRequestError, AsyncSwarmsClient, APIConnectionError
+from swarms_client.lib.singleflight import Singleflight
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+RUN = {"job_id": "abc", "status": "success", "output": [{"role": "agent", "content": "done"}]}
+
+AGENTS: Any = [{"agent_name": "writer", "model_name": "gpt-4o"}]
+
+
+class _Gate:
+    """Holds every request until it's opened, so that identical requests overlap."""
+
+    def __init__(self, response: httpx.Response) -> None:
+        self.response = response
+        self.opened = threading.Event()
+
+    def __call__(self, _request: httpx.Request) -> httpx.Response:
+        assert self.opened.wait(5)
+        return self.response
+
+
+def _wait_for_flight(singleflight: Singleflight) -> None:
+    deadline = time.monotonic() + 5
+    while not singleflight._flights and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert singleflight._flights
+
+
+def _client(singleflight: Singleflight, **kwargs: Any) -> SwarmsClient:
+    return SwarmsClient(base_url=base_url, api_key=api_key, singleflight=singleflight, **kwargs)
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_identical_requests_share_one_request(respx_mock: MockRouter) -> None:
+    gate = _Gate(httpx.Response(200, json=RUN, headers={"x-request-id": "req_1"}))
+    route = respx_mock.post("/v1/swarm/completions").mock(side_effect=gate)
+    singleflight = Singleflight()
+
+    with _client(singleflight) as client, ThreadPoolExecutor(max_workers=4) as pool:
+        leader = pool.submit(client.swarms.with_raw_response.run, task="summarize", agents=AGENTS)
+        _wait_for_flight(singleflight)
+        followers = [
+            pool.submit(client.swarms.with_raw_response.run, agents=AGENTS, task="summarize") for _ in range(3)
+        ]
+        time.sleep(0.2)
+        gate.opened.set()
+
+        responses = [leader.result(), *(follower.result() for follower in followers)]
+
+    assert route.call_count == 1
+    assert all(response.parse() == responses[0].parse() for response in responses)
+    assert all(response.headers["x-request-id"] == "req_1" for response in responses)
+    assert singleflight.stats() == {"sent": 1, "shared": 3}
+    assert not singleflight._flights
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_different_and_sequential_requests_are_sent(respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/v1/agent/completions").mock(return_value=httpx.Response(200, json={"job_id": "abc"}))
+    singleflight = Singleflight()
+
+    with _client(singleflight) as client:
+        client.agent.run(task="a")
+        client.agent.run(task="a")
+        client.agent.run(task="b")
+        client.with_options(api_key="Another API Key").agent.run(task="b")
+
+    assert route.call_count == 4
+    assert singleflight.stats() == {"sent": 4, "shared": 0}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_errors_are_shared(respx_mock: MockRouter) -> None:
+    gate = _Gate(httpx.Response(400, json={"detail": "bad spec"}))
+    route = respx_mock.post("/v1/agent/completions").mock(side_effect=gate)
+    singleflight = Singleflight()
+
+    with _client(singleflight, max_retries=0) as client, ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(client.agent.run, task="a")
+        _wait_for_flight(singleflight)
+        follower = pool.submit(client.agent.run, task="a")
+        time.sleep(0.2)
+        gate.opened.set()
+
+        for future in (leader, follower):
+            with pytest.raises(BadRequestError) as exc_info:
+                future.result()
+            assert exc_info.value.body == {"detail": "bad spec"}
+
+    assert route.call_count == 1
+    assert singleflight.stats() == {"sent": 1, "shared": 1}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_waiting_callers_keep_their_own_timeout(respx_mock: MockRouter) -> None:
+    gate = _Gate(httpx.Response(200, json={"job_id": "abc"}))
+    respx_mock.post("/v1/agent/completions").mock(side_effect=gate)
+    singleflight = Singleflight()
+
+    with _client(singleflight, max_retries=0) as client, ThreadPoolExecutor(max_workers=1) as pool:
+        leader = pool.submit(client.agent.run, task="a")
+        _wait_for_flight(singleflight)
+
+        started = time.monotonic()
+        with pytest.raises(APITimeoutError):
+            client.agent.run(task="a", timeout=0.05)
+        assert time.monotonic() - started < 2
+
+        gate.opened.set()
+        assert leader.result().job_id == "abc"
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_streamed_responses_are_not_shared(respx_mock: MockRouter) -> None:
+    route = respx_mock.post("/v1/swarm/completions").mock(return_value=httpx.Response(200, json=RUN))
+    singleflight = Singleflight()
+
+    with _client(singleflight) as client:
+        with client.swarms.with_streaming_response.run(task="summarize") as response:
+            response.read()
+
+    assert route.call_count == 1
+    assert singleflight.stats() == {"sent": 0, "shared": 0}
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_requests_are_shared(respx_mock: MockRouter) -> None:
+    async def respond(_request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json=RUN)
+
+    route = respx_mock.post("/v1/swarm/completions").mock(side_effect=respond)
+    singleflight = Singleflight()
+
+    async with AsyncSwarmsClient(base_url=base_url, api_key=api_key, singleflight=singleflight) as client:
+        runs = await asyncio.gather(*(client.swarms.run(task="summarize", agents=AGENTS) for _ in range(5)))
+
+    assert route.call_count == 1
+    assert all(run == runs[0] for run in runs)
+    assert singleflight.stats() == {"sent": 1, "shared": 4}
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_requests_with_different_headers_are_sent(respx_mock: MockRouter) -> None:
+    async def respond(_request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json=RUN)
+
+    route = respx_mock.post("/v1/swarm/completions").mock(side_effect=respond)
+    singleflight = Singleflight()
+
+    async with AsyncSwarmsClient(base_url=base_url, api_key=api_key, singleflight=singleflight) as client:
+        await asyncio.gather(
+            client.swarms.run(task="summarize", extra_headers={"Idempotency-Key": "a"}),
+            client.swarms.run(task="summarize", extra_headers={"Idempotency-Key": "b"}),
+            client.swarms.run(task="summarize", extra_headers={"Idempotency-Key": "b"}),
+            # the timeout of each attempt is sent in a header, but doesn't make the request different
+            client.swarms.run(task="summarize", extra_headers={"Idempotency-Key": "b"}, timeout=30),
+        )
+
+    assert route.call_count == 2
+    assert singleflight.stats() == {"sent": 2, "shared": 2}
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_every_caller_raises_its_own_connection_error(respx_mock: MockRouter) -> None:
+    async def respond(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        raise httpx.ConnectError("connection reset", request=request)
+
+    respx_mock.post("/v1/agent/completions").mock(side_effect=respond)
+    singleflight = Singleflight()
+
+    async with AsyncSwarmsClient(
+        base_url=base_url, api_key=api_key, singleflight=singleflight, max_retries=0
+    ) as client:
+        errors = await asyncio.gather(*(client.agent.run(task="a") for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(error, APIConnectionError) for error in errors)
+    causes = [error.__cause__ for error in errors]
+    assert all(isinstance(cause, httpx.ConnectError) for cause in causes)
+    assert len({id(cause) for cause in causes}) == 3
+    assert singleflight.stats() == {"sent": 1, "shared": 2}
+
+
+@pytest.mark.respx(base_url=f"{base_url}/api")
+async def test_base_url_with_a_path(respx_mock: MockRouter) -> None:
+    async def respond(_request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json=RUN)
+
+    route = respx_mock.post("/v1/swarm/completions").mock(side_effect=respond)
+    singleflight = Singleflight()
+
+    async with AsyncSwarmsClient(base_url=f"{base_url}/api", api_key=api_key, singleflight=singleflight) as client:
+        await asyncio.gather(*(client.swarms.run(task="summarize", agents=AGENTS) for _ in range(2)))
+
+    assert route.call_count == 1
+    assert singleflight.stats() == {"sent": 1, "shared": 1}
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_cancelled_leader_hands_over(respx_mock: MockRouter) -> None:
+    requests: List[httpx.Request] = []
+
+    async def respond(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json={"job_id": "abc"})
+
+    respx_mock.post("/v1/agent/completions").mock(side_effect=respond)
+    singleflight = Singleflight()
+
+    async with AsyncSwarmsClient(base_url=base_url, api_key=api_key, singleflight=singleflight) as client:
+        leader = asyncio.ensure_future(client.agent.run(task="a"))
+        await asyncio.sleep(0.05)
+        follower = asyncio.ensure_future(client.agent.run(task="a"))
+        await asyncio.sleep(0.05)
+        leader.cancel()
+
+        assert (await follower).job_id == "abc"
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+    # the follower sent the request again
+    assert len(requests) == 2
+    assert singleflight.stats() == {"sent": 2, "shared": 0}
+
+
+def test_copy_keeps_the_singleflight() -> None:
+    singleflight = Singleflight()
+    client = _client(singleflight)
+
+    assert client.with_options(timeout=10)._singleflight is singleflight
+    client.close()
@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import time
+import threading
+from typing import Any, List, Iterator, Optional
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import httpx
+import pytest
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient
+from swarms_client.lib.stream_resume import StreamMetrics
+
+api_key = "My API Key"
+
+EVENTS = 6
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["content-length"]))
+        last_event_id = self.headers.get("last-event-id")
+        self.server.last_event_ids.append(last_event_id)
+        start = 0 if last_event_id is None else int(last_event_id)
+
+        self.server.stop.wait(self.server.headers_delay)
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("transfer-encoding", "chunked")
+        self.end_headers()
+
+        try:
+            for i in range(start, EVENTS):
+                if i == EVENTS // 2:
+                    self._pause(resumed=last_event_id is not None)
+                self._write(b'retry: 1\nid: %d\ndata: {"content": "token-%d"}\n\n' % (i + 1, i))
+            self.wfile.write(b"0\r\n\r\n")
+        except OSError:
+            # the client gave up on the connection
+            self.close_connection = True
+
+    def _pause(self, *, resumed: bool) -> None:
+        if resumed or self.server.mode == "none":
+            return
+
+        deadline = time.monotonic() + self.server.pause
+        while not self.server.stop.is_set() and time.monotonic() < deadline:
+            if self.server.mode == "heartbeat":
+                self._write(b": ping\n\n")
+            self.server.stop.wait(0.05)
+
+    def _write(self, data: bytes) -> None:
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+        self.wfile.flush()
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self, *, mode: str, pause: float = 1.0, headers_delay: float = 0) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.mode = mode
+        self.pause = pause
+        self.headers_delay = headers_delay
+        self.stop = threading.Event()
+        self.last_event_ids: List[Optional[str]] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def serve() -> Iterator[Any]:
+    servers: List[_Server] = []
+
+    def start(**kwargs: Any) -> _Server:
+        server = _Server(**kwargs)
+        servers.append(server)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    yield start
+
+    for server in servers:
+        server.stop.set()
+        server.shutdown()
+        server.server_close()
+
+
+EXPECTED = [f"token-{i}" for i in range(EVENTS)]
+
+
+def test_resumes_a_stalled_stream(serve: Any) -> None:
+    server = serve(mode="stall", pause=5)
+    metrics = StreamMetrics()
+
+    with SwarmsClient(base_url=server.url, api_key=api_key, stream_idle_timeout=0.2, stream_metrics=metrics) as client:
+        start = time.monotonic()
+        with client.swarms.run(task="summarize", stream=True) as stream:
+            assert [chunk.content for chunk in stream] == EXPECTED
+            assert stream.resumes == 1
+
+    assert time.monotonic() - start < 2
+    assert server.last_event_ids == [None, str(EVENTS // 2)]
+    assert metrics.stats()["disconnects"] == 1
+
+
+def test_heartbeats_keep_the_stream_alive(serve: Any) -> None:
+    server = serve(mode="heartbeat", pause=0.6)
+
+    with SwarmsClient(base_url=server.url, api_key=api_key, stream_idle_timeout=0.2) as client:
+        with client.swarms.run(task="summarize", stream=True) as stream:
+            assert [chunk.content for chunk in stream] == EXPECTED
+            assert stream.resumes == 0
+
+    assert server.last_event_ids == [None]
+
+
+def test_raises_read_timeout_when_it_cant_resume(serve: Any) -> None:
+    server = serve(mode="stall", pause=5)
+
+    with SwarmsClient(base_url=server.url, api_key=api_key, stream_idle_timeout=0.2, max_stream_resumes=0) as client:
+        received: List[Optional[str]] = []
+        with pytest.raises(httpx.ReadTimeout):
+            for chunk in client.swarms.run(task="summarize", stream=True):
+                received.append(chunk.content)
+
+    assert received == EXPECTED[: EVENTS // 2]
+
+
+def test_does_not_apply_to_the_response_headers(serve: Any) -> None:
+    server = serve(mode="none", headers_delay=0.4)
+
+    with SwarmsClient(base_url=server.url, api_key=api_key, stream_idle_timeout=0.1) as client:
+        stream = client.swarms.run(task="summarize", stream=True)
+        assert [chunk.content for chunk in stream] == EXPECTED
+
+
+async def test_async_resumes_a_stalled_stream(serve: Any) -> None:
+    server = serve(mode="stall", pause=5)
+
+    async with AsyncSwarmsClient(base_url=server.url, api_key=api_key, stream_idle_timeout=0.2) as client:
+        stream = await client.agent.run(task="summarize", stream=True)
+        async with stream:
+            assert [chunk.content async for chunk in stream] == EXPECTED
+            assert stream.resumes == 1
+
+
+async def test_async_heartbeats_keep_the_stream_alive(serve: Any) -> None:
+    server = serve(mode="heartbeat", pause=0.6)
+
+    async with AsyncSwarmsClient(base_url=server.url, api_key=api_key, stream_idle_timeout=0.2) as client:
+        stream = await client.agent.run(task="summarize", stream=True)
+        async with stream:
+            assert [chunk.content async for chunk in stream] == EXPECTED
+            assert stream.resumes == 0
+
+
+def test_copy_keeps_the_idle_timeout() -> None:
+    client = SwarmsClient(base_url="http://127.0.0.1:4010", api_key=api_key, stream_idle_timeout=30)
+
+    assert client.with_options(timeout=10)._stream_idle_timeout == 30
+    assert client.with_options(stream_idle_timeout=5)._stream_idle_timeout == 5
+    assert SwarmsClient(base_url="http://127.0.0.1:4010", api_key=api_key)._stream_idle_timeout is None
+    client.close()
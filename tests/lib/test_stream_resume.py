@@ -0,0 +1,231 @@
+from __future__ import annotations
+
+import json
+import random
+import socket
+import threading
+from typing import Any, List, Iterator, Optional
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import httpx
+import pytest
+
+from swarms_client import APIError, SwarmsClient, AsyncSwarmsClient
+from swarms_client._streaming import ServerSentEvent
+from swarms_client.lib.timing import RequestTiming
+from swarms_client.lib.stream_resume import _REPLAY_WINDOW, StreamMetrics, _StreamResumeState
+
+api_key = "My API Key"
+
+EVENTS = 40
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["content-length"]))
+        last_event_id = self.headers.get("last-event-id")
+        self.server.last_event_ids.append(last_event_id)
+
+        # replay the last event the client received, like a server that resumes inclusively
+        start = 0 if last_event_id is None else int(last_event_id) - 1
+        events = [self.server.event(i) for i in range(start, EVENTS)]
+        payload = b"".join(events)
+
+        self.send_response(200)
+        self.send_header("content-type", "text/event-stream")
+        self.send_header("transfer-encoding", "chunked")
+        self.end_headers()
+
+        end = len(payload)
+        if self.server.cuts:
+            self.server.cuts -= 1
+            # cut after at least one new event, so that every connection makes progress
+            end = self.server.rnd.randint(len(b"".join(events[:2])), len(payload) - 1)
+
+        pos = 0
+        while pos < end:
+            size = min(self.server.rnd.randint(1, 64), end - pos)
+            self.wfile.write(b"%x\r\n%s\r\n" % (size, payload[pos : pos + size]))
+            pos += size
+
+        if end < len(payload):
+            self.wfile.flush()
+            self.connection.shutdown(socket.SHUT_RDWR)
+            self.close_connection = True
+            return
+
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self, *, cuts: int, seed: int, ids: bool = True) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.cuts = cuts
+        self.rnd = random.Random(seed)
+        self.ids = ids
+        self.last_event_ids: List[Optional[str]] = []
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def event(self, index: int) -> bytes:
+        event = b'data: {"content": "token-%d"}\n' % index
+        if index == 0:
+            event = b"retry: 1\n" + event
+        if self.ids:
+            event = b"id: %d\n" % (index + 1) + event
+        return event + b"\n"
+
+
+@pytest.fixture
+def serve() -> Iterator[Any]:
+    servers: List[_Server] = []
+
+    def start(**kwargs: Any) -> _Server:
+        server = _Server(**kwargs)
+        servers.append(server)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    yield start
+
+    for server in servers:
+        server.shutdown()
+        server.server_close()
+
+
+def _contents(chunks: Any) -> List[Optional[str]]:
+    return [chunk.content for chunk in chunks]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_resumes_after_random_cuts(serve: Any, seed: int) -> None:
+    server = serve(cuts=3, seed=seed)
+    metrics = StreamMetrics()
+
+    with SwarmsClient(base_url=server.url, api_key=api_key, max_stream_resumes=3, stream_metrics=metrics) as client:
+        with client.swarms.run(task="summarize", stream=True) as stream:
+            assert _contents(stream) == [f"token-{i}" for i in range(EVENTS)]
+            assert stream.resumes == 3
+
+    assert metrics.stats() == {"disconnects": 3, "resumes": 3, "failed_resumes": 0, "duplicates": 3}
+
+
+def test_sends_last_event_id(serve: Any) -> None:
+    server = serve(cuts=2, seed=0)
+
+    with SwarmsClient(base_url=server.url, api_key=api_key) as client:
+        stream = client.swarms.run(task="summarize", stream=True)
+        assert _contents(stream) == [f"token-{i}" for i in range(EVENTS)]
+
+    first, *resumed = server.last_event_ids
+    assert first is None
+    assert len(resumed) == 2
+    assert 0 < int(resumed[0] or 0) < int(resumed[1] or 0) < EVENTS
+    assert json.loads(stream.response.request.content) == {"task": "summarize", "stream": True}
+
+
+def test_resumes_are_sent_like_other_requests(serve: Any) -> None:
+    server = serve(cuts=2, seed=0)
+    timings: List[RequestTiming] = []
+
+    with SwarmsClient(base_url=server.url, api_key=api_key, on_timing=timings.append) as client:
+        stream = client.swarms.run(task="summarize", stream=True)
+        assert _contents(stream) == [f"token-{i}" for i in range(EVENTS)]
+
+    # the first request and both resumes
+    assert len(timings) == 3
+    assert stream.response.request.headers["last-event-id"] == server.last_event_ids[-1]
+
+
+class _DroppedStream(httpx.SyncByteStream):
+    def __iter__(self) -> Iterator[bytes]:
+        yield b'id: 1\ndata: {"content": "token-0"}\n\n'
+        raise httpx.ReadError("connection reset")
+
+
+def test_errors_after_a_resume_belong_to_the_resumed_response() -> None:
+    def respond(request: httpx.Request) -> httpx.Response:
+        if "last-event-id" not in request.headers:
+            return httpx.Response(200, stream=_DroppedStream(), headers={"content-type": "text/event-stream"})
+        return httpx.Response(
+            200,
+            content=b'id: 2\nevent: error\ndata: {"error": "failed"}\n\n',
+            headers={"content-type": "text/event-stream"},
+        )
+
+    http_client = httpx.Client(transport=httpx.MockTransport(respond))
+    with SwarmsClient(base_url="http://127.0.0.1:4010", api_key=api_key, http_client=http_client) as client:
+        stream = client.swarms.run(task="summarize", stream=True)
+        with pytest.raises(APIError) as exc_info:
+            list(stream)
+
+    assert exc_info.value.request.headers["last-event-id"] == "1"
+
+
+def test_only_recent_event_ids_are_kept() -> None:
+    state = _StreamResumeState(max_resumes=1, metrics=None)
+    for i in range(_REPLAY_WINDOW * 5):
+        state.observe(ServerSentEvent(id=str(i), data="{}"))
+
+    assert len(state._seen) == _REPLAY_WINDOW
+    state.resumed()
+    assert not state.observe(ServerSentEvent(id=str(_REPLAY_WINDOW * 5 - 1), data="{}"))
+    assert state.observe(ServerSentEvent(id=str(_REPLAY_WINDOW * 5), data="{}"))
+
+
+def test_gives_up_after_max_stream_resumes(serve: Any) -> None:
+    server = serve(cuts=3, seed=0)
+    metrics = StreamMetrics()
+
+    with SwarmsClient(base_url=server.url, api_key=api_key, max_stream_resumes=2, stream_metrics=metrics) as client:
+        with pytest.raises(httpx.RemoteProtocolError):
+            list(client.swarms.run(task="summarize", stream=True))
+
+    assert metrics.stats()["resumes"] == 2
+    assert metrics.stats()["failed_resumes"] == 1
+
+
+def test_does_not_resume_without_event_ids(serve: Any) -> None:
+    server = serve(cuts=1, seed=0, ids=False)
+    metrics = StreamMetrics()
+
+    with SwarmsClient(base_url=server.url, api_key=api_key, stream_metrics=metrics) as client:
+        with pytest.raises(httpx.RemoteProtocolError):
+            list(client.swarms.run(task="summarize", stream=True))
+
+    assert metrics.stats() == {"disconnects": 1, "resumes": 0, "failed_resumes": 1, "duplicates": 0}
+
+
+@pytest.mark.parametrize("seed", range(3))
+async def test_async_resumes_after_random_cuts(serve: Any, seed: int) -> None:
+    server = serve(cuts=3, seed=seed)
+
+    async with AsyncSwarmsClient(base_url=server.url, api_key=api_key, max_stream_resumes=3) as client:
+        stream = await client.agent.run(task="summarize", stream=True)
+        async with stream:
+            assert [chunk.content async for chunk in stream] == [f"token-{i}" for i in range(EVENTS)]
+            assert stream.resumes == 3
+
+
+def test_copy_keeps_stream_options() -> None:
+    metrics = StreamMetrics()
+    client = SwarmsClient(
+        base_url="http://127.0.0.1:4010", api_key=api_key, max_stream_resumes=7, stream_metrics=metrics
+    )
+
+    copied = client.with_options(timeout=10)
+    assert copied._max_stream_resumes == 7
+    assert copied._stream_metrics is metrics
+    assert client.with_options(max_stream_resumes=0)._max_stream_resumes == 0
+    client.close()
@@ -0,0 +1,207 @@
+from __future__ import annotations
+
+import time
+import threading
+from typing import Any, List, Iterator, AsyncIterator
+
+import anyio
+import httpx
+import pytest
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient
+from swarms_client._streaming import Stream, AsyncStream
+
+ITEMS = 50
+
+
+class _Body:
+    """A response body that records how often each event was read."""
+
+    def __init__(
+        self, items: int = ITEMS, *, fail_after: int | None = None, error: BaseException | None = None
+    ) -> None:
+        self.items = items
+        self.fail_after = fail_after
+        self.error = error or httpx.ReadError("connection lost")
+        self.reads = 0
+
+    def events(self, i: int) -> bytes:
+        return b'data: {"i": %d}\n\n' % i
+
+    def __iter__(self) -> Iterator[bytes]:
+        for i in range(self.items):
+            if i == self.fail_after:
+                raise self.error
+            self.reads += 1
+            yield self.events(i)
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
+
+
+def _stream(client: SwarmsClient, body: _Body) -> Stream[Any]:
+    return Stream(cast_to=object, client=client, response=httpx.Response(200, content=iter(body)))
+
+
+def _async_stream(client: AsyncSwarmsClient, body: _Body) -> AsyncStream[Any]:
+    return AsyncStream(cast_to=object, client=client, response=httpx.Response(200, content=body.__aiter__()))
+
+
+EXPECTED = [{"i": i} for i in range(ITEMS)]
+
+
+def test_block_keeps_consumers_within_the_buffer_size(client: SwarmsClient) -> None:
+    body = _Body()
+    consumers = _stream(client, body).tee(3, buffer_size=4)
+    received: List[List[Any]] = [[] for _ in consumers]
+    max_buffered = [0]
+
+    def consume(index: int) -> None:
+        for item in consumers[index]:
+            received[index].append(item)
+            max_buffered[0] = max(max_buffered[0], *(consumer.buffered for consumer in consumers))
+            if index == 2:
+                time.sleep(0.001)
+
+    threads = [threading.Thread(target=consume, args=(i,)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+
+    assert received == [EXPECTED] * 3
+    assert body.reads == ITEMS
+    assert max_buffered[0] <= 4
+
+
+def test_drop_keeps_the_newest_items(client: SwarmsClient) -> None:
+    fast, slow = _stream(client, _Body()).tee(buffer_size=10, policy="drop")
+
+    assert list(fast) == EXPECTED
+    assert slow.buffered == 10
+    assert list(slow) == EXPECTED[-10:]
+    assert slow.dropped == ITEMS - 10
+    assert fast.dropped == 0
+
+
+def test_spill_keeps_every_item_in_order(client: SwarmsClient) -> None:
+    fast, slow = _stream(client, _Body()).tee(buffer_size=8, policy="spill")
+
+    assert [next(fast) for _ in range(20)] == EXPECTED[:20]
+    assert next(slow) == EXPECTED[0]
+    assert list(fast) == EXPECTED[20:]
+    assert slow.buffered == ITEMS - 1
+    assert list(slow) == EXPECTED[1:]
+    assert slow.dropped == 0
+
+
+def test_errors_reach_every_consumer(client: SwarmsClient) -> None:
+    first, second = _stream(client, _Body(fail_after=5)).tee(policy="spill")
+
+    with pytest.raises(httpx.ReadError):
+        list(first)
+
+    assert [next(second) for _ in range(5)] == EXPECTED[:5]
+    with pytest.raises(httpx.ReadError):
+        next(second)
+
+
+def test_interrupted_reads_reach_every_consumer(client: SwarmsClient) -> None:
+    first, second = _stream(client, _Body(fail_after=5, error=KeyboardInterrupt())).tee(policy="spill")
+
+    with pytest.raises(KeyboardInterrupt):
+        list(first)
+
+    assert [next(second) for _ in range(5)] == EXPECTED[:5]
+    with pytest.raises(RuntimeError, match="interrupted"):
+        next(second)
+
+
+def test_closing_every_consumer_closes_the_response(client: SwarmsClient) -> None:
+    stream = _stream(client, _Body())
+    first, second = stream.tee()
+
+    assert next(first) == EXPECTED[0]
+    first.close()
+    assert list(first) == []
+    assert not stream.response.is_closed
+
+    # a closed consumer doesn't hold back the others
+    assert list(second) == EXPECTED
+
+    with second:
+        pass
+    assert stream.response.is_closed
+
+
+@pytest.mark.parametrize("kwargs", [{"n": 0}, {"buffer_size": 0}, {"policy": "wait"}])
+def test_invalid_arguments(client: SwarmsClient, kwargs: Any) -> None:
+    with pytest.raises(ValueError):
+        _stream(client, _Body()).tee(**kwargs)
+
+
+@pytest.mark.parametrize("policy", ["block", "drop", "spill"])
+async def test_async_tee(async_client: AsyncSwarmsClient, policy: Any) -> None:
+    body = _Body()
+    consumers = _async_stream(async_client, body).tee(3, buffer_size=4, policy=policy)
+    received: List[List[Any]] = [[] for _ in consumers]
+
+    async def consume(index: int) -> None:
+        async for item in consumers[index]:
+            received[index].append(item)
+            if index == 2:
+                await anyio.sleep(0.001)
+
+    async with anyio.create_task_group() as tg:
+        for index in range(3):
+            tg.start_soon(consume, index)
+
+    assert body.reads == ITEMS
+    if policy != "drop":
+        assert received == [EXPECTED] * 3
+    for consumer, items in zip(consumers, received):
+        # consumers that fall behind miss items, but always get the latest ones in order
+        assert len(items) + consumer.dropped == ITEMS
+        assert [item for item in EXPECTED if item in items] == items
+        assert items[-1] == EXPECTED[-1]
+
+
+async def test_async_block_waits_for_slow_consumers(async_client: AsyncSwarmsClient) -> None:
+    body = _Body()
+    fast, slow = _async_stream(async_client, body).tee(buffer_size=3)
+
+    async def read_fast() -> List[Any]:
+        return [item async for item in fast]
+
+    with anyio.move_on_after(0.1):
+        await read_fast()
+    # the fast consumer can't get further than 3 items ahead of the slow one
+    assert slow.buffered == 3
+    assert body.reads == 3
+
+    # once the fast consumer is closed, it no longer holds back the slow one
+    await fast.close()
+    assert [item async for item in slow] == EXPECTED
+
+
+async def test_async_cancelled_reader_fails_the_other_consumers(async_client: AsyncSwarmsClient) -> None:
+    async def body() -> AsyncIterator[bytes]:
+        for i in range(5):
+            yield b'data: {"i": %d}\n\n' % i
+        await anyio.sleep(10)
+        yield b'data: {"i": 5}\n\n'
+
+    stream = AsyncStream(cast_to=object, client=async_client, response=httpx.Response(200, content=body()))
+    reader, other = stream.tee(policy="spill")
+
+    received: List[Any] = []
+    with anyio.move_on_after(0.1):
+        async for item in reader:
+            received.append(item)
+    # cancelled in the middle of the stream, while it was reading the response
+    assert received == EXPECTED[:5]
+
+    assert [await other.__anext__() for _ in range(5)] == EXPECTED[:5]
+    with pytest.raises(RuntimeError, match="cancelled"):
+        await other.__anext__()
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import os
+import logging
+import threading
+from typing import Any, List, Iterator
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient
+from swarms_client.lib.timing import RequestTiming
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    # don't wait for idle keep-alive connections on shutdown
+    daemon_threads = True
+    block_on_close = False
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_network_phases(server_url: str) -> None:
+    with SwarmsClient(base_url=server_url, api_key=api_key, request_timing=True) as client:
+        first = client.with_raw_response.health.check()
+        assert first.parse().status == "ok"
+        second = client.with_raw_response.health.check()
+        second.parse()
+
+    timing = first.timing
+    assert timing is not None
+    assert timing.new_connection is True
+    assert timing.connect is not None and timing.connect >= 0
+    assert timing.tls is None
+    assert timing.dns is None
+    for phase in (timing.pool_wait, timing.send, timing.ttfb, timing.body, timing.decode, timing.construct):
+        assert phase is not None and phase >= 0
+    assert timing.total is not None and timing.total >= timing.ttfb
+    assert timing.retries_taken == 0
+
+    # the second request reuses the pooled connection
+    assert second.timing is not None
+    assert second.timing.new_connection is False
+    assert second.timing.connect is None
+
+
+def test_disabled_by_default(server_url: str) -> None:
+    with SwarmsClient(base_url=server_url, api_key=api_key) as client:
+        response = client.with_raw_response.health.check()
+
+    assert response.timing is None
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_on_timing_callback(respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/swarm/completions").mock(return_value=httpx.Response(200, json={"job_id": "abc"}))
+    timings: List[RequestTiming] = []
+    client = SwarmsClient(base_url=base_url, api_key=api_key, on_timing=timings.append)
+
+    client.swarms.run(name="swarm", task="summarize")
+
+    assert len(timings) == 1
+    timing = timings[0]
+    assert timing.transform is not None and timing.transform > 0
+    assert timing.build_request is not None
+    assert timing.decode is not None
+    assert timing.construct is not None
+    assert timing.total is not None
+    # the mock transport doesn't emit trace events
+    assert timing.new_connection is None
+    assert timing.ttfb is None
+
+    # the callback is kept by copies
+    client.with_options(timeout=10).swarms.run(task="summarize")
+    assert len(timings) == 2
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_callback_errors_are_logged(respx_mock: MockRouter, caplog: pytest.LogCaptureFixture) -> None:
+    respx_mock.get("/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+
+    def on_timing(_timing: RequestTiming) -> None:
+        raise RuntimeError("broken hook")
+
+    client = SwarmsClient(base_url=base_url, api_key=api_key, on_timing=on_timing)
+    with caplog.at_level(logging.WARNING, logger="swarms_client"):
+        assert client.health.check().status == "ok"
+
+    assert "on_timing" in caplog.text
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_counts_retries(respx_mock: MockRouter) -> None:
+    respx_mock.get("/health").mock(
+        side_effect=[
+            httpx.Response(500, json={}, headers={"retry-after-ms": "1"}),
+            httpx.Response(200, json={"status": "ok"}),
+        ]
+    )
+    timings: List[RequestTiming] = []
+    client = SwarmsClient(base_url=base_url, api_key=api_key, on_timing=timings.append)
+
+    client.with_options(max_retries=1).health.check()
+
+    assert [timing.retries_taken for timing in timings] == [1]
+
+
+async def test_async_client(server_url: str) -> None:
+    timings: List[RequestTiming] = []
+    async with AsyncSwarmsClient(base_url=server_url, api_key=api_key, on_timing=timings.append) as client:
+        await client.health.check()
+        response = await client.with_raw_response.health.check()
+
+    assert response.timing is timings[1]
+    assert timings[0].new_connection is True
+    assert timings[1].new_connection is False
+    assert timings[1].ttfb is not None
+    assert timings[0].construct is not None
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import time
+import threading
+from typing import Any, Set, Tuple, Iterator
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import anyio
+import pytest
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient
+
+api_key = "My API Key"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _Server
+
+    def do_GET(self) -> None:
+        with self.server.lock:
+            self.server.requests += 1
+            self.server.connections.add(self.client_address)
+
+        body = b'{"status": "ok"}'
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    # don't wait for idle keep-alive connections on shutdown
+    daemon_threads = True
+    block_on_close = False
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.connections: Set[Tuple[str, int]] = set()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def server() -> Iterator[_Server]:
+    server = _Server()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_warmup_opens_distinct_connections(server: _Server) -> None:
+    with SwarmsClient(base_url=server.url, api_key=api_key) as client:
+        assert client.warmup(connections=4) == 4
+        assert len(server.connections) == 4
+
+        # the warm connections are reused by later requests
+        for _ in range(4):
+            client.health.check()
+        assert len(server.connections) == 4
+
+
+async def test_async_warmup_opens_distinct_connections(server: _Server) -> None:
+    async with AsyncSwarmsClient(base_url=server.url, api_key=api_key) as client:
+        assert await client.warmup(connections=3) == 3
+        assert len(server.connections) == 3
+
+        await client.health.check()
+        assert len(server.connections) == 3
+
+
+def test_warmup_errors_are_not_raised() -> None:
+    # nothing is listening on port 9
+    with SwarmsClient(base_url="http://127.0.0.1:9", api_key=api_key, max_retries=0) as client:
+        assert client.warmup(connections=2) == 0
+
+
+def test_warmup_validates_connections() -> None:
+    with SwarmsClient(base_url="http://127.0.0.1:9", api_key=api_key) as client:
+        with pytest.raises(ValueError):
+            client.warmup(connections=0)
+
+
+def test_keepalive(server: _Server) -> None:
+    with SwarmsClient(base_url=server.url, api_key=api_key) as client:
+        with client.keepalive(interval=0.05, connections=2):
+            time.sleep(0.3)
+        requests = server.requests
+
+        assert requests >= 4
+        assert len(server.connections) == 2
+
+        time.sleep(0.1)
+        assert server.requests == requests
+
+
+async def test_async_keepalive(server: _Server) -> None:
+    async with AsyncSwarmsClient(base_url=server.url, api_key=api_key) as client:
+        async with client.keepalive(interval=0.05):
+            await anyio.sleep(0.3)
+        requests = server.requests
+
+        assert requests >= 2
+        assert len(server.connections) == 1
+
+        await anyio.sleep(0.1)
+        assert server.requests == requests
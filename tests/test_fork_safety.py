@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import os
+import threading
+import multiprocessing
+from typing import Any, List, Iterator
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import httpx
+import pytest
+from respx import MockRouter
+
+from swarms_client import SwarmsClient, AsyncSwarmsClient
+from swarms_client._base_client import _after_fork_in_child
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
+api_key = "My API Key"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b'{"status": "%d"}' % self.client_address[1]
+        self.send_response(200)
+        self.send_header("content-type", "application/json")
+        self.send_header("content-length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args: Any) -> None:
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    # don't wait for idle keep-alive connections on shutdown
+    daemon_threads = True
+    block_on_close = False
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _health_status_in_child(client: SwarmsClient, results: Any) -> None:
+    try:
+        results.put(client.health.check().status)
+    except Exception as err:
+        results.put(repr(err))
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_resets_pool_after_fork(respx_mock: MockRouter) -> None:
+    respx_mock.get("/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+    client = SwarmsClient(base_url=base_url, api_key=api_key)
+    transport = client._client._transport
+
+    client.health.check()
+    assert client._client._transport is transport
+
+    _after_fork_in_child()
+    client.health.check()
+
+    assert client._client._transport is not transport
+    assert respx_mock.calls.call_count == 2
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_resets_async_pool_after_fork(respx_mock: MockRouter) -> None:
+    respx_mock.get("/health").mock(return_value=httpx.Response(200, json={"status": "ok"}))
+    client = AsyncSwarmsClient(base_url=base_url, api_key=api_key)
+    transport = client._client._transport
+
+    _after_fork_in_child()
+    await client.health.check()
+
+    assert client._client._transport is not transport
+
+
+def test_custom_http_client_is_left_alone() -> None:
+    http_client = httpx.Client()
+    client = SwarmsClient(base_url=base_url, api_key=api_key, http_client=http_client)
+    transport = http_client._transport
+
+    _after_fork_in_child()
+    client.close()
+
+    assert http_client._transport is transport
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="requires the fork start method")
+def test_forked_children_open_their_own_connections(server_url: str) -> None:
+    client = SwarmsClient(base_url=server_url, api_key=api_key)
+    parent_port = client.health.check().status
+
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+    children = [ctx.Process(target=_health_status_in_child, args=(client, results)) for _ in range(3)]
+    for child in children:
+        child.start()
+    ports: List[str] = [results.get(timeout=10) for _ in children]
+    for child in children:
+        child.join(10)
+
+    assert all(port.isdigit() for port in ports), ports
+    assert parent_port not in ports
+    # the parent's pooled connection is still intact
+    assert client.health.check().status == parent_port
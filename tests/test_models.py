@@ -1,5 +1,5 @@
 import json
-from typing import TYPE_CHECKING, Any, Dict, List, Union, Optional, cast
+from typing import TYPE_CHECKING, Any, Set, Dict, List, Union, Optional, cast
 from datetime import datetime, timezone
 from typing_extensions import Literal, Annotated, TypeAliasType
 
@@ -985,3 +985,52 @@ def test_extra_properties() -> None:
     assert model.a.prop == 1
     assert isinstance(model.a, Item)
     assert model.other == "foo"
+
+
+def test_construct_type_reuses_compiled_plans() -> None:
+    class Node(BaseModel):
+        name: str
+        score: Optional[float] = None
+        children: Optional[List["Node"]] = None
+
+    if PYDANTIC_V2:
+        Node.model_rebuild()
+    else:
+        Node.update_forward_refs()  # type: ignore
+
+    data = [{"name": "root", "score": 1, "children": [{"name": "leaf", "children": None}]}] * 3
+    for _ in range(2):
+        nodes = cast(List[Node], construct_type(type_=List[Node], value=data))
+        assert [node.name for node in nodes] == ["root", "root", "root"]
+        assert isinstance(nodes[0].score, float)
+        assert nodes[0].children is not None
+        assert isinstance(nodes[0].children[0], Node)
+        assert nodes[0].children[0].children is None
+        assert nodes[0].children[0].model_fields_set == {"name", "children"}
+
+    # the given data is never mutated or shared
+    tags = {"a": "b"}
+    model = construct_type(type_=Dict[str, str], value=tags)
+    assert model == tags
+    assert model is not tags
+
+
+def test_construct_type_overridden_construct() -> None:
+    class Model(BaseModel):
+        foo: str
+
+        @classmethod
+        def construct(cls, _fields_set: Optional[Set[str]] = None, **values: object) -> "Model":  # type: ignore[override]
+            return super().construct(_fields_set, **{**values, "foo": "overridden"})
+
+    assert cast(Model, construct_type(type_=Model, value={"foo": "bar"})).foo == "overridden"
+    assert cast(BasicModel, construct_type(type_=BasicModel, value={"foo": "bar"})).foo == "bar"
+
+
+def test_construct_type_non_str_keys() -> None:
+    with pytest.raises(TypeError, match="keywords must be strings"):
+        construct_type(type_=BasicModel, value={"foo": "bar", 1: "baz"})
+
+    # like other unexpected data, it is returned as is from a union of models
+    value = {"foo": "bar", 1: "baz"}
+    assert construct_type(type_=Union[BasicModel, str], value=value) is value
@@ -1,12 +1,18 @@
 from __future__ import annotations
 
+import os
+import json
 from typing import Iterator, AsyncIterator
 
 import httpx
 import pytest
+from respx import MockRouter
 
-from swarms_client import SwarmsClient, AsyncSwarmsClient
-from swarms_client._streaming import Stream, AsyncStream, ServerSentEvent
+from swarms_client import APIError, SwarmsClient, AsyncSwarmsClient
+from swarms_client._streaming import Stream, SSEDecoder, AsyncStream, ServerSentEvent
+from swarms_client.lib.run_chunks import AgentRunChunk, SwarmRunChunk
+
+base_url = os.environ.get("TEST_API_BASE_URL", "http://127.0.0.1:4010")
 
 
 @pytest.mark.asyncio
@@ -252,6 +258,141 @@ async def test_multi_byte_character_multiple_chunks(
     assert sse.json() == {"content": "известни"}
 
 
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_line_endings_split_across_chunks(
+    sync: bool,
+    client: SwarmsClient,
+    async_client: AsyncSwarmsClient,
+) -> None:
+    def body() -> Iterator[bytes]:
+        yield b"event: a\r"
+        yield b"\ndata: 1\r"
+        yield b"\r"
+        yield b"data: 2\n"
+        yield b"\r\n"
+        yield b"data: 3\r\n\r"
+        yield b"\n"
+
+    iterator = make_event_iterator(
+        content=body(), sync=sync, client=client, async_client=async_client
+    )
+
+    sse = await iter_next(iterator)
+    assert sse.event == "a"
+    assert sse.data == "1"
+
+    sse = await iter_next(iterator)
+    assert sse.event is None
+    assert sse.data == "2"
+
+    sse = await iter_next(iterator)
+    assert sse.data == "3"
+
+    await assert_empty_iter(iterator)
+
+
+def test_decoder_only_buffers_the_incomplete_line() -> None:
+    decoder = SSEDecoder()
+
+    assert decoder._decode_chunk(b"data: a\n\ndata: " + b"x" * 1000) != []
+    assert len(decoder._buffer) == 1006
+    assert decoder._decode_chunk(b"x" * 1000) == []
+    assert decoder._decode_chunk(b"\r") == []
+    assert decoder._buffer == bytearray()
+
+    (sse,) = decoder._decode_chunk(b"\n\n")
+    assert sse.data == "x" * 2000
+
+
+def test_decoder_ignores_empty_chunks() -> None:
+    decoder = SSEDecoder()
+
+    assert decoder._decode_chunk(b"data: 1\r") == []
+    assert decoder._decode_chunk(b"") == []
+    # the second half of the `\r\n`, not an empty line that ends the event
+    assert decoder._decode_chunk(b"\n") == []
+
+    (sse,) = decoder._decode_chunk(b"\r\n")
+    assert sse.data == "1"
+
+
+def test_decoder_keeps_the_data_as_bytes() -> None:
+    decoder = SSEDecoder()
+
+    (sse,) = decoder._decode_chunk('event: é\ndata: {"name":\ndata:"héllo"}\n\n'.encode())
+    assert sse.event == "é"
+    assert sse.raw_data == '{"name":\n"héllo"}'.encode()
+    assert sse.data == '{"name":\n"héllo"}'
+    assert sse.json() == {"name": "héllo"}
+
+    # events that are built from a `str` still have their bytes
+    assert ServerSentEvent(data="é").raw_data == "é".encode()
+    assert ServerSentEvent().raw_data == b""
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sync", [True, False], ids=["sync", "async"])
+async def test_done_and_error_events(
+    sync: bool, client: SwarmsClient, async_client: AsyncSwarmsClient
+) -> None:
+    def body() -> Iterator[bytes]:
+        yield b'data: {"content": "a"}\n\n'
+        yield b"data: [DONE]\n\n"
+        yield b'data: {"content": "b"}\n\n'
+
+    stream = make_stream(body(), sync=sync, client=client, async_client=async_client)
+    assert [chunk async for chunk in iter_all(stream)] == [{"content": "a"}]
+
+    def error_body() -> Iterator[bytes]:
+        yield b'data: {"content": "a"}\n\n'
+        yield b'event: error\ndata: {"error": {"message": "agent failed"}}\n\n'
+
+    stream = make_stream(
+        error_body(), sync=sync, client=client, async_client=async_client
+    )
+    with pytest.raises(APIError, match="agent failed") as exc_info:
+        [chunk async for chunk in iter_all(stream)]
+    assert exc_info.value.body == {"message": "agent failed"}
+
+
+@pytest.mark.respx(base_url=base_url)
+def test_run_stream(client: SwarmsClient, respx_mock: MockRouter) -> None:
+    respx_mock.post("/v1/swarm/completions").mock(
+        return_value=httpx.Response(
+            200,
+            content=b'data: {"agent_name": "writer", "content": "Hel"}\n\n'
+            b'data: {"agent_name": "writer", "content": "lo"}\n\n',
+            headers={"content-type": "text/event-stream"},
+        )
+    )
+
+    with client.swarms.run(task="greet", stream=True) as stream:
+        chunks = list(stream)
+
+    assert json.loads(respx_mock.calls.last.request.content)["stream"] is True
+    assert all(isinstance(chunk, SwarmRunChunk) for chunk in chunks)
+    assert "".join(chunk.content or "" for chunk in chunks) == "Hello"
+    assert chunks[0].agent_name == "writer"
+
+
+@pytest.mark.respx(base_url=base_url)
+async def test_async_run_stream(
+    async_client: AsyncSwarmsClient, respx_mock: MockRouter
+) -> None:
+    respx_mock.post("/v1/agent/completions").mock(
+        return_value=httpx.Response(
+            200,
+            content=b'data: {"content": "Hi", "name": "writer"}\n\n',
+            headers={"content-type": "text/event-stream"},
+        )
+    )
+
+    stream = await async_client.agent.run(task="greet", stream=True)
+    chunks = [chunk async for chunk in stream]
+
+    assert chunks == [AgentRunChunk(content="Hi", name="writer")]
+
+
 async def to_aiter(iter: Iterator[bytes]) -> AsyncIterator[bytes]:
     for chunk in iter:
         yield chunk
@@ -290,3 +431,36 @@ def make_event_iterator(
         client=async_client,
         response=httpx.Response(200, content=to_aiter(content)),
     )._iter_events()
+
+
+def make_stream(
+    content: Iterator[bytes],
+    *,
+    sync: bool,
+    client: SwarmsClient,
+    async_client: AsyncSwarmsClient,
+) -> Stream[object] | AsyncStream[object]:
+    request = httpx.Request("POST", base_url)
+    if sync:
+        return Stream(
+            cast_to=object,
+            client=client,
+            response=httpx.Response(200, content=content, request=request),
+        )
+
+    return AsyncStream(
+        cast_to=object,
+        client=async_client,
+        response=httpx.Response(200, content=to_aiter(content), request=request),
+    )
+
+
+async def iter_all(
+    stream: Stream[object] | AsyncStream[object],
+) -> AsyncIterator[object]:
+    if isinstance(stream, AsyncStream):
+        async for item in stream:
+            yield item
+    else:
+        for item in stream:
+            yield item
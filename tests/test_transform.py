@@ -515,3 +515,59 @@ async def test_transform_skipping(use_async: bool) -> None:
 async def test_strips_notgiven(use_async: bool) -> None:
     assert await transform({"foo_bar": "bar"}, Foo1, use_async) == {"fooBar": "bar"}
     assert await transform({"foo_bar": NOT_GIVEN}, Foo1, use_async) == {}
+
+
+class NestedParams(TypedDict, total=False):
+    name: str
+    tags: List[str]
+    metadata: Dict[str, object]
+
+
+class OuterParams(TypedDict, total=False):
+    items: Iterable[NestedParams]
+    messages: Union[Iterable[Dict[str, object]], Dict[str, object], None]
+
+
+@parametrize
+@pytest.mark.asyncio
+async def test_data_without_transforms_is_not_copied(use_async: bool) -> None:
+    data: OuterParams = {
+        "items": [{"name": "a", "tags": ["x"], "metadata": {"nested": [{"deep": 1}]}}],
+        "messages": [{"role": "user", "content": "hi"}],
+    }
+    result = await transform(data, OuterParams, use_async)
+    assert result is data
+    assert result["items"] is data["items"]
+
+
+@parametrize
+@pytest.mark.asyncio
+async def test_only_changed_containers_are_copied(use_async: bool) -> None:
+    unchanged: NestedParams = {"name": "a", "metadata": {"key": "value"}}
+    changed: NestedParams = {"name": "b", "metadata": {"model": MyModel(foo="hello!")}}
+    data: OuterParams = {
+        "items": [unchanged, changed],
+        "messages": NOT_GIVEN,  # type: ignore[typeddict-item]
+    }
+
+    result = await transform(data, OuterParams, use_async)
+    assert result == {
+        "items": [
+            {"name": "a", "metadata": {"key": "value"}},
+            {"name": "b", "metadata": {"model": {"foo": "hello!"}}},
+        ]
+    }
+    assert result is not data
+    items = cast(List[NestedParams], result["items"])
+    assert items[0] is unchanged
+    assert items[1] is not changed
+    # the input is never mutated
+    assert data["messages"] is NOT_GIVEN
+    assert isinstance(changed["metadata"]["model"], MyModel)
+
+
+@parametrize
+@pytest.mark.asyncio
+async def test_iterables_are_materialized(use_async: bool) -> None:
+    data = {"items": (item for item in [{"name": "a"}])}
+    assert await transform(data, OuterParams, use_async) == {"items": [{"name": "a"}]}